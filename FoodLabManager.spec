@@ -56,6 +56,8 @@ hidden_imports = [
     # 프로젝트 모듈
     'version',
     'database',
+    'migrations',
+    'schema_registry',
     'connection_manager',
     'api_client',
     'updater',
@@ -88,6 +90,9 @@ hidden_imports = [
     'views.communication_tab',
     'views.user_management_tab',
     'views.settings_dialog',
+    'views.bulk_import_worker',
+    'views.export_worker',
+    'views.schedule_pager',
 ]
 
 # 추가 하위 모듈 수집
@@ -10,6 +10,7 @@ API 클라이언트
 - HTTP 연결 풀링 (requests.Session)
 - 클라이언트 캐싱 (TTL 기반)
 - 단축된 타임아웃
+- 첨부파일 분할 업로드 / Range 이어받기 (외부망 연결 끊김 대비)
 '''
 
 import requests
@@ -17,7 +18,10 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import json
 import os
+import re
 import time
+import hashlib
+import tempfile
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -28,6 +32,12 @@ API_EXTERNAL_URL = "http://14.7.14.31:8000"  # 외부망 (포트포워딩 필요
 # 설정 파일 경로
 CONFIG_PATH = 'config/api_config.json'
 
+# 첨부파일 전송 설정
+TRANSFER_TIMEOUT = (5, 60)  # (연결, 읽기) - 청크 하나 기준
+TRANSFER_RETRY_COUNT = 5  # 연속 실패 허용 횟수 (실패 시 받은 위치부터 이어서 전송)
+TRANSFER_READ_SIZE = 64 * 1024  # 다운로드 기록 단위
+BULK_IMPORT_TIMEOUT = (5, 300)  # (연결, 읽기) - 엑셀 일괄 가져오기 (한 트랜잭션)
+
 
 class ApiCache:
     """API 응답 캐시 클래스 (TTL 기반)"""
@@ -84,6 +94,8 @@ class ApiClient:
         self._load_config()
         self._setup_session()
         self._cache = ApiCache()
+        # 진행 중인 분할 업로드 {(스케줄 ID, 파일 경로, 크기, SHA-256): 업로드 ID}
+        self._pending_uploads = {}
 
     def _setup_session(self):
         """HTTP 세션 설정 (연결 풀링)"""
@@ -139,7 +151,8 @@ class ApiClient:
             headers["Authorization"] = f"Bearer {self._token}"
         return headers
 
-    def _request(self, method, endpoint, data=None, params=None, retry_count=2, use_cache=False, cache_ttl=60):
+    def _request(self, method, endpoint, data=None, params=None, retry_count=2, use_cache=False, cache_ttl=60,
+                 timeout=None):
         """
         API 요청 실행 (연결 풀링 + 캐싱)
 
@@ -151,6 +164,7 @@ class ApiClient:
             retry_count: 재시도 횟수 (기본 2회)
             use_cache: 캐싱 사용 여부 (GET 요청만)
             cache_ttl: 캐시 유효 시간 (초)
+            timeout: (연결, 읽기) 타임아웃 (기본 2초, 5초 / long-poll 등 오래 걸리는 요청용)
         """
         # 캐시 확인 (GET 요청만)
         cache_key = None
@@ -162,7 +176,8 @@ class ApiClient:
 
         url = f"{self._base_url}{endpoint}"
         # 타임아웃 단축: 연결 2초, 읽기 5초
-        timeout = (2, 5)
+        if timeout is None:
+            timeout = (2, 5)
 
         last_exception = None
 
@@ -201,7 +216,7 @@ class ApiClient:
                 if self._base_url == API_BASE_URL:
                     print(f"[API] 내부망 연결 실패, 외부망으로 전환: {API_EXTERNAL_URL}")
                     self._base_url = API_EXTERNAL_URL
-                    return self._request(method, endpoint, data, params, retry_count, use_cache, cache_ttl)
+                    return self._request(method, endpoint, data, params, retry_count, use_cache, cache_ttl, timeout)
                 last_exception = e
                 # 외부망에서도 실패시 빠른 재시도
                 if attempt < retry_count - 1:
@@ -434,6 +449,18 @@ class ApiClient:
         result = self._request("DELETE", f"/api/clients/{client_id}")
         return result.get("success", False)
 
+    def _bulk_upsert(self, endpoint, columns, rows):
+        """엑셀 일괄 가져오기 (서버에서 한 트랜잭션으로 저장, 재시도하지 않음)"""
+        result = self._request("POST", endpoint, {"columns": columns, "rows": rows},
+                               retry_count=1, timeout=BULK_IMPORT_TIMEOUT)
+        if not result.get("success"):
+            raise Exception(result.get("message") or "일괄 저장에 실패했습니다.")
+        return result.get("data", {})
+
+    def bulk_upsert_clients(self, columns, rows):
+        """업체 일괄 추가/수정"""
+        return self._bulk_upsert("/api/clients/bulk", columns, rows)
+
     def search_clients(self, keyword):
         """업체 검색"""
         result = self._request("GET", f"/api/clients/search/{keyword}")
@@ -441,9 +468,15 @@ class ApiClient:
 
     # ==================== Schedules ====================
 
-    def get_schedules(self, keyword=None, status=None, date_from=None, date_to=None):
-        """스케줄 목록 조회"""
+    def get_schedules(self, keyword=None, status=None, date_from=None, date_to=None, fields=None):
+        """스케줄 목록 조회
+
+        Args:
+            fields: 'summary' 또는 쉼표로 구분한 컬럼명 (None이면 전체 컬럼)
+        """
         params = {}
+        if fields:
+            params["fields"] = fields
         if keyword:
             params["keyword"] = keyword
         if status:
@@ -456,6 +489,46 @@ class ApiClient:
         result = self._request("GET", "/api/schedules", params=params)
         return result.get("data", [])
 
+    def get_schedule_page(self, cursor=None, limit=200, filters=None, sort="desc", fields=None):
+        """스케줄 페이지 조회 (키셋 페이지네이션)
+
+        Returns:
+            {'items': [...], 'next_cursor': str 또는 None, 'has_more': bool}
+        """
+        params = {"limit": limit, "sort": sort}
+        if cursor:
+            params["cursor"] = cursor
+        if fields:
+            params["fields"] = fields
+        for key, value in (filters or {}).items():
+            if not value:
+                continue
+            # 목록 값은 쉼표로 구분해 전달
+            params[key] = ",".join(value) if isinstance(value, (list, tuple)) else value
+
+        result = self._request("GET", "/api/schedules", params=params)
+        if result.get("success"):
+            return {
+                "items": result.get("data", []),
+                "next_cursor": result.get("next_cursor"),
+                "has_more": result.get("has_more", False)
+            }
+        return None
+
+    def get_schedule_changes(self, since=None, fields=None):
+        """since 이후 변경된 스케줄 조회 (추가/수정/삭제)
+
+        Returns:
+            {'changed': [...], 'deleted': [...], 'server_time': ..., 'reset': bool}
+        """
+        params = {"since": since} if since else {}
+        if fields:
+            params["fields"] = fields
+        result = self._request("GET", "/api/schedules/changes", params=params)
+        if result.get("success"):
+            return result.get("data")
+        return None
+
     def get_schedule(self, schedule_id):
         """ID로 스케줄 조회"""
         result = self._request("GET", f"/api/schedules/{schedule_id}")
@@ -537,6 +610,21 @@ class ApiClient:
         result = self._request("POST", "/api/fees/calculate", test_items)
         return result.get("data", 0)
 
+    def calculate_fee_breakdown(self, test_items):
+        """수수료 항목별 내역 계산"""
+        result = self._request("POST", "/api/fees/calculate/breakdown", test_items)
+        return result.get("data") or {'total': 0, 'items': [], 'missing': []}
+
+    def calculate_fee_batch(self, items_by_key):
+        """여러 스케줄의 수수료 일괄 계산 ({키: 검사 항목 목록} -> {키: 총액})"""
+        result = self._request("POST", "/api/fees/calculate/batch", items_by_key)
+        return result.get("data", {})
+
+    def get_catalog_version(self):
+        """수수료/식품 유형 카탈로그 버전 (캐시 안 함)"""
+        result = self._request("GET", "/api/catalog/version")
+        return result.get("data", 0)
+
     # ==================== Food Types ====================
 
     def get_food_types(self, use_cache=True):
@@ -549,6 +637,40 @@ class ApiClient:
         result = self._request("GET", f"/api/food-types/{type_id}", use_cache=True, cache_ttl=120)
         return result.get("data")
 
+    def bulk_upsert_fees(self, columns, rows):
+        """수수료 일괄 추가/수정"""
+        result = self._bulk_upsert("/api/fees/bulk", columns, rows)
+        self.invalidate_cache("/api/fees")
+        return result
+
+    def import_fees_excel(self, file_path):
+        """수수료 엑셀로 전체 교체 (서버에서 임시 테이블 적재 후 한 번에 교체)
+
+        Returns:
+            {'count': 교체 후 수수료 수, 'errors': [[엑셀 행 번호, 오류 메시지], ...]}
+        """
+        headers = {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+
+        with open(file_path, 'rb') as f:
+            files = {'file': (os.path.basename(file_path), f)}
+            response = self._session.post(
+                f"{self._base_url}/api/fees/import",
+                headers=headers,
+                files=files,
+                timeout=BULK_IMPORT_TIMEOUT
+            )
+        self.invalidate_cache("/api/fees")
+
+        if response.status_code != 200:
+            try:
+                detail = response.json().get("detail")
+            except ValueError:
+                detail = None
+            raise Exception(detail or f"가져오기 실패: {response.status_code}")
+        return response.json().get("data", {})
+
     def get_food_type_by_name(self, type_name):
         """이름으로 식품 유형 조회 (캐시 2분)"""
         result = self._request("GET", f"/api/food-types/name/{type_name}", use_cache=True, cache_ttl=120)
@@ -576,6 +698,12 @@ class ApiClient:
             self.invalidate_cache("/api/food-types")
         return result.get("success", False)
 
+    def bulk_upsert_food_types(self, columns, rows):
+        """식품 유형 일괄 추가/수정"""
+        result = self._bulk_upsert("/api/food-types/bulk", columns, rows)
+        self.invalidate_cache("/api/food-types")
+        return result
+
     def search_food_types(self, keyword):
         """식품 유형 검색"""
         result = self._request("GET", f"/api/food-types/search/{keyword}")
@@ -589,33 +717,123 @@ class ApiClient:
         return result.get("data", [])
 
     def upload_attachment(self, schedule_id, file_path):
-        """첨부파일 업로드"""
-        import os
+        """첨부파일 분할 업로드
+
+        - 시작 시 전체 SHA-256을 보내 완료 시 서버가 받은 내용과 비교
+        - 서버에 같은 내용이 있으면 요청받은 무작위 구간의 SHA-256으로 보유를 확인하고 전송 생략
+        - 청크마다 SHA-256을 함께 보내고 서버는 최종 폴더에 바로 기록
+        - 연결이 끊기면 서버에 받은 위치를 확인한 뒤 이어서 전송
+        - 재시도가 모두 실패해도 업로드 ID를 기억해 두어 같은 파일을 다시 올리면 이어서 전송
+
+        Returns:
+            (success, message, attachment_id)
+        """
         if not os.path.exists(file_path):
             return False, "파일을 찾을 수 없습니다.", None
         try:
             file_name = os.path.basename(file_path)
-            # 파일 업로드 시 Content-Type 헤더 제외 (multipart/form-data 자동 설정)
-            headers = {}
-            if self._token:
-                headers["Authorization"] = f"Bearer {self._token}"
-
+            file_size = os.path.getsize(file_path)
+            digest = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                files = {'file': (file_name, f)}
-                response = self._session.post(
-                    f"{self._base_url}/api/schedules/{schedule_id}/attachments",
-                    headers=headers,
-                    files=files,
-                    timeout=(5, 30)
-                )
-            if response.status_code == 200:
-                data = response.json()
-                return True, "파일이 업로드되었습니다.", data.get("attachment_id")
-            else:
-                return False, f"업로드 실패: {response.status_code}", None
+                for chunk in iter(lambda: f.read(TRANSFER_READ_SIZE), b''):
+                    digest.update(chunk)
+            sha256 = digest.hexdigest()
+
+            base = f"/api/schedules/{schedule_id}/attachments/uploads"
+            key = (schedule_id, os.path.abspath(file_path), file_size, sha256)
+
+            # 이전에 중단된 업로드가 있으면 이어서 전송
+            info = None
+            upload_id = self._pending_uploads.get(key)
+            if upload_id:
+                result = self._request("GET", f"{base}/{upload_id}")
+                if result.get("success"):
+                    info = result.get("data")
+            if not info:
+                result = self._request("POST", base, {
+                    "file_name": file_name,
+                    "file_size": file_size,
+                    "sha256": sha256,
+                })
+                if not result.get("success"):
+                    return False, result.get("message", "업로드 실패"), None
+                info = result.get("data")
+                upload_id = info["upload_id"]
+                self._pending_uploads[key] = upload_id
+
+                proof = info.get("proof")
+                if proof:
+                    # 서버에 같은 내용이 있음 - 요청받은 구간으로 보유 확인 (실패하면 그대로 전송)
+                    result = self._request("POST", f"{base}/{upload_id}/link", {
+                        "proofs": self._proof_digests(file_path, proof["nonce"], proof["ranges"]),
+                    })
+                    if result.get("success"):
+                        self._pending_uploads.pop(key, None)
+                        self.invalidate_cache(f"/api/schedules/{schedule_id}/attachments")
+                        return True, "파일이 업로드되었습니다.", result.get("attachment_id")
+
+            self._upload_chunks(f"{base}/{upload_id}", file_path, file_size,
+                                info.get("received", 0), info["chunk_size"])
+
+            result = self._request("POST", f"{base}/{upload_id}/complete", timeout=TRANSFER_TIMEOUT)
+            self._pending_uploads.pop(key, None)
+            if result.get("success"):
+                self.invalidate_cache(f"/api/schedules/{schedule_id}/attachments")
+                return True, "파일이 업로드되었습니다.", result.get("attachment_id")
+            return False, result.get("message", "업로드 실패"), None
         except Exception as e:
             return False, f"업로드 오류: {str(e)}", None
 
+    @staticmethod
+    def _proof_digests(file_path, nonce, ranges):
+        """보유 확인 응답 - 구간마다 SHA-256(nonce + 구간 데이터)"""
+        digests = []
+        with open(file_path, 'rb') as f:
+            for offset, length in ranges:
+                f.seek(offset)
+                digests.append(hashlib.sha256(bytes.fromhex(nonce) + f.read(length)).hexdigest())
+        return digests
+
+    def _upload_chunks(self, endpoint, file_path, file_size, received, chunk_size):
+        """받은 위치(received)부터 파일 끝까지 청크 전송 (연결 풀 세션 사용)"""
+        url = f"{self._base_url}{endpoint}"
+        failures = 0
+        with open(file_path, 'rb') as f:
+            while received < file_size:
+                f.seek(received)
+                chunk = f.read(chunk_size)
+                headers = self._get_headers()
+                headers["Content-Type"] = "application/octet-stream"
+                headers["X-Chunk-SHA256"] = hashlib.sha256(chunk).hexdigest()
+                try:
+                    response = self._session.put(url, headers=headers, params={"offset": received},
+                                                 data=chunk, timeout=TRANSFER_TIMEOUT)
+                    response.raise_for_status()
+                    result = response.json()
+                except requests.exceptions.RequestException as e:
+                    failures += 1
+                    if failures >= TRANSFER_RETRY_COUNT:
+                        raise Exception(f"청크 전송 실패 ({received}/{file_size} bytes): {str(e)}")
+                    print(f"[API] 청크 전송 실패, 재시도... ({failures}/{TRANSFER_RETRY_COUNT})")
+                    time.sleep(min(2 ** failures * 0.5, 10))
+                    # 서버가 실제로 받은 위치 확인
+                    try:
+                        status = self._request("GET", endpoint)
+                        if status.get("success"):
+                            received = status["data"]["received"]
+                    except Exception:
+                        pass
+                    continue
+
+                if result.get("received") is not None:
+                    received = result["received"]
+                if result.get("success"):
+                    failures = 0
+                else:
+                    failures += 1
+                    if failures >= TRANSFER_RETRY_COUNT:
+                        raise Exception(result.get("message", "청크 전송 실패"))
+
     def delete_attachment(self, attachment_id):
         """첨부파일 삭제"""
         result = self._request("DELETE", f"/api/attachments/{attachment_id}")
@@ -631,57 +849,103 @@ class ApiClient:
         return None
 
     def download_attachment(self, attachment_id, save_path=None):
-        """첨부파일 다운로드
+        """첨부파일 다운로드 (연결이 끊기면 Range 요청으로 이어받기)
 
         Args:
             attachment_id: 첨부파일 ID
             save_path: 저장할 경로 (없으면 임시 파일에 저장)
+                지정한 경우 중단된 <save_path>.part가 있으면 이어서 받음
 
         Returns:
             (success, file_path or error_message)
         """
-        import tempfile
+        url = f"{self._base_url}/api/attachments/{attachment_id}/download"
+        filename = None
 
         try:
-            response = requests.get(
-                f"{self._base_url}/api/attachments/{attachment_id}/download",
-                headers=self._get_headers(),
-                timeout=(5, 60),  # 다운로드는 더 긴 타임아웃
-                stream=True
-            )
-
-            if response.status_code == 200:
-                # Content-Disposition 헤더에서 파일명 추출
-                content_disp = response.headers.get('content-disposition', '')
-                filename = None
-                if 'filename=' in content_disp:
-                    import re
-                    match = re.search(r'filename[*]?=(?:UTF-8\'\')?([^;\n]+)', content_disp)
-                    if match:
-                        filename = match.group(1).strip('"\'')
-
-                # 저장 경로 결정
-                if save_path:
-                    file_path = save_path
-                else:
-                    suffix = os.path.splitext(filename)[1] if filename else ''
-                    fd, file_path = tempfile.mkstemp(suffix=suffix)
-                    os.close(fd)
-
-                # 파일 저장
-                with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                return True, file_path
+            if save_path:
+                part_path = f"{save_path}.part"
             else:
-                return False, f"다운로드 실패: {response.status_code}"
+                fd, part_path = tempfile.mkstemp(suffix='.part')
+                os.close(fd)
+
+            failures = 0
+            while True:
+                offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                headers = self._get_headers()
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+
+                try:
+                    with self._session.get(url, headers=headers, timeout=TRANSFER_TIMEOUT,
+                                           stream=True) as response:
+                        if response.status_code == 416 and offset:
+                            break  # 이미 모두 받음
+
+                        if response.status_code not in (200, 206):
+                            return False, f"다운로드 실패: {response.status_code}"
+
+                        if response.headers.get('content-type', '').startswith('application/json'):
+                            # 서버 오류 응답 (파일 없음 등)
+                            return False, response.json().get("message", "다운로드 실패")
+
+                        filename = filename or self._parse_filename(response.headers.get('content-disposition', ''))
+
+                        if response.status_code == 206:
+                            mode = 'ab'
+                            total = int(response.headers.get('content-range', '').rsplit('/', 1)[-1])
+                        else:
+                            # 서버가 Range를 무시한 경우 처음부터 다시 받음
+                            mode = 'wb'
+                            total = int(response.headers.get('content-length', -1))
+
+                        with open(part_path, mode) as f:
+                            for chunk in response.iter_content(chunk_size=TRANSFER_READ_SIZE):
+                                f.write(chunk)
+
+                    if total < 0 or os.path.getsize(part_path) >= total:
+                        break
+                    raise requests.exceptions.ChunkedEncodingError("응답이 중간에 끊겼습니다.")
+
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError) as e:
+                    failures += 1
+                    if failures >= TRANSFER_RETRY_COUNT:
+                        return False, f"다운로드 오류: {str(e)}"
+                    print(f"[API] 다운로드 끊김, 이어받기... ({failures}/{TRANSFER_RETRY_COUNT})")
+                    time.sleep(min(2 ** failures * 0.5, 10))
+
+            # 저장 경로 결정
+            if save_path:
+                file_path = save_path
+            else:
+                suffix = os.path.splitext(filename)[1] if filename else ''
+                fd, file_path = tempfile.mkstemp(suffix=suffix)
+                os.close(fd)
+            os.replace(part_path, file_path)
+
+            return True, file_path
 
         except Exception as e:
             return False, f"다운로드 오류: {str(e)}"
 
+    @staticmethod
+    def _parse_filename(content_disp):
+        """Content-Disposition 헤더에서 파일명 추출"""
+        from urllib.parse import unquote
+        match = re.search(r'filename[*]?=(?:UTF-8\'\')?([^;\n]+)', content_disp)
+        if match:
+            return unquote(match.group(1).strip('"\''))
+        return None
+
     # ==================== Settings ====================
 
+    def get_settings_version(self, user_id=None):
+        """설정 버전 조회 (캐시 안 함, user_id 지정 시 사용자 설정)"""
+        params = {"user_id": user_id} if user_id is not None else None
+        result = self._request("GET", "/api/settings-version", params=params)
+        return result.get("data")
+
     def get_settings(self):
         """모든 설정 조회"""
         result = self._request("GET", "/api/settings")
@@ -749,6 +1013,11 @@ class ApiClient:
             print(f"활동 로그 API 기록 실패: {str(e)}")
             return None
 
+    def create_activity_logs_batch(self, entries):
+        """활동 로그 일괄 생성 (실패 시 False - 호출한 쪽에서 재시도)"""
+        result = self._request("POST", "/api/activity-logs/batch", {"logs": entries}, retry_count=1)
+        return bool(result.get("success"))
+
     def get_activity_logs(self, user_id=None, username=None, action_type=None,
                          date_from=None, date_to=None, target_type=None,
                          limit=500, offset=0):
@@ -770,6 +1039,22 @@ class ApiClient:
         result = self._request("GET", "/api/activity-logs", params=params)
         return result.get("data", [])
 
+    def get_activity_log_page(self, cursor=None, limit=100, filters=None):
+        """활동 로그 페이지 조회 (키셋 페이지네이션)
+
+        Returns:
+            {'items': [...], 'next_cursor': str 또는 None, 'has_more': bool}
+        """
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        for key, value in (filters or {}).items():
+            if value:
+                params[key] = value
+
+        result = self._request("GET", "/api/activity-logs/page", params=params)
+        return result.get("data", {'items': [], 'next_cursor': None, 'has_more': False})
+
     def get_user_activity_logs(self, user_id, limit=100, offset=0):
         """특정 사용자의 활동 로그 조회"""
         result = self._request("GET", f"/api/activity-logs/user/{user_id}",
@@ -852,6 +1137,20 @@ class ApiClient:
         result = self._request("GET", f"/api/messages/unread-by-partner/{user_id}")
         return result.get("data", {})
 
+    def get_message_state(self, user_id):
+        """메시지 상태 조회 (마지막 메시지 ID, 미읽음 수, etag)"""
+        result = self._request("GET", f"/api/messages/state/{user_id}")
+        return result.get("data")
+
+    def poll_messages(self, user_id, etag=None, timeout=25):
+        """메시지 변경 대기 (long-poll, 변경되거나 timeout초 지나면 상태 반환)"""
+        params = {"timeout": timeout}
+        if etag:
+            params["etag"] = etag
+        result = self._request("GET", f"/api/messages/poll/{user_id}", params=params,
+                               retry_count=1, timeout=(2, timeout + 10))
+        return result.get("data")
+
     def delete_message(self, message_id, user_id):
         """메시지 삭제"""
         result = self._request("DELETE", f"/api/messages/{message_id}",
@@ -10,23 +10,30 @@ import os
 # API 서버 환경변수 설정 (첨부파일 모델에서 DB 직접 접근하도록)
 os.environ['FOODLAB_API_SERVER'] = 'true'
 
-from fastapi import FastAPI, HTTPException, Depends, Header, File, UploadFile
+from fastapi import FastAPI, HTTPException, Depends, Header, File, UploadFile, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import uvicorn
+import asyncio
 import json
 import secrets
 
 # 기존 모델 import
 from models.users import User, DEPARTMENTS, PERMISSION_LABELS, PERMISSION_BY_CATEGORY
 from models.clients import Client
-from models.schedules import Schedule
+from models.schedules import Schedule, parse_schedule_fields, decode_page_cursor
 from models.fees import Fee
 from models.product_types import ProductType
-from models.schedule_attachments import ScheduleAttachment
-from models.activity_log import ActivityLog, ACTION_TYPES
-from models.communications import Message, EmailLog
+from models.schedule_attachments import ScheduleAttachment, UPLOAD_CHUNK_SIZE
+from models.activity_log import ActivityLog, ACTION_TYPES, decode_log_cursor
+from models.communications import Message, EmailLog, MESSAGE_POLL_TIMEOUT
+from utils.db_executor import run_db, db_executor
+from utils.session_store import create_session_store
+from utils.message_notifier import MessageNotifier
+from utils.catalog_cache import get_catalog_version as get_catalog_version_value
+from models.settings import get_settings_version
+from migrations import ensure_schema
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -44,8 +51,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 세션 저장소 (간단한 토큰 기반 인증)
-sessions = {}
+# 세션 저장소 (토큰 기반 인증)
+# - FOODLAB_SESSION_BACKEND 환경변수로 memory / mysql / file 선택
+# - mysql/file은 여러 워커가 공유하고 재시작 후에도 로그인 유지
+sessions = create_session_store()
+
+
+@app.on_event("startup")
+async def load_schema():
+    """서버 시작 시 스키마 확인 및 스키마 레지스트리 로드 (첫 요청 지연 방지)"""
+    await run_db('schema', ensure_schema)
 
 # API 키 (환경변수로 관리 권장)
 API_SECRET_KEY = "foodlab-api-secret-key-2024"
@@ -162,6 +177,10 @@ class ActivityLogCreate(BaseModel):
     target_id: Optional[int] = None
     target_name: Optional[str] = None
     details: Optional[str] = None
+    created_at: Optional[str] = None  # 클라이언트에서 기록한 시각 (일괄 저장 시)
+
+class ActivityLogBatch(BaseModel):
+    logs: List[ActivityLogCreate]
 
 class ActivityLogFilter(BaseModel):
     user_id: Optional[int] = None
@@ -190,6 +209,18 @@ class EmailLogCreate(BaseModel):
     sent_by: Optional[int] = None
     client_name: Optional[str] = None
 
+class AttachmentUploadInit(BaseModel):
+    file_name: str
+    file_size: int
+    sha256: Optional[str] = None
+
+class AttachmentUploadProof(BaseModel):
+    proofs: List[str]  # 보유 확인 구간별 SHA-256 (hex)
+
+class BulkUpsertRequest(BaseModel):
+    columns: List[str]
+    rows: List[List[Any]]
+
 class EmailLogStatusUpdate(BaseModel):
     status: Optional[str] = None
     received: Optional[str] = None
@@ -209,10 +240,11 @@ def verify_token(authorization: str = Header(None)):
         raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다")
 
     token = authorization.replace("Bearer ", "")
-    if token not in sessions:
+    user = sessions.get(token)
+    if user is None:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
 
-    return sessions[token]
+    return user
 
 
 # ==================== 인증 API ====================
@@ -220,12 +252,12 @@ def verify_token(authorization: str = Header(None)):
 @app.post("/api/auth/login", response_model=LoginResponse)
 async def login(request: LoginRequest):
     """로그인"""
-    user = User.authenticate(request.username, request.password)
+    user = await run_db('auth', User.authenticate, request.username, request.password)
 
     if user:
         # 토큰 생성
         token = secrets.token_urlsafe(32)
-        sessions[token] = user
+        await run_db('auth', sessions.set, token, user)
 
         return LoginResponse(
             success=True,
@@ -242,8 +274,7 @@ async def login(request: LoginRequest):
 async def logout(user: dict = Depends(verify_token), authorization: str = Header(None)):
     """로그아웃"""
     token = authorization.replace("Bearer ", "")
-    if token in sessions:
-        del sessions[token]
+    await run_db('auth', sessions.delete, token)
     return {"success": True, "message": "로그아웃되었습니다"}
 
 @app.get("/api/auth/me")
@@ -257,13 +288,13 @@ async def get_current_user(user: dict = Depends(verify_token)):
 @app.get("/api/users")
 async def get_users(user: dict = Depends(verify_token)):
     """모든 사용자 조회"""
-    users = User.get_all()
+    users = await run_db('users', User.get_all)
     return {"success": True, "data": users}
 
 @app.get("/api/users/{user_id}")
 async def get_user(user_id: int, user: dict = Depends(verify_token)):
     """ID로 사용자 조회"""
-    user_data = User.get_by_id(user_id)
+    user_data = await run_db('users', User.get_by_id, user_id)
     if user_data:
         return {"success": True, "data": user_data}
     raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
@@ -271,7 +302,7 @@ async def get_user(user_id: int, user: dict = Depends(verify_token)):
 @app.post("/api/users")
 async def create_user(request: UserCreate, user: dict = Depends(verify_token)):
     """새 사용자 생성"""
-    user_id = User.create(
+    user_id = await run_db('users', User.create,
         username=request.username,
         password=request.password,
         name=request.name,
@@ -288,7 +319,7 @@ async def create_user(request: UserCreate, user: dict = Depends(verify_token)):
 @app.put("/api/users/{user_id}")
 async def update_user(user_id: int, request: UserUpdate, user: dict = Depends(verify_token)):
     """사용자 정보 수정"""
-    success = User.update(
+    success = await run_db('users', User.update,
         user_id=user_id,
         name=request.name,
         department=request.department,
@@ -301,49 +332,49 @@ async def update_user(user_id: int, request: UserUpdate, user: dict = Depends(ve
 @app.delete("/api/users/{user_id}")
 async def delete_user(user_id: int, user: dict = Depends(verify_token)):
     """사용자 삭제"""
-    success = User.delete(user_id)
+    success = await run_db('users', User.delete, user_id)
     return {"success": success}
 
 @app.post("/api/users/{user_id}/toggle-active")
 async def toggle_user_active(user_id: int, activate: bool = True, user: dict = Depends(verify_token)):
     """사용자 활성화/비활성화"""
-    success = User.toggle_active(user_id, activate)
+    success = await run_db('users', User.toggle_active, user_id, activate)
     return {"success": success}
 
 @app.post("/api/users/{user_id}/reset-password")
 async def reset_user_password(user_id: int, user: dict = Depends(verify_token)):
     """비밀번호 초기화"""
-    success = User.reset_password(user_id)
+    success = await run_db('users', User.reset_password, user_id)
     return {"success": success}
 
 @app.post("/api/users/{user_id}/change-password")
 async def change_user_password(user_id: int, new_password: str, user: dict = Depends(verify_token)):
     """비밀번호 변경"""
-    success = User.update_password(user_id, new_password)
+    success = await run_db('users', User.update_password, user_id, new_password)
     return {"success": success}
 
 @app.post("/api/users/{user_id}/verify-password")
 async def verify_user_password(user_id: int, password: str, user: dict = Depends(verify_token)):
     """비밀번호 확인"""
-    success = User.verify_password(user_id, password)
+    success = await run_db('users', User.verify_password, user_id, password)
     return {"success": success}
 
 @app.post("/api/users/{user_id}/toggle-view-all")
 async def toggle_user_view_all(user_id: int, can_view: bool = True, user: dict = Depends(verify_token)):
     """사용자 열람권한 토글"""
-    success = User.toggle_view_all(user_id, can_view)
+    success = await run_db('users', User.toggle_view_all, user_id, can_view)
     return {"success": success}
 
 @app.get("/api/users/{user_id}/active-status")
 async def get_user_active_status(user_id: int, user: dict = Depends(verify_token)):
     """사용자 활성화 상태 조회"""
-    status = User.get_active_status(user_id)
+    status = await run_db('users', User.get_active_status, user_id)
     return {"success": True, "data": status}
 
 @app.get("/api/users/{user_id}/view-all-status")
 async def get_user_view_all_status(user_id: int, user: dict = Depends(verify_token)):
     """사용자 열람권한 상태 조회"""
-    status = User.get_view_all_status(user_id)
+    status = await run_db('users', User.get_view_all_status, user_id)
     return {"success": True, "data": status}
 
 @app.get("/api/users/constants/departments")
@@ -360,6 +391,15 @@ async def get_permissions():
     }}
 
 
+async def _bulk_upsert(endpoint, func, request):
+    """엑셀 일괄 가져오기 공통 처리 (한 트랜잭션으로 저장)"""
+    try:
+        result = await run_db(endpoint, func, request.columns, request.rows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"success": True, "data": result}
+
+
 # ==================== Clients API ====================
 
 @app.get("/api/clients")
@@ -372,31 +412,35 @@ async def get_clients(
     user: dict = Depends(verify_token)
 ):
     """업체 목록 조회 (페이지네이션)"""
-    result = Client.get_paginated(
-        page=page,
-        per_page=per_page,
-        search_keyword=search_keyword,
-        search_field=search_field,
-        sales_rep_filter=sales_rep_filter
-    )
+    try:
+        result = await run_db('clients', Client.fetch_paginated,
+            page=page,
+            per_page=per_page,
+            search_keyword=search_keyword,
+            search_field=search_field,
+            sales_rep_filter=sales_rep_filter
+        )
+    except Exception as e:
+        # 빈 페이지로 응답하면 내보내기가 중간에 끝난 것을 알 수 없음
+        raise HTTPException(status_code=500, detail=f"업체 목록 조회 오류: {str(e)}")
     return {"success": True, "data": result}
 
 @app.get("/api/clients/all")
 async def get_all_clients(user: dict = Depends(verify_token)):
     """모든 업체 조회"""
-    clients = Client.get_all()
+    clients = await run_db('clients', Client.get_all)
     return {"success": True, "data": clients}
 
 @app.get("/api/clients/count")
 async def get_clients_count(user: dict = Depends(verify_token)):
     """업체 수 조회"""
-    count = Client.get_total_count()
+    count = await run_db('clients', Client.get_total_count)
     return {"success": True, "data": count}
 
 @app.get("/api/clients/{client_id}")
 async def get_client(client_id: int, user: dict = Depends(verify_token)):
     """ID로 업체 조회"""
-    client = Client.get_by_id(client_id)
+    client = await run_db('clients', Client.get_by_id, client_id)
     if client:
         return {"success": True, "data": client}
     raise HTTPException(status_code=404, detail="업체를 찾을 수 없습니다")
@@ -404,27 +448,32 @@ async def get_client(client_id: int, user: dict = Depends(verify_token)):
 @app.post("/api/clients")
 async def create_client(request: ClientCreate, user: dict = Depends(verify_token)):
     """새 업체 생성"""
-    client_id = Client.create(**request.dict())
+    client_id = await run_db('clients', Client.create, **request.dict())
     if client_id:
         return {"success": True, "data": {"id": client_id}}
     raise HTTPException(status_code=400, detail="업체 생성에 실패했습니다")
 
+@app.post("/api/clients/bulk")
+async def bulk_upsert_clients(request: BulkUpsertRequest, user: dict = Depends(verify_token)):
+    """업체 일괄 추가/수정 (엑셀 가져오기)"""
+    return await _bulk_upsert('clients', Client.bulk_upsert, request)
+
 @app.put("/api/clients/{client_id}")
 async def update_client(client_id: int, request: ClientUpdate, user: dict = Depends(verify_token)):
     """업체 정보 수정"""
-    success = Client.update(client_id=client_id, **request.dict())
+    success = await run_db('clients', Client.update, client_id=client_id, **request.dict())
     return {"success": success}
 
 @app.delete("/api/clients/{client_id}")
 async def delete_client(client_id: int, user: dict = Depends(verify_token)):
     """업체 삭제"""
-    success = Client.delete(client_id)
+    success = await run_db('clients', Client.delete, client_id)
     return {"success": success}
 
 @app.get("/api/clients/search/{keyword}")
 async def search_clients(keyword: str, user: dict = Depends(verify_token)):
     """업체 검색"""
-    clients = Client.search(keyword)
+    clients = await run_db('clients', Client.search, keyword)
     return {"success": True, "data": clients}
 
 
@@ -436,24 +485,81 @@ async def get_schedules(
     status: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    sort: str = "desc",
+    keyword_field: Optional[str] = None,
+    keyword_statuses: Optional[str] = None,
+    sales_rep: Optional[str] = None,
     user: dict = Depends(verify_token)
 ):
-    """스케줄 목록 조회 (필터링)"""
+    """스케줄 목록 조회 (필터링)
+
+    fields: 'summary' 또는 쉼표로 구분한 컬럼명 - 필터 없는 목록 조회 / 페이지 조회에 적용
+    limit: 지정하면 키셋 페이지 조회 (cursor, sort, keyword_field, keyword_statuses, sales_rep 사용)
+    """
+    try:
+        columns = parse_schedule_fields(fields)
+        if cursor:
+            decode_page_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if limit:
+        # 페이지 조회 (상태/상태명 검색은 쉼표로 구분한 여러 코드 허용)
+        filters = {
+            'keyword': keyword,
+            'keyword_field': keyword_field,
+            'keyword_statuses': keyword_statuses.split(',') if keyword_statuses else None,
+            'status': status.split(',') if status else None,
+            'sales_rep': sales_rep,
+            'date_from': date_from,
+            'date_to': date_to,
+        }
+        try:
+            page = await run_db('schedules', Schedule.fetch_page,
+                cursor=cursor,
+                limit=limit,
+                filters={k: v for k, v in filters.items() if v},
+                sort=sort,
+                columns=columns
+            )
+        except Exception as e:
+            # 빈 페이지로 응답하면 내보내기가 중간에 끝난 것을 알 수 없음
+            raise HTTPException(status_code=500, detail=f"스케줄 페이지 조회 오류: {str(e)}")
+        return {"success": True, "data": page['items'],
+                "next_cursor": page['next_cursor'], "has_more": page['has_more']}
+
     if keyword or status or date_from or date_to:
-        schedules = Schedule.get_filtered(
+        schedules = await run_db('schedules', Schedule.get_filtered,
             keyword=keyword,
             status=status,
             date_from=date_from,
             date_to=date_to
         )
     else:
-        schedules = Schedule.get_all()
+        schedules = await run_db('schedules', Schedule.get_all, columns=columns)
     return {"success": True, "data": schedules}
 
+@app.get("/api/schedules/changes")
+async def get_schedule_changes(since: Optional[str] = None, fields: Optional[str] = None,
+                               user: dict = Depends(verify_token)):
+    """since 이후 변경된 스케줄 조회 (추가/수정 + 삭제된 ID)"""
+    try:
+        columns = parse_schedule_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    changes = await run_db('schedules', Schedule.get_changes, since, columns=columns)
+    if changes is None:
+        return {"success": False, "message": "변경분 조회 실패"}
+    return {"success": True, "data": changes}
+
 @app.get("/api/schedules/{schedule_id}")
 async def get_schedule(schedule_id: int, user: dict = Depends(verify_token)):
     """ID로 스케줄 조회"""
-    schedule = Schedule.get_by_id(schedule_id)
+    schedule = await run_db('schedules', Schedule.get_by_id, schedule_id)
     if schedule:
         return {"success": True, "data": schedule}
     raise HTTPException(status_code=404, detail="스케줄을 찾을 수 없습니다")
@@ -461,7 +567,7 @@ async def get_schedule(schedule_id: int, user: dict = Depends(verify_token)):
 @app.post("/api/schedules")
 async def create_schedule(request: ScheduleCreate, user: dict = Depends(verify_token)):
     """새 스케줄 생성"""
-    schedule_id = Schedule.create(
+    schedule_id = await run_db('schedules', Schedule.create,
         client_id=request.client_id,
         product_name=request.product_name,
         food_type_id=request.food_type_id,
@@ -491,37 +597,37 @@ async def create_schedule(request: ScheduleCreate, user: dict = Depends(verify_t
 @app.put("/api/schedules/{schedule_id}")
 async def update_schedule(schedule_id: int, request: ScheduleUpdate, user: dict = Depends(verify_token)):
     """스케줄 정보 수정"""
-    success = Schedule.update(schedule_id, request.data)
+    success = await run_db('schedules', Schedule.update, schedule_id, request.data)
     return {"success": success}
 
 @app.patch("/api/schedules/{schedule_id}/status")
 async def update_schedule_status(schedule_id: int, status: str, user: dict = Depends(verify_token)):
     """스케줄 상태 변경"""
-    success = Schedule.update_status(schedule_id, status)
+    success = await run_db('schedules', Schedule.update_status, schedule_id, status)
     return {"success": success}
 
 @app.patch("/api/schedules/{schedule_id}/memo")
 async def update_schedule_memo(schedule_id: int, memo: str, user: dict = Depends(verify_token)):
     """스케줄 메모 수정"""
-    success = Schedule.update_memo(schedule_id, memo)
+    success = await run_db('schedules', Schedule.update_memo, schedule_id, memo)
     return {"success": success}
 
 @app.patch("/api/schedules/{schedule_id}/experiment-data")
 async def update_schedule_experiment_data(schedule_id: int, request: ScheduleUpdate, user: dict = Depends(verify_token)):
     """스케줄 실험 데이터 수정 (experiment_schedule_data, additional_test_items 등)"""
-    success = Schedule.update_experiment_schedule_data(schedule_id, request.data)
+    success = await run_db('schedules', Schedule.update_experiment_schedule_data, schedule_id, request.data)
     return {"success": success}
 
 @app.delete("/api/schedules/{schedule_id}")
 async def delete_schedule(schedule_id: int, user: dict = Depends(verify_token)):
     """스케줄 삭제"""
-    success = Schedule.delete(schedule_id)
+    success = await run_db('schedules', Schedule.delete, schedule_id)
     return {"success": success}
 
 @app.get("/api/schedules/search/{keyword}")
 async def search_schedules(keyword: str, user: dict = Depends(verify_token)):
     """스케줄 검색"""
-    schedules = Schedule.search(keyword)
+    schedules = await run_db('schedules', Schedule.search, keyword)
     return {"success": True, "data": schedules}
 
 
@@ -530,7 +636,7 @@ async def search_schedules(keyword: str, user: dict = Depends(verify_token)):
 @app.get("/api/fees")
 async def get_fees(user: dict = Depends(verify_token)):
     """모든 수수료 조회"""
-    fees = Fee.get_all()
+    fees = await run_db('fees', Fee.get_all)
     # dict 변환
     fees_list = [dict(fee) for fee in fees] if fees else []
     return {"success": True, "data": fees_list}
@@ -538,7 +644,7 @@ async def get_fees(user: dict = Depends(verify_token)):
 @app.get("/api/fees/{test_item}")
 async def get_fee_by_item(test_item: str, user: dict = Depends(verify_token)):
     """검사 항목으로 수수료 조회"""
-    fee = Fee.get_by_item(test_item)
+    fee = await run_db('fees', Fee.get_by_item, test_item)
     if fee:
         return {"success": True, "data": dict(fee)}
     raise HTTPException(status_code=404, detail="수수료를 찾을 수 없습니다")
@@ -546,7 +652,7 @@ async def get_fee_by_item(test_item: str, user: dict = Depends(verify_token)):
 @app.post("/api/fees")
 async def create_fee(request: FeeCreate, user: dict = Depends(verify_token)):
     """새 수수료 생성"""
-    fee_id = Fee.create(
+    fee_id = await run_db('fees', Fee.create,
         test_item=request.test_item,
         food_category=request.food_category,
         price=request.price,
@@ -558,10 +664,43 @@ async def create_fee(request: FeeCreate, user: dict = Depends(verify_token)):
         return {"success": True, "data": {"id": fee_id}}
     raise HTTPException(status_code=400, detail="수수료 생성에 실패했습니다")
 
+@app.post("/api/fees/bulk")
+async def bulk_upsert_fees(request: BulkUpsertRequest, user: dict = Depends(verify_token)):
+    """수수료 일괄 추가/수정 (엑셀 가져오기)"""
+    return await _bulk_upsert('fees', Fee.bulk_upsert, request)
+
+@app.post("/api/fees/import")
+async def import_fees_excel(file: UploadFile = File(...), user: dict = Depends(verify_token)):
+    """수수료 엑셀로 전체 교체 (임시 테이블 적재 후 한 번에 교체)"""
+    import shutil
+    import tempfile
+    from utils.bulk_import import replace_fees_from_excel
+
+    ext = os.path.splitext(file.filename or '')[1].lower()
+    if ext not in ('.xlsx', '.xlsm'):
+        raise HTTPException(status_code=400, detail="엑셀 파일(.xlsx)만 가져올 수 있습니다.")
+
+    def _import():
+        fd, temp_path = tempfile.mkstemp(suffix=ext)
+        try:
+            with os.fdopen(fd, 'wb') as buffer:
+                shutil.copyfileobj(file.file, buffer)
+            return replace_fees_from_excel(temp_path)
+        finally:
+            os.remove(temp_path)
+
+    try:
+        count, errors = await run_db('fees', _import)
+    except (ValueError, RuntimeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수수료 가져오기 오류: {str(e)}")
+    return {"success": True, "data": {"count": count, "errors": errors}}
+
 @app.put("/api/fees/{fee_id}")
 async def update_fee(fee_id: int, request: FeeUpdate, user: dict = Depends(verify_token)):
     """수수료 정보 수정"""
-    success = Fee.update(
+    success = await run_db('fees', Fee.update,
         fee_id=fee_id,
         test_item=request.test_item,
         food_category=request.food_category,
@@ -575,29 +714,48 @@ async def update_fee(fee_id: int, request: FeeUpdate, user: dict = Depends(verif
 @app.delete("/api/fees/{fee_id}")
 async def delete_fee(fee_id: int, user: dict = Depends(verify_token)):
     """수수료 삭제"""
-    success = Fee.delete(fee_id)
+    success = await run_db('fees', Fee.delete, fee_id)
     return {"success": success}
 
 @app.post("/api/fees/calculate")
 async def calculate_fee(test_items: List[str], user: dict = Depends(verify_token)):
     """수수료 계산"""
-    total = Fee.calculate_total_fee(test_items)
+    total = await run_db('fees', Fee.calculate_total_fee, test_items)
     return {"success": True, "data": total}
 
+@app.post("/api/fees/calculate/breakdown")
+async def calculate_fee_breakdown(test_items: List[str], user: dict = Depends(verify_token)):
+    """수수료 항목별 내역 계산"""
+    breakdown = await run_db('fees', Fee.calculate_fee_breakdown, test_items)
+    return {"success": True, "data": breakdown}
+
+@app.post("/api/fees/calculate/batch")
+async def calculate_fee_batch(items_by_key: Dict[str, List[str]], user: dict = Depends(verify_token)):
+    """여러 스케줄의 수수료 일괄 계산 ({키: 검사 항목 목록} -> {키: 총액})"""
+    totals = await run_db('fees', Fee.calculate_total_fees, items_by_key)
+    return {"success": True, "data": totals}
+
+
+@app.get("/api/catalog/version")
+async def get_catalog_version(user: dict = Depends(verify_token)):
+    """수수료/식품 유형 카탈로그 버전 (클라이언트 캐시 무효화 확인용)"""
+    version = await run_db('fees', get_catalog_version_value)
+    return {"success": True, "data": version}
+
 
 # ==================== Product Types API ====================
 
 @app.get("/api/food-types")
 async def get_food_types(user: dict = Depends(verify_token)):
     """모든 식품 유형 조회"""
-    types = ProductType.get_all()
+    types = await run_db('food_types', ProductType.get_all)
     types_list = [dict(t) for t in types] if types else []
     return {"success": True, "data": types_list}
 
 @app.get("/api/food-types/{type_id}")
 async def get_food_type(type_id: int, user: dict = Depends(verify_token)):
     """ID로 식품 유형 조회"""
-    food_type = ProductType.get_by_id(type_id)
+    food_type = await run_db('food_types', ProductType.get_by_id, type_id)
     if food_type:
         return {"success": True, "data": food_type}
     raise HTTPException(status_code=404, detail="식품 유형을 찾을 수 없습니다")
@@ -605,7 +763,7 @@ async def get_food_type(type_id: int, user: dict = Depends(verify_token)):
 @app.get("/api/food-types/name/{type_name}")
 async def get_food_type_by_name(type_name: str, user: dict = Depends(verify_token)):
     """이름으로 식품 유형 조회"""
-    food_type = ProductType.get_by_name(type_name)
+    food_type = await run_db('food_types', ProductType.get_by_name, type_name)
     if food_type:
         return {"success": True, "data": food_type}
     raise HTTPException(status_code=404, detail="식품 유형을 찾을 수 없습니다")
@@ -613,7 +771,7 @@ async def get_food_type_by_name(type_name: str, user: dict = Depends(verify_toke
 @app.post("/api/food-types")
 async def create_food_type(request: ProductTypeCreate, user: dict = Depends(verify_token)):
     """새 식품 유형 생성"""
-    type_id = ProductType.create(
+    type_id = await run_db('food_types', ProductType.create,
         type_name=request.type_name,
         category=request.category,
         sterilization=request.sterilization,
@@ -625,10 +783,15 @@ async def create_food_type(request: ProductTypeCreate, user: dict = Depends(veri
         return {"success": True, "data": {"id": type_id}}
     raise HTTPException(status_code=400, detail="식품 유형 생성에 실패했습니다")
 
+@app.post("/api/food-types/bulk")
+async def bulk_upsert_food_types(request: BulkUpsertRequest, user: dict = Depends(verify_token)):
+    """식품 유형 일괄 추가/수정 (엑셀 가져오기)"""
+    return await _bulk_upsert('food_types', ProductType.bulk_upsert, request)
+
 @app.put("/api/food-types/{type_id}")
 async def update_food_type(type_id: int, request: ProductTypeUpdate, user: dict = Depends(verify_token)):
     """식품 유형 정보 수정"""
-    success = ProductType.update(
+    success = await run_db('food_types', ProductType.update,
         type_id=type_id,
         type_name=request.type_name,
         category=request.category,
@@ -642,13 +805,13 @@ async def update_food_type(type_id: int, request: ProductTypeUpdate, user: dict
 @app.delete("/api/food-types/{type_id}")
 async def delete_food_type(type_id: int, user: dict = Depends(verify_token)):
     """식품 유형 삭제"""
-    success = ProductType.delete(type_id)
+    success = await run_db('food_types', ProductType.delete, type_id)
     return {"success": success}
 
 @app.get("/api/food-types/search/{keyword}")
 async def search_food_types(keyword: str, user: dict = Depends(verify_token)):
     """식품 유형 검색"""
-    types = ProductType.search(keyword)
+    types = await run_db('food_types', ProductType.search, keyword)
     types_list = [dict(t) for t in types] if types else []
     return {"success": True, "data": types_list}
 
@@ -658,31 +821,23 @@ async def search_food_types(keyword: str, user: dict = Depends(verify_token)):
 @app.get("/api/schedules/{schedule_id}/attachments")
 async def get_schedule_attachments(schedule_id: int, user: dict = Depends(verify_token)):
     """스케줄 첨부파일 목록"""
-    attachments = ScheduleAttachment.get_by_schedule(schedule_id)
+    attachments = await run_db('attachments', ScheduleAttachment.get_by_schedule, schedule_id)
     attachments_list = [dict(a) for a in attachments] if attachments else []
     return {"success": True, "data": attachments_list}
 
 
 @app.post("/api/schedules/{schedule_id}/attachments")
 async def upload_attachment(schedule_id: int, file: UploadFile = File(...), user: dict = Depends(verify_token)):
-    """첨부파일 업로드"""
-    import tempfile
-    import shutil
-
+    """첨부파일 업로드 (단일 요청, 이전 버전 클라이언트용 - 최종 폴더에 바로 저장)"""
     try:
-        # 임시 파일에 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-            shutil.copyfileobj(file.file, tmp)
-            tmp_path = tmp.name
+        def _save():
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+            file.file.seek(0)
+            return ScheduleAttachment.save_stream(schedule_id, file.filename, file.file, file_size)
 
-        # ScheduleAttachment.add() 사용
-        success, message, attachment_id = ScheduleAttachment.add(schedule_id, tmp_path)
-
-        # 임시 파일 삭제
-        try:
-            os.unlink(tmp_path)
-        except:
-            pass
+        # 디스크 I/O도 DB 스레드 풀에서 실행
+        success, message, attachment_id = await run_db('attachments', _save)
 
         if success:
             return {"success": True, "message": message, "attachment_id": attachment_id}
@@ -693,36 +848,173 @@ async def upload_attachment(schedule_id: int, file: UploadFile = File(...), user
         return {"success": False, "message": f"업로드 오류: {str(e)}"}
 
 
+@app.post("/api/schedules/{schedule_id}/attachments/uploads")
+async def begin_attachment_upload(schedule_id: int, request: AttachmentUploadInit,
+                                  user: dict = Depends(verify_token)):
+    """분할 업로드 시작"""
+    success, message, info = await run_db(
+        'attachments', ScheduleAttachment.begin_upload,
+        schedule_id, request.file_name, request.file_size, request.sha256
+    )
+    if success:
+        return {"success": True, "data": info}
+    return {"success": False, "message": message}
+
+
+@app.get("/api/schedules/{schedule_id}/attachments/uploads/{upload_id}")
+async def get_attachment_upload(schedule_id: int, upload_id: str, user: dict = Depends(verify_token)):
+    """분할 업로드 진행 상태 (연결이 끊긴 뒤 이어서 보낼 위치 확인)"""
+    info = await run_db('attachments', ScheduleAttachment.get_upload_status, schedule_id, upload_id)
+    if info:
+        return {"success": True, "data": info}
+    return {"success": False, "message": "업로드 정보를 찾을 수 없습니다."}
+
+
+@app.put("/api/schedules/{schedule_id}/attachments/uploads/{upload_id}")
+async def put_attachment_chunk(schedule_id: int, upload_id: str, offset: int, request: Request,
+                               x_chunk_sha256: Optional[str] = Header(None),
+                               user: dict = Depends(verify_token)):
+    """분할 업로드 청크 수신 (본문: 청크 바이트, offset: 시작 위치)"""
+    too_large = {"success": False, "message": "청크 크기가 너무 큽니다."}
+    # 본문을 읽기 전에 Content-Length로 거부하고, 길이가 없으면 읽으면서 크기 제한
+    content_length = request.headers.get('content-length')
+    if content_length is not None and (not content_length.isdigit() or int(content_length) > UPLOAD_CHUNK_SIZE):
+        return too_large
+    body = bytearray()
+    async for part in request.stream():
+        body.extend(part)
+        if len(body) > UPLOAD_CHUNK_SIZE:
+            return too_large
+    data = bytes(body)
+    success, message, received = await run_db(
+        'attachments', ScheduleAttachment.write_upload_chunk,
+        schedule_id, upload_id, offset, data, x_chunk_sha256
+    )
+    return {"success": success, "message": message, "received": received}
+
+
+@app.post("/api/schedules/{schedule_id}/attachments/uploads/{upload_id}/complete")
+async def complete_attachment_upload(schedule_id: int, upload_id: str, user: dict = Depends(verify_token)):
+    """분할 업로드 완료 (체크섬 확인 후 첨부파일 등록)"""
+    success, message, attachment_id = await run_db(
+        'attachments', ScheduleAttachment.complete_upload, schedule_id, upload_id
+    )
+    if success:
+        return {"success": True, "message": message, "attachment_id": attachment_id}
+    return {"success": False, "message": message}
+
+
+@app.post("/api/schedules/{schedule_id}/attachments/uploads/{upload_id}/link")
+async def link_attachment_upload(schedule_id: int, upload_id: str, request: AttachmentUploadProof,
+                                 user: dict = Depends(verify_token)):
+    """같은 내용이 이미 있으면 보유 확인 후 전송 없이 등록"""
+    success, message, attachment_id = await run_db(
+        'attachments', ScheduleAttachment.link_upload, schedule_id, upload_id, request.proofs
+    )
+    if success:
+        return {"success": True, "message": message, "attachment_id": attachment_id}
+    return {"success": False, "message": message}
+
+
+@app.delete("/api/schedules/{schedule_id}/attachments/uploads/{upload_id}")
+async def abort_attachment_upload(schedule_id: int, upload_id: str, user: dict = Depends(verify_token)):
+    """분할 업로드 취소"""
+    success = await run_db('attachments', ScheduleAttachment.abort_upload, schedule_id, upload_id)
+    return {"success": success}
+
+
 @app.get("/api/attachments/{attachment_id}")
 async def get_attachment(attachment_id: int, user: dict = Depends(verify_token)):
     """첨부파일 정보 조회"""
-    attachment = ScheduleAttachment.get_by_id(attachment_id)
+    attachment = await run_db('attachments', ScheduleAttachment.get_by_id, attachment_id)
     if attachment:
         return {"success": True, "data": dict(attachment)}
     return {"success": False, "message": "첨부파일을 찾을 수 없습니다."}
 
 
 @app.get("/api/attachments/{attachment_id}/download")
-async def download_attachment(attachment_id: int, user: dict = Depends(verify_token)):
-    """첨부파일 다운로드"""
-    from fastapi.responses import FileResponse
-
-    file_path = ScheduleAttachment.get_file_path(attachment_id)
-    if file_path and os.path.exists(file_path):
-        attachment = ScheduleAttachment.get_by_id(attachment_id)
-        filename = attachment['file_name'] if attachment else os.path.basename(file_path)
+async def download_attachment(attachment_id: int, range: Optional[str] = Header(None),
+                              user: dict = Depends(verify_token)):
+    """첨부파일 다운로드 (Range 요청 지원 - 끊긴 다운로드 이어받기)"""
+    from fastapi.responses import FileResponse, Response, StreamingResponse
+    from urllib.parse import quote
+
+    file_path = await run_db('attachments', ScheduleAttachment.get_file_path, attachment_id)
+    if not file_path or not os.path.exists(file_path):
+        return {"success": False, "message": "파일을 찾을 수 없습니다."}
+
+    attachment = await run_db('attachments', ScheduleAttachment.get_by_id, attachment_id)
+    filename = attachment['file_name'] if attachment else os.path.basename(file_path)
+
+    file_size = os.path.getsize(file_path)
+    byte_range = _parse_byte_range(range, file_size)
+    if byte_range is None:
         return FileResponse(
             path=file_path,
             filename=filename,
-            media_type='application/octet-stream'
+            media_type='application/octet-stream',
+            headers={"Accept-Ranges": "bytes"}
         )
-    return {"success": False, "message": "파일을 찾을 수 없습니다."}
+    if byte_range is False:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{file_size}"})
+
+    start, end = byte_range
+
+    def _iter_range():
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    return StreamingResponse(
+        _iter_range(),
+        status_code=206,
+        media_type='application/octet-stream',
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{file_size}",
+            "Content-Length": str(end - start + 1),
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+        }
+    )
+
+
+def _parse_byte_range(range_header, file_size):
+    """Range 헤더(bytes=시작-끝) 해석
+
+    Returns:
+        None: Range 없음/해석 불가 (전체 전송) / False: 범위 밖 / (start, end)
+    """
+    if not range_header or not range_header.startswith('bytes='):
+        return None
+    spec = range_header[len('bytes='):].split(',')[0].strip()
+    start_text, _, end_text = spec.partition('-')
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else file_size - 1
+        elif end_text:
+            # bytes=-N : 마지막 N바이트
+            start = max(file_size - int(end_text), 0)
+            end = file_size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+    if start >= file_size or start > end:
+        return False
+    return start, min(end, file_size - 1)
 
 
 @app.delete("/api/attachments/{attachment_id}")
 async def delete_attachment(attachment_id: int, user: dict = Depends(verify_token)):
     """첨부파일 삭제"""
-    success, message = ScheduleAttachment.delete(attachment_id)
+    success, message = await run_db('attachments', ScheduleAttachment.delete, attachment_id)
     return {"success": success, "message": message}
 
 
@@ -735,36 +1027,54 @@ async def create_activity_log(request: ActivityLogCreate, user: dict = Depends(v
         # ACTION_TYPES에서 action_name 가져오기
         action_name = ACTION_TYPES.get(request.action_type, request.action_type)
 
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO activity_logs
-            (user_id, username, user_name, department, action_type, action_name,
-             target_type, target_id, target_name, details)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ''', (
-            request.user_id,
-            request.username,
-            request.user_name,
-            request.department or '',
-            request.action_type,
-            action_name,
-            request.target_type,
-            request.target_id,
-            request.target_name,
-            request.details
-        ))
-
-        log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        def _insert():
+            from database import get_connection
+            from utils.activity_log_storage import add_to_summary
+            from utils.activity_log_writer import now_text
+            conn = get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                INSERT INTO activity_logs
+                (user_id, username, user_name, department, action_type, action_name,
+                 target_type, target_id, target_name, details)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ''', (
+                request.user_id,
+                request.username,
+                request.user_name,
+                request.department or '',
+                request.action_type,
+                action_name,
+                request.target_type,
+                request.target_id,
+                request.target_name,
+                request.details
+            ))
+
+            log_id = cursor.lastrowid
+            # 사용자별 요약 증분 반영 (같은 트랜잭션)
+            add_to_summary(cursor, [(request.user_id, request.username, request.user_name,
+                                     request.department or '',
+                                     now_text())])
+            conn.commit()
+            conn.close()
+            return log_id
+
+        log_id = await run_db('activity_logs', _insert)
 
         return {"success": True, "data": {"id": log_id}}
     except Exception as e:
         return {"success": False, "message": str(e)}
 
+@app.post("/api/activity-logs/batch")
+async def create_activity_logs_batch(request: ActivityLogBatch, user: dict = Depends(verify_token)):
+    """활동 로그 일괄 생성 (클라이언트 버퍼에 모인 로그, 다중 행 INSERT 한 번)"""
+    # created_at은 insert_batch에서 DB 시각 기준 허용 지연 범위로 제한
+    entries = [log.dict() for log in request.logs]
+    count = await run_db('activity_logs', ActivityLog.insert_batch, entries)
+    return {"success": True, "data": {"count": count}}
+
 @app.get("/api/activity-logs")
 async def get_activity_logs(
     user_id: Optional[int] = None,
@@ -792,9 +1102,46 @@ async def get_activity_logs(
     if target_type:
         filters['target_type'] = target_type
 
-    logs = ActivityLog.get_all(limit=limit, offset=offset, filters=filters if filters else None)
+    logs = await run_db('activity_logs', ActivityLog.get_all, limit=limit, offset=offset, filters=filters if filters else None)
     return {"success": True, "data": logs}
 
+@app.get("/api/activity-logs/page")
+async def get_activity_log_page(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    user_id: Optional[int] = None,
+    username: Optional[str] = None,
+    action_type: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    target_type: Optional[str] = None,
+    user: dict = Depends(verify_token)
+):
+    """활동 로그 페이지 조회 (키셋 페이지네이션 - cursor는 이전 응답의 next_cursor)"""
+    filters = {}
+    if user_id:
+        filters['user_id'] = user_id
+    if username:
+        filters['username'] = username
+    if action_type:
+        filters['action_type'] = action_type
+    if date_from:
+        filters['date_from'] = date_from
+    if date_to:
+        filters['date_to'] = date_to
+    if target_type:
+        filters['target_type'] = target_type
+
+    if cursor:
+        try:
+            decode_log_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    page = await run_db('activity_logs', ActivityLog.get_page, cursor=cursor, limit=limit,
+                        filters=filters if filters else None)
+    return {"success": True, "data": page}
+
 @app.get("/api/activity-logs/user/{target_user_id}")
 async def get_user_activity_logs(
     target_user_id: int,
@@ -803,13 +1150,13 @@ async def get_user_activity_logs(
     user: dict = Depends(verify_token)
 ):
     """특정 사용자의 활동 로그 조회"""
-    logs = ActivityLog.get_by_user(target_user_id, limit=limit, offset=offset)
+    logs = await run_db('activity_logs', ActivityLog.get_by_user, target_user_id, limit=limit, offset=offset)
     return {"success": True, "data": logs}
 
 @app.get("/api/activity-logs/summary")
 async def get_activity_logs_summary(user: dict = Depends(verify_token)):
     """사용자별 활동 요약"""
-    summary = ActivityLog.get_user_summary()
+    summary = await run_db('activity_logs', ActivityLog.get_user_summary)
     return {"success": True, "data": summary}
 
 @app.get("/api/activity-logs/count")
@@ -834,7 +1181,7 @@ async def get_activity_logs_count(
     if date_to:
         filters['date_to'] = date_to
 
-    count = ActivityLog.get_count(filters if filters else None)
+    count = await run_db('activity_logs', ActivityLog.get_count, filters if filters else None)
     return {"success": True, "data": count}
 
 @app.get("/api/activity-logs/action-types")
@@ -845,10 +1192,13 @@ async def get_action_types(user: dict = Depends(verify_token)):
 
 # ==================== Messages API ====================
 
+# 새 메시지/읽음 변경 알림 (long-poll 대기 요청을 깨움)
+message_notifier = MessageNotifier(Message.get_change_token)
+
 @app.post("/api/messages")
 async def send_message(request: MessageCreate, user: dict = Depends(verify_token)):
     """메시지 전송"""
-    message_id = Message.send(
+    message_id = await run_db('messages', Message.send,
         sender_id=request.sender_id,
         receiver_id=request.receiver_id,
         content=request.content,
@@ -856,9 +1206,43 @@ async def send_message(request: MessageCreate, user: dict = Depends(verify_token
         subject=request.subject
     )
     if message_id:
+        message_notifier.notify()
         return {"success": True, "data": {"id": message_id}}
     return {"success": False, "message": "메시지 전송 실패"}
 
+@app.get("/api/messages/state/{target_user_id}")
+async def get_message_state(target_user_id: int, user: dict = Depends(verify_token)):
+    """메시지 상태 조회 (마지막 메시지 ID, 미읽음 수, etag)"""
+    state = await run_db('messages', Message.get_message_state, target_user_id)
+    if state is None:
+        raise HTTPException(status_code=500, detail="메시지 상태 조회 실패")
+    return {"success": True, "data": state}
+
+@app.get("/api/messages/poll/{target_user_id}")
+async def poll_messages(
+    target_user_id: int,
+    etag: Optional[str] = None,
+    timeout: int = MESSAGE_POLL_TIMEOUT,
+    user: dict = Depends(verify_token)
+):
+    """메시지 변경 대기 (long-poll)
+
+    상태 etag가 클라이언트가 보낸 값과 다르면 바로 응답하고,
+    같으면 변경 알림이 오거나 timeout초가 지날 때까지 대기
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0, min(timeout, MESSAGE_POLL_TIMEOUT))
+    while True:
+        # 상태 조회 전에 이벤트를 받아 둠 (조회 ~ 대기 사이의 알림도 놓치지 않음)
+        event = message_notifier.current_event()
+        state = await run_db('messages', Message.get_message_state, target_user_id)
+        if state is None:
+            raise HTTPException(status_code=500, detail="메시지 상태 조회 실패")
+        remaining = deadline - loop.time()
+        if state['etag'] != etag or remaining <= 0:
+            return {"success": True, "data": state, "changed": state['etag'] != etag}
+        await message_notifier.wait(remaining, event)
+
 @app.get("/api/messages/conversation")
 async def get_conversation(
     user1_id: int,
@@ -867,49 +1251,53 @@ async def get_conversation(
     user: dict = Depends(verify_token)
 ):
     """두 사용자 간 대화 내역 조회"""
-    messages = Message.get_conversation(user1_id, user2_id, limit)
+    messages = await run_db('messages', Message.get_conversation, user1_id, user2_id, limit)
     return {"success": True, "data": messages}
 
 @app.get("/api/messages/partners/{target_user_id}")
 async def get_chat_partners(target_user_id: int, user: dict = Depends(verify_token)):
     """대화 상대 목록 조회"""
-    partners = Message.get_chat_partners(target_user_id)
+    partners = await run_db('messages', Message.get_chat_partners, target_user_id)
     return {"success": True, "data": partners}
 
 @app.post("/api/messages/{message_id}/read")
 async def mark_message_read(message_id: int, target_user_id: int, user: dict = Depends(verify_token)):
     """메시지 읽음 처리"""
-    success = Message.mark_as_read(message_id, target_user_id)
+    success = await run_db('messages', Message.mark_as_read, message_id, target_user_id)
+    message_notifier.notify()
     return {"success": success}
 
 @app.post("/api/messages/conversation/read")
 async def mark_conversation_read(target_user_id: int, partner_id: int, user: dict = Depends(verify_token)):
     """대화 전체 읽음 처리"""
-    count = Message.mark_conversation_as_read(target_user_id, partner_id)
+    count = await run_db('messages', Message.mark_conversation_as_read, target_user_id, partner_id)
+    message_notifier.notify()
     return {"success": True, "data": count}
 
 @app.get("/api/messages/unread-count/{target_user_id}")
 async def get_unread_count(target_user_id: int, user: dict = Depends(verify_token)):
     """읽지 않은 메시지 수"""
-    count = Message.get_unread_count(target_user_id)
+    count = await run_db('messages', Message.get_unread_count, target_user_id)
     return {"success": True, "data": count}
 
 @app.get("/api/messages/unread-by-partner/{target_user_id}")
 async def get_unread_by_partner(target_user_id: int, user: dict = Depends(verify_token)):
     """상대별 읽지 않은 메시지 수"""
-    unread = Message.get_unread_by_partner(target_user_id)
+    unread = await run_db('messages', Message.get_unread_by_partner, target_user_id)
     return {"success": True, "data": unread}
 
 @app.delete("/api/messages/{message_id}")
 async def delete_message(message_id: int, target_user_id: int, user: dict = Depends(verify_token)):
     """메시지 삭제"""
-    success = Message.delete_message(message_id, target_user_id)
+    success = await run_db('messages', Message.delete_message, message_id, target_user_id)
+    message_notifier.notify()
     return {"success": success}
 
 @app.delete("/api/messages/conversation/{partner_id}")
 async def delete_conversation(partner_id: int, target_user_id: int, user: dict = Depends(verify_token)):
     """대화 전체 삭제"""
-    count = Message.delete_conversation(target_user_id, partner_id)
+    count = await run_db('messages', Message.delete_conversation, target_user_id, partner_id)
+    message_notifier.notify()
     return {"success": True, "data": count}
 
 
@@ -918,7 +1306,7 @@ async def delete_conversation(partner_id: int, target_user_id: int, user: dict =
 @app.post("/api/email-logs")
 async def create_email_log(request: EmailLogCreate, user: dict = Depends(verify_token)):
     """이메일 로그 저장"""
-    log_id = EmailLog.save(
+    log_id = await run_db('email_logs', EmailLog.save,
         schedule_id=request.schedule_id,
         estimate_type=request.estimate_type,
         sender_email=request.sender_email,
@@ -941,13 +1329,13 @@ async def get_email_logs(
     user: dict = Depends(verify_token)
 ):
     """이메일 로그 목록 조회"""
-    logs = EmailLog.get_all(limit=limit, sent_by=sent_by)
+    logs = await run_db('email_logs', EmailLog.get_all, limit=limit, sent_by=sent_by)
     return {"success": True, "data": logs}
 
 @app.get("/api/email-logs/{log_id}")
 async def get_email_log(log_id: int, user: dict = Depends(verify_token)):
     """이메일 로그 상세 조회"""
-    log = EmailLog.get_by_id(log_id)
+    log = await run_db('email_logs', EmailLog.get_by_id, log_id)
     if log:
         return {"success": True, "data": log}
     return {"success": False, "message": "이메일 로그를 찾을 수 없습니다"}
@@ -955,7 +1343,7 @@ async def get_email_log(log_id: int, user: dict = Depends(verify_token)):
 @app.get("/api/email-logs/schedule/{schedule_id}")
 async def get_email_logs_by_schedule(schedule_id: int, user: dict = Depends(verify_token)):
     """스케줄별 이메일 로그 조회"""
-    logs = EmailLog.get_by_schedule(schedule_id)
+    logs = await run_db('email_logs', EmailLog.get_by_schedule, schedule_id)
     return {"success": True, "data": logs}
 
 @app.get("/api/email-logs/search")
@@ -968,7 +1356,7 @@ async def search_email_logs(
     user: dict = Depends(verify_token)
 ):
     """이메일 로그 검색"""
-    logs = EmailLog.search(
+    logs = await run_db('email_logs', EmailLog.search,
         keyword=keyword,
         start_date=start_date,
         end_date=end_date,
@@ -980,13 +1368,13 @@ async def search_email_logs(
 @app.delete("/api/email-logs/{log_id}")
 async def delete_email_log(log_id: int, target_user_id: Optional[int] = None, user: dict = Depends(verify_token)):
     """이메일 로그 삭제"""
-    success = EmailLog.delete(log_id, target_user_id)
+    success = await run_db('email_logs', EmailLog.delete, log_id, target_user_id)
     return {"success": success}
 
 @app.put("/api/email-logs/{log_id}/status")
 async def update_email_log_status(log_id: int, request: EmailLogStatusUpdate, user: dict = Depends(verify_token)):
     """이메일 로그 상태 업데이트"""
-    success = EmailLog.update_status(
+    success = await run_db('email_logs', EmailLog.update_status,
         log_id,
         status=request.status,
         received=request.received,
@@ -997,17 +1385,83 @@ async def update_email_log_status(log_id: int, request: EmailLogStatusUpdate, us
 
 # ==================== Settings API ====================
 
+def _select_settings(user_id=None):
+    """설정 전체 조회 (user_id 지정 시 사용자별 설정) - DB 스레드에서 실행"""
+    from database import get_connection
+    conn = get_connection()
+    cursor = conn.cursor()
+    if user_id is None:
+        cursor.execute("SELECT `key`, value FROM settings")
+    else:
+        cursor.execute("SELECT `key`, value FROM user_settings WHERE user_id = %s", (user_id,))
+    settings = cursor.fetchall()
+    conn.close()
+    return {s['key']: s['value'] for s in settings}
+
+
+def _select_setting(key, user_id=None):
+    """특정 설정 조회 (없으면 None) - DB 스레드에서 실행"""
+    from database import get_connection
+    conn = get_connection()
+    cursor = conn.cursor()
+    if user_id is None:
+        cursor.execute("SELECT value FROM settings WHERE `key` = %s", (key,))
+    else:
+        cursor.execute("SELECT value FROM user_settings WHERE user_id = %s AND `key` = %s", (user_id, key))
+    result = cursor.fetchone()
+    conn.close()
+    return result
+
+
+def _upsert_settings(settings, user_id=None):
+    """설정 저장 (업데이트 후 없으면 추가) - DB 스레드에서 실행"""
+    from database import get_connection
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    for key, value in settings.items():
+        # 먼저 업데이트 시도
+        if user_id is None:
+            cursor.execute("""
+                UPDATE settings SET value = %s, updated_at = CURRENT_TIMESTAMP
+                WHERE `key` = %s
+            """, (value, key))
+        else:
+            cursor.execute("""
+                UPDATE user_settings SET value = %s
+                WHERE user_id = %s AND `key` = %s
+            """, (value, user_id, key))
+
+        # 업데이트된 행이 없으면 새로 추가
+        if cursor.rowcount == 0:
+            if user_id is None:
+                cursor.execute("""
+                    INSERT INTO settings (`key`, value) VALUES (%s, %s)
+                """, (key, value))
+            else:
+                cursor.execute("""
+                    INSERT INTO user_settings (user_id, `key`, value) VALUES (%s, %s, %s)
+                """, (user_id, key, value))
+
+    conn.commit()
+    conn.close()
+
+
+@app.get("/api/settings-version")
+async def get_settings_version_api(user_id: Optional[int] = None, user: dict = Depends(verify_token)):
+    """설정 버전 조회 (클라이언트 설정 스냅샷 갱신 확인용, user_id 지정 시 사용자 설정)"""
+    try:
+        version = await run_db('settings', get_settings_version, user_id)
+        return {"success": True, "data": version}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/settings")
 async def get_settings(user: dict = Depends(verify_token)):
     """설정 목록 조회"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT `key`, value FROM settings")
-        settings = cursor.fetchall()
-        conn.close()
-        settings_dict = {s['key']: s['value'] for s in settings}
+        settings_dict = await run_db('settings', _select_settings)
         return {"success": True, "data": settings_dict}
     except Exception as e:
         return {"success": False, "error": str(e), "data": {}}
@@ -1016,12 +1470,7 @@ async def get_settings(user: dict = Depends(verify_token)):
 async def get_setting(key: str, user: dict = Depends(verify_token)):
     """특정 설정 조회"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE `key` = %s", (key,))
-        result = cursor.fetchone()
-        conn.close()
+        result = await run_db('settings', _select_setting, key)
         if result:
             return {"success": True, "data": result['value']}
         return {"success": False, "data": None, "message": "설정을 찾을 수 없습니다"}
@@ -1033,24 +1482,7 @@ async def get_setting(key: str, user: dict = Depends(verify_token)):
 async def update_setting(key: str, value: str, user: dict = Depends(verify_token)):
     """설정 업데이트"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # 먼저 업데이트 시도
-        cursor.execute("""
-            UPDATE settings SET value = %s, updated_at = CURRENT_TIMESTAMP
-            WHERE `key` = %s
-        """, (value, key))
-
-        # 업데이트된 행이 없으면 새로 추가
-        if cursor.rowcount == 0:
-            cursor.execute("""
-                INSERT INTO settings (`key`, value) VALUES (%s, %s)
-            """, (key, value))
-
-        conn.commit()
-        conn.close()
+        await run_db('settings', _upsert_settings, {key: value})
         return {"success": True, "message": "설정이 저장되었습니다"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1060,23 +1492,7 @@ async def update_setting(key: str, value: str, user: dict = Depends(verify_token
 async def update_settings_batch(settings: Dict[str, str], user: dict = Depends(verify_token)):
     """여러 설정 일괄 업데이트"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        for key, value in settings.items():
-            cursor.execute("""
-                UPDATE settings SET value = %s, updated_at = CURRENT_TIMESTAMP
-                WHERE `key` = %s
-            """, (value, key))
-
-            if cursor.rowcount == 0:
-                cursor.execute("""
-                    INSERT INTO settings (`key`, value) VALUES (%s, %s)
-                """, (key, value))
-
-        conn.commit()
-        conn.close()
+        await run_db('settings', _upsert_settings, settings)
         return {"success": True, "message": f"{len(settings)}개 설정이 저장되었습니다"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1088,13 +1504,7 @@ async def update_settings_batch(settings: Dict[str, str], user: dict = Depends(v
 async def get_user_settings(user_id: int, user: dict = Depends(verify_token)):
     """사용자별 설정 조회"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT `key`, value FROM user_settings WHERE user_id = %s", (user_id,))
-        settings = cursor.fetchall()
-        conn.close()
-        settings_dict = {s['key']: s['value'] for s in settings}
+        settings_dict = await run_db('settings', _select_settings, user_id=user_id)
         return {"success": True, "data": settings_dict}
     except Exception as e:
         return {"success": False, "error": str(e), "data": {}}
@@ -1104,12 +1514,7 @@ async def get_user_settings(user_id: int, user: dict = Depends(verify_token)):
 async def get_user_setting(user_id: int, key: str, user: dict = Depends(verify_token)):
     """사용자별 특정 설정 조회"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM user_settings WHERE user_id = %s AND `key` = %s", (user_id, key))
-        result = cursor.fetchone()
-        conn.close()
+        result = await run_db('settings', _select_setting, key, user_id=user_id)
         if result:
             return {"success": True, "data": result['value']}
         return {"success": False, "data": None, "message": "설정을 찾을 수 없습니다"}
@@ -1121,24 +1526,7 @@ async def get_user_setting(user_id: int, key: str, user: dict = Depends(verify_t
 async def update_user_setting(user_id: int, key: str, value: str, user: dict = Depends(verify_token)):
     """사용자별 설정 업데이트"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # 먼저 업데이트 시도
-        cursor.execute("""
-            UPDATE user_settings SET value = %s
-            WHERE user_id = %s AND `key` = %s
-        """, (value, user_id, key))
-
-        # 업데이트된 행이 없으면 새로 추가
-        if cursor.rowcount == 0:
-            cursor.execute("""
-                INSERT INTO user_settings (user_id, `key`, value) VALUES (%s, %s, %s)
-            """, (user_id, key, value))
-
-        conn.commit()
-        conn.close()
+        await run_db('settings', _upsert_settings, {key: value}, user_id=user_id)
         return {"success": True, "message": "설정이 저장되었습니다"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1148,23 +1536,7 @@ async def update_user_setting(user_id: int, key: str, value: str, user: dict = D
 async def update_user_settings_batch(user_id: int, settings: Dict[str, str], user: dict = Depends(verify_token)):
     """사용자별 여러 설정 일괄 업데이트"""
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        for key, value in settings.items():
-            cursor.execute("""
-                UPDATE user_settings SET value = %s
-                WHERE user_id = %s AND `key` = %s
-            """, (value, user_id, key))
-
-            if cursor.rowcount == 0:
-                cursor.execute("""
-                    INSERT INTO user_settings (user_id, `key`, value) VALUES (%s, %s, %s)
-                """, (user_id, key, value))
-
-        conn.commit()
-        conn.close()
+        await run_db('settings', _upsert_settings, settings, user_id=user_id)
         return {"success": True, "message": f"{len(settings)}개 설정이 저장되었습니다"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1215,29 +1587,16 @@ async def upload_company_image(image_type: str, file: UploadFile = File(...), us
                 os.remove(old_file)
 
         # 파일 저장
-        with open(dest_path, 'wb') as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        def _save_file():
+            with open(dest_path, 'wb') as buffer:
+                shutil.copyfileobj(file.file, buffer)
 
-        # 설정에 경로 저장
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
+        await run_db('settings', _save_file)
 
+        # 설정에 경로 저장
         setting_key = f"{image_type}_path"
         setting_value = f"server:{image_type}"  # 서버 이미지 표시
-
-        cursor.execute("""
-            UPDATE settings SET value = %s, updated_at = CURRENT_TIMESTAMP
-            WHERE `key` = %s
-        """, (setting_value, setting_key))
-
-        if cursor.rowcount == 0:
-            cursor.execute("""
-                INSERT INTO settings (`key`, value) VALUES (%s, %s)
-            """, (setting_key, setting_value))
-
-        conn.commit()
-        conn.close()
+        await run_db('settings', _upsert_settings, {setting_key: setting_value})
 
         return {
             "success": True,
@@ -1319,15 +1678,18 @@ async def delete_company_image(image_type: str, user: dict = Depends(verify_toke
 
     # 설정에서 경로 삭제
     try:
-        from database import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
+        def _clear_path():
+            from database import get_connection
+            conn = get_connection()
+            cursor = conn.cursor()
 
-        setting_key = f"{image_type}_path"
-        cursor.execute("UPDATE settings SET value = '' WHERE `key` = %s", (setting_key,))
+            setting_key = f"{image_type}_path"
+            cursor.execute("UPDATE settings SET value = '' WHERE `key` = %s", (setting_key,))
 
-        conn.commit()
-        conn.close()
+            conn.commit()
+            conn.close()
+
+        await run_db('settings', _clear_path)
     except:
         pass
 
@@ -1363,7 +1725,7 @@ async def get_db_config():
 @app.get("/api/debug/db-stats")
 async def get_db_stats():
     """데이터베이스 통계 확인 (진단용)"""
-    try:
+    def _count_tables():
         from database import get_connection
         conn = get_connection()
         cursor = conn.cursor()
@@ -1381,24 +1743,64 @@ async def get_db_stats():
                 stats[table] = "error"
 
         conn.close()
+        return stats
+
+    try:
+        stats = await run_db('debug', _count_tables)
         return {"success": True, "data": stats}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@app.get("/api/debug/executor-stats")
+async def get_executor_stats():
+    """DB 실행기 스레드 풀/엔드포인트별 대기열 지표 (진단용)"""
+    return {"success": True, "data": db_executor.get_stats()}
+
+
 # ==================== 서버 실행 ====================
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="FoodLab API 서버")
+    parser.add_argument("--prod", action="store_true",
+                        help="운영 모드 (멀티 워커, 자동 재시작 없음)")
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("FOODLAB_API_WORKERS", os.cpu_count() or 1)),
+                        help="운영 모드 워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
     print("=" * 50)
     print("FoodLab API 서버 시작")
     print("=" * 50)
-    print("접속 주소: http://0.0.0.0:8000")
-    print("API 문서: http://0.0.0.0:8000/docs")
-    print("=" * 50)
-
-    uvicorn.run(
-        "api_server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+    print(f"접속 주소: http://{args.host}:{args.port}")
+    print(f"API 문서: http://{args.host}:{args.port}/docs")
+
+    if args.prod:
+        workers = max(1, args.workers)
+        backend = os.environ.get("FOODLAB_SESSION_BACKEND", "mysql").lower()
+        print(f"운영 모드: 워커 {workers}개, 세션 저장소: {backend}")
+        if workers > 1 and backend == "memory":
+            print("[경고] memory 세션 저장소는 워커 간 공유되지 않습니다 (mysql 또는 file 사용 권장)")
+        print("=" * 50)
+
+        uvicorn.run(
+            "api_server:app",
+            host=args.host,
+            port=args.port,
+            workers=workers,
+            reload=False
+        )
+    else:
+        print("개발 모드: 단일 프로세스, 자동 재시작")
+        print("=" * 50)
+
+        uvicorn.run(
+            "api_server:app",
+            host=args.host,
+            port=args.port,
+            reload=True
+        )
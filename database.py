@@ -31,6 +31,9 @@ except ImportError:
 # 설정 파일 경로
 CONFIG_PATH = 'config/db_config.json'
 
+# 연결 풀 최대 연결 수 (API 서버 DB 실행기 스레드 수와 공유)
+POOL_MAX_CONNECTIONS = 20
+
 # 연결 풀 (싱글톤)
 _connection_pool = None
 _pool_lock = threading.Lock()
@@ -107,7 +110,7 @@ def _get_pool():
         try:
             _connection_pool = PooledDB(
                 creator=pymysql,
-                maxconnections=20,  # 최대 연결 수
+                maxconnections=POOL_MAX_CONNECTIONS,  # 최대 연결 수
                 mincached=3,        # 최소 유휴 연결 수
                 maxcached=10,       # 최대 유휴 연결 수
                 maxusage=None,      # 연결 재사용 횟수 (None=무제한)
@@ -123,7 +126,7 @@ def _get_pool():
                 cursorclass=pymysql.cursors.DictCursor,
                 autocommit=False
             )
-            print(f"[DB] 연결 풀 초기화 완료 (최대 {20}개 연결)")
+            print(f"[DB] 연결 풀 초기화 완료 (최대 {POOL_MAX_CONNECTIONS}개 연결)")
         except Exception as e:
             print(f"[DB] 연결 풀 초기화 실패: {e}")
             _connection_pool = None
@@ -175,7 +178,15 @@ def test_connection():
         return False, str(e)
 
 def init_database():
-    '''데이터베이스 초기화 및 테이블 생성'''
+    '''데이터베이스 초기화 및 테이블 생성
+
+    스키마 버전이 최신이면 DDL 확인 없이 바로 종료
+    '''
+    from migrations import get_schema_version, ensure_schema, LATEST_VERSION
+    if get_schema_version() >= LATEST_VERSION:
+        print("데이터베이스 스키마 최신 상태 (초기화 생략)")
+        return
+
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -394,51 +405,32 @@ def init_database():
     VALUES (%s, %s, %s, %s)
     ''', ('admin', 'admin123', '관리자', 'admin'))
 
-    # 수수료 데이터가 비어있으면 cash_db.xlsx에서 자동 가져오기
     cursor.execute("SELECT COUNT(*) as cnt FROM fees")
-    if cursor.fetchone()['cnt'] == 0:
-        # cash_db.xlsx 파일 찾기
-        excel_paths = ['cash_db.xlsx', '../cash_db.xlsx', 'data/cash_db.xlsx']
-        excel_file = None
-        for path in excel_paths:
-            if os.path.exists(path):
-                excel_file = path
-                break
+    fees_empty = cursor.fetchone()['cnt'] == 0
+
+    conn.commit()
+    conn.close()
+
+    # 기본 테이블 이후 추가된 컬럼/테이블/인덱스 적용
+    # (방금 만든 테이블이 반영되도록 스키마 레지스트리는 다시 로드)
+    from schema_registry import schema_registry
+    schema_registry.invalidate()
+    ensure_schema()
 
+    # 수수료 데이터가 비어있으면 cash_db.xlsx에서 자동 가져오기
+    if fees_empty:
+        excel_paths = ['cash_db.xlsx', '../cash_db.xlsx', 'data/cash_db.xlsx']
+        excel_file = next((path for path in excel_paths if os.path.exists(path)), None)
         if excel_file:
             try:
-                import openpyxl
-                wb = openpyxl.load_workbook(excel_file)
-                ws = wb.active
-
-                # Excel 데이터 삽입 (첫 번째 행은 헤더)
-                inserted_count = 0
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    display_order, food_category, test_item, price, sample_qty = row
-
-                    if not test_item:
-                        continue
-
-                    display_order = display_order if display_order is not None else 100
-                    food_category = food_category if food_category else ""
-                    price = price if price is not None else 0
-                    sample_qty = int(sample_qty) if sample_qty is not None else 0
-
-                    cursor.execute('''
-                        INSERT INTO fees (test_item, food_category, price, description, display_order, sample_quantity)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    ''', (test_item, food_category, price, "", display_order, sample_qty))
-                    inserted_count += 1
-
-                print(f"cash_db.xlsx에서 {inserted_count}개 수수료 데이터 자동 로드 완료!")
+                from utils.bulk_import import replace_fees_from_excel
+                count, _ = replace_fees_from_excel(excel_file)
+                print(f"cash_db.xlsx에서 {count}개 수수료 데이터 자동 로드 완료!")
             except ImportError:
                 print("openpyxl 모듈이 없어 Excel 파일을 로드할 수 없습니다.")
             except Exception as e:
                 print(f"Excel 파일 로드 중 오류: {e}")
 
-    conn.commit()
-    conn.close()
-
     print("데이터베이스 초기화 완료!")
 
 
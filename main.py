@@ -222,6 +222,10 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # 견적서 일괄 생성 프로세스 풀 (실행파일에서 작업자 프로세스 시작 처리)
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     try:
         main()
     except Exception as e:
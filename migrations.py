@@ -0,0 +1,488 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+데이터베이스 스키마 마이그레이션
+- 모델별로 흩어져 있던 컬럼/테이블 확인(_ensure_*)을 버전별 마이그레이션 목록으로 통합
+- 적용된 버전은 schema_version 테이블에 기록하여 최신이면 DDL 확인 없이 바로 사용
+- 여러 클라이언트/API 워커가 동시에 시작해도 GET_LOCK으로 한 곳에서만 적용
+- 컬럼/인덱스 존재 여부는 schema_registry(information_schema 한 번 조회)에서 확인
+'''
+
+import threading
+import time
+
+from database import get_connection
+from schema_registry import schema_registry
+from utils.chosung import fill_client_chosung, fill_schedule_chosung
+from utils.activity_log_storage import convert_to_partitioned
+
+
+# 마이그레이션 작업 형식
+# - 'SQL 문자열': 그대로 실행 (CREATE TABLE IF NOT EXISTS 등)
+# - ('column', 테이블, 컬럼, 정의): 컬럼이 없으면 추가
+# - ('index', 테이블, 인덱스명, 컬럼 목록): 인덱스가 없으면 추가
+# - 함수: func(cursor) 호출 (SQL로 계산할 수 없는 기존 데이터 채우기)
+MIGRATIONS = [
+    (1, '모델별 추가 컬럼/테이블 통합', [
+        # schedules - 견적/보고서 관련 추가 컬럼
+        ('column', 'schedules', 'estimate_date', 'TEXT'),
+        ('column', 'schedules', 'expected_date', 'TEXT'),
+        ('column', 'schedules', 'interim_report_date', 'TEXT'),
+        ('column', 'schedules', 'supply_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'tax_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'total_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'is_urgent', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'report_date', 'TEXT'),
+        ('column', 'schedules', 'report1_date', 'TEXT'),
+        ('column', 'schedules', 'report2_date', 'TEXT'),
+        ('column', 'schedules', 'report3_date', 'TEXT'),
+        ('column', 'schedules', 'interim1_round', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'interim2_round', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'interim3_round', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_period_days', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_period_months', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_period_years', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_experiment_days', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_rounds', 'INTEGER DEFAULT 0'),
+        # 1차 견적 필드 (최초 생성 시 고정)
+        ('column', 'schedules', 'first_item_detail', 'TEXT'),
+        ('column', 'schedules', 'first_cost_per_test', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_rounds_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_report_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_interim_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_formula_text', 'TEXT'),
+        ('column', 'schedules', 'first_supply_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_tax_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'first_total_amount', 'INTEGER DEFAULT 0'),
+        # 중단 견적 필드 (중단 시점 저장)
+        ('column', 'schedules', 'suspend_item_detail', 'TEXT'),
+        ('column', 'schedules', 'suspend_cost_per_test', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_rounds_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_report_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_interim_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_formula_text', 'TEXT'),
+        ('column', 'schedules', 'suspend_supply_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_tax_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'suspend_total_amount', 'INTEGER DEFAULT 0'),
+        # 연장 견적 필드 (연장 설정 시 저장)
+        ('column', 'schedules', 'extend_item_detail', 'TEXT'),
+        ('column', 'schedules', 'extend_cost_per_test', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_rounds_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_report_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_interim_cost', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_formula_text', 'TEXT'),
+        ('column', 'schedules', 'extend_supply_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_tax_amount', 'INTEGER DEFAULT 0'),
+        ('column', 'schedules', 'extend_total_amount', 'INTEGER DEFAULT 0'),
+        # 견적서 Remark (견적서 유형별)
+        ('column', 'schedules', 'remark_first', 'TEXT'),
+        ('column', 'schedules', 'remark_suspend', 'TEXT'),
+        ('column', 'schedules', 'remark_extend', 'TEXT'),
+        # 변경분 동기화용 수정 시각
+        ('column', 'schedules', 'updated_at',
+         'TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+
+        # users
+        ('column', 'users', 'department', "VARCHAR(255) DEFAULT ''"),
+        ('column', 'users', 'permissions', "VARCHAR(2000) DEFAULT '{}'"),
+        ('column', 'users', 'email', "VARCHAR(255) DEFAULT ''"),
+        ('column', 'users', 'phone', "VARCHAR(50) DEFAULT ''"),
+        ('column', 'users', 'is_active', "INT DEFAULT 0"),
+        ('column', 'users', 'can_view_all', "INT DEFAULT 0"),  # 열람권한: 1=모든 데이터 열람 가능, 0=본인 데이터만
+
+        # clients
+        ('column', 'clients', 'detail_address', 'TEXT'),
+
+        # fees
+        ('column', 'fees', 'display_order', 'INTEGER DEFAULT 100'),
+        ('column', 'fees', 'sample_quantity', 'INTEGER DEFAULT 0'),
+
+        # 스케줄 삭제 기록 (변경분 조회 시 삭제된 스케줄 전달)
+        '''
+        CREATE TABLE IF NOT EXISTS schedule_tombstones (
+            schedule_id INT PRIMARY KEY,
+            deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_schedule_tombstones_deleted_at (deleted_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+
+        # 활동 로그
+        '''
+        CREATE TABLE IF NOT EXISTS activity_logs (
+            id INT PRIMARY KEY AUTO_INCREMENT,
+            user_id INT NOT NULL,
+            username VARCHAR(100) NOT NULL,
+            user_name VARCHAR(100) NOT NULL,
+            department VARCHAR(100),
+            action_type VARCHAR(50) NOT NULL,
+            action_name VARCHAR(100) NOT NULL,
+            target_type VARCHAR(50),
+            target_id INT,
+            target_name VARCHAR(200),
+            details TEXT,
+            ip_address VARCHAR(50),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+        ''',
+
+        # 메시지 / 읽음 상태 / 이메일 발송 로그
+        '''
+        CREATE TABLE IF NOT EXISTS messages (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            sender_id INT NOT NULL,
+            receiver_id INT,
+            message_type VARCHAR(50) DEFAULT 'chat',
+            subject VARCHAR(255),
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_sender (sender_id),
+            INDEX idx_receiver (receiver_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS message_reads (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            message_id INT NOT NULL,
+            user_id INT NOT NULL,
+            read_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE KEY unique_read (message_id, user_id),
+            INDEX idx_message (message_id),
+            INDEX idx_user (user_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS email_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            schedule_id INT,
+            estimate_type VARCHAR(50),
+            sender_email VARCHAR(255),
+            to_emails TEXT,
+            cc_emails TEXT,
+            subject VARCHAR(500),
+            body TEXT,
+            attachment_name VARCHAR(255),
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            sent_by INT,
+            client_name VARCHAR(255),
+            status VARCHAR(50) DEFAULT '정상',
+            received VARCHAR(10) DEFAULT '아니오',
+            received_at TIMESTAMP NULL,
+            INDEX idx_schedule (schedule_id),
+            INDEX idx_sent_at (sent_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        ('column', 'email_logs', 'status', "VARCHAR(50) DEFAULT '정상'"),
+        ('column', 'email_logs', 'received', "VARCHAR(10) DEFAULT '아니오'"),
+        ('column', 'email_logs', 'received_at', 'TIMESTAMP NULL'),
+
+        # 스케줄 첨부파일
+        '''
+        CREATE TABLE IF NOT EXISTS schedule_attachments (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            schedule_id INT NOT NULL,
+            file_name VARCHAR(255) NOT NULL,
+            file_path VARCHAR(500) NOT NULL,
+            file_size INT DEFAULT 0,
+            file_type VARCHAR(50),
+            uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (schedule_id) REFERENCES schedules (id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+
+        # 자주 사용하는 수신자 목록
+        '''
+        CREATE TABLE IF NOT EXISTS frequent_recipients (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            recipient_ids TEXT NOT NULL,
+            cc_ids TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+
+        # API 서버 로그인 세션 (utils/session_store.py)
+        '''
+        CREATE TABLE IF NOT EXISTS api_sessions (
+            token VARCHAR(64) PRIMARY KEY,
+            user_id INT,
+            user_data TEXT NOT NULL,
+            expires_at DATETIME NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_api_sessions_expires (expires_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+    ]),
+
+    # 조회 조건에 맞춘 인덱스
+    # - schedules.client_id, user_settings(user_id, key)는 외래키/UNIQUE KEY 인덱스가 이미 있음
+    (2, '조회 조건 인덱스 추가', [
+        ('index', 'schedules', 'idx_schedules_status_created', ['status', 'created_at']),
+        ('index', 'schedules', 'idx_schedules_created_id', ['created_at', 'id']),
+        ('index', 'schedules', 'idx_schedules_updated_at', ['updated_at']),
+        ('index', 'clients', 'idx_clients_sales_rep', ['sales_rep']),
+        ('index', 'clients', 'idx_clients_name', ['name']),
+        ('index', 'fees', 'idx_fees_test_item', ['test_item']),
+        ('index', 'fees', 'idx_fees_display_order', ['display_order', 'test_item']),
+        ('index', 'activity_logs', 'idx_activity_logs_user_created', ['user_id', 'created_at']),
+        ('index', 'activity_logs', 'idx_activity_logs_created_at', ['created_at']),
+        ('index', 'activity_logs', 'idx_activity_logs_action_type', ['action_type']),
+        ('index', 'messages', 'idx_messages_receiver_created', ['receiver_id', 'created_at']),
+        ('index', 'messages', 'idx_messages_pair_created', ['sender_id', 'receiver_id', 'created_at']),
+        ('index', 'message_reads', 'idx_message_reads_user_message', ['user_id', 'message_id']),
+        ('index', 'email_logs', 'idx_email_logs_sent_by', ['sent_by', 'sent_at']),
+        ('index', 'schedule_attachments', 'idx_schedule_attachments_schedule',
+         ['schedule_id', 'uploaded_at']),
+    ]),
+
+    # 대화 요약 (사용자별 대화 상대 목록/미읽음 수를 메시지 이력 크기와 무관하게 조회)
+    # - 참여자마다 한 행 (user_id 기준 상대방 partner_id)
+    # - Message 쓰기(send/읽음/삭제)와 같은 트랜잭션에서 갱신
+    (3, '대화 요약 테이블 추가', [
+        '''
+        CREATE TABLE IF NOT EXISTS conversations (
+            user_id INT NOT NULL,
+            partner_id INT NOT NULL,
+            last_message_id INT NOT NULL,
+            last_message_time TIMESTAMP NULL,
+            last_message VARCHAR(200),
+            message_count INT NOT NULL DEFAULT 0,
+            unread_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, partner_id),
+            INDEX idx_conversations_user_time (user_id, last_message_time)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        # 기존 메시지 이력으로 초기 데이터 채우기
+        '''
+        INSERT IGNORE INTO conversations
+            (user_id, partner_id, last_message_id, last_message_time, last_message,
+             message_count, unread_count)
+        SELECT t.user_id, t.partner_id, m.id, m.created_at, LEFT(m.content, 200),
+               t.message_count,
+               (SELECT COUNT(*) FROM messages u
+                WHERE u.sender_id = t.partner_id AND u.receiver_id = t.user_id
+                AND NOT EXISTS (SELECT 1 FROM message_reads r
+                                WHERE r.message_id = u.id AND r.user_id = t.user_id))
+        FROM (
+            SELECT user_id, partner_id, MAX(last_id) as last_id, SUM(cnt) as message_count
+            FROM (
+                SELECT sender_id as user_id, receiver_id as partner_id, MAX(id) as last_id, COUNT(*) as cnt
+                FROM messages
+                WHERE receiver_id IS NOT NULL AND sender_id != receiver_id
+                GROUP BY sender_id, receiver_id
+                UNION ALL
+                SELECT receiver_id, sender_id, MAX(id), COUNT(*)
+                FROM messages
+                WHERE receiver_id IS NOT NULL AND sender_id != receiver_id
+                GROUP BY receiver_id, sender_id
+            ) pairs
+            GROUP BY user_id, partner_id
+        ) t
+        JOIN messages m ON m.id = t.last_id
+        ''',
+    ]),
+
+    # 첨부파일 내용 주소 저장소 (SHA-256 기준 한 벌만 보관)
+    # - 참조 수는 schedule_attachments.sha256 행 수로 계산 (스케줄 삭제 CASCADE에도 정확)
+    # - 기존 첨부파일(sha256 NULL)은 스케줄별 폴더의 파일을 그대로 사용
+    (4, '첨부파일 내용 주소 저장소 추가', [
+        '''
+        CREATE TABLE IF NOT EXISTS attachment_blobs (
+            sha256 CHAR(64) PRIMARY KEY,
+            file_path VARCHAR(500) NOT NULL,
+            file_size BIGINT NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        ('column', 'schedule_attachments', 'sha256', 'CHAR(64) NULL'),
+        ('index', 'schedule_attachments', 'idx_schedule_attachments_sha256', ['sha256']),
+    ]),
+
+    # 업체 초성 검색 (초성은 저장 시 계산, 바이너리 비교로 ㄱ/ㄲ 등을 구분)
+    (5, '업체 초성 검색 컬럼 추가', [
+        ('column', 'clients', 'name_chosung', 'VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin'),
+        ('column', 'clients', 'ceo_chosung', 'VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin'),
+        ('column', 'clients', 'contact_chosung', 'VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin'),
+        fill_client_chosung,
+    ]),
+
+    # 활동 로그 월별 파티션 + 사용자별 요약 테이블
+    # - 보관 기간 정리는 파티션 DROP, 목록은 (created_at, id) 키셋 페이지네이션
+    # - 파티션 테이블은 외래 키를 지원하지 않으므로 users 외래 키는 제거됨
+    (6, '활동 로그 월별 파티션 및 요약 테이블', [
+        convert_to_partitioned,
+    ]),
+
+    # 스케줄 샘플명 초성 검색 (초성 검색도 서버에서 필터링해 페이지 단위로 조회)
+    (7, '스케줄 샘플명 초성 검색 컬럼 추가', [
+        ('column', 'schedules', 'product_name_chosung', 'VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin'),
+        fill_schedule_chosung,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# 마이그레이션 동시 실행 방지용 MySQL 잠금 이름
+_MIGRATION_LOCK_NAME = 'foodlab_schema_migration'
+
+# 프로세스 내 확인 여부 (앱 실행 중 한 번만)
+_schema_checked = False
+_schema_lock = threading.Lock()
+
+# 확인 실패 후 다시 시도하기까지 대기 (초) - 권한 부족 등 계속 실패할 때
+# 모델 호출마다 잠금 대기/DDL을 반복하지 않도록
+SCHEMA_RETRY_INTERVAL = 60
+_schema_failed_at = None  # 마지막 실패 시각 (time.monotonic)
+
+# 마지막으로 확인한 스키마 버전 (최신이면 다시 조회하지 않음)
+_known_version = 0
+
+
+def _ensure_version_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        description VARCHAR(255),
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    ''')
+
+
+def get_schema_version(cursor=None):
+    '''현재 적용된 스키마 버전 (버전 테이블이 없으면 0)
+
+    스키마 레지스트리를 먼저 로드하므로 이후 컬럼/인덱스 확인은 메모리에서 처리
+    '''
+    global _known_version
+    if _known_version >= LATEST_VERSION:
+        return _known_version
+
+    own_conn = None
+    if cursor is None:
+        own_conn = get_connection()
+        cursor = own_conn.cursor()
+    try:
+        if not schema_registry.is_loaded():
+            schema_registry.load(cursor)
+        if not schema_registry.has_table('schema_version'):
+            return 0
+        cursor.execute("SELECT MAX(version) as version FROM schema_version")
+        row = cursor.fetchone()
+        _known_version = (row['version'] or 0) if row else 0
+        return _known_version
+    except Exception:
+        return 0
+    finally:
+        if own_conn is not None:
+            own_conn.close()
+
+
+def _apply_operation(cursor, operation):
+    '''마이그레이션 작업 하나 적용 (이미 적용된 상태면 건너뜀)'''
+    if callable(operation):
+        operation(cursor)
+        schema_registry.load(cursor)
+        return
+
+    if isinstance(operation, str):
+        cursor.execute(operation)
+        # CREATE TABLE 등으로 생긴 컬럼/인덱스 반영 (마이그레이션 적용 시에만 실행)
+        schema_registry.load(cursor)
+        return
+
+    kind = operation[0]
+    if kind == 'column':
+        _, table, column, definition = operation
+        if not schema_registry.has_column(table, column):
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            schema_registry.add_column(table, column)
+            print(f"[마이그레이션] {table} 컬럼 추가: {column}")
+    elif kind == 'index':
+        _, table, index_name, columns = operation
+        if not schema_registry.has_index(table, index_name):
+            cursor.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(columns)})")
+            schema_registry.add_index(table, index_name)
+            print(f"[마이그레이션] {table} 인덱스 추가: {index_name}")
+    else:
+        raise ValueError(f"알 수 없는 마이그레이션 작업: {kind}")
+
+
+def run_migrations():
+    '''적용되지 않은 마이그레이션을 순서대로 적용
+
+    Returns:
+        적용 후 스키마 버전
+    '''
+    global _known_version
+    if _known_version >= LATEST_VERSION:
+        return _known_version
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        if get_schema_version(cursor) >= LATEST_VERSION:
+            return LATEST_VERSION
+
+        _ensure_version_table(cursor)
+        conn.commit()
+
+        # 다른 클라이언트/워커와 동시에 적용하지 않도록 잠금
+        cursor.execute("SELECT GET_LOCK(%s, 60) as locked", (_MIGRATION_LOCK_NAME,))
+        row = cursor.fetchone()
+        if not row or not row['locked']:
+            raise Exception("스키마 마이그레이션 잠금을 얻지 못했습니다.")
+
+        try:
+            # 잠금 대기 중 다른 곳에서 적용했을 수 있으므로 레지스트리와 버전을 다시 확인
+            schema_registry.load(cursor)
+            current = get_schema_version(cursor)
+            for version, description, operations in MIGRATIONS:
+                if version <= current:
+                    continue
+                print(f"[마이그레이션] v{version} 적용 중: {description}")
+                for operation in operations:
+                    _apply_operation(cursor, operation)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                    (version, description)
+                )
+                conn.commit()
+                current = version
+                _known_version = version
+            return current
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (_MIGRATION_LOCK_NAME,))
+    finally:
+        conn.close()
+
+
+def _in_retry_wait():
+    '''마지막 실패 후 재시도 대기 중인지'''
+    failed_at = _schema_failed_at
+    return failed_at is not None and time.monotonic() - failed_at < SCHEMA_RETRY_INTERVAL
+
+
+def ensure_schema():
+    '''스키마가 최신인지 확인하고 필요하면 마이그레이션 (프로세스당 한 번, 내부망/API 서버 전용)
+
+    실패하면 SCHEMA_RETRY_INTERVAL초 동안은 다시 시도하지 않음
+    '''
+    global _schema_checked, _schema_failed_at
+    if _schema_checked or _in_retry_wait():
+        return
+
+    with _schema_lock:
+        if _schema_checked or _in_retry_wait():
+            return
+        try:
+            run_migrations()
+            _schema_checked = True
+            _schema_failed_at = None
+        except Exception as e:
+            # 확인 완료로 표시하지 않음 - 대기 시간이 지난 뒤 호출에서 다시 시도
+            _schema_failed_at = time.monotonic()
+            print(f"[마이그레이션] 스키마 확인 중 오류: {str(e)}")
@@ -74,68 +74,111 @@ ACTION_TYPES = {
 }
 
 
+# 다음 달 파티션 확인 여부 (프로세스당 한 번)
+_partitions_checked = False
+
+# 목록 조회 컬럼 (SELECT * 대신 필요한 컬럼만)
+_LIST_COLUMNS = (
+    "id, user_id, username, user_name, department, action_type, action_name, "
+    "target_type, target_id, target_name, details, created_at"
+)
+
+# 페이지 조회 기본/최대 건수
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_log_cursor(log):
+    """페이지 커서 생성 (마지막 행의 created_at|id)"""
+    created_at = log.get('created_at')
+    if isinstance(created_at, datetime.datetime):
+        created_at = created_at.strftime('%Y-%m-%d %H:%M:%S')
+    return f"{created_at or ''}|{log['id']}"
+
+
+def decode_log_cursor(cursor):
+    """페이지 커서 해석 -> (created_at, id)
+
+    Raises:
+        ValueError: 잘못된 커서 형식
+    """
+    created_at, _, log_id = (cursor or '').rpartition('|')
+    if not created_at:
+        raise ValueError(f"잘못된 커서: {cursor}")
+    return created_at.replace('T', ' '), int(log_id)
+
+
+def _build_where(filters):
+    """필터 조건 -> (WHERE 절, 파라미터) - 모든 조건이 인덱스를 사용하도록 범위/앞부분 일치로 변환"""
+    conditions = []
+    params = []
+    filters = filters or {}
+
+    if filters.get('user_id'):
+        conditions.append("user_id = %s")
+        params.append(filters['user_id'])
+
+    if filters.get('username'):
+        # 아이디 앞부분 일치 (인덱스 사용)
+        conditions.append("username LIKE %s")
+        params.append(filters['username'].replace('%', r'\%').replace('_', r'\_') + '%')
+
+    if filters.get('action_type'):
+        conditions.append("action_type = %s")
+        params.append(filters['action_type'])
+
+    if filters.get('date_from'):
+        conditions.append("created_at >= %s")
+        params.append(f"{filters['date_from']} 00:00:00")
+
+    if filters.get('date_to'):
+        # date_to 당일 포함 (다음 날 0시 미만)
+        date_to = datetime.datetime.strptime(filters['date_to'], '%Y-%m-%d') + datetime.timedelta(days=1)
+        conditions.append("created_at < %s")
+        params.append(date_to.strftime('%Y-%m-%d 00:00:00'))
+
+    if filters.get('target_type'):
+        conditions.append("target_type = %s")
+        params.append(filters['target_type'])
+
+    where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+    return where, params
+
+
 class ActivityLog:
     @staticmethod
     def _ensure_table():
-        """activity_logs 테이블이 없으면 생성 (내부망 전용)"""
+        """activity_logs 테이블이 없으면 생성 (스키마 마이그레이션, 내부망 전용)
+
+        다음 달 파티션도 프로세스당 한 번 확인 (없으면 추가)
+        """
+        global _partitions_checked
         # 외부망에서는 테이블 생성 시도 안함
         if not _is_internal_mode():
             return
+        from migrations import ensure_schema
+        ensure_schema()
 
+        if _partitions_checked:
+            return
+        _partitions_checked = True
         try:
+            from utils.activity_log_storage import ensure_future_partitions
             conn = _get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS activity_logs (
-                id INT PRIMARY KEY AUTO_INCREMENT,
-                user_id INT NOT NULL,
-                username VARCHAR(100) NOT NULL,
-                user_name VARCHAR(100) NOT NULL,
-                department VARCHAR(100),
-                action_type VARCHAR(50) NOT NULL,
-                action_name VARCHAR(100) NOT NULL,
-                target_type VARCHAR(50),
-                target_id INT,
-                target_name VARCHAR(200),
-                details TEXT,
-                ip_address VARCHAR(50),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-            ''')
-
-            # 인덱스 생성 (빠른 검색을 위해) - 이미 존재하면 무시
             try:
-                cursor.execute('''
-                CREATE INDEX idx_activity_logs_user_id ON activity_logs (user_id)
-                ''')
-            except:
-                pass  # 인덱스가 이미 존재함
-
-            try:
-                cursor.execute('''
-                CREATE INDEX idx_activity_logs_created_at ON activity_logs (created_at)
-                ''')
-            except:
-                pass  # 인덱스가 이미 존재함
-
-            try:
-                cursor.execute('''
-                CREATE INDEX idx_activity_logs_action_type ON activity_logs (action_type)
-                ''')
-            except:
-                pass  # 인덱스가 이미 존재함
-
-            conn.commit()
-            conn.close()
+                ensure_future_partitions(conn.cursor())
+            finally:
+                conn.close()
         except Exception as e:
-            print(f"activity_logs 테이블 생성 중 오류: {str(e)}")
+            print(f"활동 로그 파티션 확인 중 오류: {str(e)}")
 
     @staticmethod
     def log(user, action_type, target_type=None, target_id=None, target_name=None, details=None):
         """
-        사용자 활동 로그 기록 (Dual-mode)
+        사용자 활동 로그 기록 (비동기, Dual-mode)
+
+        버퍼에 넣고 바로 반환하며, 백그라운드 스레드가 모아서 저장
+        (utils/activity_log_writer.py)
 
         Args:
             user: 현재 로그인한 사용자 정보 (dict)
@@ -152,105 +195,96 @@ class ActivityLog:
         if isinstance(details, dict):
             details = json.dumps(details, ensure_ascii=False)
 
-        # 연결 모드에 따라 분기
+        from utils.activity_log_writer import activity_log_writer, now_text
+        activity_log_writer.submit({
+            'user_id': user.get('id'),
+            'username': user.get('username', ''),
+            'user_name': user.get('name', ''),
+            'department': user.get('department', '') or '',
+            'action_type': action_type,
+            'target_type': target_type,
+            'target_id': target_id,
+            'target_name': target_name,
+            'details': details,
+            'created_at': now_text(),
+        })
+        return None
+
+    @staticmethod
+    def write_batch(entries):
+        """버퍼에 모인 로그 일괄 저장 (Dual-mode, 실패 시 예외 - 기록기가 재시도)
+
+        Args:
+            entries: [{'user_id', 'username', 'user_name', 'department', 'action_type',
+                       'target_type', 'target_id', 'target_name', 'details', 'created_at'}, ...]
+        """
         if _is_internal_mode():
-            return ActivityLog._log_to_db(user, action_type, target_type, target_id, target_name, details)
+            ActivityLog.insert_batch(entries)
         else:
-            return ActivityLog._log_to_api(user, action_type, target_type, target_id, target_name, details)
+            api = _get_api()
+            if not api.create_activity_logs_batch(entries):
+                raise Exception("활동 로그 일괄 저장 API 호출 실패")
 
     @staticmethod
-    def _log_to_db(user, action_type, target_type, target_id, target_name, details):
-        """내부망: MySQL 직접 저장"""
-        try:
-            ActivityLog._ensure_table()
+    def insert_batch(entries):
+        """활동 로그 다중 행 INSERT (한 트랜잭션) - 내부망 / API 서버 전용
 
-            conn = _get_connection()
-            cursor = conn.cursor()
+        created_at은 DB 시각 기준 [현재 - MAX_QUEUE_LAG, 현재] 범위로 제한
+        (PC 시계가 틀려도 다른 월 파티션 / 요약에 들어가지 않도록)
 
-            # 활동 유형 이름 가져오기
-            action_name = ACTION_TYPES.get(action_type, action_type)
+        Returns:
+            저장한 건수
+        """
+        if not entries:
+            return 0
+        from utils.activity_log_storage import add_to_summary
+        from utils.activity_log_writer import clamp_created_at
+        ActivityLog._ensure_table()
 
-            cursor.execute('''
+        conn = _get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT NOW() AS now")
+            now = cursor.fetchone()['now']
+            params = [(
+                entry.get('user_id'),
+                entry.get('username', ''),
+                entry.get('user_name', ''),
+                entry.get('department') or '',
+                entry['action_type'],
+                ACTION_TYPES.get(entry['action_type'], entry['action_type']),
+                entry.get('target_type'),
+                entry.get('target_id'),
+                entry.get('target_name'),
+                entry.get('details'),
+                clamp_created_at(entry.get('created_at'), now),
+            ) for entry in entries]
+
+            # executemany는 VALUES (...), (...) 한 문장으로 전송
+            cursor.executemany('''
                 INSERT INTO activity_logs
                 (user_id, username, user_name, department, action_type, action_name,
-                 target_type, target_id, target_name, details)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                user.get('id'),
-                user.get('username', ''),
-                user.get('name', ''),
-                user.get('department', ''),
-                action_type,
-                action_name,
-                target_type,
-                target_id,
-                target_name,
-                details
-            ))
-
-            log_id = cursor.lastrowid
+                 target_type, target_id, target_name, details, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ''', params)
+            # 사용자별 요약 증분 반영 (같은 트랜잭션)
+            add_to_summary(cursor, [p[:4] + (p[10],) for p in params])
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
             conn.close()
-
-            return log_id
-        except Exception as e:
-            print(f"활동 로그 DB 기록 중 오류: {str(e)}")
-            return None
-
-    @staticmethod
-    def _log_to_api(user, action_type, target_type, target_id, target_name, details):
-        """외부망: API 호출"""
-        try:
-            api = _get_api()
-            log_id = api.create_activity_log(
-                user_id=user.get('id'),
-                username=user.get('username', ''),
-                user_name=user.get('name', ''),
-                department=user.get('department', ''),
-                action_type=action_type,
-                target_type=target_type,
-                target_id=target_id,
-                target_name=target_name,
-                details=details
-            )
-            return log_id
-        except Exception as e:
-            # 외부망에서 로그 실패는 무시 (사용자 경험 우선)
-            print(f"활동 로그 API 기록 중 오류 (무시됨): {str(e)}")
-            return None
+        return len(params)
 
     @staticmethod
     def get_by_user(user_id, limit=100, offset=0):
         """특정 사용자의 활동 로그 조회 (Dual-mode)"""
         if _is_internal_mode():
-            return ActivityLog._get_by_user_from_db(user_id, limit, offset)
+            return ActivityLog._get_all_from_db(limit, offset, {'user_id': user_id})
         else:
             return ActivityLog._get_by_user_from_api(user_id, limit, offset)
 
-    @staticmethod
-    def _get_by_user_from_db(user_id, limit, offset):
-        """내부망: DB에서 조회"""
-        try:
-            ActivityLog._ensure_table()
-
-            conn = _get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT * FROM activity_logs
-                WHERE user_id = %s
-                ORDER BY created_at DESC
-                LIMIT %s OFFSET %s
-            ''', (user_id, limit, offset))
-
-            logs = cursor.fetchall()
-            conn.close()
-
-            return [dict(log) for log in logs]
-        except Exception as e:
-            print(f"사용자별 활동 로그 조회 중 오류: {str(e)}")
-            return []
-
     @staticmethod
     def _get_by_user_from_api(user_id, limit, offset):
         """외부망: API에서 조회"""
@@ -261,17 +295,69 @@ class ActivityLog:
             print(f"사용자별 활동 로그 API 조회 중 오류: {str(e)}")
             return []
 
+    @staticmethod
+    def get_page(cursor=None, limit=DEFAULT_PAGE_SIZE, filters=None):
+        """활동 로그 페이지 조회 (created_at, id 기준 키셋 페이지네이션, 최신순, Dual-mode)
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            limit: 페이지 크기 (최대 MAX_PAGE_SIZE)
+            filters: get_all과 동일
+
+        Returns:
+            {'items': [...], 'next_cursor': str 또는 None, 'has_more': bool}
+        """
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        empty = {'items': [], 'next_cursor': None, 'has_more': False}
+
+        try:
+            if _is_internal_mode():
+                ActivityLog._ensure_table()
+
+                where, params = _build_where(filters)
+                if cursor:
+                    cursor_created_at, cursor_id = decode_log_cursor(cursor)
+                    where += " AND " if where else " WHERE "
+                    where += "(created_at < %s OR (created_at = %s AND id < %s))"
+                    params.extend([cursor_created_at, cursor_created_at, cursor_id])
+
+                conn = _get_connection()
+                db_cursor = conn.cursor()
+                db_cursor.execute(
+                    f"SELECT {_LIST_COLUMNS} FROM activity_logs{where} "
+                    f"ORDER BY created_at DESC, id DESC LIMIT %s",
+                    params + [limit + 1]  # 다음 페이지 존재 여부 확인용 1건 추가
+                )
+                rows = [dict(r) for r in db_cursor.fetchall()]
+                conn.close()
+
+                has_more = len(rows) > limit
+                items = rows[:limit]
+                return {
+                    'items': items,
+                    'next_cursor': encode_log_cursor(items[-1]) if has_more else None,
+                    'has_more': has_more
+                }
+            else:
+                api = _get_api()
+                return api.get_activity_log_page(cursor=cursor, limit=limit, filters=filters) or empty
+        except Exception as e:
+            print(f"활동 로그 페이지 조회 중 오류: {str(e)}")
+            return empty
+
     @staticmethod
     def get_all(limit=500, offset=0, filters=None):
         """
         모든 활동 로그 조회 (필터 지원, Dual-mode)
 
+        새 화면은 get_page(키셋 페이지네이션) 사용
+
         Args:
             limit: 조회 개수 제한
             offset: 시작 위치
             filters: 필터 조건 (dict)
                 - user_id: 사용자 ID
-                - username: 사용자 아이디
+                - username: 사용자 아이디 (앞부분 일치)
                 - action_type: 활동 유형
                 - date_from: 시작 날짜 (YYYY-MM-DD)
                 - date_to: 종료 날짜 (YYYY-MM-DD)
@@ -288,41 +374,14 @@ class ActivityLog:
         try:
             ActivityLog._ensure_table()
 
+            where, params = _build_where(filters)
             conn = _get_connection()
             cursor = conn.cursor()
-
-            query = "SELECT * FROM activity_logs WHERE 1=1"
-            params = []
-
-            if filters:
-                if filters.get('user_id'):
-                    query += " AND user_id = %s"
-                    params.append(filters['user_id'])
-
-                if filters.get('username'):
-                    query += " AND username LIKE %s"
-                    params.append(f"%{filters['username']}%")
-
-                if filters.get('action_type'):
-                    query += " AND action_type = %s"
-                    params.append(filters['action_type'])
-
-                if filters.get('date_from'):
-                    query += " AND date(created_at) >= %s"
-                    params.append(filters['date_from'])
-
-                if filters.get('date_to'):
-                    query += " AND date(created_at) <= %s"
-                    params.append(filters['date_to'])
-
-                if filters.get('target_type'):
-                    query += " AND target_type = %s"
-                    params.append(filters['target_type'])
-
-            query += " ORDER BY created_at DESC LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
-
-            cursor.execute(query, params)
+            cursor.execute(
+                f"SELECT {_LIST_COLUMNS} FROM activity_logs{where} "
+                f"ORDER BY created_at DESC, id DESC LIMIT %s OFFSET %s",
+                params + [limit, offset]
+            )
             logs = cursor.fetchall()
             conn.close()
 
@@ -360,42 +419,28 @@ class ActivityLog:
 
     @staticmethod
     def _get_count_from_db(filters):
-        """내부망: DB에서 개수 조회"""
+        """내부망: DB에서 개수 조회 (사용자 조건만 있으면 요약 테이블 사용)"""
         try:
             ActivityLog._ensure_table()
 
+            from utils.activity_log_storage import SUMMARY_TABLE
+            filters = {k: v for k, v in (filters or {}).items() if v}
             conn = _get_connection()
             cursor = conn.cursor()
 
-            query = "SELECT COUNT(*) as count FROM activity_logs WHERE 1=1"
-            params = []
-
-            if filters:
-                if filters.get('user_id'):
-                    query += " AND user_id = %s"
-                    params.append(filters['user_id'])
-
-                if filters.get('username'):
-                    query += " AND username LIKE %s"
-                    params.append(f"%{filters['username']}%")
-
-                if filters.get('action_type'):
-                    query += " AND action_type = %s"
-                    params.append(filters['action_type'])
-
-                if filters.get('date_from'):
-                    query += " AND date(created_at) >= %s"
-                    params.append(filters['date_from'])
-
-                if filters.get('date_to'):
-                    query += " AND date(created_at) <= %s"
-                    params.append(filters['date_to'])
-
-            cursor.execute(query, params)
+            if set(filters) <= {'user_id'}:
+                if filters:
+                    cursor.execute(f"SELECT total_actions AS count FROM {SUMMARY_TABLE} WHERE user_id = %s",
+                                   (filters['user_id'],))
+                else:
+                    cursor.execute(f"SELECT COALESCE(SUM(total_actions), 0) AS count FROM {SUMMARY_TABLE}")
+            else:
+                where, params = _build_where(filters)
+                cursor.execute(f"SELECT COUNT(*) as count FROM activity_logs{where}", params)
             result = cursor.fetchone()
             conn.close()
 
-            return result['count'] if result else 0
+            return int(result['count']) if result else 0
         except Exception as e:
             print(f"활동 로그 개수 조회 중 오류: {str(e)}")
             return 0
@@ -426,23 +471,17 @@ class ActivityLog:
 
     @staticmethod
     def _get_user_summary_from_db():
-        """내부망: DB에서 요약 조회"""
+        """내부망: 요약 테이블에서 조회 (로그 저장 시 증분 반영, 로그 전체를 집계하지 않음)"""
         try:
             ActivityLog._ensure_table()
 
+            from utils.activity_log_storage import SUMMARY_TABLE
             conn = _get_connection()
             cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT
-                    user_id,
-                    username,
-                    user_name,
-                    department,
-                    COUNT(*) as total_actions,
-                    MAX(created_at) as last_activity
-                FROM activity_logs
-                GROUP BY user_id
+            cursor.execute(f'''
+                SELECT user_id, username, user_name, department, total_actions, last_activity
+                FROM {SUMMARY_TABLE}
                 ORDER BY last_activity DESC
             ''')
 
@@ -466,7 +505,10 @@ class ActivityLog:
 
     @staticmethod
     def delete_old_logs(days=365):
-        """오래된 로그 삭제 (기본 1년, 내부망 전용)"""
+        """오래된 로그 삭제 (기본 1년, 내부망 전용)
+
+        지난 달 파티션은 통째로 DROP하고 경계 달만 범위 DELETE (요약 테이블도 차감)
+        """
         # 외부망에서는 삭제 권한 없음
         if not _is_internal_mode():
             print("외부망에서는 로그 삭제가 불가능합니다.")
@@ -475,17 +517,13 @@ class ActivityLog:
         try:
             ActivityLog._ensure_table()
 
+            from utils.activity_log_storage import delete_before
             conn = _get_connection()
             cursor = conn.cursor()
 
-            cutoff_date = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
-
-            cursor.execute('''
-                DELETE FROM activity_logs
-                WHERE date(created_at) < %s
-            ''', (cutoff_date,))
+            cutoff_date = datetime.date.today() - datetime.timedelta(days=days)
+            deleted_count = delete_before(cursor, cutoff_date)
 
-            deleted_count = cursor.rowcount
             conn.commit()
             conn.close()
 
@@ -6,6 +6,7 @@
 """
 
 from connection_manager import is_internal_mode, connection_manager
+from utils.chosung import get_chosung, is_chosung_only, CLIENT_CHOSUNG_COLUMNS
 import datetime
 
 def _get_api():
@@ -28,20 +29,11 @@ class Client:
 
     @staticmethod
     def _ensure_detail_address_column():
-        """detail_address 컬럼이 없으면 추가 (내부망 전용)"""
+        """detail_address 컬럼이 없으면 추가 (스키마 마이그레이션, 내부망 전용)"""
         if not is_internal_mode():
             return
-        try:
-            conn = _get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SHOW COLUMNS FROM clients")
-            columns = [col['Field'] for col in cursor.fetchall()]
-            if 'detail_address' not in columns:
-                cursor.execute("ALTER TABLE clients ADD COLUMN detail_address TEXT")
-                conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"컬럼 추가 중 오류: {str(e)}")
+        from migrations import ensure_schema
+        ensure_schema()
 
     @staticmethod
     def create(name, ceo=None, business_no=None, category=None, phone=None, fax=None,
@@ -58,11 +50,13 @@ class Client:
                 cursor.execute("""
                     INSERT INTO clients (name, ceo, business_no, category, phone, fax,
                         contact_person, email, sales_rep, toll_free, zip_code, address,
-                        detail_address, notes, sales_business, sales_phone, sales_mobile, sales_address, mobile)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        detail_address, notes, sales_business, sales_phone, sales_mobile, sales_address, mobile,
+                        name_chosung, ceo_chosung, contact_chosung)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """, (name, ceo, business_no, category, phone, fax, contact_person, email,
                       sales_rep, toll_free, zip_code, address, detail_address, notes, sales_business,
-                      sales_phone, sales_mobile, sales_address, mobile))
+                      sales_phone, sales_mobile, sales_address, mobile,
+                      get_chosung(name), get_chosung(ceo), get_chosung(contact_person)))
                 client_id = cursor.lastrowid
                 conn.commit()
                 conn.close()
@@ -137,6 +131,34 @@ class Client:
             print(f"업체 목록 조회 중 오류: {str(e)}")
             return []
 
+    @staticmethod
+    def iter_all(batch_size=1000):
+        """모든 업체를 한 건씩 반환 (내보내기용, 이름순)
+
+        내부망은 서버 측 커서로, 외부망은 페이지 단위 API 조회로 받아오므로
+        전체 목록을 한 번에 메모리에 올리지 않음
+        """
+        if is_internal_mode():
+            from utils.streaming_export import iter_query
+            Client._ensure_detail_address_column()
+            yield from iter_query("""
+                SELECT id, name, ceo, business_no, category, phone, fax,
+                    contact_person, email, sales_rep, toll_free, zip_code,
+                    address, detail_address, notes, sales_business, sales_phone, sales_mobile,
+                    sales_address, mobile, created_at
+                FROM clients
+                ORDER BY name, id
+            """, batch_size=batch_size)
+        else:
+            page = 1
+            while True:
+                # 중간 페이지 조회에 실패하면 일부만 내보내지 않도록 예외를 그대로 전달
+                result = Client.fetch_paginated(page=page, per_page=batch_size)
+                yield from result['clients']
+                if page >= result.get('total_pages', 1):
+                    break
+                page += 1
+
     @staticmethod
     def get_total_count():
         """전체 업체 수 조회"""
@@ -157,94 +179,111 @@ class Client:
 
     @staticmethod
     def get_paginated(page=1, per_page=100, search_keyword=None, search_field=None, sales_rep_filter=None):
-        """페이지네이션 업체 조회
+        """페이지네이션 업체 조회 (조회 실패 시 빈 페이지 반환, 인자와 반환 값은 fetch_paginated와 동일)"""
+        try:
+            return Client.fetch_paginated(page=page, per_page=per_page, search_keyword=search_keyword,
+                                          search_field=search_field, sales_rep_filter=sales_rep_filter)
+        except Exception as e:
+            print(f"페이지네이션 업체 조회 중 오류: {str(e)}")
+            return {'clients': [], 'total_count': 0, 'total_pages': 1, 'current_page': 1, 'per_page': per_page}
+
+    @staticmethod
+    def fetch_paginated(page=1, per_page=100, search_keyword=None, search_field=None, sales_rep_filter=None):
+        """페이지네이션 업체 조회 (이름, id순 / 조회 실패 시 예외 발생)
 
         Args:
             page: 페이지 번호
             per_page: 페이지당 항목 수
-            search_keyword: 검색어
+            search_keyword: 검색어 (초성만 입력하면 초성 검색)
             search_field: 검색 필드
             sales_rep_filter: 영업담당 필터 (해당 업체만 보기용)
         """
-        try:
-            if is_internal_mode():
-                Client._ensure_detail_address_column()
-                conn = _get_connection()
-                cursor = conn.cursor()
+        if is_internal_mode():
+            Client._ensure_detail_address_column()
+            conn = _get_connection()
+            cursor = conn.cursor()
 
-                offset = (page - 1) * per_page
-                where_conditions = []
-                params = []
-
-                # 영업담당 필터 (해당 업체만 보기)
-                if sales_rep_filter:
-                    where_conditions.append("sales_rep = %s")
-                    params.append(sales_rep_filter)
-
-                # 검색 조건이 있는 경우
-                if search_keyword:
-                    if search_field == "고객/회사명":
-                        where_conditions.append("name LIKE %s")
-                        params.append(f"%{search_keyword}%")
-                    elif search_field == "대표자":
-                        where_conditions.append("ceo LIKE %s")
-                        params.append(f"%{search_keyword}%")
-                    elif search_field == "담당자":
-                        where_conditions.append("contact_person LIKE %s")
-                        params.append(f"%{search_keyword}%")
-                    elif search_field == "사업자번호":
-                        where_conditions.append("business_no LIKE %s")
-                        params.append(f"%{search_keyword}%")
-                    else:  # 전체
-                        where_conditions.append("(name LIKE %s OR ceo LIKE %s OR contact_person LIKE %s OR business_no LIKE %s)")
-                        params.extend([f"%{search_keyword}%", f"%{search_keyword}%", f"%{search_keyword}%", f"%{search_keyword}%"])
-
-                # WHERE 절 생성
-                where_clause = ""
-                if where_conditions:
-                    where_clause = "WHERE " + " AND ".join(where_conditions)
-
-                # 총 개수 조회
-                cursor.execute(f"SELECT COUNT(*) as cnt FROM clients {where_clause}", params)
-                result = cursor.fetchone()
-                total_count = result['cnt'] if result else 0
+            offset = (page - 1) * per_page
+            where_conditions = []
+            params = []
 
-                # 데이터 조회
-                cursor.execute(f"""
-                    SELECT id, name, ceo, business_no, category, phone, fax,
-                        contact_person, email, sales_rep, toll_free, zip_code,
-                        address, detail_address, notes, sales_business, sales_phone, sales_mobile,
-                        sales_address, mobile, created_at
-                    FROM clients
-                    {where_clause}
-                    ORDER BY name
-                    LIMIT %s OFFSET %s
-                """, params + [per_page, offset])
+            # 영업담당 필터 (해당 업체만 보기)
+            if sales_rep_filter:
+                where_conditions.append("sales_rep = %s")
+                params.append(sales_rep_filter)
 
-                clients = cursor.fetchall()
-                conn.close()
+            # 초성 검색 (저장된 초성 컬럼에서 검색)
+            if search_keyword and is_chosung_only(search_keyword):
+                fields = {"고객/회사명": ['name'], "대표자": ['ceo'], "담당자": ['contact_person']}.get(
+                    search_field, ['name', 'ceo', 'contact_person'])
+                where_conditions.append(
+                    "(" + " OR ".join(f"{CLIENT_CHOSUNG_COLUMNS[f]} LIKE %s" for f in fields) + ")")
+                params.extend([f"%{search_keyword}%"] * len(fields))
 
-                total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 1
+            # 검색 조건이 있는 경우
+            elif search_keyword:
+                if search_field == "고객/회사명":
+                    where_conditions.append("name LIKE %s")
+                    params.append(f"%{search_keyword}%")
+                elif search_field == "대표자":
+                    where_conditions.append("ceo LIKE %s")
+                    params.append(f"%{search_keyword}%")
+                elif search_field == "담당자":
+                    where_conditions.append("contact_person LIKE %s")
+                    params.append(f"%{search_keyword}%")
+                elif search_field == "사업자번호":
+                    where_conditions.append("business_no LIKE %s")
+                    params.append(f"%{search_keyword}%")
+                else:  # 전체
+                    where_conditions.append("(name LIKE %s OR ceo LIKE %s OR contact_person LIKE %s OR business_no LIKE %s)")
+                    params.extend([f"%{search_keyword}%", f"%{search_keyword}%", f"%{search_keyword}%", f"%{search_keyword}%"])
 
-                return {
-                    'clients': [dict(client) for client in clients],
-                    'total_count': total_count,
-                    'total_pages': total_pages,
-                    'current_page': page,
-                    'per_page': per_page
-                }
-            else:
-                api = _get_api()
-                return api.get_clients(
-                    page=page,
-                    per_page=per_page,
-                    search_keyword=search_keyword,
-                    search_field=search_field,
-                    sales_rep_filter=sales_rep_filter
-                )
-        except Exception as e:
-            print(f"페이지네이션 업체 조회 중 오류: {str(e)}")
-            return {'clients': [], 'total_count': 0, 'total_pages': 1, 'current_page': 1, 'per_page': per_page}
+            # WHERE 절 생성
+            where_clause = ""
+            if where_conditions:
+                where_clause = "WHERE " + " AND ".join(where_conditions)
+
+            # 총 개수 조회
+            cursor.execute(f"SELECT COUNT(*) as cnt FROM clients {where_clause}", params)
+            result = cursor.fetchone()
+            total_count = result['cnt'] if result else 0
+
+            # 데이터 조회
+            cursor.execute(f"""
+                SELECT id, name, ceo, business_no, category, phone, fax,
+                    contact_person, email, sales_rep, toll_free, zip_code,
+                    address, detail_address, notes, sales_business, sales_phone, sales_mobile,
+                    sales_address, mobile, created_at
+                FROM clients
+                {where_clause}
+                ORDER BY name, id
+                LIMIT %s OFFSET %s
+            """, params + [per_page, offset])
+
+            clients = cursor.fetchall()
+            conn.close()
+
+            total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 1
+
+            return {
+                'clients': [dict(client) for client in clients],
+                'total_count': total_count,
+                'total_pages': total_pages,
+                'current_page': page,
+                'per_page': per_page
+            }
+        else:
+            api = _get_api()
+            result = api.get_clients(
+                page=page,
+                per_page=per_page,
+                search_keyword=search_keyword,
+                search_field=search_field,
+                sales_rep_filter=sales_rep_filter
+            )
+            if not result or 'clients' not in result:
+                raise RuntimeError("업체 페이지 조회 실패 (서버 응답 오류)")
+            return result
 
     @staticmethod
     def update(client_id, name, ceo=None, business_no=None, category=None, phone=None,
@@ -263,11 +302,13 @@ class Client:
                     SET name = %s, ceo = %s, business_no = %s, category = %s, phone = %s,
                         fax = %s, contact_person = %s, email = %s, sales_rep = %s, toll_free = %s,
                         zip_code = %s, address = %s, detail_address = %s, notes = %s, sales_business = %s,
-                        sales_phone = %s, sales_mobile = %s, sales_address = %s, mobile = %s
+                        sales_phone = %s, sales_mobile = %s, sales_address = %s, mobile = %s,
+                        name_chosung = %s, ceo_chosung = %s, contact_chosung = %s
                     WHERE id = %s
                 """, (name, ceo, business_no, category, phone, fax, contact_person, email,
                       sales_rep, toll_free, zip_code, address, detail_address, notes, sales_business,
-                      sales_phone, sales_mobile, sales_address, mobile, client_id))
+                      sales_phone, sales_mobile, sales_address, mobile,
+                      get_chosung(name), get_chosung(ceo), get_chosung(contact_person), client_id))
                 success = cursor.rowcount > 0
                 conn.commit()
                 conn.close()
@@ -306,23 +347,47 @@ class Client:
             print(f"업체 삭제 중 오류: {str(e)}")
             return False
 
+    @staticmethod
+    def bulk_upsert(columns, rows):
+        """업체 일괄 추가/수정 (엑셀 가져오기, 한 트랜잭션) - 업체명이 같으면 수정
+
+        Args:
+            columns: 열 목록 (name 포함)
+            rows: [[값, ...], ...]
+
+        Returns:
+            {'inserted': 추가 수, 'updated': 수정 수}
+        """
+        if is_internal_mode():
+            from utils.bulk_import import CLIENT_SPEC, upsert_rows
+            return upsert_rows(CLIENT_SPEC, columns, rows)
+        else:
+            api = _get_api()
+            return api.bulk_upsert_clients(columns, rows)
+
     @staticmethod
     def search(keyword):
-        """업체명, 담당자, CEO, 사업자번호로 검색"""
+        """업체명, 담당자, CEO, 사업자번호로 검색 (초성만 입력하면 업체명/대표자/담당자 초성 검색)"""
         try:
             if is_internal_mode():
                 Client._ensure_detail_address_column()
                 conn = _get_connection()
                 cursor = conn.cursor()
-                cursor.execute("""
+                if is_chosung_only(keyword):
+                    condition = "name_chosung LIKE %s OR ceo_chosung LIKE %s OR contact_chosung LIKE %s"
+                    params = (f"%{keyword}%",) * 3
+                else:
+                    condition = "name LIKE %s OR contact_person LIKE %s OR ceo LIKE %s OR business_no LIKE %s"
+                    params = (f"%{keyword}%",) * 4
+                cursor.execute(f"""
                     SELECT id, name, ceo, business_no, category, phone, fax,
                         contact_person, email, sales_rep, toll_free, zip_code,
                         address, detail_address, notes, sales_business, sales_phone, sales_mobile,
                         sales_address, mobile, created_at
                     FROM clients
-                    WHERE name LIKE %s OR contact_person LIKE %s OR ceo LIKE %s OR business_no LIKE %s
+                    WHERE {condition}
                     ORDER BY name
-                """, (f"%{keyword}%", f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"))
+                """, params)
                 clients = cursor.fetchall()
                 conn.close()
 
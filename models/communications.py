@@ -4,9 +4,20 @@
 - Dual-mode 지원: 내부망(MySQL 직접) / 외부망(API 호출)
 """
 
+import time
 from datetime import datetime
 
 
+# 메시지 변경 대기(long-poll) 최대 시간 (초)
+MESSAGE_POLL_TIMEOUT = 25
+
+# 내부망 변경 확인 주기 (초) - 변경 토큰만 조회하고 바뀐 경우에만 목록 다시 로드
+MESSAGE_STATE_CHECK_INTERVAL = 5
+
+# 대화 요약(conversations)에 저장하는 마지막 메시지 미리보기 길이
+CONVERSATION_SNIPPET_LENGTH = 200
+
+
 def _is_internal_mode():
     """내부망 모드 여부 확인"""
     try:
@@ -33,84 +44,99 @@ class Message:
 
     @staticmethod
     def _ensure_tables():
-        """필요한 테이블 생성 (MySQL) - 내부망 전용"""
+        """필요한 테이블 생성 (스키마 마이그레이션) - 내부망 전용"""
         if not _is_internal_mode():
             return  # 외부망에서는 테이블 생성 불가
-        try:
-            conn = _get_connection()
-            cursor = conn.cursor()
+        from migrations import ensure_schema
+        ensure_schema()
 
-            # 메시지 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    sender_id INT NOT NULL,
-                    receiver_id INT,
-                    message_type VARCHAR(50) DEFAULT 'chat',
-                    subject VARCHAR(255),
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_sender (sender_id),
-                    INDEX idx_receiver (receiver_id)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """)
+    # ==================== 대화 요약 (conversations) ====================
 
-            # 메시지 읽음 상태 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS message_reads (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    message_id INT NOT NULL,
-                    user_id INT NOT NULL,
-                    read_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE KEY unique_read (message_id, user_id),
-                    INDEX idx_message (message_id),
-                    INDEX idx_user (user_id)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """)
-
-            # 이메일 발송 로그 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS email_logs (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    schedule_id INT,
-                    estimate_type VARCHAR(50),
-                    sender_email VARCHAR(255),
-                    to_emails TEXT,
-                    cc_emails TEXT,
-                    subject VARCHAR(500),
-                    body TEXT,
-                    attachment_name VARCHAR(255),
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    sent_by INT,
-                    client_name VARCHAR(255),
-                    status VARCHAR(50) DEFAULT '정상',
-                    received VARCHAR(10) DEFAULT '아니오',
-                    received_at TIMESTAMP NULL,
-                    INDEX idx_schedule (schedule_id),
-                    INDEX idx_sent_at (sent_at)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """)
+    @staticmethod
+    def _update_conversation_on_send(cursor, message_id, sender_id, receiver_id, content):
+        """메시지 전송 시 양쪽 참여자의 대화 요약 갱신 (호출한 쪽 트랜잭션 안에서 실행)"""
+        if receiver_id is None or receiver_id == sender_id:
+            return  # 전체 공지/본인 메시지는 대화 목록에 표시하지 않음
 
-            # 기존 테이블에 새 컬럼 추가 (없는 경우)
-            try:
-                cursor.execute("ALTER TABLE email_logs ADD COLUMN status VARCHAR(50) DEFAULT '정상'")
-            except:
-                pass
-            try:
-                cursor.execute("ALTER TABLE email_logs ADD COLUMN received VARCHAR(10) DEFAULT '아니오'")
-            except:
-                pass
-            try:
-                cursor.execute("ALTER TABLE email_logs ADD COLUMN received_at TIMESTAMP NULL")
-            except:
-                pass
+        cursor.execute("SELECT created_at FROM messages WHERE id = %s", (message_id,))
+        row = cursor.fetchone()
+        created_at = row['created_at'] if row else None
+        snippet = (content or '')[:CONVERSATION_SNIPPET_LENGTH]
 
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"테이블 생성 오류: {e}")
-            import traceback
-            traceback.print_exc()
+        # (보낸 사람, 받는 사람) / (받는 사람, 보낸 사람 - 미읽음 +1)
+        # 동시에 보낸 메시지가 늦게 커밋되어도 마지막 메시지는 id가 가장 큰 메시지로 유지
+        # (last_message_id는 다른 값 비교에 쓰이므로 마지막에 갱신)
+        for user_id, partner_id, unread_delta in ((sender_id, receiver_id, 0),
+                                                  (receiver_id, sender_id, 1)):
+            cursor.execute("""
+                INSERT INTO conversations
+                    (user_id, partner_id, last_message_id, last_message_time, last_message,
+                     message_count, unread_count)
+                VALUES (%s, %s, %s, %s, %s, 1, %s)
+                ON DUPLICATE KEY UPDATE
+                    last_message_time = IF(VALUES(last_message_id) > last_message_id,
+                                           VALUES(last_message_time), last_message_time),
+                    last_message = IF(VALUES(last_message_id) > last_message_id,
+                                      VALUES(last_message), last_message),
+                    last_message_id = GREATEST(last_message_id, VALUES(last_message_id)),
+                    message_count = message_count + 1,
+                    unread_count = unread_count + VALUES(unread_count)
+            """, (user_id, partner_id, message_id, created_at, snippet, unread_delta))
+
+    @staticmethod
+    def _refresh_conversation(cursor, user1_id, user2_id):
+        """두 사용자 대화 요약을 메시지 테이블에서 다시 계산 (삭제 시, 호출한 쪽 트랜잭션 안에서 실행)"""
+        if user1_id is None or user2_id is None or user1_id == user2_id:
+            return
+
+        cursor.execute("""
+            SELECT id, created_at, content FROM messages
+            WHERE (sender_id = %s AND receiver_id = %s)
+               OR (sender_id = %s AND receiver_id = %s)
+            ORDER BY id DESC LIMIT 1
+        """, (user1_id, user2_id, user2_id, user1_id))
+        last = cursor.fetchone()
+
+        if not last:
+            cursor.execute("""
+                DELETE FROM conversations
+                WHERE (user_id = %s AND partner_id = %s) OR (user_id = %s AND partner_id = %s)
+            """, (user1_id, user2_id, user2_id, user1_id))
+            return
+
+        cursor.execute("""
+            SELECT COUNT(*) as cnt FROM messages
+            WHERE (sender_id = %s AND receiver_id = %s)
+               OR (sender_id = %s AND receiver_id = %s)
+        """, (user1_id, user2_id, user2_id, user1_id))
+        message_count = cursor.fetchone()['cnt']
+
+        snippet = (last['content'] or '')[:CONVERSATION_SNIPPET_LENGTH]
+        # 저장된 마지막 메시지가 더 최근이고 아직 남아 있으면 (다시 계산하는 동안 전송된 메시지) 유지
+        keep_last = ("last_message_id > VALUES(last_message_id) AND EXISTS "
+                     "(SELECT 1 FROM messages WHERE messages.id = conversations.last_message_id)")
+        for user_id, partner_id in ((user1_id, user2_id), (user2_id, user1_id)):
+            cursor.execute("""
+                SELECT COUNT(*) as cnt FROM messages m
+                WHERE m.sender_id = %s AND m.receiver_id = %s
+                AND NOT EXISTS (SELECT 1 FROM message_reads r
+                                WHERE r.message_id = m.id AND r.user_id = %s)
+            """, (partner_id, user_id, user_id))
+            unread_count = cursor.fetchone()['cnt']
+
+            cursor.execute(f"""
+                INSERT INTO conversations
+                    (user_id, partner_id, last_message_id, last_message_time, last_message,
+                     message_count, unread_count)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    last_message_time = IF({keep_last}, last_message_time, VALUES(last_message_time)),
+                    last_message = IF({keep_last}, last_message, VALUES(last_message)),
+                    last_message_id = IF({keep_last}, last_message_id, VALUES(last_message_id)),
+                    message_count = VALUES(message_count),
+                    unread_count = VALUES(unread_count)
+            """, (user_id, partner_id, last['id'], last['created_at'], snippet,
+                  message_count, unread_count))
 
     @staticmethod
     def send(sender_id, receiver_id, content, message_type='chat', subject=None):
@@ -134,6 +160,7 @@ class Message:
             """, (sender_id, receiver_id, message_type, subject, content))
 
             message_id = cursor.lastrowid
+            Message._update_conversation_on_send(cursor, message_id, sender_id, receiver_id, content)
             conn.commit()
             conn.close()
             return message_id
@@ -213,26 +240,20 @@ class Message:
             conn = _get_connection()
             cursor = conn.cursor()
 
+            # 대화 요약 테이블에서 조회 (메시지 이력 크기와 무관)
             cursor.execute("""
                 SELECT
-                    u.id as partner_id,
+                    c.partner_id,
                     u.name as partner_name,
                     u.department as partner_department,
-                    MAX(m.created_at) as last_message_time,
-                    (SELECT content FROM messages m2
-                     WHERE ((m2.sender_id = %s AND m2.receiver_id = u.id)
-                         OR (m2.sender_id = u.id AND m2.receiver_id = %s))
-                     ORDER BY m2.created_at DESC LIMIT 1) as last_message
-                FROM messages m
-                JOIN users u ON u.id = CASE
-                    WHEN m.sender_id = %s THEN m.receiver_id
-                    ELSE m.sender_id
-                END
-                WHERE (m.sender_id = %s OR m.receiver_id = %s)
-                  AND u.id != %s
-                GROUP BY u.id, u.name, u.department
-                ORDER BY last_message_time DESC
-            """, (user_id, user_id, user_id, user_id, user_id, user_id))
+                    c.last_message_time,
+                    c.last_message,
+                    c.unread_count
+                FROM conversations c
+                JOIN users u ON u.id = c.partner_id
+                WHERE c.user_id = %s
+                ORDER BY c.last_message_time DESC, c.last_message_id DESC
+            """, (user_id,))
 
             partners = cursor.fetchall()
             conn.close()
@@ -272,6 +293,16 @@ class Message:
                 VALUES (%s, %s)
             """, (message_id, user_id))
 
+            if cursor.rowcount > 0:
+                # 새로 읽은 받은 메시지면 해당 대화의 미읽음 수 감소
+                cursor.execute("""
+                    UPDATE conversations c
+                    JOIN messages m ON m.id = %s
+                    SET c.unread_count = GREATEST(c.unread_count - 1, 0)
+                    WHERE m.receiver_id = %s
+                      AND c.user_id = m.receiver_id AND c.partner_id = m.sender_id
+                """, (message_id, user_id))
+
             conn.commit()
             conn.close()
             return True
@@ -305,25 +336,24 @@ class Message:
             conn = _get_connection()
             cursor = conn.cursor()
 
-            # 상대방이 보낸 메시지 중 안 읽은 것들 조회
+            # 상대방이 보낸 메시지 중 안 읽은 것들 한 번에 읽음 처리
             cursor.execute("""
-                SELECT id FROM messages
-                WHERE sender_id = %s AND receiver_id = %s
-                AND id NOT IN (SELECT message_id FROM message_reads WHERE user_id = %s)
-            """, (partner_id, user_id, user_id))
-
-            unread_ids = [row['id'] for row in cursor.fetchall()]
+                INSERT IGNORE INTO message_reads (message_id, user_id)
+                SELECT m.id, %s FROM messages m
+                WHERE m.sender_id = %s AND m.receiver_id = %s
+                AND NOT EXISTS (SELECT 1 FROM message_reads r
+                                WHERE r.message_id = m.id AND r.user_id = %s)
+            """, (user_id, partner_id, user_id, user_id))
+            read_count = cursor.rowcount
 
-            # 읽음 처리
-            for msg_id in unread_ids:
-                cursor.execute("""
-                    INSERT IGNORE INTO message_reads (message_id, user_id)
-                    VALUES (%s, %s)
-                """, (msg_id, user_id))
+            cursor.execute("""
+                UPDATE conversations SET unread_count = 0
+                WHERE user_id = %s AND partner_id = %s
+            """, (user_id, partner_id))
 
             conn.commit()
             conn.close()
-            return len(unread_ids)
+            return read_count
         except Exception as e:
             print(f"대화 읽음 처리 오류: {e}")
             return 0
@@ -355,15 +385,14 @@ class Message:
             cursor = conn.cursor()
 
             cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM messages m
-                WHERE m.receiver_id = %s
-                AND m.id NOT IN (SELECT message_id FROM message_reads WHERE user_id = %s)
-            """, (user_id, user_id))
+                SELECT IFNULL(SUM(unread_count), 0) as count
+                FROM conversations
+                WHERE user_id = %s
+            """, (user_id,))
 
             result = cursor.fetchone()
             conn.close()
-            return result['count'] if result else 0
+            return int(result['count']) if result else 0
         except Exception as e:
             print(f"미읽음 수 조회 오류: {e}")
             return 0
@@ -395,12 +424,10 @@ class Message:
             cursor = conn.cursor()
 
             cursor.execute("""
-                SELECT m.sender_id as partner_id, COUNT(*) as unread_count
-                FROM messages m
-                WHERE m.receiver_id = %s
-                AND m.id NOT IN (SELECT message_id FROM message_reads WHERE user_id = %s)
-                GROUP BY m.sender_id
-            """, (user_id, user_id))
+                SELECT partner_id, unread_count
+                FROM conversations
+                WHERE user_id = %s AND unread_count > 0
+            """, (user_id,))
 
             result = cursor.fetchall()
             conn.close()
@@ -419,6 +446,107 @@ class Message:
             print(f"상대별 미읽음 수 API 오류: {e}")
             return {}
 
+    @staticmethod
+    def get_message_state(user_id):
+        """사용자의 메시지 상태 조회 (Dual-mode)
+
+        Returns:
+            {'last_message_id', 'message_count', 'unread_count', 'etag'} 또는 None (오류 시)
+            etag는 새 메시지/삭제/읽음 처리 시 바뀜
+        """
+        if _is_internal_mode():
+            return Message._get_message_state_from_db(user_id)
+        else:
+            return Message._get_message_state_from_api(user_id)
+
+    @staticmethod
+    def _get_message_state_from_db(user_id):
+        """내부망: DB에서 메시지 상태 조회 (대화 요약 테이블 사용)"""
+        try:
+            Message._ensure_tables()
+            conn = _get_connection()
+            cursor = conn.cursor()
+
+            # 대화 요약 테이블에서 집계 (user_id 기본 키 범위 조회)
+            cursor.execute("""
+                SELECT
+                    IFNULL(MAX(last_message_id), 0) as last_message_id,
+                    IFNULL(SUM(message_count), 0) as message_count,
+                    IFNULL(SUM(unread_count), 0) as unread_count
+                FROM conversations
+                WHERE user_id = %s
+            """, (user_id,))
+
+            row = cursor.fetchone()
+            conn.close()
+            state = {
+                'last_message_id': int(row['last_message_id'] or 0),
+                'message_count': int(row['message_count'] or 0),
+                'unread_count': int(row['unread_count'] or 0),
+            }
+            state['etag'] = f"{state['last_message_id']}-{state['message_count']}-{state['unread_count']}"
+            return state
+        except Exception as e:
+            print(f"메시지 상태 조회 오류: {e}")
+            return None
+
+    @staticmethod
+    def _get_message_state_from_api(user_id):
+        """외부망: API에서 메시지 상태 조회"""
+        try:
+            api = _get_api()
+            return api.get_message_state(user_id)
+        except Exception as e:
+            print(f"메시지 상태 API 오류: {e}")
+            return None
+
+    @staticmethod
+    def get_change_token():
+        """전체 메시지/읽음 테이블 변경 토큰 (API 서버 변경 감지용, 내부망 전용)"""
+        conn = _get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    (SELECT IFNULL(MAX(id), 0) FROM messages) as last_message_id,
+                    (SELECT COUNT(*) FROM messages) as message_count,
+                    (SELECT IFNULL(MAX(id), 0) FROM message_reads) as last_read_id
+            """)
+            row = cursor.fetchone()
+        finally:
+            conn.close()
+        return f"{row['last_message_id']}-{row['message_count']}-{row['last_read_id']}"
+
+    @staticmethod
+    def wait_for_changes(user_id, etag=None, timeout=MESSAGE_POLL_TIMEOUT):
+        """메시지 상태가 etag와 달라질 때까지 대기 후 상태 반환 (Dual-mode)
+
+        - 외부망: API 서버 long-poll (새 메시지가 오면 바로 응답)
+        - 내부망: MESSAGE_STATE_CHECK_INTERVAL초마다 상태만 조회 (조건부 조회)
+
+        Returns:
+            상태 dict (시간 초과 시 현재 상태) 또는 None (오류 시)
+        """
+        if _is_internal_mode():
+            return Message._wait_for_changes_from_db(user_id, etag, timeout)
+        else:
+            # 오류는 호출한 쪽(감시 스레드)에서 처리하도록 그대로 전달
+            api = _get_api()
+            return api.poll_messages(user_id, etag, timeout)
+
+    @staticmethod
+    def _wait_for_changes_from_db(user_id, etag, timeout):
+        """내부망: 상태가 바뀔 때까지 주기적으로 확인"""
+        deadline = time.time() + timeout
+        while True:
+            state = Message._get_message_state_from_db(user_id)
+            if state is None or state['etag'] != etag:
+                return state
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return state
+            time.sleep(min(MESSAGE_STATE_CHECK_INTERVAL, remaining))
+
     @staticmethod
     def delete_message(message_id, user_id):
         """메시지 삭제 (본인이 보낸 메시지만, Dual-mode)"""
@@ -434,15 +562,25 @@ class Message:
             conn = _get_connection()
             cursor = conn.cursor()
 
+            # 본인이 보낸 메시지만 삭제 (대화 요약 갱신을 위해 받는 사람 확인)
+            cursor.execute("""
+                SELECT receiver_id FROM messages WHERE id = %s AND sender_id = %s
+            """, (message_id, user_id))
+            target = cursor.fetchone()
+            if not target:
+                conn.close()
+                return False
+
             # 읽음 상태도 함께 삭제
             cursor.execute("DELETE FROM message_reads WHERE message_id = %s", (message_id,))
 
-            # 본인이 보낸 메시지만 삭제
             cursor.execute("""
                 DELETE FROM messages WHERE id = %s AND sender_id = %s
             """, (message_id, user_id))
 
             deleted = cursor.rowcount > 0
+            if deleted:
+                Message._refresh_conversation(cursor, user_id, target['receiver_id'])
             conn.commit()
             conn.close()
             return deleted
@@ -493,6 +631,13 @@ class Message:
                 cursor.execute(f"DELETE FROM messages WHERE id IN ({placeholders})", message_ids)
 
             deleted_count = cursor.rowcount
+
+            # 양쪽 대화 요약 삭제
+            cursor.execute("""
+                DELETE FROM conversations
+                WHERE (user_id = %s AND partner_id = %s) OR (user_id = %s AND partner_id = %s)
+            """, (user_id, partner_id, partner_id, user_id))
+
             conn.commit()
             conn.close()
             return deleted_count
@@ -3,9 +3,11 @@
 수수료 관리 모델
 내부망: DB 직접 연결
 외부망: API 사용
+조회는 카탈로그 캐시(utils/catalog_cache.py)에서 처리
 """
 
 from connection_manager import is_internal_mode, connection_manager
+from utils.catalog_cache import catalog_cache, bump_catalog_version
 import os
 
 def _get_api():
@@ -17,93 +19,67 @@ def _get_connection():
     from database import get_connection
     return get_connection()
 
+def _parse_test_items(test_items):
+    """검사 항목 목록 정규화 (쉼표로 구분된 문자열 또는 목록)"""
+    if not test_items:
+        return []
+    if isinstance(test_items, str):
+        return [item.strip() for item in test_items.split(',')]
+    return list(test_items)
+
 class Fee:
     @staticmethod
     def get_all():
-        """모든 수수료 조회"""
+        """모든 수수료 조회 (카탈로그 캐시)"""
+        return catalog_cache.get_fees()
+
+    @staticmethod
+    def _load_all():
+        """모든 수수료를 DB/API에서 직접 조회 (카탈로그 캐시 로더)"""
         if is_internal_mode():
+            # display_order 등 추가 컬럼은 스키마 마이그레이션에서 보장
+            from migrations import ensure_schema
+            ensure_schema()
+
             conn = _get_connection()
             cursor = conn.cursor()
-
-            # 열 정보 확인 (MySQL)
-            cursor.execute("SHOW COLUMNS FROM fees")
-            columns = [column['Field'] for column in cursor.fetchall()]
-
-            # display_order 열이 있는지 확인
-            if "display_order" in columns:
-                cursor.execute("SELECT * FROM fees ORDER BY display_order, test_item")
-            else:
-                # display_order 열 추가
-                try:
-                    cursor.execute("ALTER TABLE fees ADD COLUMN display_order INTEGER DEFAULT 100")
-                    conn.commit()
-                    # 기존 데이터에 기본값 설정
-                    cursor.execute("UPDATE fees SET display_order = 100")
-                    conn.commit()
-                    cursor.execute("SELECT * FROM fees ORDER BY display_order, test_item")
-                except Exception:
-                    # 실패하면 기존 정렬 방식 사용
-                    cursor.execute("SELECT * FROM fees ORDER BY test_item")
+            cursor.execute("SELECT * FROM fees ORDER BY display_order, test_item")
 
             fees = cursor.fetchall()
             conn.close()
             return fees
         else:
             api = _get_api()
-            return api.get_fees()
+            return api.get_fees(use_cache=False)
 
     @staticmethod
     def get_by_item(test_item):
-        """검사 항목으로 수수료 조회"""
-        if is_internal_mode():
-            conn = _get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM fees WHERE test_item = %s", (test_item,))
-            fee = cursor.fetchone()
-            conn.close()
-            return fee
-        else:
-            api = _get_api()
-            return api.get_fee_by_item(test_item)
+        """검사 항목으로 수수료 조회 (카탈로그 캐시)"""
+        return catalog_cache.get_fee(test_item)
 
     @staticmethod
     def create(test_item, food_category="", price=0, description="", display_order=100, sample_quantity=0):
         """새 수수료 생성"""
         if is_internal_mode():
+            # display_order, sample_quantity 컬럼은 스키마 마이그레이션에서 보장
+            from migrations import ensure_schema
+            ensure_schema()
+
             conn = _get_connection()
             cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    "INSERT INTO fees (test_item, food_category, price, description, display_order, sample_quantity) VALUES (%s, %s, %s, %s, %s, %s)",
-                    (test_item, food_category, price, description, display_order, sample_quantity)
-                )
-            except Exception as e:
-                # display_order 또는 sample_quantity 열이 없는 경우를 처리
-                if "no such column" in str(e):
-                    # 열 추가 시도
-                    try:
-                        cursor.execute("ALTER TABLE fees ADD COLUMN display_order INTEGER DEFAULT 100")
-                    except Exception:
-                        pass
-                    try:
-                        cursor.execute("ALTER TABLE fees ADD COLUMN sample_quantity INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                    # 다시 삽입 시도
-                    cursor.execute(
-                        "INSERT INTO fees (test_item, food_category, price, description, display_order, sample_quantity) VALUES (%s, %s, %s, %s, %s, %s)",
-                        (test_item, food_category, price, description, display_order, sample_quantity)
-                    )
-                else:
-                    # 다른 예외는 다시 발생시킴
-                    raise
-            conn.commit()
+            cursor.execute(
+                "INSERT INTO fees (test_item, food_category, price, description, display_order, sample_quantity) VALUES (%s, %s, %s, %s, %s, %s)",
+                (test_item, food_category, price, description, display_order, sample_quantity)
+            )
             fee_id = cursor.lastrowid
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return fee_id
         else:
             api = _get_api()
-            return api.create_fee(
+            fee_id = api.create_fee(
                 test_item=test_item,
                 food_category=food_category,
                 price=price,
@@ -111,45 +87,32 @@ class Fee:
                 display_order=display_order,
                 sample_quantity=sample_quantity
             )
+            catalog_cache.invalidate()
+            return fee_id
 
     @staticmethod
     def update(fee_id, test_item, food_category="", price=0, description="", display_order=None, sample_quantity=None):
         """수수료 정보 수정"""
         if is_internal_mode():
+            # display_order, sample_quantity 컬럼은 스키마 마이그레이션에서 보장
+            from migrations import ensure_schema
+            ensure_schema()
+
             conn = _get_connection()
             cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    "UPDATE fees SET test_item = %s, food_category = %s, price = %s, description = %s, display_order = %s, sample_quantity = %s WHERE id = %s",
-                    (test_item, food_category, price, description, display_order or 100, sample_quantity or 0, fee_id)
-                )
-            except Exception as e:
-                # 열이 없는 경우를 처리
-                if "no such column" in str(e):
-                    # 열 추가 시도
-                    try:
-                        cursor.execute("ALTER TABLE fees ADD COLUMN display_order INTEGER DEFAULT 100")
-                    except Exception:
-                        pass
-                    try:
-                        cursor.execute("ALTER TABLE fees ADD COLUMN sample_quantity INTEGER DEFAULT 0")
-                    except Exception:
-                        pass
-                    # 다시 업데이트 시도
-                    cursor.execute(
-                        "UPDATE fees SET test_item = %s, food_category = %s, price = %s, description = %s, display_order = %s, sample_quantity = %s WHERE id = %s",
-                        (test_item, food_category, price, description, display_order or 100, sample_quantity or 0, fee_id)
-                    )
-                else:
-                    # 다른 예외는 다시 발생시킴
-                    raise
-            conn.commit()
+            cursor.execute(
+                "UPDATE fees SET test_item = %s, food_category = %s, price = %s, description = %s, display_order = %s, sample_quantity = %s WHERE id = %s",
+                (test_item, food_category, price, description, display_order or 100, sample_quantity or 0, fee_id)
+            )
             rowcount = cursor.rowcount
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return rowcount > 0
         else:
             api = _get_api()
-            return api.update_fee(
+            success = api.update_fee(
                 fee_id,
                 test_item=test_item,
                 food_category=food_category,
@@ -158,6 +121,8 @@ class Fee:
                 display_order=display_order,
                 sample_quantity=sample_quantity
             )
+            catalog_cache.invalidate()
+            return success
 
     @staticmethod
     def delete(fee_id):
@@ -166,116 +131,155 @@ class Fee:
             conn = _get_connection()
             cursor = conn.cursor()
             cursor.execute("DELETE FROM fees WHERE id = %s", (fee_id,))
-            conn.commit()
             rowcount = cursor.rowcount
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return rowcount > 0
         else:
             api = _get_api()
-            return api.delete_fee(fee_id)
+            success = api.delete_fee(fee_id)
+            catalog_cache.invalidate()
+            return success
 
     @staticmethod
-    def calculate_total_fee(test_items):
-        """검사 항목 목록의 총 수수료 계산"""
-        if not test_items:
-            return 0
+    def bulk_upsert(columns, rows):
+        """수수료 일괄 추가/수정 (엑셀 가져오기, 한 트랜잭션) - 검사항목이 같으면 수정
 
-        # 쉼표로 구분된 문자열을 목록으로 변환
-        if isinstance(test_items, str):
-            items_list = [item.strip() for item in test_items.split(',')]
+        Returns:
+            {'inserted': 추가 수, 'updated': 수정 수}
+        """
+        if is_internal_mode():
+            from utils.bulk_import import FEE_SPEC, upsert_rows
+            return upsert_rows(FEE_SPEC, columns, rows)
         else:
-            items_list = test_items
+            api = _get_api()
+            result = api.bulk_upsert_fees(columns, rows)
+            catalog_cache.invalidate()
+            return result
+
+    @staticmethod
+    def get_prices(test_items):
+        """검사 항목별 단가 일괄 조회 (카탈로그 캐시, DB 조회 없음)
+
+        Returns:
+            {검사항목: 단가} (수수료 표에 없는 항목은 제외)
+        """
+        items = [item for item in dict.fromkeys(_parse_test_items(test_items)) if item]
+        if not items:
+            return {}
+        return catalog_cache.get_prices(items)
+
+    @staticmethod
+    def _build_breakdown(items_list, prices):
+        """항목별 단가 내역 구성"""
+        breakdown = []
+        missing = []
+        total_price = 0
+        for item in items_list:
+            price = prices.get(item)
+            if price is None:
+                missing.append(item)
+                price = 0
+            breakdown.append({'test_item': item, 'price': price})
+            total_price += price
+        return {'total': total_price, 'items': breakdown, 'missing': missing}
+
+    @staticmethod
+    def calculate_fee_breakdown(test_items):
+        """검사 항목 목록의 항목별 수수료 내역 계산
+
+        Returns:
+            {'total': 총액, 'items': [{'test_item', 'price'}, ...], 'missing': [단가 없는 항목]}
+        """
+        items_list = _parse_test_items(test_items)
+        if not items_list:
+            return {'total': 0, 'items': [], 'missing': []}
 
         if is_internal_mode():
-            conn = _get_connection()
-            cursor = conn.cursor()
+            return Fee._build_breakdown(items_list, Fee.get_prices(items_list))
+        else:
+            api = _get_api()
+            return api.calculate_fee_breakdown(items_list)
 
-            total_price = 0
-            for item in items_list:
-                cursor.execute("SELECT price FROM fees WHERE test_item = %s", (item,))
-                fee = cursor.fetchone()
-                if fee:
-                    total_price += fee['price']
+    @staticmethod
+    def calculate_total_fee(test_items):
+        """검사 항목 목록의 총 수수료 계산"""
+        items_list = _parse_test_items(test_items)
+        if not items_list:
+            return 0
 
-            conn.close()
-            return total_price
+        if is_internal_mode():
+            prices = Fee.get_prices(items_list)
+            return sum(prices.get(item, 0) for item in items_list)
         else:
             api = _get_api()
             return api.calculate_fee(items_list)
 
     @staticmethod
-    def import_from_excel(file_path):
-        """Excel 파일에서 수수료 데이터 가져오기 (기존 데이터 삭제 후) - 내부망 전용"""
-        if not is_internal_mode():
-            return False, "엑셀 가져오기는 내부망에서만 가능합니다."
+    def calculate_total_fees(items_by_key):
+        """여러 스케줄의 검사 항목 총 수수료 일괄 계산 (견적 일괄 재계산용)
 
-        try:
-            import openpyxl
+        모든 스케줄의 검사 항목을 모아 단가를 한 번에 조회
 
-            if not os.path.exists(file_path):
-                return False, f"파일이 존재하지 않습니다: {file_path}"
+        Args:
+            items_by_key: {키(스케줄 ID 등): 검사 항목 목록 또는 쉼표 구분 문자열}
 
-            wb = openpyxl.load_workbook(file_path)
-            ws = wb.active
+        Returns:
+            {키: 총 수수료}
+        """
+        if not items_by_key:
+            return {}
 
-            conn = _get_connection()
-            cursor = conn.cursor()
+        parsed = {key: _parse_test_items(items) for key, items in items_by_key.items()}
 
-            # 기존 데이터 삭제
-            cursor.execute("DELETE FROM fees")
-
-            # display_order 열 확인 및 추가 (MySQL)
-            cursor.execute("SHOW COLUMNS FROM fees")
-            columns = [column['Field'] for column in cursor.fetchall()]
-
-            if "display_order" not in columns:
-                cursor.execute("ALTER TABLE fees ADD COLUMN display_order INTEGER DEFAULT 100")
-            if "sample_quantity" not in columns:
-                cursor.execute("ALTER TABLE fees ADD COLUMN sample_quantity INTEGER DEFAULT 0")
-
-            # Excel 데이터 삽입 (첫 번째 행은 헤더이므로 2번째 행부터)
-            # 열: 정렬순서, 식품 카테고리, 검사항목, 가격, 검체 수량(g)
-            inserted_count = 0
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                display_order, food_category, test_item, price, sample_qty = row
-
-                # 빈 행 스킵
-                if not test_item:
-                    continue
-
-                # None 값 처리
-                display_order = display_order if display_order is not None else 100
-                food_category = food_category if food_category else ""
-                price = price if price is not None else 0
-
-                # sample_quantity 처리 (숫자가 아닌 경우 0으로 설정)
-                if sample_qty is None:
-                    sample_qty = 0
-                elif isinstance(sample_qty, str):
-                    # 숫자만 추출 시도
-                    try:
-                        sample_qty = int(''.join(filter(str.isdigit, sample_qty.split('\n')[0][:10])))
-                    except (ValueError, TypeError):
-                        sample_qty = 0
-                else:
-                    try:
-                        sample_qty = int(sample_qty)
-                    except (ValueError, TypeError):
-                        sample_qty = 0
-
-                cursor.execute("""
-                    INSERT INTO fees (test_item, food_category, price, description, display_order, sample_quantity)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (test_item, food_category, price, "", display_order, sample_qty))
-                inserted_count += 1
+        if is_internal_mode():
+            all_items = [item for items in parsed.values() for item in items]
+            prices = Fee.get_prices(all_items)
+            return {
+                key: sum(prices.get(item, 0) for item in items)
+                for key, items in parsed.items()
+            }
+        else:
+            api = _get_api()
+            # JSON 키는 문자열이므로 원래 키로 복원
+            totals = api.calculate_fee_batch({str(key): items for key, items in parsed.items()})
+            return {key: totals.get(str(key), 0) for key in parsed}
 
-            conn.commit()
-            conn.close()
+    @staticmethod
+    def import_from_excel(file_path, progress=None):
+        """Excel 파일로 수수료 전체 교체 (임시 테이블에 적재 후 한 번에 교체)
+
+        열: 정렬순서, 식품 카테고리, 검사항목, 가격, 검체 수량(g) (머리글이 있으면 머리글 기준)
 
-            return True, f"{inserted_count}개의 수수료 데이터가 성공적으로 가져와졌습니다."
+        Returns:
+            (성공 여부, 메시지)
+        """
+        if not os.path.exists(file_path):
+            return False, f"파일이 존재하지 않습니다: {file_path}"
+
+        try:
+            if is_internal_mode():
+                from utils.bulk_import import replace_fees_from_excel
+                count, errors = replace_fees_from_excel(file_path, progress=progress)
+            else:
+                api = _get_api()
+                result = api.import_fees_excel(file_path)
+                catalog_cache.invalidate()
+                if not result:
+                    return False, "가져오기 오류: 서버 응답이 없습니다."
+                count = result.get('count', 0)
+                errors = [tuple(error) for error in result.get('errors', [])]
         except Exception as e:
             return False, f"가져오기 오류: {str(e)}"
 
+        message = f"{count}개의 수수료 데이터가 성공적으로 가져와졌습니다."
+        if errors:
+            message += f"\n제외된 행 {len(errors)}건:\n" + '\n'.join(
+                f"  {row}행: {text}" for row, text in errors[:10])
+        return True, message
+
     @staticmethod
     def delete_all():
         """모든 수수료 데이터 삭제 - 내부망 전용"""
@@ -286,7 +290,9 @@ class Fee:
         conn = _get_connection()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM fees")
-        conn.commit()
         deleted_count = cursor.rowcount
+        bump_catalog_version(cursor)
+        conn.commit()
         conn.close()
+        catalog_cache.invalidate()
         return deleted_count
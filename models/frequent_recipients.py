@@ -14,26 +14,9 @@ class FrequentRecipient:
 
     @staticmethod
     def _ensure_table():
-        """테이블이 없으면 생성"""
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS frequent_recipients (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    name VARCHAR(255) NOT NULL,
-                    recipient_ids TEXT NOT NULL,
-                    cc_ids TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            """)
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"frequent_recipients 테이블 생성 오류: {e}")
+        """테이블이 없으면 생성 (스키마 마이그레이션)"""
+        from migrations import ensure_schema
+        ensure_schema()
 
     @staticmethod
     def get_all(user_id):
@@ -5,9 +5,11 @@
 식품 유형 관리 모델
 내부망: DB 직접 연결
 외부망: API 사용
+조회는 카탈로그 캐시(utils/catalog_cache.py)에서 처리
 '''
 
 from connection_manager import is_internal_mode, connection_manager
+from utils.catalog_cache import catalog_cache, bump_catalog_version
 
 def _get_api():
     """API 클라이언트 반환"""
@@ -21,7 +23,12 @@ def _get_connection():
 class ProductType:
     @staticmethod
     def get_all():
-        """모든 식품 유형 조회"""
+        """모든 식품 유형 조회 (카탈로그 캐시)"""
+        return catalog_cache.get_food_types()
+
+    @staticmethod
+    def _load_all():
+        """모든 식품 유형을 DB/API에서 직접 조회 (카탈로그 캐시 로더)"""
         if is_internal_mode():
             conn = _get_connection()
             cursor = conn.cursor()
@@ -31,54 +38,27 @@ class ProductType:
             return types
         else:
             api = _get_api()
-            return api.get_food_types()
+            return api.get_food_types(use_cache=False)
     
     @staticmethod
     def get_by_name(type_name):
-        """이름으로 식품 유형 조회"""
-        if is_internal_mode():
-            conn = _get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM food_types WHERE type_name = %s", (type_name,))
-            type_info = cursor.fetchone()
-            conn.close()
-            return dict(type_info) if type_info else None
-        else:
-            api = _get_api()
-            return api.get_food_type_by_name(type_name)
+        """이름으로 식품 유형 조회 (카탈로그 캐시)"""
+        return catalog_cache.get_food_type_by_name(type_name)
 
     @staticmethod
     def get_by_id(type_id):
-        """ID로 식품 유형 조회"""
+        """ID로 식품 유형 조회 (카탈로그 캐시)"""
         try:
-            if is_internal_mode():
-                conn = _get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM food_types WHERE id = %s", (type_id,))
-                type_info = cursor.fetchone()
-                conn.close()
-                return dict(type_info) if type_info else None
-            else:
-                api = _get_api()
-                return api.get_food_type(type_id)
+            return catalog_cache.get_food_type_by_id(type_id)
         except Exception as e:
             print(f"식품 유형 ID 조회 중 오류: {str(e)}")
             return None
     
     @staticmethod
     def get_test_items(type_name):
-        """식품 유형의 검사 항목 조회"""
-        if is_internal_mode():
-            conn = _get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT test_items FROM food_types WHERE type_name = %s", (type_name,))
-            result = cursor.fetchone()
-            conn.close()
-            return result['test_items'] if result else ""
-        else:
-            api = _get_api()
-            food_type = api.get_food_type_by_name(type_name)
-            return food_type.get('test_items', '') if food_type else ""
+        """식품 유형의 검사 항목 조회 (카탈로그 캐시)"""
+        food_type = catalog_cache.get_food_type_by_name(type_name)
+        return (food_type.get('test_items') or '') if food_type else ""
     
     @staticmethod
     def create(type_name, category="", sterilization="", pasteurization="", appearance="", test_items=""):
@@ -90,13 +70,15 @@ class ProductType:
                 "INSERT INTO food_types (type_name, category, sterilization, pasteurization, appearance, test_items) VALUES (%s, %s, %s, %s, %s, %s)",
                 (type_name, category, sterilization, pasteurization, appearance, test_items)
             )
-            conn.commit()
             type_id = cursor.lastrowid
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return type_id
         else:
             api = _get_api()
-            return api.create_food_type(
+            type_id = api.create_food_type(
                 type_name=type_name,
                 category=category,
                 sterilization=sterilization,
@@ -104,6 +86,8 @@ class ProductType:
                 appearance=appearance,
                 test_items=test_items
             )
+            catalog_cache.invalidate()
+            return type_id
 
     @staticmethod
     def update(type_id, type_name, category="", sterilization="", pasteurization="", appearance="", test_items=""):
@@ -115,13 +99,15 @@ class ProductType:
                 "UPDATE food_types SET type_name = %s, category = %s, sterilization = %s, pasteurization = %s, appearance = %s, test_items = %s WHERE id = %s",
                 (type_name, category, sterilization, pasteurization, appearance, test_items, type_id)
             )
-            conn.commit()
             rowcount = cursor.rowcount
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return rowcount > 0
         else:
             api = _get_api()
-            return api.update_food_type(
+            success = api.update_food_type(
                 type_id,
                 type_name=type_name,
                 category=category,
@@ -130,6 +116,8 @@ class ProductType:
                 appearance=appearance,
                 test_items=test_items
             )
+            catalog_cache.invalidate()
+            return success
 
     @staticmethod
     def delete(type_id):
@@ -138,13 +126,33 @@ class ProductType:
             conn = _get_connection()
             cursor = conn.cursor()
             cursor.execute("DELETE FROM food_types WHERE id = %s", (type_id,))
-            conn.commit()
             rowcount = cursor.rowcount
+            bump_catalog_version(cursor)
+            conn.commit()
             conn.close()
+            catalog_cache.invalidate()
             return rowcount > 0
         else:
             api = _get_api()
-            return api.delete_food_type(type_id)
+            success = api.delete_food_type(type_id)
+            catalog_cache.invalidate()
+            return success
+
+    @staticmethod
+    def bulk_upsert(columns, rows):
+        """식품 유형 일괄 추가/수정 (엑셀 가져오기, 한 트랜잭션) - 유형명이 같으면 수정
+
+        Returns:
+            {'inserted': 추가 수, 'updated': 수정 수}
+        """
+        if is_internal_mode():
+            from utils.bulk_import import FOOD_TYPE_SPEC, upsert_rows
+            return upsert_rows(FOOD_TYPE_SPEC, columns, rows)
+        else:
+            api = _get_api()
+            result = api.bulk_upsert_food_types(columns, rows)
+            catalog_cache.invalidate()
+            return result
     
     @staticmethod
     def delete_all():
@@ -164,9 +172,11 @@ class ProductType:
 
             # 테이블 데이터 삭제
             cursor.execute("DELETE FROM food_types")
+            bump_catalog_version(cursor)
 
             # 트랜잭션 커밋
             conn.commit()
+            catalog_cache.invalidate()
 
             # 삭제 후 행 수 확인
             cursor.execute("SELECT COUNT(*) as cnt FROM food_types")
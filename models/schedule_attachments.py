@@ -1,10 +1,45 @@
 # models/schedule_attachments.py
 from database import get_connection
 import os
+import re
+import json
+import time
 import shutil
+import hashlib
+import hmac
+import secrets
 from datetime import datetime
 
 
+# 분할 업로드 청크 크기 (1MB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 완료되지 않은 분할 업로드 보관 시간 (24시간 후 정리)
+UPLOAD_EXPIRE_SECONDS = 24 * 60 * 60
+
+# 분할 업로드 ID 형식 (경로 조작 방지)
+_UPLOAD_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# 같은 내용 연결 전 파일 보유 확인 (무작위 구간 수 / 구간 크기)
+PROOF_RANGE_COUNT = 4
+PROOF_RANGE_SIZE = 64 * 1024
+
+
+def proof_digests(file_path, nonce, ranges):
+    """파일 보유 확인 응답 - 구간마다 SHA-256(nonce + 구간 데이터) (hex 목록)
+
+    Args:
+        nonce: 서버가 보낸 임의 값 (hex) - 전체 SHA-256만 알아서는 답할 수 없도록 섞음
+        ranges: [[offset, length], ...]
+    """
+    digests = []
+    with open(file_path, 'rb') as f:
+        for offset, length in ranges:
+            f.seek(offset)
+            digests.append(hashlib.sha256(bytes.fromhex(nonce) + f.read(length)).hexdigest())
+    return digests
+
+
 def _is_internal_mode():
     """내부망 모드 여부 확인"""
     try:
@@ -49,47 +84,35 @@ class ScheduleAttachment:
     ALLOWED_EXTENSIONS = ['.pdf', '.png', '.jpg', '.jpeg', '.xlsx', '.xls',
                          '.doc', '.docx', '.hwp', '.hwpx']
 
-    # 최대 파일 크기 (2MB)
-    MAX_FILE_SIZE = 2 * 1024 * 1024
+    # 최대 파일 크기 (50MB - 성적서 PDF 등, 외부망은 분할 업로드)
+    MAX_FILE_SIZE = 50 * 1024 * 1024
 
     # 첨부파일 저장 디렉토리
     UPLOAD_DIR = 'attachments'
 
+    # 내용 주소 저장소 디렉토리 (UPLOAD_DIR/blobs/<sha256 앞 2자리>/<sha256>)
+    BLOB_DIR = 'blobs'
+
     @staticmethod
     def _ensure_table():
-        """테이블이 없으면 생성"""
+        """테이블이 없으면 생성 (스키마 마이그레이션)"""
         if not _is_internal_mode():
             return  # 외부망에서는 테이블 생성 불필요
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS schedule_attachments (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    schedule_id INT NOT NULL,
-                    file_name VARCHAR(255) NOT NULL,
-                    file_path VARCHAR(500) NOT NULL,
-                    file_size INT DEFAULT 0,
-                    file_type VARCHAR(50),
-                    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (schedule_id) REFERENCES schedules (id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-            ''')
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"테이블 생성 중 오류: {str(e)}")
+        from migrations import ensure_schema
+        ensure_schema()
 
     @staticmethod
-    def _get_upload_dir():
-        """업로드 디렉토리 경로 반환 (없으면 생성)"""
+    def _get_base_path():
+        """첨부파일 상대 경로의 기준 경로 (실행 파일 또는 프로젝트 폴더)"""
         import sys
         if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            return os.path.dirname(sys.executable)
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-        upload_dir = os.path.join(base_path, ScheduleAttachment.UPLOAD_DIR)
+    @staticmethod
+    def _get_upload_dir():
+        """업로드 디렉토리 경로 반환 (없으면 생성)"""
+        upload_dir = os.path.join(ScheduleAttachment._get_base_path(), ScheduleAttachment.UPLOAD_DIR)
         if not os.path.exists(upload_dir):
             os.makedirs(upload_dir)
         return upload_dir
@@ -148,57 +171,510 @@ class ScheduleAttachment:
 
             # 파일 정보
             file_name = os.path.basename(source_file_path)
-            file_ext = os.path.splitext(file_name)[1].lower()
             file_size = os.path.getsize(source_file_path)
 
-            # 확장자 확인
-            if file_ext not in ScheduleAttachment.ALLOWED_EXTENSIONS:
-                allowed = ', '.join(ScheduleAttachment.ALLOWED_EXTENSIONS)
-                return False, f"지원하지 않는 파일 형식입니다.\n지원 형식: {allowed}", None
-
-            # 파일 크기 확인
-            if file_size > ScheduleAttachment.MAX_FILE_SIZE:
-                max_mb = ScheduleAttachment.MAX_FILE_SIZE / (1024 * 1024)
-                return False, f"파일 크기가 {max_mb}MB를 초과합니다.", None
-
-            # 저장 경로 생성 (schedule_id별 폴더)
-            upload_dir = ScheduleAttachment._get_upload_dir()
-            schedule_dir = os.path.join(upload_dir, str(schedule_id))
-            if not os.path.exists(schedule_dir):
-                os.makedirs(schedule_dir)
-
-            # 중복 파일명 처리
-            dest_file_name = file_name
-            dest_path = os.path.join(schedule_dir, dest_file_name)
-            counter = 1
-            while os.path.exists(dest_path):
-                name, ext = os.path.splitext(file_name)
-                dest_file_name = f"{name}_{counter}{ext}"
-                dest_path = os.path.join(schedule_dir, dest_file_name)
-                counter += 1
-
-            # 파일 복사
-            shutil.copy2(source_file_path, dest_path)
-
-            # 상대 경로로 저장
-            relative_path = os.path.join(ScheduleAttachment.UPLOAD_DIR, str(schedule_id), dest_file_name)
-
-            # DB에 저장
-            conn = get_connection()
+            error = ScheduleAttachment._validate_file(file_name, file_size)
+            if error:
+                return False, error, None
+
+            # 같은 내용이 이미 저장되어 있으면 복사하지 않고 참조만 추가
+            sha256 = ScheduleAttachment.compute_sha256(source_file_path)
+            attachment_id = ScheduleAttachment._add_blob_record(
+                schedule_id, file_name, file_size, sha256, source_path=source_file_path
+            )
+            return True, "파일이 업로드되었습니다.", attachment_id
+
+        except Exception as e:
+            return False, f"파일 업로드 오류: {str(e)}", None
+
+    @staticmethod
+    def _validate_file(file_name, file_size):
+        """확장자/크기 확인 (문제 없으면 None, 있으면 오류 메시지)"""
+        file_ext = os.path.splitext(file_name)[1].lower()
+        if file_ext not in ScheduleAttachment.ALLOWED_EXTENSIONS:
+            allowed = ', '.join(ScheduleAttachment.ALLOWED_EXTENSIONS)
+            return f"지원하지 않는 파일 형식입니다.\n지원 형식: {allowed}"
+
+        if file_size > ScheduleAttachment.MAX_FILE_SIZE:
+            max_mb = ScheduleAttachment.MAX_FILE_SIZE / (1024 * 1024)
+            return f"파일 크기가 {max_mb}MB를 초과합니다."
+        return None
+
+    @staticmethod
+    def _get_schedule_dir(schedule_id):
+        """스케줄별 첨부파일 폴더 경로 (없으면 생성)"""
+        schedule_dir = os.path.join(ScheduleAttachment._get_upload_dir(), str(int(schedule_id)))
+        if not os.path.exists(schedule_dir):
+            os.makedirs(schedule_dir, exist_ok=True)
+        return schedule_dir
+
+    # ==================== 내용 주소 저장소 ====================
+    # 같은 내용(SHA-256)의 파일은 attachment_blobs에 한 벌만 저장하고
+    # schedule_attachments 행이 sha256으로 참조 (참조 수 = 해당 sha256 행 수)
+    # 추가/삭제는 attachment_blobs 행을 FOR UPDATE로 잠근 상태에서 파일을 배치/삭제
+    # 전송 전 중복 연결은 무작위 구간 확인으로 파일을 가지고 있는지 확인한 뒤에만 허용
+    # (체크섬만 알아서는 기존 파일에 연결할 수 없음)
+
+    @staticmethod
+    def compute_sha256(file_path):
+        """파일 SHA-256 (hex)"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _blob_relative_path(sha256):
+        return os.path.join(ScheduleAttachment.UPLOAD_DIR, ScheduleAttachment.BLOB_DIR, sha256[:2], sha256)
+
+    @staticmethod
+    def _place_blob(relative_path, source_path, move):
+        """저장소 위치에 파일 배치 (move=True면 이름 변경, 아니면 복사 후 교체)"""
+        blob_path = os.path.join(ScheduleAttachment._get_base_path(), relative_path)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        if move:
+            os.replace(source_path, blob_path)
+        else:
+            tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+            shutil.copy2(source_path, tmp_path)
+            os.replace(tmp_path, blob_path)
+
+    @staticmethod
+    def _add_blob_record(schedule_id, file_name, file_size, sha256, source_path=None, move=False):
+        """저장소 참조로 첨부파일 등록
+
+        Args:
+            source_path: 받은 파일 (저장소에 없으면 배치, 이미 있으면 커밋 후 버림)
+                         None이면 저장소에 이미 있는 내용에만 연결 (없으면 ValueError)
+            move: source_path를 복사하지 않고 이동 (분할 업로드 완료 시)
+                  등록이 실패하면 배치한 파일을 source_path로 되돌림 (다시 완료 요청 가능)
+
+        Returns:
+            새 첨부파일 ID
+        """
+        file_ext = os.path.splitext(file_name)[1].lower()
+        conn = get_connection()
+        placed_path = None  # 이번에 저장소에 배치한 파일
+        try:
             cursor = conn.cursor()
+            # 저장소 행을 먼저 만든 뒤 잠금 - 없는 행을 FOR UPDATE로 조회하면 갭 잠금이 걸려
+            # 같은 내용을 동시에 처음 올릴 때 두 트랜잭션의 INSERT가 서로를 기다림 (교착 상태)
+            cursor.execute('''
+                INSERT IGNORE INTO attachment_blobs (sha256, file_path, file_size)
+                VALUES (%s, %s, %s)
+            ''', (sha256, ScheduleAttachment._blob_relative_path(sha256), file_size))
+            created = cursor.rowcount == 1
+            cursor.execute(
+                "SELECT file_path FROM attachment_blobs WHERE sha256 = %s FOR UPDATE", (sha256,)
+            )
+            relative_path = cursor.fetchone()['file_path']
+            blob_path = os.path.join(ScheduleAttachment._get_base_path(), relative_path)
+            if created or not os.path.exists(blob_path):
+                if source_path is None:
+                    raise ValueError("저장소에 없는 내용입니다.")
+                # 새 내용이거나 저장소 파일이 사라진 경우 받은 파일로 배치
+                ScheduleAttachment._place_blob(relative_path, source_path, move)
+                placed_path = blob_path
+
             cursor.execute('''
                 INSERT INTO schedule_attachments
-                (schedule_id, file_name, file_path, file_size, file_type)
-                VALUES (%s, %s, %s, %s, %s)
-            ''', (schedule_id, dest_file_name, relative_path, file_size, file_ext))
-            conn.commit()
+                (schedule_id, file_name, file_path, file_size, file_type, sha256)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            ''', (schedule_id, file_name, relative_path, file_size, file_ext, sha256))
             attachment_id = cursor.lastrowid
+            conn.commit()
+        except Exception:
+            # 저장소 행 잠금을 쥔 상태에서 배치한 파일을 먼저 되돌린 뒤 롤백
+            if placed_path:
+                try:
+                    if move:
+                        os.replace(placed_path, source_path)
+                    else:
+                        os.remove(placed_path)
+                except OSError as e:
+                    print(f"첨부파일 저장소 파일 복구 오류: {str(e)}")
+            conn.rollback()
+            raise
+        finally:
             conn.close()
 
+        if move and source_path and placed_path is None:
+            # 이미 있는 내용 - 등록이 커밋된 뒤에 받은 파일 버림
+            try:
+                os.remove(source_path)
+            except OSError:
+                pass
+        return attachment_id
+
+    @staticmethod
+    def _release_blob(cursor, sha256):
+        """참조가 남지 않은 저장소 파일 삭제 (호출한 쪽 트랜잭션 안에서 실행, 커밋 전)"""
+        cursor.execute(
+            "SELECT file_path FROM attachment_blobs WHERE sha256 = %s FOR UPDATE", (sha256,)
+        )
+        blob = cursor.fetchone()
+        if not blob:
+            return
+        cursor.execute(
+            "SELECT COUNT(*) as cnt FROM schedule_attachments WHERE sha256 = %s", (sha256,)
+        )
+        if cursor.fetchone()['cnt'] > 0:
+            return
+        cursor.execute("DELETE FROM attachment_blobs WHERE sha256 = %s", (sha256,))
+        blob_path = os.path.join(ScheduleAttachment._get_base_path(), blob['file_path'])
+        if os.path.exists(blob_path):
+            os.remove(blob_path)
+
+    @staticmethod
+    def purge_orphan_blobs():
+        """참조하는 첨부파일이 없는 저장소 파일 정리 (스케줄 삭제 CASCADE 후 등)
+
+        Returns:
+            삭제한 저장소 파일 수
+        """
+        try:
+            conn = get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT b.sha256 FROM attachment_blobs b
+                    LEFT JOIN schedule_attachments a ON a.sha256 = b.sha256
+                    WHERE a.id IS NULL
+                ''')
+                orphans = [row['sha256'] for row in cursor.fetchall()]
+                for sha256 in orphans:
+                    ScheduleAttachment._release_blob(cursor, sha256)
+                    conn.commit()
+                return len(orphans)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"첨부파일 저장소 정리 오류: {str(e)}")
+            return 0
+
+    # ==================== 분할 업로드 (API 서버) ====================
+    # 임시 파일을 거치지 않고 최종 폴더(attachments/<schedule_id>)에 바로 기록
+    # - .upload_<id>.part: 받은 데이터, .upload_<id>.json: 업로드 정보 (워커 간 공유)
+    # - 청크는 현재까지 받은 위치(received)부터 순서대로 기록, 끊기면 상태 조회 후 이어서 전송
+    # - 완료 시 전체 SHA-256 확인 후 저장소 위치로 이름만 변경 (같은 내용이 있으면 버림)
+    # - 완료 후에도 정보 파일에 attachment_id를 남겨 완료 요청을 다시 보내면 같은 ID 반환
+    # - 같은 내용이 저장소에 있으면 시작 응답에 보유 확인 요청(proof)을 넣고,
+    #   link_upload로 맞는 응답을 받으면 전송 없이 등록 (틀리면 그대로 청크 전송)
+
+    @staticmethod
+    def _upload_paths(schedule_id, upload_id):
+        """분할 업로드 (데이터 파일, 정보 파일) 경로"""
+        if not _UPLOAD_ID_PATTERN.match(str(upload_id or '')):
+            raise ValueError("잘못된 업로드 ID입니다.")
+        schedule_dir = ScheduleAttachment._get_schedule_dir(schedule_id)
+        base = os.path.join(schedule_dir, f".upload_{upload_id}")
+        return f"{base}.part", f"{base}.json"
+
+    @staticmethod
+    def _read_upload_meta(meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_upload_meta(meta_path, meta):
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        # 원자적 교체 (다른 워커가 쓰다 만 파일을 읽지 않도록)
+        os.replace(tmp_path, meta_path)
+
+    @staticmethod
+    def _cleanup_expired_uploads(schedule_dir):
+        """보관 시간이 지난 미완료 업로드 정리"""
+        now = time.time()
+        try:
+            names = os.listdir(schedule_dir)
+        except OSError:
+            return
+        for name in names:
+            if not name.startswith('.upload_'):
+                continue
+            path = os.path.join(schedule_dir, name)
+            try:
+                if now - os.path.getmtime(path) > UPLOAD_EXPIRE_SECONDS:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def begin_upload(schedule_id, file_name, file_size, sha256=None):
+        """분할 업로드 시작
+
+        Args:
+            schedule_id: 스케줄 ID
+            file_name: 원본 파일명
+            file_size: 전체 크기 (bytes)
+            sha256: 전체 파일 SHA-256 (hex, 완료 시 확인)
+
+        Returns:
+            (success, message, {'upload_id', 'received', 'chunk_size'})
+            같은 내용이 저장소에 있으면 'proof': {'nonce', 'ranges'} 추가 (link_upload로 응답)
+        """
+        try:
+            file_name = os.path.basename(file_name or '')
+            file_size = int(file_size)
+            if not file_name or file_size < 0:
+                return False, "파일 정보가 올바르지 않습니다.", None
+
+            error = ScheduleAttachment._validate_file(file_name, file_size)
+            if error:
+                return False, error, None
+
+            schedule_dir = ScheduleAttachment._get_schedule_dir(schedule_id)
+            ScheduleAttachment._cleanup_expired_uploads(schedule_dir)
+
+            sha256 = (sha256 or '').lower() or None
+            proof = ScheduleAttachment._proof_challenge(sha256, file_size)
+
+            upload_id = secrets.token_hex(16)
+            part_path, meta_path = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+            open(part_path, 'wb').close()
+            ScheduleAttachment._write_upload_meta(meta_path, {
+                'schedule_id': int(schedule_id),
+                'file_name': file_name,
+                'file_size': file_size,
+                'sha256': sha256,
+                'received': 0,
+                'proof': proof,
+            })
+            info = {
+                'upload_id': upload_id,
+                'received': 0,
+                'chunk_size': UPLOAD_CHUNK_SIZE,
+            }
+            if proof:
+                info['proof'] = proof
+            return True, "업로드를 시작합니다.", info
+        except Exception as e:
+            return False, f"업로드 시작 오류: {str(e)}", None
+
+    @staticmethod
+    def _proof_challenge(sha256, file_size):
+        """같은 내용이 저장소에 있으면 보유 확인 요청 {'nonce', 'ranges'} (없으면 None)"""
+        if not sha256 or not re.match(r'^[0-9a-f]{64}$', sha256) or file_size <= 0:
+            return None
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT file_path, file_size FROM attachment_blobs WHERE sha256 = %s", (sha256,))
+            blob = cursor.fetchone()
+        finally:
+            conn.close()
+        if not blob or blob['file_size'] != file_size:
+            return None
+        if not os.path.exists(os.path.join(ScheduleAttachment._get_base_path(), blob['file_path'])):
+            return None
+
+        length = min(PROOF_RANGE_SIZE, file_size)
+        ranges = [[secrets.randbelow(file_size - length + 1), length] for _ in range(PROOF_RANGE_COUNT)]
+        return {'nonce': secrets.token_hex(16), 'ranges': ranges}
+
+    @staticmethod
+    def link_upload(schedule_id, upload_id, proofs):
+        """보유 확인 응답이 맞으면 파일 전송 없이 저장소의 같은 내용으로 첨부파일 등록
+
+        확인은 업로드마다 한 번만 가능 (틀리면 청크를 보내 일반 업로드로 진행)
+
+        Args:
+            proofs: proof_digests 결과 (구간별 hex 목록)
+
+        Returns:
+            (success, message, attachment_id)
+        """
+        try:
+            part_path, meta_path = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+        except ValueError as e:
+            return False, str(e), None
+
+        meta = ScheduleAttachment._read_upload_meta(meta_path)
+        if meta and meta.get('attachment_id'):
+            return True, "파일이 업로드되었습니다.", meta['attachment_id']
+        if not meta or not meta.get('proof'):
+            return False, "보유 확인 요청이 없는 업로드입니다.", None
+
+        proof = meta.pop('proof')
+        ScheduleAttachment._write_upload_meta(meta_path, meta)
+        try:
+            blob_path = os.path.join(ScheduleAttachment._get_base_path(),
+                                     ScheduleAttachment._blob_relative_path(meta['sha256']))
+            expected = proof_digests(blob_path, proof['nonce'], proof['ranges'])
+            proofs = [str(p).lower() for p in (proofs or [])]
+            if len(proofs) != len(expected) or not all(
+                    hmac.compare_digest(a, b) for a, b in zip(proofs, expected)):
+                return False, "파일 내용을 확인하지 못했습니다. 파일을 전송합니다.", None
+
+            attachment_id = ScheduleAttachment._add_blob_record(
+                schedule_id, meta['file_name'], meta['file_size'], meta['sha256']
+            )
+            meta['attachment_id'] = attachment_id
+            ScheduleAttachment._write_upload_meta(meta_path, meta)
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
             return True, "파일이 업로드되었습니다.", attachment_id
+        except Exception as e:
+            return False, f"첨부파일 연결 오류: {str(e)}", None
+
+    @staticmethod
+    def get_upload_status(schedule_id, upload_id):
+        """분할 업로드 진행 상태 (없으면 None)"""
+        try:
+            _, meta_path = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+        except ValueError:
+            return None
+        meta = ScheduleAttachment._read_upload_meta(meta_path)
+        if not meta:
+            return None
+        return {
+            'upload_id': upload_id,
+            'file_name': meta['file_name'],
+            'file_size': meta['file_size'],
+            'received': meta['received'],
+            'chunk_size': UPLOAD_CHUNK_SIZE,
+        }
+
+    @staticmethod
+    def write_upload_chunk(schedule_id, upload_id, offset, data, sha256=None):
+        """분할 업로드 청크 기록
+
+        Args:
+            offset: 청크 시작 위치 (이미 받은 범위를 다시 보내면 무시)
+            data: 청크 데이터 (bytes)
+            sha256: 청크 SHA-256 (hex, 있으면 확인)
+
+        Returns:
+            (success, message, received)
+        """
+        try:
+            part_path, meta_path = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+        except ValueError as e:
+            return False, str(e), None
+
+        meta = ScheduleAttachment._read_upload_meta(meta_path)
+        if not meta:
+            return False, "업로드 정보를 찾을 수 없습니다.", None
+
+        received = meta['received']
+        offset = int(offset)
+        if sha256 and hashlib.sha256(data).hexdigest() != sha256.lower():
+            return False, "청크 체크섬이 일치하지 않습니다.", received
+        if offset > received:
+            return False, "청크 위치가 올바르지 않습니다.", received
+        if offset + len(data) <= received:
+            return True, "이미 받은 청크입니다.", received  # 재전송된 청크
+        if offset + len(data) > meta['file_size']:
+            return False, "파일 크기를 초과하는 청크입니다.", received
 
+        try:
+            with open(part_path, 'r+b') as f:
+                f.seek(offset)
+                f.write(data)
+            meta['received'] = offset + len(data)
+            ScheduleAttachment._write_upload_meta(meta_path, meta)
+            return True, "청크를 받았습니다.", meta['received']
         except Exception as e:
-            return False, f"파일 업로드 오류: {str(e)}", None
+            return False, f"청크 기록 오류: {str(e)}", received
+
+    @staticmethod
+    def complete_upload(schedule_id, upload_id):
+        """분할 업로드 완료 (크기/체크섬 확인 후 첨부파일 등록)
+
+        이미 완료된 업로드면 등록했던 첨부파일 ID를 그대로 반환
+        (응답을 받지 못한 클라이언트가 다시 요청해도 첨부파일이 중복 등록되지 않음)
+
+        Returns:
+            (success, message, attachment_id)
+        """
+        try:
+            part_path, meta_path = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+        except ValueError as e:
+            return False, str(e), None
+
+        meta = ScheduleAttachment._read_upload_meta(meta_path)
+        if meta and meta.get('attachment_id'):
+            return True, "파일이 업로드되었습니다.", meta['attachment_id']
+        if not meta or not os.path.exists(part_path):
+            return False, "업로드 정보를 찾을 수 없습니다.", None
+
+        if meta['received'] != meta['file_size'] or os.path.getsize(part_path) != meta['file_size']:
+            return False, "파일을 모두 받지 못했습니다.", None
+
+        # 완료 처리 선점 (이름 변경은 원자적 - 동시에 온 완료 요청은 하나만 처리)
+        completing_path = f"{part_path}.completing"
+        try:
+            os.rename(part_path, completing_path)
+        except OSError:
+            return False, "업로드 완료 처리 중입니다. 잠시 후 다시 시도해 주세요.", None
+
+        try:
+            sha256 = ScheduleAttachment.compute_sha256(completing_path)
+            if meta.get('sha256') and sha256 != meta['sha256']:
+                os.rename(completing_path, part_path)
+                return False, "파일 체크섬이 일치하지 않습니다.", None
+
+            # 저장소 위치로 이름만 변경 (복사 없음)
+            attachment_id = ScheduleAttachment._add_blob_record(
+                schedule_id, meta['file_name'], meta['file_size'], sha256,
+                source_path=completing_path, move=True
+            )
+            meta['attachment_id'] = attachment_id
+            ScheduleAttachment._write_upload_meta(meta_path, meta)
+            return True, "파일이 업로드되었습니다.", attachment_id
+        except Exception as e:
+            if os.path.exists(completing_path):
+                os.rename(completing_path, part_path)
+            return False, f"업로드 완료 오류: {str(e)}", None
+
+    @staticmethod
+    def abort_upload(schedule_id, upload_id):
+        """분할 업로드 취소 (받은 데이터 삭제)"""
+        try:
+            paths = ScheduleAttachment._upload_paths(schedule_id, upload_id)
+        except ValueError:
+            return False
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return True
+
+    @staticmethod
+    def save_stream(schedule_id, file_name, stream, file_size):
+        """업로드 스트림을 분할 업로드 방식으로 최종 폴더에 바로 저장 (API 서버, 단일 요청 업로드용)
+
+        Returns:
+            (success, message, attachment_id)
+        """
+        success, message, info = ScheduleAttachment.begin_upload(schedule_id, file_name, file_size)
+        if not success:
+            return False, message, None
+
+        upload_id = info['upload_id']
+        offset = 0
+        while True:
+            data = stream.read(UPLOAD_CHUNK_SIZE)
+            if not data:
+                break
+            success, message, offset = ScheduleAttachment.write_upload_chunk(schedule_id, upload_id, offset, data)
+            if not success:
+                ScheduleAttachment.abort_upload(schedule_id, upload_id)
+                return False, message, None
+
+        success, message, attachment_id = ScheduleAttachment.complete_upload(schedule_id, upload_id)
+        # 단일 요청 업로드는 완료 요청을 다시 받지 않으므로 업로드 정보도 바로 삭제
+        ScheduleAttachment.abort_upload(schedule_id, upload_id)
+        return success, message, attachment_id
 
     @staticmethod
     def delete(attachment_id):
@@ -224,26 +700,31 @@ class ScheduleAttachment:
             cursor = conn.cursor()
 
             # 파일 정보 조회
-            cursor.execute('SELECT file_path FROM schedule_attachments WHERE id = %s', (attachment_id,))
+            cursor.execute('SELECT file_path, sha256 FROM schedule_attachments WHERE id = %s', (attachment_id,))
             result = cursor.fetchone()
 
             if not result:
                 conn.close()
                 return False, "첨부파일을 찾을 수 없습니다."
 
-            # 실제 파일 삭제
-            import sys
-            if getattr(sys, 'frozen', False):
-                base_path = os.path.dirname(sys.executable)
-            else:
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-            file_path = os.path.join(base_path, result['file_path'])
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            if result['sha256']:
+                # 추가 작업과 같은 순서로 저장소 행을 먼저 잠금
+                cursor.execute(
+                    "SELECT sha256 FROM attachment_blobs WHERE sha256 = %s FOR UPDATE", (result['sha256'],)
+                )
 
             # DB에서 삭제
             cursor.execute('DELETE FROM schedule_attachments WHERE id = %s', (attachment_id,))
+
+            if result['sha256']:
+                # 저장소 파일은 다른 참조가 없을 때만 삭제
+                ScheduleAttachment._release_blob(cursor, result['sha256'])
+            else:
+                # 기존 방식(스케줄별 폴더) 파일 삭제
+                file_path = os.path.join(ScheduleAttachment._get_base_path(), result['file_path'])
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
             conn.commit()
             conn.close()
 
@@ -9,6 +9,9 @@ from connection_manager import is_internal_mode, connection_manager
 import datetime
 import time
 
+from utils.business_calendar import experiment_end_date
+from utils.chosung import get_chosung, is_chosung_only
+
 def _get_api():
     """API 클라이언트 반환"""
     return connection_manager.get_api_client()
@@ -19,26 +22,173 @@ def _get_connection():
     return get_connection()
 
 
-# 전역 캐시 변수
-_schedule_cache = {
-    'data': None,
-    'timestamp': 0,
-    'ttl': 30  # 30초 캐시 유효시간
-}
+# 페이지 조회 기본/최대 건수
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+
+def encode_page_cursor(schedule):
+    """페이지 커서 생성 (마지막 행의 created_at|id)"""
+    created_at = schedule.get('created_at')
+    if isinstance(created_at, datetime.datetime):
+        created_at = created_at.strftime('%Y-%m-%d %H:%M:%S')
+    return f"{created_at or ''}|{schedule['id']}"
+
+
+def decode_page_cursor(cursor):
+    """페이지 커서 해석 -> (created_at, id)
+
+    Raises:
+        ValueError: 잘못된 커서 형식
+    """
+    created_at, _, schedule_id = (cursor or '').rpartition('|')
+    if not created_at:
+        raise ValueError(f"잘못된 커서: {cursor}")
+    return created_at.replace('T', ' '), int(schedule_id)
+
+
+def _new_list_cache():
+    """목록 캐시 생성"""
+    return {
+        'data': None,
+        'timestamp': 0,
+        'ttl': 30,  # 30초 캐시 유효시간
+        'server_time': None,  # 마지막 동기화 기준 시각 (서버 DB 시간, 변경분 조회용)
+        'full_sync_at': 0  # 마지막 전체 조회 시각
+    }
+
+
+# 전역 캐시 변수 (전체 컬럼)
+_schedule_cache = _new_list_cache()
+
+# 컬럼 투영별 캐시 {컬럼 튜플: 캐시}
+_projection_caches = {}
+
+# 목록 화면용 요약 컬럼 (견적 상세 first_*/suspend_*/extend_* 및 JSON 데이터 제외)
+# 스케줄을 열 때는 get_by_id로 전체 컬럼 조회
+SUMMARY_COLUMNS = (
+    'id', 'client_id', 'title', 'status', 'product_name', 'food_type_id',
+    'test_method', 'storage_condition', 'custom_temperatures',
+    'test_period_days', 'test_period_months', 'test_period_years',
+    'sampling_count', 'report_interim', 'report_korean', 'report_english',
+    'extension_test', 'report1_date', 'report2_date', 'report3_date',
+    'packaging_weight', 'packaging_unit', 'start_date', 'end_date',
+    'estimate_date', 'expected_date', 'supply_amount', 'tax_amount',
+    'total_amount', 'is_urgent', 'memo', 'created_at', 'updated_at',
+)
+
+# 변경분 동기화 설정
+# - 업체명 등 JOIN 컬럼 변경은 updated_at에 반영되지 않으므로 주기적으로 전체 조회
+FULL_RESYNC_INTERVAL = 600  # 10분
+TOMBSTONE_RETENTION_DAYS = 7  # 삭제 기록 보관 기간
 
 _columns_checked = False  # 컬럼 확인 여부 (앱 실행 중 한 번만)
 
+# 목록 조회 공통 SELECT (전체 조회/변경분 조회에서 사용, {columns}: 스케줄 컬럼)
+_LIST_SELECT = """
+    SELECT {columns},
+           c.name as client_name,
+           c.ceo as client_ceo,
+           c.contact_person as client_contact,
+           c.email as client_email,
+           c.phone as client_phone,
+           c.sales_rep as sales_rep
+    FROM schedules s
+    LEFT JOIN clients c ON s.client_id = c.id
+"""
+
+
+def _list_select(columns=None):
+    """목록 조회 SELECT 문 (columns가 None이면 전체 컬럼)"""
+    if columns is None:
+        return _LIST_SELECT.format(columns='s.*')
+    return _LIST_SELECT.format(columns=', '.join(f's.{col}' for col in columns))
+
+
+def _get_list_cache(columns=None):
+    """컬럼 투영에 해당하는 목록 캐시 반환"""
+    if columns is None:
+        return _schedule_cache
+    key = tuple(columns)
+    if key not in _projection_caches:
+        _projection_caches[key] = _new_list_cache()
+    return _projection_caches[key]
+
+
+def _all_list_caches():
+    return [_schedule_cache] + list(_projection_caches.values())
+
+
+def _columns_to_fields(columns):
+    """API fields 파라미터 값으로 변환"""
+    if columns is None:
+        return None
+    if tuple(columns) == SUMMARY_COLUMNS:
+        return 'summary'
+    return ','.join(columns)
+
+
+def parse_schedule_fields(fields):
+    """API fields 파라미터를 컬럼 목록으로 변환
+
+    Args:
+        fields: None(전체), 'summary', 또는 쉼표로 구분한 요약 컬럼명
+
+    Raises:
+        ValueError: 허용되지 않은 컬럼명
+    """
+    if not fields:
+        return None
+    if fields == 'summary':
+        return SUMMARY_COLUMNS
+    columns = [f.strip() for f in fields.split(',') if f.strip()]
+    invalid = [col for col in columns if col not in SUMMARY_COLUMNS]
+    if invalid:
+        raise ValueError(f"허용되지 않은 컬럼: {', '.join(invalid)}")
+    # 병합/정렬에 필요한 컬럼은 항상 포함
+    for required in ('created_at', 'id'):
+        if required not in columns:
+            columns.insert(0, required)
+    return tuple(columns)
+
 
 def invalidate_schedule_cache():
-    """스케줄 캐시 무효화 (데이터 변경 시 호출)"""
-    _schedule_cache['data'] = None
-    _schedule_cache['timestamp'] = 0
+    """스케줄 캐시 무효화 (데이터 변경 시 호출)
+
+    캐시 데이터는 유지하고 유효시간만 만료시켜 다음 조회 시 변경분만 받아 병합
+    """
+    for cache in _all_list_caches():
+        cache['timestamp'] = 0
+
+
+def reset_schedule_cache():
+    """스케줄 캐시 완전 초기화 (다음 조회 시 전체 다시 받기)"""
+    for cache in _all_list_caches():
+        cache['data'] = None
+        cache['timestamp'] = 0
+        cache['server_time'] = None
+        cache['full_sync_at'] = 0
+
+
+def _schedule_sort_key(schedule):
+    """목록 정렬 키 (created_at DESC, id DESC)"""
+    return (str(schedule.get('created_at') or ''), schedule.get('id') or 0)
+
+
+def _merge_schedule_changes(schedules, changes):
+    """캐시된 스케줄 목록에 변경분(추가/수정/삭제) 병합"""
+    by_id = {s['id']: s for s in schedules}
+    for schedule in changes.get('changed', []):
+        by_id[schedule['id']] = schedule
+    for schedule_id in changes.get('deleted', []):
+        by_id.pop(schedule_id, None)
+    return sorted(by_id.values(), key=_schedule_sort_key, reverse=True)
 
 
 class Schedule:
     @staticmethod
     def _ensure_columns():
-        """필요한 컬럼이 없으면 추가 (내부망 전용) - 앱 실행 중 한 번만 실행"""
+        """스키마 마이그레이션 확인 및 오래된 삭제 기록 정리 (내부망 전용) - 앱 실행 중 한 번만 실행"""
         global _columns_checked
         if _columns_checked:
             return  # 이미 확인됨
@@ -46,74 +196,20 @@ class Schedule:
             _columns_checked = True
             return
         try:
+            from migrations import ensure_schema
+            ensure_schema()
+
             conn = _get_connection()
             cursor = conn.cursor()
-            cursor.execute("SHOW COLUMNS FROM schedules")
-            columns = [col['Field'] for col in cursor.fetchall()]
-
-            # 필요한 컬럼 목록
-            new_columns = {
-                'estimate_date': 'TEXT',
-                'expected_date': 'TEXT',
-                'interim_report_date': 'TEXT',
-                'supply_amount': 'INTEGER DEFAULT 0',
-                'tax_amount': 'INTEGER DEFAULT 0',
-                'total_amount': 'INTEGER DEFAULT 0',
-                'is_urgent': 'INTEGER DEFAULT 0',
-                'report_date': 'TEXT',
-                'report1_date': 'TEXT',
-                'report2_date': 'TEXT',
-                'report3_date': 'TEXT',
-                'interim1_round': 'INTEGER DEFAULT 0',
-                'interim2_round': 'INTEGER DEFAULT 0',
-                'interim3_round': 'INTEGER DEFAULT 0',
-                'extend_period_days': 'INTEGER DEFAULT 0',
-                'extend_period_months': 'INTEGER DEFAULT 0',
-                'extend_period_years': 'INTEGER DEFAULT 0',
-                'extend_experiment_days': 'INTEGER DEFAULT 0',
-                'extend_rounds': 'INTEGER DEFAULT 0',
-                # 1차 견적 필드 (최초 생성 시 고정)
-                'first_item_detail': 'TEXT',
-                'first_cost_per_test': 'INTEGER DEFAULT 0',
-                'first_rounds_cost': 'INTEGER DEFAULT 0',
-                'first_report_cost': 'INTEGER DEFAULT 0',
-                'first_interim_cost': 'INTEGER DEFAULT 0',
-                'first_formula_text': 'TEXT',
-                'first_supply_amount': 'INTEGER DEFAULT 0',
-                'first_tax_amount': 'INTEGER DEFAULT 0',
-                'first_total_amount': 'INTEGER DEFAULT 0',
-                # 중단 견적 필드 (중단 시점 저장)
-                'suspend_item_detail': 'TEXT',
-                'suspend_cost_per_test': 'INTEGER DEFAULT 0',
-                'suspend_rounds_cost': 'INTEGER DEFAULT 0',
-                'suspend_report_cost': 'INTEGER DEFAULT 0',
-                'suspend_interim_cost': 'INTEGER DEFAULT 0',
-                'suspend_formula_text': 'TEXT',
-                'suspend_supply_amount': 'INTEGER DEFAULT 0',
-                'suspend_tax_amount': 'INTEGER DEFAULT 0',
-                'suspend_total_amount': 'INTEGER DEFAULT 0',
-                # 연장 견적 필드 (연장 설정 시 저장)
-                'extend_item_detail': 'TEXT',
-                'extend_cost_per_test': 'INTEGER DEFAULT 0',
-                'extend_rounds_cost': 'INTEGER DEFAULT 0',
-                'extend_report_cost': 'INTEGER DEFAULT 0',
-                'extend_interim_cost': 'INTEGER DEFAULT 0',
-                'extend_formula_text': 'TEXT',
-                'extend_supply_amount': 'INTEGER DEFAULT 0',
-                'extend_tax_amount': 'INTEGER DEFAULT 0',
-                'extend_total_amount': 'INTEGER DEFAULT 0'
-            }
-
-            for col_name, col_type in new_columns.items():
-                if col_name not in columns:
-                    cursor.execute(f"ALTER TABLE schedules ADD COLUMN {col_name} {col_type}")
-                    print(f"컬럼 추가됨: {col_name}")
-
+            cursor.execute(
+                "DELETE FROM schedule_tombstones WHERE deleted_at < NOW() - INTERVAL %s DAY",
+                (TOMBSTONE_RETENTION_DAYS,)
+            )
             conn.commit()
             conn.close()
             _columns_checked = True  # 성공 시에만 플래그 설정
         except Exception as e:
-            print(f"컬럼 추가 중 오류: {str(e)}")
+            print(f"스키마 확인 중 오류: {str(e)}")
             _columns_checked = True  # 오류 시에도 재시도 방지
 
     @staticmethod
@@ -137,13 +233,8 @@ class Schedule:
                 cursor = conn.cursor()
 
                 # 실험 종료일 계산
-                if test_start_date:
-                    from datetime import datetime, timedelta
-                    start = datetime.strptime(test_start_date, '%Y-%m-%d')
-                    total_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
-                    end_date = (start + timedelta(days=total_days)).strftime('%Y-%m-%d')
-                else:
-                    end_date = None
+                end_date = experiment_end_date(test_start_date, test_period_days,
+                                               test_period_months, test_period_years)
 
                 cursor.execute("""
                     INSERT INTO schedules (
@@ -152,16 +243,16 @@ class Schedule:
                         test_period_days, test_period_months, test_period_years,
                         sampling_count, report_interim, report_korean, report_english,
                         extension_test, custom_temperatures, packaging_weight, packaging_unit,
-                        estimate_date, expected_date, interim_report_date
+                        estimate_date, expected_date, interim_report_date, product_name_chosung
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """, (
                     client_id, product_name, test_start_date, end_date, status,
                     product_name, food_type_id, test_method, storage_condition,
                     test_period_days, test_period_months, test_period_years,
                     sampling_count, report_interim, report_korean, report_english,
                     extension_test, custom_temperatures, packaging_weight, packaging_unit,
-                    estimate_date, expected_date, interim_report_date
+                    estimate_date, expected_date, interim_report_date, get_chosung(product_name)
                 ))
 
                 schedule_id = cursor.lastrowid
@@ -219,52 +310,142 @@ class Schedule:
             return None
 
     @staticmethod
-    def get_all(use_cache=True):
+    def get_all(use_cache=True, columns=None):
         """모든 스케줄 조회 (캐싱 지원)
 
         Args:
             use_cache: True면 캐시 사용, False면 강제로 DB에서 조회
+            columns: 조회할 스케줄 컬럼 (None이면 전체, 업체 JOIN 컬럼은 항상 포함)
         """
+        cache = _get_list_cache(columns)
+
         # 캐시 유효성 확인
         current_time = time.time()
-        if use_cache and _schedule_cache['data'] is not None:
-            if current_time - _schedule_cache['timestamp'] < _schedule_cache['ttl']:
-                return _schedule_cache['data']
+        if use_cache and cache['data'] is not None:
+            if current_time - cache['timestamp'] < cache['ttl']:
+                return cache['data']
+
+            # 캐시 만료 - 전체 재조회 주기 전이면 변경분만 받아 병합
+            if (cache['server_time']
+                    and current_time - cache['full_sync_at'] < FULL_RESYNC_INTERVAL):
+                changes = Schedule.get_changes(cache['server_time'], columns=columns)
+                if changes is not None and not changes.get('reset'):
+                    result = _merge_schedule_changes(cache['data'], changes)
+                    cache['data'] = result
+                    cache['timestamp'] = current_time
+                    cache['server_time'] = changes.get('server_time')
+                    return result
 
         try:
+            # 전체 조회 전 기준 시각 확보 (조회 중 변경분을 다음 동기화에서 놓치지 않도록)
+            server_time = Schedule.get_server_time()
+
             if is_internal_mode():
                 Schedule._ensure_columns()
                 conn = _get_connection()
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT s.*,
-                           c.name as client_name,
-                           c.ceo as client_ceo,
-                           c.contact_person as client_contact,
-                           c.email as client_email,
-                           c.phone as client_phone,
-                           c.sales_rep as sales_rep
-                    FROM schedules s
-                    LEFT JOIN clients c ON s.client_id = c.id
-                    ORDER BY s.created_at DESC
-                """)
+                cursor.execute(_list_select(columns) + " ORDER BY s.created_at DESC")
                 schedules = cursor.fetchall()
                 conn.close()
 
                 result = [dict(s) for s in schedules]
             else:
                 api = _get_api()
-                result = api.get_schedules()
+                result = api.get_schedules(fields=_columns_to_fields(columns))
 
             # 캐시 업데이트
-            _schedule_cache['data'] = result
-            _schedule_cache['timestamp'] = current_time
+            cache['data'] = result
+            cache['timestamp'] = current_time
+            cache['server_time'] = server_time
+            cache['full_sync_at'] = current_time
 
             return result
         except Exception as e:
             print(f"스케줄 목록 조회 중 오류: {str(e)}")
             return []
 
+    @staticmethod
+    def get_summary(use_cache=True):
+        """목록 화면용 요약 컬럼만 조회 (캐싱 지원)
+
+        스케줄 상세(견적 필드, 실험 데이터 등)는 get_by_id로 조회
+        """
+        return Schedule.get_all(use_cache=use_cache, columns=SUMMARY_COLUMNS)
+
+    @staticmethod
+    def get_server_time():
+        """변경분 조회 기준 시각 (서버 DB 시간, 'YYYY-MM-DD HH:MM:SS')"""
+        try:
+            if is_internal_mode():
+                conn = _get_connection()
+                cursor = conn.cursor()
+                cursor.execute("SELECT NOW() as now")
+                row = cursor.fetchone()
+                conn.close()
+                return row['now'].strftime('%Y-%m-%d %H:%M:%S') if row else None
+            else:
+                # 외부망은 변경분 응답의 server_time 사용 (빈 변경분 조회로 기준 시각 확보)
+                api = _get_api()
+                changes = api.get_schedule_changes(None)
+                return changes.get('server_time') if changes else None
+        except Exception as e:
+            print(f"서버 시각 조회 중 오류: {str(e)}")
+            return None
+
+    @staticmethod
+    def get_changes(since, columns=None):
+        """since 이후 변경된 스케줄 조회 (추가/수정 + 삭제 기록)
+
+        Args:
+            since: 기준 시각 ('YYYY-MM-DD HH:MM:SS'), None이면 기준 시각만 반환
+            columns: 조회할 스케줄 컬럼 (None이면 전체)
+
+        Returns:
+            {'changed': [스케줄...], 'deleted': [id...], 'server_time': 다음 기준 시각,
+             'reset': 삭제 기록 보관 기간을 넘겨 전체 조회가 필요하면 True}
+            오류 시 None
+        """
+        try:
+            if is_internal_mode():
+                Schedule._ensure_columns()
+                conn = _get_connection()
+                cursor = conn.cursor()
+
+                # 조회 전에 기준 시각을 먼저 잡아 조회 중 변경분 누락 방지
+                cursor.execute("SELECT NOW() as now")
+                server_time = cursor.fetchone()['now'].strftime('%Y-%m-%d %H:%M:%S')
+                result = {'changed': [], 'deleted': [], 'server_time': server_time, 'reset': False}
+
+                if since:
+                    cursor.execute(
+                        "SELECT %s < NOW() - INTERVAL %s DAY as expired",
+                        (since, TOMBSTONE_RETENTION_DAYS)
+                    )
+                    if cursor.fetchone()['expired']:
+                        result['reset'] = True
+                    else:
+                        # 같은 초 안의 변경을 놓치지 않도록 >= 사용 (중복은 병합 시 덮어씀)
+                        cursor.execute(
+                            _list_select(columns) + " WHERE s.updated_at >= %s ORDER BY s.created_at DESC",
+                            (since,)
+                        )
+                        result['changed'] = [dict(s) for s in cursor.fetchall()]
+
+                        cursor.execute(
+                            "SELECT schedule_id FROM schedule_tombstones WHERE deleted_at >= %s",
+                            (since,)
+                        )
+                        result['deleted'] = [row['schedule_id'] for row in cursor.fetchall()]
+
+                conn.close()
+                return result
+            else:
+                api = _get_api()
+                return api.get_schedule_changes(since, fields=_columns_to_fields(columns))
+        except Exception as e:
+            print(f"스케줄 변경분 조회 중 오류: {str(e)}")
+            return None
+
     @staticmethod
     def update_status(schedule_id, status):
         """스케줄 상태 업데이트"""
@@ -298,14 +479,24 @@ class Schedule:
         """스케줄 삭제"""
         try:
             if is_internal_mode():
+                Schedule._ensure_columns()
                 conn = _get_connection()
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM schedules WHERE id = %s", (schedule_id,))
                 success = cursor.rowcount > 0
+                if success:
+                    # 변경분 조회용 삭제 기록
+                    cursor.execute("""
+                        REPLACE INTO schedule_tombstones (schedule_id, deleted_at)
+                        VALUES (%s, NOW())
+                    """, (schedule_id,))
                 conn.commit()
                 conn.close()
                 if success:
                     invalidate_schedule_cache()  # 캐시 무효화
+                    # CASCADE로 삭제된 첨부파일이 참조하던 저장소 파일 정리
+                    from models.schedule_attachments import ScheduleAttachment
+                    ScheduleAttachment.purge_orphan_blobs()
                 return success
             else:
                 api = _get_api()
@@ -444,14 +635,8 @@ class Schedule:
 
                 # 실험 종료일 계산
                 start_date = data.get('start_date')
-                end_date = None
-                if start_date:
-                    from datetime import datetime, timedelta
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    total_days = (data.get('test_period_days', 0) or 0) + \
-                                 ((data.get('test_period_months', 0) or 0) * 30) + \
-                                 ((data.get('test_period_years', 0) or 0) * 365)
-                    end_date = (start + timedelta(days=total_days)).strftime('%Y-%m-%d')
+                end_date = experiment_end_date(start_date, data.get('test_period_days'),
+                                               data.get('test_period_months'), data.get('test_period_years'))
 
                 cursor.execute("""
                     UPDATE schedules SET
@@ -460,6 +645,7 @@ class Schedule:
                         start_date = %s,
                         end_date = %s,
                         product_name = %s,
+                        product_name_chosung = %s,
                         food_type_id = %s,
                         test_method = %s,
                         storage_condition = %s,
@@ -494,6 +680,7 @@ class Schedule:
                     start_date,
                     end_date,
                     data.get('product_name'),
+                    get_chosung(data.get('product_name')),
                     data.get('food_type_id'),
                     data.get('test_method'),
                     data.get('storage_condition'),
@@ -543,6 +730,151 @@ class Schedule:
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def get_page(cursor=None, limit=DEFAULT_PAGE_SIZE, filters=None, sort='desc', columns=SUMMARY_COLUMNS):
+        """스케줄 페이지 조회 (조회 실패 시 빈 페이지 반환, 인자와 반환 값은 fetch_page와 동일)"""
+        try:
+            return Schedule.fetch_page(cursor=cursor, limit=limit, filters=filters, sort=sort, columns=columns)
+        except Exception as e:
+            print(f"스케줄 페이지 조회 중 오류: {str(e)}")
+            return {'items': [], 'next_cursor': None, 'has_more': False}
+
+    @staticmethod
+    def fetch_page(cursor=None, limit=DEFAULT_PAGE_SIZE, filters=None, sort='desc', columns=SUMMARY_COLUMNS):
+        """스케줄 페이지 조회 (created_at, id 기준 키셋 페이지네이션, 조회 실패 시 예외 발생)
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            limit: 페이지 크기 (최대 MAX_PAGE_SIZE)
+            filters: 서버 필터 dict
+                - keyword: 검색어 (keyword_field 기준 LIKE 검색, 초성만 입력하면 저장된 초성 컬럼에서 검색)
+                - keyword_field: 'all'(기본), 'client_name', 'product_name'
+                - keyword_statuses: 검색어와 OR로 묶을 상태 코드 목록 (상태명 검색용)
+                - status: 상태 코드 또는 상태 코드 목록
+                - sales_rep: 영업담당 (본인 담당 스케줄만 조회 시)
+                - date_from, date_to: 시작일 기간
+            sort: 'desc'(최신순, 기본) 또는 'asc'
+            columns: 조회할 스케줄 컬럼 (기본 요약 컬럼, None이면 전체)
+
+        Returns:
+            {'items': [...], 'next_cursor': str 또는 None, 'has_more': bool}
+        """
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        filters = filters or {}
+
+        if is_internal_mode():
+            Schedule._ensure_columns()
+
+            descending = sort != 'asc'
+            query = _list_select(columns) + " WHERE 1=1"
+            params = []
+
+            # 키워드 검색 (상태명 검색 시 해당 상태 코드와 OR)
+            keyword = filters.get('keyword')
+            keyword_statuses = filters.get('keyword_statuses') or []
+            if keyword or keyword_statuses:
+                conditions = []
+                if keyword and is_chosung_only(keyword):
+                    # 초성 검색은 업체명/샘플명 초성 컬럼에서 검색 (제목은 샘플명과 같음)
+                    field = filters.get('keyword_field') or 'all'
+                    like = f"%{keyword}%"
+                    if field == 'client_name':
+                        conditions.append("c.name_chosung LIKE %s")
+                        params.append(like)
+                    elif field == 'product_name':
+                        conditions.append("s.product_name_chosung LIKE %s")
+                        params.append(like)
+                    else:
+                        conditions.append("c.name_chosung LIKE %s OR s.product_name_chosung LIKE %s")
+                        params.extend([like, like])
+                elif keyword:
+                    field = filters.get('keyword_field') or 'all'
+                    like = f"%{keyword}%"
+                    if field == 'client_name':
+                        conditions.append("c.name LIKE %s")
+                        params.append(like)
+                    elif field == 'product_name':
+                        conditions.append("s.product_name LIKE %s")
+                        params.append(like)
+                    else:
+                        conditions.append("s.title LIKE %s OR c.name LIKE %s OR s.product_name LIKE %s")
+                        params.extend([like, like, like])
+                if keyword_statuses:
+                    conditions.append(f"s.status IN ({', '.join(['%s'] * len(keyword_statuses))})")
+                    params.extend(keyword_statuses)
+                query += " AND (" + " OR ".join(conditions) + ")"
+
+            # 상태 필터
+            status = filters.get('status')
+            if status:
+                statuses = [status] if isinstance(status, str) else list(status)
+                query += f" AND s.status IN ({', '.join(['%s'] * len(statuses))})"
+                params.extend(statuses)
+
+            # 영업담당 필터
+            if filters.get('sales_rep'):
+                query += " AND c.sales_rep = %s"
+                params.append(filters['sales_rep'])
+
+            # 기간 필터
+            if filters.get('date_from'):
+                query += " AND s.start_date >= %s"
+                params.append(filters['date_from'])
+            if filters.get('date_to'):
+                query += " AND (s.end_date <= %s OR s.start_date <= %s)"
+                params.extend([filters['date_to'], filters['date_to']])
+
+            # 키셋 조건 (인덱스 idx_schedules_created_id 사용)
+            if cursor:
+                cursor_created_at, cursor_id = decode_page_cursor(cursor)
+                op = '<' if descending else '>'
+                query += f" AND (s.created_at {op} %s OR (s.created_at = %s AND s.id {op} %s))"
+                params.extend([cursor_created_at, cursor_created_at, cursor_id])
+
+            direction = 'DESC' if descending else 'ASC'
+            query += f" ORDER BY s.created_at {direction}, s.id {direction} LIMIT %s"
+            params.append(limit + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
+
+            conn = _get_connection()
+            db_cursor = conn.cursor()
+            db_cursor.execute(query, params)
+            rows = [dict(r) for r in db_cursor.fetchall()]
+            conn.close()
+
+            has_more = len(rows) > limit
+            items = rows[:limit]
+            return {
+                'items': items,
+                'next_cursor': encode_page_cursor(items[-1]) if has_more else None,
+                'has_more': has_more
+            }
+        else:
+            api = _get_api()
+            page = api.get_schedule_page(
+                cursor=cursor, limit=limit, filters=filters, sort=sort,
+                fields=_columns_to_fields(columns)
+            )
+            if page is None:
+                raise RuntimeError("스케줄 페이지 조회 실패 (서버 응답 오류)")
+            return page
+
+    @staticmethod
+    def iter_all(filters=None, columns=SUMMARY_COLUMNS, page_size=MAX_PAGE_SIZE):
+        """조건에 맞는 스케줄을 한 건씩 반환 (내보내기용, fetch_page 키셋 페이지를 차례로 조회)
+
+        중간 페이지 조회에 실패하면 일부만 내보내지 않도록 예외를 그대로 전달
+
+        Args:
+            filters, columns: fetch_page와 동일
+        """
+        cursor = None
+        while True:
+            page = Schedule.fetch_page(cursor=cursor, limit=page_size, filters=filters, columns=columns)
+            yield from page['items']
+            if not page['has_more']:
+                break
+            cursor = page['next_cursor']
+
     @staticmethod
     def get_filtered(keyword=None, status=None, date_from=None, date_to=None):
         """필터링된 스케줄 조회"""
@@ -2,11 +2,19 @@
 """
 애플리케이션 설정 관리 모델
 Dual-mode 지원: 내부망(DB 직접 접근), 외부망(API)
+조회(get/get_all)는 메모리 스냅샷에서 처리하고 저장 시 또는 버전 확인 시 갱신
 """
 
+import threading
+import time
+
 from database import get_connection
 
 
+# 스냅샷 버전 확인 주기 (초) - 다른 PC에서 변경한 설정은 최대 이 시간 후 반영
+SNAPSHOT_CHECK_INTERVAL = 30
+
+
 def _is_internal_mode():
     """내부망 모드 여부 확인"""
     try:
@@ -22,48 +30,153 @@ def _get_api():
     return get_api_client()
 
 
+def get_settings_version(user_id=None):
+    """설정 버전 문자열 (내부망/API 서버 전용)
+
+    행 수, 최종 수정 시각, 값 체크섬을 조합하므로 같은 초에 바뀐 값도 감지
+
+    Args:
+        user_id: 사용자 ID (None이면 공용 설정)
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        if user_id is None:
+            cursor.execute("""
+                SELECT COUNT(*) as cnt, MAX(updated_at) as last_updated,
+                       SUM(CRC32(CONCAT(`key`, '=', value))) as checksum
+                FROM settings
+            """)
+        else:
+            cursor.execute("""
+                SELECT COUNT(*) as cnt, MAX(updated_at) as last_updated,
+                       SUM(CRC32(CONCAT(`key`, '=', IFNULL(value, '')))) as checksum
+                FROM user_settings WHERE user_id = %s
+            """, (user_id,))
+        row = cursor.fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return ''
+    return f"{row['cnt']}:{row['last_updated']}:{row['checksum']}"
+
+
+class _SettingsSnapshot:
+    """설정 {key: value} 메모리 스냅샷
+
+    처음 조회 시 전체를 한 번 로드하고 이후에는 메모리에서 응답
+    SNAPSHOT_CHECK_INTERVAL초마다 서버의 설정 버전을 확인하여 바뀌었으면 다시 로드
+    """
+
+    def __init__(self, load_values, load_version):
+        self._load_values = load_values
+        self._load_version = load_version
+        self._values = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_all(self):
+        with self._lock:
+            now = time.time()
+            if self._values is not None and now - self._checked_at >= SNAPSHOT_CHECK_INTERVAL:
+                self._checked_at = now
+                try:
+                    if self._load_version() != self._version:
+                        self._values = None
+                except Exception as e:
+                    # 버전 확인 실패 시 기존 스냅샷 유지
+                    print(f"설정 버전 확인 오류: {str(e)}")
+
+            if self._values is None:
+                # 버전을 먼저 읽어야 로드 도중 바뀐 값을 다음 확인에서 감지
+                version = self._load_version()
+                self._values = dict(self._load_values() or {})
+                self._version = version
+                self._checked_at = now
+            return self._values
+
+    def invalidate(self):
+        with self._lock:
+            self._values = None
+
+
+def _get_snapshot_version(user_id=None):
+    """현재 모드에 맞게 설정 버전 조회"""
+    if _is_internal_mode():
+        return get_settings_version(user_id)
+    return _get_api().get_settings_version(user_id)
+
+
+def _load_settings_values(user_id=None):
+    """현재 모드에 맞게 설정 전체 조회 (오류 시 예외 발생, 스냅샷 로더)"""
+    if _is_internal_mode():
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            if user_id is None:
+                cursor.execute("SELECT `key`, value FROM settings")
+            else:
+                cursor.execute("SELECT `key`, value FROM user_settings WHERE user_id = %s", (user_id,))
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+        return {row['key']: row['value'] for row in rows}
+
+    api = _get_api()
+    if user_id is None:
+        return api.get_settings()
+    return api.get_user_settings(user_id)
+
+
+_settings_snapshot = _SettingsSnapshot(_load_settings_values, _get_snapshot_version)
+_user_snapshots = {}
+_user_snapshots_lock = threading.Lock()
+
+
+def _get_user_snapshot(user_id):
+    with _user_snapshots_lock:
+        snapshot = _user_snapshots.get(user_id)
+        if snapshot is None:
+            snapshot = _SettingsSnapshot(
+                lambda: _load_settings_values(user_id),
+                lambda: _get_snapshot_version(user_id)
+            )
+            _user_snapshots[user_id] = snapshot
+        return snapshot
+
+
+def invalidate_settings_snapshot(user_id=None):
+    """설정 스냅샷 무효화 (설정을 직접 SQL로 변경한 경우 호출)
+
+    Args:
+        user_id: 사용자 ID (None이면 공용 설정)
+    """
+    if user_id is None:
+        _settings_snapshot.invalidate()
+    else:
+        _get_user_snapshot(user_id).invalidate()
+
+
 class Settings:
     """공용 설정 관리 클래스"""
 
     @staticmethod
     def get_all():
-        """모든 설정 조회 (Dual-mode)
+        """모든 설정 조회 (Dual-mode, 메모리 스냅샷)
 
         Returns:
             dict: {key: value} 형식의 설정 딕셔너리
         """
-        if _is_internal_mode():
-            return Settings._get_all_from_db()
-        else:
-            return Settings._get_all_from_api()
-
-    @staticmethod
-    def _get_all_from_db():
-        """내부망: DB에서 모든 설정 조회"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT `key`, value FROM settings")
-            settings = cursor.fetchall()
-            conn.close()
-            return {s['key']: s['value'] for s in settings}
+            return dict(_settings_snapshot.get_all())
         except Exception as e:
             print(f"설정 조회 오류: {str(e)}")
             return {}
 
-    @staticmethod
-    def _get_all_from_api():
-        """외부망: API에서 모든 설정 조회"""
-        try:
-            api = _get_api()
-            return api.get_settings()
-        except Exception as e:
-            print(f"설정 조회 오류 (API): {str(e)}")
-            return {}
-
     @staticmethod
     def get(key, default=None):
-        """특정 설정 조회 (Dual-mode)
+        """특정 설정 조회 (Dual-mode, 메모리 스냅샷)
 
         Args:
             key: 설정 키
@@ -72,37 +185,12 @@ class Settings:
         Returns:
             설정 값 또는 기본값
         """
-        if _is_internal_mode():
-            return Settings._get_from_db(key, default)
-        else:
-            return Settings._get_from_api(key, default)
-
-    @staticmethod
-    def _get_from_db(key, default=None):
-        """내부망: DB에서 특정 설정 조회"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE `key` = %s", (key,))
-            result = cursor.fetchone()
-            conn.close()
-            if result:
-                return result['value']
-            return default
+            value = _settings_snapshot.get_all().get(key)
         except Exception as e:
             print(f"설정 조회 오류: {str(e)}")
             return default
-
-    @staticmethod
-    def _get_from_api(key, default=None):
-        """외부망: API에서 특정 설정 조회"""
-        try:
-            api = _get_api()
-            value = api.get_setting(key)
-            return value if value is not None else default
-        except Exception as e:
-            print(f"설정 조회 오류 (API): {str(e)}")
-            return default
+        return value if value is not None else default
 
     @staticmethod
     def set(key, value):
@@ -116,9 +204,11 @@ class Settings:
             bool: 성공 여부
         """
         if _is_internal_mode():
-            return Settings._set_to_db(key, value)
+            result = Settings._set_to_db(key, value)
         else:
-            return Settings._set_to_api(key, value)
+            result = Settings._set_to_api(key, value)
+        _settings_snapshot.invalidate()
+        return result
 
     @staticmethod
     def _set_to_db(key, value):
@@ -165,9 +255,11 @@ class Settings:
             bool: 성공 여부
         """
         if _is_internal_mode():
-            return Settings._set_batch_to_db(settings_dict)
+            result = Settings._set_batch_to_db(settings_dict)
         else:
-            return Settings._set_batch_to_api(settings_dict)
+            result = Settings._set_batch_to_api(settings_dict)
+        _settings_snapshot.invalidate()
+        return result
 
     @staticmethod
     def _set_batch_to_db(settings_dict):
@@ -210,7 +302,7 @@ class UserSettings:
 
     @staticmethod
     def get_all(user_id):
-        """사용자의 모든 설정 조회 (Dual-mode)
+        """사용자의 모든 설정 조회 (Dual-mode, 메모리 스냅샷)
 
         Args:
             user_id: 사용자 ID
@@ -218,38 +310,15 @@ class UserSettings:
         Returns:
             dict: {key: value} 형식의 설정 딕셔너리
         """
-        if _is_internal_mode():
-            return UserSettings._get_all_from_db(user_id)
-        else:
-            return UserSettings._get_all_from_api(user_id)
-
-    @staticmethod
-    def _get_all_from_db(user_id):
-        """내부망: DB에서 사용자 설정 조회"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT `key`, value FROM user_settings WHERE user_id = %s", (user_id,))
-            settings = cursor.fetchall()
-            conn.close()
-            return {s['key']: s['value'] for s in settings}
+            return dict(_get_user_snapshot(user_id).get_all())
         except Exception as e:
             print(f"사용자 설정 조회 오류: {str(e)}")
             return {}
 
-    @staticmethod
-    def _get_all_from_api(user_id):
-        """외부망: API에서 사용자 설정 조회"""
-        try:
-            api = _get_api()
-            return api.get_user_settings(user_id)
-        except Exception as e:
-            print(f"사용자 설정 조회 오류 (API): {str(e)}")
-            return {}
-
     @staticmethod
     def get(user_id, key, default=None):
-        """사용자의 특정 설정 조회 (Dual-mode)
+        """사용자의 특정 설정 조회 (Dual-mode, 메모리 스냅샷)
 
         Args:
             user_id: 사용자 ID
@@ -259,37 +328,12 @@ class UserSettings:
         Returns:
             설정 값 또는 기본값
         """
-        if _is_internal_mode():
-            return UserSettings._get_from_db(user_id, key, default)
-        else:
-            return UserSettings._get_from_api(user_id, key, default)
-
-    @staticmethod
-    def _get_from_db(user_id, key, default=None):
-        """내부망: DB에서 사용자 설정 조회"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM user_settings WHERE user_id = %s AND `key` = %s", (user_id, key))
-            result = cursor.fetchone()
-            conn.close()
-            if result:
-                return result['value']
-            return default
+            value = _get_user_snapshot(user_id).get_all().get(key)
         except Exception as e:
             print(f"사용자 설정 조회 오류: {str(e)}")
             return default
-
-    @staticmethod
-    def _get_from_api(user_id, key, default=None):
-        """외부망: API에서 사용자 설정 조회"""
-        try:
-            api = _get_api()
-            value = api.get_user_setting(user_id, key)
-            return value if value is not None else default
-        except Exception as e:
-            print(f"사용자 설정 조회 오류 (API): {str(e)}")
-            return default
+        return value if value is not None else default
 
     @staticmethod
     def set(user_id, key, value):
@@ -304,9 +348,11 @@ class UserSettings:
             bool: 성공 여부
         """
         if _is_internal_mode():
-            return UserSettings._set_to_db(user_id, key, value)
+            result = UserSettings._set_to_db(user_id, key, value)
         else:
-            return UserSettings._set_to_api(user_id, key, value)
+            result = UserSettings._set_to_api(user_id, key, value)
+        _get_user_snapshot(user_id).invalidate()
+        return result
 
     @staticmethod
     def _set_to_db(user_id, key, value):
@@ -354,9 +400,11 @@ class UserSettings:
             bool: 성공 여부
         """
         if _is_internal_mode():
-            return UserSettings._set_batch_to_db(user_id, settings_dict)
+            result = UserSettings._set_batch_to_db(user_id, settings_dict)
         else:
-            return UserSettings._set_batch_to_api(user_id, settings_dict)
+            result = UserSettings._set_batch_to_api(user_id, settings_dict)
+        _get_user_snapshot(user_id).invalidate()
+        return result
 
     @staticmethod
     def _set_batch_to_db(user_id, settings_dict):
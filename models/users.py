@@ -200,33 +200,11 @@ DEFAULT_PASSWORD = 'bfl1411'
 class User:
     @staticmethod
     def _ensure_columns():
-        """필요한 컬럼이 없으면 추가 - 내부망 전용"""
+        """필요한 컬럼이 없으면 추가 (스키마 마이그레이션) - 내부망 전용"""
         if not _is_internal_mode():
             return  # 외부망에서는 컬럼 추가 불가
-        try:
-            conn = _get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SHOW COLUMNS FROM users")
-            columns = [col['Field'] for col in cursor.fetchall()]
-
-            new_columns = {
-                'department': "VARCHAR(255) DEFAULT ''",
-                'permissions': "VARCHAR(2000) DEFAULT '{}'",
-                'email': "VARCHAR(255) DEFAULT ''",
-                'phone': "VARCHAR(50) DEFAULT ''",
-                'is_active': "INT DEFAULT 0",
-                'can_view_all': "INT DEFAULT 0",  # 열람권한: 1=모든 데이터 열람 가능, 0=본인 데이터만
-            }
-
-            for col_name, col_type in new_columns.items():
-                if col_name not in columns:
-                    cursor.execute(f"ALTER TABLE users ADD COLUMN {col_name} {col_type}")
-                    print(f"users 테이블에 컬럼 추가됨: {col_name}")
-
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"users 컬럼 추가 중 오류: {str(e)}")
+        from migrations import ensure_schema
+        ensure_schema()
 
     @staticmethod
     def authenticate(username, password):
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+데이터베이스 스키마 레지스트리
+- information_schema에서 현재 DB의 테이블/컬럼/인덱스 목록을 쿼리 한 번으로 읽어 메모리에 보관
+- "컬럼 X가 있는가" 같은 확인을 SHOW COLUMNS 없이 메모리에서 바로 응답
+- 프로세스당 한 번 로드, DDL 적용 후에는 add_column/add_index로 갱신하거나 다시 로드
+'''
+
+import threading
+
+from database import get_connection
+
+
+# 컬럼(C)과 인덱스(I)를 한 번에 조회
+_SCHEMA_QUERY = '''
+SELECT 'C' AS kind, TABLE_NAME AS table_name, COLUMN_NAME AS name, ORDINAL_POSITION AS position
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE()
+UNION ALL
+SELECT DISTINCT 'I' AS kind, TABLE_NAME AS table_name, INDEX_NAME AS name, 0 AS position
+FROM information_schema.STATISTICS
+WHERE TABLE_SCHEMA = DATABASE()
+ORDER BY kind, table_name, position
+'''
+
+
+class SchemaRegistry:
+    '''테이블별 컬럼/인덱스 목록 메모리 캐시'''
+
+    def __init__(self):
+        self._columns = None   # {테이블: [컬럼, ...]} (정의 순서)
+        self._column_sets = {}  # {테이블: {컬럼(소문자), ...}}
+        self._indexes = {}     # {테이블: {인덱스명(소문자), ...}}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name):
+        # MySQL 식별자는 대소문자 구분 없이 비교
+        return str(name).lower()
+
+    def is_loaded(self):
+        return self._columns is not None
+
+    def load(self, cursor=None):
+        '''information_schema에서 스키마 정보 다시 읽기
+
+        Args:
+            cursor: 사용할 커서 (None이면 새 연결 사용)
+        '''
+        own_conn = None
+        if cursor is None:
+            own_conn = get_connection()
+            cursor = own_conn.cursor()
+        try:
+            cursor.execute(_SCHEMA_QUERY)
+            rows = cursor.fetchall()
+        finally:
+            if own_conn is not None:
+                own_conn.close()
+
+        columns = {}
+        column_sets = {}
+        indexes = {}
+        for row in rows:
+            table = self._key(row['table_name'])
+            if row['kind'] == 'C':
+                columns.setdefault(table, []).append(row['name'])
+                column_sets.setdefault(table, set()).add(self._key(row['name']))
+            else:
+                indexes.setdefault(table, set()).add(self._key(row['name']))
+
+        with self._lock:
+            self._columns = columns
+            self._column_sets = column_sets
+            self._indexes = indexes
+
+    def _ensure_loaded(self):
+        if self._columns is None:
+            self.load()
+
+    def invalidate(self):
+        '''다음 조회 시 다시 로드하도록 초기화'''
+        with self._lock:
+            self._columns = None
+            self._column_sets = {}
+            self._indexes = {}
+
+    def has_table(self, table):
+        self._ensure_loaded()
+        return self._key(table) in self._column_sets
+
+    def has_column(self, table, column):
+        self._ensure_loaded()
+        return self._key(column) in self._column_sets.get(self._key(table), ())
+
+    def has_index(self, table, index_name):
+        self._ensure_loaded()
+        return self._key(index_name) in self._indexes.get(self._key(table), ())
+
+    def get_columns(self, table):
+        '''테이블 컬럼 목록 (정의 순서, 테이블이 없으면 빈 목록)'''
+        self._ensure_loaded()
+        return list(self._columns.get(self._key(table), []))
+
+    def add_column(self, table, column):
+        '''ALTER TABLE ... ADD COLUMN 적용 후 레지스트리 반영'''
+        if self._columns is None:
+            return
+        table = self._key(table)
+        with self._lock:
+            self._columns.setdefault(table, []).append(column)
+            self._column_sets.setdefault(table, set()).add(self._key(column))
+
+    def add_index(self, table, index_name):
+        '''CREATE INDEX 적용 후 레지스트리 반영'''
+        if self._columns is None:
+            return
+        with self._lock:
+            self._indexes.setdefault(self._key(table), set()).add(self._key(index_name))
+
+
+# 싱글톤 인스턴스
+schema_registry = SchemaRegistry()
+
+
+def has_table(table):
+    return schema_registry.has_table(table)
+
+
+def has_column(table, column):
+    return schema_registry.has_column(table, column)
+
+
+def has_index(table, index_name):
+    return schema_registry.has_index(table, index_name)
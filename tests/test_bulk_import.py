@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+엑셀 일괄 가져오기 엔진(검증/정규화, 저장 SQL) 테스트
+'''
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import migrations
+from utils.bulk_import import CLIENT_SPEC, FEE_SPEC, prepare_rows, upsert_rows
+
+
+class FakeCursor:
+    '''기존 행 조회 결과를 돌려주고 실행한 SQL을 기록'''
+
+    def __init__(self, existing):
+        self.existing = existing
+        self.executed = []
+        self.batches = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+    def fetchall(self):
+        return self.existing
+
+    def executemany(self, sql, params):
+        self.batches.append((sql, list(params)))
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.committed = False
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def rows_by_excel_row(rows, columns):
+    return {row: dict(zip(columns, values)) for row, values in rows}
+
+
+class TestPrepareRows:
+    '''prepare_rows 테스트 클래스'''
+
+    def test_alias_precedence(self):
+        '''같은 DB 열의 엑셀 열이 여러 개면 뒤쪽 열 값 우선, 비어 있으면 앞쪽 값'''
+        df = pd.DataFrame({
+            '고객/회사명': ['옛이름', '가나식품'],
+            '업체명': ['새이름', None],
+            '전화번호': ['02-123-4567', None],
+        })
+        columns, rows, result = prepare_rows(df, CLIENT_SPEC)
+        values = rows_by_excel_row(rows, columns)
+        assert values[2]['name'] == '새이름'
+        assert values[3]['name'] == '가나식품'
+        assert values[2]['phone'] == '02-123-4567'
+        assert values[3]['phone'] is None
+        assert result.errors == []
+
+    def test_int_coercion_with_commas(self):
+        '''정수 열은 쉼표 제거 후 변환, 숫자가 아니면 엑셀 행 번호와 함께 오류'''
+        df = pd.DataFrame({
+            '검사항목': ['세균수', '대장균', '수분'],
+            '가격': ['1,200', 3400.0, 'abc'],
+            '정렬순서': ['1,000', None, 7],
+        })
+        columns, rows, result = prepare_rows(df, FEE_SPEC)
+        values = rows_by_excel_row(rows, columns)
+        assert values[2]['price'] == 1200
+        assert values[2]['display_order'] == 1000
+        assert values[3]['price'] == 3400
+        assert values[3]['display_order'] == 2  # 비어 있으면 엑셀 행 순서
+        assert 4 not in values
+        assert result.errors == [(4, "'가격' 값이 숫자가 아닙니다")]
+
+    def test_required_and_blank_key_rows(self):
+        '''필수 값이 없으면 엑셀 행 번호로 오류, 키가 빈 행은 건너뜀'''
+        df = pd.DataFrame({
+            '검사항목': ['세균수', None, '대장균', ' '],
+            '가격': [1000, 2000, None, 3000],
+        })
+        columns, rows, result = prepare_rows(df, FEE_SPEC)
+        assert [row for row, _ in rows] == [2]
+        assert result.total == 4
+        assert result.skipped == 2
+        assert result.errors == [(4, "'가격' 값이 없습니다")]
+
+    def test_missing_columns_not_saved(self):
+        '''엑셀에 없는 열은 저장 열에서 빠짐 (기존 행 값 유지, 기본값은 저장 시 새 행에만)'''
+        df = pd.DataFrame({'검사항목': ['세균수'], '가격': [1000]})
+        columns, rows, _ = prepare_rows(df, FEE_SPEC)
+        assert columns == ['test_item', 'price']
+        assert rows == [(2, ['세균수', 1000])]
+
+    def test_duplicate_keys_keep_last(self):
+        '''같은 키가 여러 번 나오면 마지막 행 값 사용 + 앞 행은 오류로 보고'''
+        df = pd.DataFrame({'검사항목': ['세균수', '세균수'], '가격': [1000, 2000]})
+        columns, rows, result = prepare_rows(df, FEE_SPEC)
+        assert rows == [(3, ['세균수', 2000])]
+        assert result.errors == [(2, "'세균수' 중복 - 3행 값 사용")]
+
+    def test_missing_key_column(self):
+        '''키 열이 없으면 ValueError'''
+        df = pd.DataFrame({'가격': [1000]})
+        with pytest.raises(ValueError, match='검사항목'):
+            prepare_rows(df, FEE_SPEC)
+
+
+class TestUpsertRows:
+    '''upsert_rows 저장 SQL 테스트 클래스'''
+
+    def test_defaults_only_in_insert_values(self, monkeypatch):
+        '''엑셀에 없는 기본값 열은 INSERT 값에만 있고 ON DUPLICATE KEY UPDATE에는 없음'''
+        cursor = FakeCursor(existing=[{'id': 7, 'k': '세균수'}])
+        conn = FakeConnection(cursor)
+        monkeypatch.setattr(database, 'get_connection', lambda: conn)
+        monkeypatch.setattr(migrations, 'ensure_schema', lambda: None)
+        monkeypatch.setattr('utils.catalog_cache.bump_catalog_version', lambda cursor: None)
+
+        saved = upsert_rows(FEE_SPEC, ['test_item', 'price'], [['세균수', 1000], ['수분', 500]])
+        assert saved == {'inserted': 1, 'updated': 1}
+        assert conn.committed
+
+        sql, params = cursor.batches[0]
+        insert_part, update_part = sql.split('ON DUPLICATE KEY UPDATE')
+        assert '`food_category`' in insert_part
+        assert '`display_order`' in insert_part
+        assert update_part.strip() == '`test_item` = VALUES(`test_item`), `price` = VALUES(`price`)'
+
+        # 값 순서: id, 엑셀 열, 기본값 열 (food_category, sample_quantity, display_order=행 순서)
+        assert params == [
+            [7, '세균수', 1000, '', 0, 1],
+            [None, '수분', 500, '', 0, 2],
+        ]
+
+    def test_rejects_unknown_columns(self):
+        '''spec에 없는 열은 저장 거부'''
+        with pytest.raises(ValueError, match='password'):
+            upsert_rows(FEE_SPEC, ['test_item', 'password'], [['세균수', 'x']])
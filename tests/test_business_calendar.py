@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+영업일 달력(공휴일, 대체공휴일, 사용자 지정 휴무일/근무일) 테스트
+'''
+
+import json
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import business_calendar
+from utils.business_calendar import add_business_days, business_days_between, is_business_day
+
+
+@pytest.fixture
+def custom_holidays(monkeypatch):
+    '''custom_holidays 설정 값 지정 (설정 조회 대신 사용) + 달력 캐시 초기화'''
+    setting = {'raw': None}
+
+    def set_entries(entries):
+        setting['raw'] = json.dumps(entries) if entries is not None else None
+
+    monkeypatch.setattr(business_calendar, '_load_custom_holidays', lambda: setting['raw'])
+    monkeypatch.setattr(business_calendar, '_calendar', None)
+    monkeypatch.setattr(business_calendar, '_calendar_key', None)
+    return set_entries
+
+
+class TestBusinessCalendar:
+    '''영업일 달력 테스트 클래스'''
+
+    def test_add_business_days_skips_seollal_and_chuseok(self, custom_holidays):
+        '''설날/추석 연휴와 주말 건너뜀'''
+        # 2026 설날 2/16~2/18 (월~수), 2/13은 금요일
+        assert add_business_days(date(2026, 2, 13), 1) == date(2026, 2, 19)
+        # 2026 추석 9/24~9/26 (목~토)
+        assert add_business_days(date(2026, 9, 23), 1) == date(2026, 9, 28)
+        assert add_business_days(date(2026, 9, 23), 3) == date(2026, 9, 30)
+
+    def test_substitute_holidays(self, custom_holidays):
+        '''대체공휴일 (부처님오신날 / 설날 / 추석이 일요일과 겹침)'''
+        # 2026 부처님오신날 5/24 일요일 -> 5/25 대체공휴일
+        assert not is_business_day(date(2026, 5, 25))
+        assert add_business_days(date(2026, 5, 22), 1) == date(2026, 5, 26)
+        # 2033 설날 1/30 일요일 -> 연휴 다음 첫 평일 2/2 대체공휴일
+        assert not is_business_day(date(2033, 2, 2))
+        assert add_business_days(date(2033, 1, 28), 1) == date(2033, 2, 3)
+        # 2031 추석 9/28 일요일 -> 9/30 대체공휴일
+        assert not is_business_day(date(2031, 9, 30))
+
+    def test_custom_holiday_and_workday(self, custom_holidays):
+        '''설정의 휴무일 추가 / 기본 공휴일 근무 지정'''
+        assert add_business_days(date(2026, 6, 2), 1) == date(2026, 6, 3)
+        custom_holidays([
+            {'date': '2026-06-03', 'name': '지방선거', 'type': 'holiday'},
+            {'date': '2026-05-25', 'name': '근무', 'type': 'workday'},
+            {'date': 'invalid'},
+        ])
+        assert add_business_days(date(2026, 6, 2), 1) == date(2026, 6, 4)
+        assert is_business_day(date(2026, 5, 25))
+        assert add_business_days(date(2026, 5, 22), 1) == date(2026, 5, 25)
+
+    def test_calendar_reused_and_widened(self, custom_holidays):
+        '''같은 범위/설정이면 재사용, 범위 밖 날짜는 범위를 넓혀 다시 생성'''
+        this_year = date.today().year
+        calendar = business_calendar.get_calendar()
+        assert business_calendar.get_calendar(this_year, this_year) is calendar
+
+        later = date(calendar.last_year + 3, 3, 2)
+        add_business_days(later, 10)
+        widened = business_calendar.get_calendar()
+        assert widened is not calendar
+        assert widened.first_year == calendar.first_year
+        assert widened.last_year >= later.year
+
+        # 설정이 바뀌면 다시 생성
+        custom_holidays([{'date': f'{this_year}-07-01', 'type': 'holiday'}])
+        assert business_calendar.get_calendar() is not widened
+
+    def test_between_is_inverse_of_add(self, custom_holidays):
+        '''business_days_between(start, add_business_days(start, n)) == n'''
+        for start in [date(2026, 1, 1), date(2026, 2, 13), date(2026, 9, 24), date(2027, 12, 31)]:
+            for n in range(0, 400, 7):
+                end = add_business_days(start, n)
+                assert business_days_between(start, end) == n
+                assert business_days_between(end, start) == -n
+
+    def test_input_types(self, custom_holidays):
+        '''date / datetime / 문자열 입력과 반환 형식'''
+        assert add_business_days(datetime(2026, 2, 13, 9, 30), 1) == datetime(2026, 2, 19, 9, 30)
+        assert add_business_days('2026-02-13', 1) == datetime(2026, 2, 19)
+        assert business_days_between('2026-02-13', '2026-02-19') == 1
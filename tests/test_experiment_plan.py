@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+온도조건별 실험 계획(O/X 행렬, 견적 계산) 테스트
+'''
+
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import experiment_plan as plan_engine
+from utils.experiment_plan import ExperimentPlan
+
+
+class TestExperimentPlan:
+    '''실험 계획 테스트 클래스'''
+
+    def make_plan(self, **kwargs):
+        return ExperimentPlan(['세균수', '대장균', '수분'], {'세균수': 10000, '대장균': 20000, '수분': 5000}, 4, **kwargs)
+
+    def test_experiment_days(self):
+        '''실험 방법별 실험 일수'''
+        assert plan_engine.experiment_days('real', months=2) == 90
+        assert plan_engine.experiment_days('acceleration', months=2) == 30
+        assert plan_engine.experiment_days('acceleration') == 0
+
+    def test_round_offsets(self):
+        '''회차별 제조후 일수 (마지막 회차는 정확히 실험 일수)'''
+        assert plan_engine.round_offsets(10, 4) == [0, 3, 7, 10]
+        assert plan_engine.round_offsets(7, 1) == [7]
+        assert plan_engine.round_offsets(7, 0) == []
+
+    def test_toggle_and_costs(self):
+        '''O/X 변경이 회차별 비용과 항목별 내역에 반영'''
+        plan = self.make_plan()
+        assert plan.cost_per_test() == 35000
+        assert plan.base_rounds_cost() == 140000
+
+        assert plan.toggle(1, 2) == 'X'
+        assert plan.column_costs().tolist() == [35000, 35000, 15000, 35000]
+        assert plan.base_rounds_cost() == 120000
+        assert plan.item_detail() == '세균수(4회)=40,000원 | 대장균(3회)=60,000원 | 수분(4회)=20,000원'
+        assert plan.completed_rounds() == 2
+
+        assert plan.set_mark(1, 2, 'O') is True
+        assert plan.set_mark(1, 2, 'O') is False
+        assert plan.completed_rounds() == 4
+
+    def test_extend_rounds(self):
+        '''연장 회차 추가/제거 및 저장된 O/X 복원'''
+        plan = self.make_plan(saved_marks={'수분': ['O', 'X', '', 'O', 'X']})
+        assert plan.mark(2, 1) == 'X'
+        assert plan.mark(2, 2) == 'O'
+
+        plan.set_extend_rounds(2)
+        assert plan.total_rounds == 6
+        assert plan.extend_rounds_cost() == 70000
+
+        plan.apply_marks({'수분': ['O', 'X', '', 'O', 'X']}, first_round=4)
+        assert plan.extend_rounds_cost() == 65000
+        assert plan.item_detail(4) == '세균수(2회)=20,000원 | 대장균(2회)=40,000원 | 수분(1회)=5,000원'
+        assert plan.to_dict()['수분'] == ['O', 'X', 'O', 'O', 'X', 'O']
+
+        plan.set_extend_rounds(0)
+        assert plan.extend_rounds == 0
+        assert plan.extend_rounds_cost() == 0
+        assert plan.item_detail(4) == '-'
+
+    def test_estimate_amounts(self):
+        '''견적 금액 및 계산식'''
+        amounts = plan_engine.estimate_amounts(100000, 3, 300000)
+        assert amounts == {'supply': 600000, 'tax': 60000, 'total': 660000,
+                           'formula': '100,000×3+300,000=600,000원'}
+        amounts = plan_engine.estimate_amounts(100000, 1, 200000, 200000)
+        assert amounts['formula'] == '100,000×1+200,000+200,000=500,000원'
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+메시지 변경 알림(long-poll 대기) 테스트
+'''
+
+import asyncio
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.message_notifier import MessageNotifier
+
+
+def make_notifier():
+    # 전역 변경 토큰은 바뀌지 않음 (감시 작업이 요청을 깨우지 않도록 초기 토큰도 같게)
+    notifier = MessageNotifier(lambda: 'token', interval=0.01)
+    notifier._token = 'token'
+    return notifier
+
+
+class TestMessageNotifier:
+    '''메시지 변경 알림 테스트 클래스'''
+
+    def test_notify_between_state_read_and_wait(self):
+        '''상태 조회와 대기 사이에 온 알림도 바로 깨움'''
+        async def scenario():
+            notifier = make_notifier()
+            event = notifier.current_event()  # 상태 조회 전
+            notifier.notify()                 # 조회 ~ 대기 사이에 메시지 도착
+            return await notifier.wait(2, event)
+
+        assert asyncio.run(scenario()) is True
+
+    def test_notify_while_waiting(self):
+        '''대기 중 알림 수신'''
+        async def scenario():
+            notifier = make_notifier()
+            event = notifier.current_event()
+            asyncio.get_running_loop().call_later(0.05, notifier.notify)
+            return await notifier.wait(2, event)
+
+        assert asyncio.run(scenario()) is True
+
+    def test_timeout_without_change(self):
+        '''변경이 없으면 시간 초과'''
+        async def scenario():
+            notifier = make_notifier()
+            return await notifier.wait(0.1, notifier.current_event())
+
+        assert asyncio.run(scenario()) is False
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+첨부파일 저장소 / 분할 업로드 테스트 (DB는 메모리 대체 객체 사용)
+'''
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import schedule_attachments
+from models.schedule_attachments import ScheduleAttachment
+
+
+class FakeDB:
+    '''attachment_blobs / schedule_attachments만 흉내 내는 메모리 DB'''
+
+    def __init__(self):
+        self.blobs = {}        # sha256 -> {'file_path', 'file_size'}
+        self.attachments = []  # (schedule_id, file_name, file_path, file_size, file_type, sha256)
+        self.fail_commit = False
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.pending_blobs = {}
+        self.pending_rows = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        if self.db.fail_commit:
+            raise Exception("commit 실패")
+        self.db.blobs.update(self.pending_blobs)
+        self.db.attachments.extend(self.pending_rows)
+        self.rollback()
+
+    def rollback(self):
+        self.pending_blobs = {}
+        self.pending_rows = []
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def execute(self, sql, params=()):
+        sql = ' '.join(sql.split())
+        db = self.conn.db
+        if sql.startswith('INSERT IGNORE INTO attachment_blobs'):
+            sha256, file_path, file_size = params
+            exists = sha256 in db.blobs or sha256 in self.conn.pending_blobs
+            if not exists:
+                self.conn.pending_blobs[sha256] = {'file_path': file_path, 'file_size': file_size}
+            self.rowcount = 0 if exists else 1
+        elif 'FROM attachment_blobs WHERE sha256 = %s' in sql:
+            blob = self.conn.pending_blobs.get(params[0]) or db.blobs.get(params[0])
+            self.rows = [dict(blob, sha256=params[0])] if blob else []
+        elif sql.startswith('INSERT INTO schedule_attachments'):
+            self.conn.pending_rows.append(params)
+            self.lastrowid = len(db.attachments) + len(self.conn.pending_rows)
+        else:
+            raise AssertionError(f"예상하지 못한 SQL: {sql}")
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(schedule_attachments, 'get_connection', fake.connect)
+    monkeypatch.setattr(ScheduleAttachment, '_get_base_path', staticmethod(lambda: str(tmp_path)))
+    return fake
+
+
+def blob_file(sha256):
+    return os.path.join(ScheduleAttachment._get_base_path(), ScheduleAttachment._blob_relative_path(sha256))
+
+
+def start_upload(data, file_name='report.pdf'):
+    '''분할 업로드 시작 + 전체 청크 전송 -> (upload_id, sha256, part_path)'''
+    sha256 = hashlib.sha256(data).hexdigest()
+    success, _, info = ScheduleAttachment.begin_upload(1, file_name, len(data), sha256)
+    assert success
+    upload_id = info['upload_id']
+    success, _, received = ScheduleAttachment.write_upload_chunk(1, upload_id, 0, data)
+    assert success and received == len(data)
+    part_path, _ = ScheduleAttachment._upload_paths(1, upload_id)
+    return upload_id, sha256, part_path
+
+
+class TestScheduleAttachment:
+    '''첨부파일 테스트 클래스'''
+
+    def test_complete_upload_moves_into_store(self, db):
+        '''완료 시 저장소로 이동 + 다시 완료 요청하면 같은 ID'''
+        data = b'%PDF-1.4 report' * 100
+        upload_id, sha256, part_path = start_upload(data)
+
+        success, _, attachment_id = ScheduleAttachment.complete_upload(1, upload_id)
+        assert success and attachment_id == 1
+        assert not os.path.exists(part_path)
+        with open(blob_file(sha256), 'rb') as f:
+            assert f.read() == data
+        assert ScheduleAttachment.complete_upload(1, upload_id)[2] == attachment_id
+        assert len(db.attachments) == 1
+
+    def test_failed_commit_keeps_upload_retryable(self, db):
+        '''등록 커밋이 실패하면 받은 파일을 되돌려 완료 요청을 다시 보낼 수 있음'''
+        data = b'%PDF-1.4 retry' * 100
+        upload_id, sha256, part_path = start_upload(data)
+
+        db.fail_commit = True
+        success, _, _ = ScheduleAttachment.complete_upload(1, upload_id)
+        assert not success
+        assert not os.path.exists(blob_file(sha256))
+        with open(part_path, 'rb') as f:
+            assert f.read() == data
+
+        db.fail_commit = False
+        success, _, attachment_id = ScheduleAttachment.complete_upload(1, upload_id)
+        assert success and attachment_id
+        assert os.path.exists(blob_file(sha256))
+
+    def test_existing_content_discards_upload_after_commit(self, db):
+        '''같은 내용이 이미 있으면 커밋 후에만 받은 파일을 버림'''
+        data = b'%PDF-1.4 same' * 100
+        first_id, sha256, _ = start_upload(data)
+        assert ScheduleAttachment.complete_upload(1, first_id)[0]
+
+        upload_id, _, part_path = start_upload(data, 'copy.pdf')
+        db.fail_commit = True
+        assert not ScheduleAttachment.complete_upload(1, upload_id)[0]
+        assert os.path.exists(part_path)
+
+        db.fail_commit = False
+        assert ScheduleAttachment.complete_upload(1, upload_id)[0]
+        assert not os.path.exists(part_path)
+        assert not os.path.exists(f"{part_path}.completing")
+        assert os.path.exists(blob_file(sha256))
+        assert len(db.attachments) == 2
+
+    def test_link_existing_content_with_proof(self, db, tmp_path):
+        '''같은 내용이 있으면 구간 보유 확인 후 전송 없이 등록'''
+        data = os.urandom(300 * 1024)
+        first_id, sha256, _ = start_upload(data)
+        assert ScheduleAttachment.complete_upload(1, first_id)[0]
+
+        local_path = tmp_path / 'local.pdf'
+        local_path.write_bytes(data)
+        success, _, info = ScheduleAttachment.begin_upload(2, 'local.pdf', len(data), sha256)
+        assert success
+        proof = info['proof']
+        assert len(proof['ranges']) == schedule_attachments.PROOF_RANGE_COUNT
+
+        digests = schedule_attachments.proof_digests(str(local_path), proof['nonce'], proof['ranges'])
+        success, _, attachment_id = ScheduleAttachment.link_upload(2, info['upload_id'], digests)
+        assert success and attachment_id == 2
+        assert db.attachments[-1][0] == 2 and db.attachments[-1][5] == sha256
+        # 다시 요청해도 같은 ID (완료 요청도 동일)
+        assert ScheduleAttachment.link_upload(2, info['upload_id'], digests)[2] == attachment_id
+        assert ScheduleAttachment.complete_upload(2, info['upload_id'])[2] == attachment_id
+
+    def test_link_rejects_checksum_only_caller(self, db):
+        '''전체 SHA-256만 아는 요청은 연결되지 않고 일반 업로드로 진행'''
+        data = b'%PDF-1.4 secret' * 100
+        first_id, sha256, _ = start_upload(data)
+        assert ScheduleAttachment.complete_upload(1, first_id)[0]
+
+        success, _, info = ScheduleAttachment.begin_upload(2, 'guess.pdf', len(data), sha256)
+        assert success and info['proof']
+        upload_id = info['upload_id']
+        guesses = [sha256] * len(info['proof']['ranges'])
+        assert not ScheduleAttachment.link_upload(2, upload_id, guesses)[0]
+        assert len(db.attachments) == 1
+
+        # 확인은 한 번만 - 맞는 응답을 다시 보내도 연결하지 않음
+        digests = [hashlib.sha256(bytes.fromhex(info['proof']['nonce']) + data[o:o + n]).hexdigest()
+                   for o, n in info['proof']['ranges']]
+        assert not ScheduleAttachment.link_upload(2, upload_id, digests)[0]
+
+        # 파일을 보내면 일반 업로드로 등록
+        assert ScheduleAttachment.write_upload_chunk(2, upload_id, 0, data)[0]
+        assert ScheduleAttachment.complete_upload(2, upload_id)[0]
+        assert len(db.attachments) == 2
+
+    def test_no_proof_for_unknown_content(self, db):
+        '''저장소에 없는 내용은 보유 확인 요청 없음'''
+        data = b'%PDF-1.4 new'
+        success, _, info = ScheduleAttachment.begin_upload(1, 'new.pdf', len(data),
+                                                           hashlib.sha256(data).hexdigest())
+        assert success and 'proof' not in info
+        assert not ScheduleAttachment.link_upload(1, info['upload_id'], [])[0]
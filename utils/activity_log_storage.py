@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+활동 로그 저장 구조 (월별 RANGE 파티션 + 사용자별 요약 테이블) - 내부망 / API 서버 전용
+- activity_logs는 created_at 기준 월별 파티션 (p202610 = 2026년 10월, p_future = 그 이후)
+- 보관 기간 정리는 지난 달 파티션 DROP (행 단위 DELETE 없음), 경계 달만 범위 DELETE
+- 사용자별 요약(get_user_summary)은 activity_log_user_summary에 저장 시 증분 반영
+"""
+
+import datetime
+
+
+SUMMARY_TABLE = 'activity_log_user_summary'
+FUTURE_PARTITION = 'p_future'
+
+# 미리 만들어 두는 다음 달 파티션 수
+PARTITION_MONTHS_AHEAD = 3
+
+# 파티션 테이블 정의 ({table}: 테이블명, {partitions}: 파티션 목록)
+# - 파티션 테이블은 외래 키를 지원하지 않고, 기본 키에 파티션 열(created_at)이 포함되어야 함
+_PARTITIONED_TABLE = '''
+    CREATE TABLE {table} (
+        id INT NOT NULL AUTO_INCREMENT,
+        user_id INT NOT NULL,
+        username VARCHAR(100) NOT NULL,
+        user_name VARCHAR(100) NOT NULL,
+        department VARCHAR(100),
+        action_type VARCHAR(50) NOT NULL,
+        action_name VARCHAR(100) NOT NULL,
+        target_type VARCHAR(50),
+        target_id INT,
+        target_name VARCHAR(200),
+        details TEXT,
+        ip_address VARCHAR(50),
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id, created_at),
+        INDEX idx_activity_logs_created_id (created_at, id),
+        INDEX idx_activity_logs_user_created (user_id, created_at, id),
+        INDEX idx_activity_logs_action_created (action_type, created_at, id),
+        INDEX idx_activity_logs_username_created (username, created_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    PARTITION BY RANGE (UNIX_TIMESTAMP(created_at)) ({partitions})
+'''
+
+_LOG_COLUMNS = ('id, user_id, username, user_name, department, action_type, action_name, '
+                'target_type, target_id, target_name, details, ip_address, created_at')
+
+
+def _month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def _next_month(month):
+    return datetime.date(month.year + (month.month == 12), month.month % 12 + 1, 1)
+
+
+def _partition_name(month):
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+def _partition_month(name):
+    """파티션 이름의 월 (월별 파티션이 아니면 None)"""
+    try:
+        return datetime.date(int(name[1:5]), int(name[5:7]), 1)
+    except (ValueError, IndexError):
+        return None
+
+
+def _partition_definition(month):
+    """month 한 달을 담는 파티션 정의 (상한: 다음 달 1일 0시)"""
+    upper = _next_month(month).strftime('%Y-%m-%d 00:00:00')
+    return f"PARTITION {_partition_name(month)} VALUES LESS THAN (UNIX_TIMESTAMP('{upper}'))"
+
+
+def _month_range(first, last):
+    month = first
+    while month <= last:
+        yield month
+        month = _next_month(month)
+
+
+def list_partitions(cursor):
+    """activity_logs 월별 파티션 목록 [(월, 파티션명), ...] (파티션 테이블이 아니면 빈 목록)"""
+    cursor.execute('''
+        SELECT PARTITION_NAME AS name FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'activity_logs'
+          AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    ''')
+    partitions = []
+    for row in cursor.fetchall():
+        month = _partition_month(row['name'])
+        if month:
+            partitions.append((month, row['name']))
+    return partitions
+
+
+def convert_to_partitioned(cursor):
+    """기존 activity_logs를 월별 파티션 테이블로 변환 + 요약 테이블 채우기 (스키마 마이그레이션)
+
+    새 테이블에 복사한 뒤 RENAME TABLE로 교체 (id는 그대로 유지)
+    복사 ~ RENAME 사이에 기존 테이블에 추가된 로그는 교체 후 새 id로 다시 옮김
+    """
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {SUMMARY_TABLE} (
+            user_id INT PRIMARY KEY,
+            username VARCHAR(100) NOT NULL,
+            user_name VARCHAR(100) NOT NULL,
+            department VARCHAR(100),
+            total_actions INT NOT NULL DEFAULT 0,
+            last_activity TIMESTAMP NULL,
+            INDEX idx_activity_log_user_summary_last (last_activity)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    ''')
+
+    if list_partitions(cursor):
+        return
+
+    cursor.execute("SELECT MIN(created_at) AS first FROM activity_logs")
+    row = cursor.fetchone()
+    today = datetime.date.today()
+    first = _month_start(row['first']) if row and row['first'] else _month_start(today)
+    last = _month_start(today)
+    for _ in range(PARTITION_MONTHS_AHEAD):
+        last = _next_month(last)
+
+    partitions = [_partition_definition(month) for month in _month_range(first, last)]
+    partitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+
+    cursor.execute("DROP TABLE IF EXISTS activity_logs_partitioned")
+    cursor.execute(_PARTITIONED_TABLE.format(table='activity_logs_partitioned',
+                                             partitions=',\n        '.join(partitions)))
+    cursor.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM activity_logs")
+    copied_id = cursor.fetchone()['max_id']
+    cursor.execute(f'''
+        INSERT INTO activity_logs_partitioned ({_LOG_COLUMNS})
+        SELECT id, user_id, username, user_name, department, action_type, action_name,
+               target_type, target_id, target_name, details, ip_address,
+               COALESCE(created_at, CURRENT_TIMESTAMP)
+        FROM activity_logs
+        WHERE id <= %s
+    ''', (copied_id,))
+    cursor.execute("RENAME TABLE activity_logs TO activity_logs_unpartitioned, "
+                   "activity_logs_partitioned TO activity_logs")
+
+    # 복사 이후 기존 테이블에 들어온 로그 (교체 후 새 테이블에 쌓이는 id와 겹치지 않도록 id는 새로 발급)
+    cursor.execute('''
+        INSERT INTO activity_logs (user_id, username, user_name, department, action_type, action_name,
+                                   target_type, target_id, target_name, details, ip_address, created_at)
+        SELECT user_id, username, user_name, department, action_type, action_name,
+               target_type, target_id, target_name, details, ip_address,
+               COALESCE(created_at, CURRENT_TIMESTAMP)
+        FROM activity_logs_unpartitioned
+        WHERE id > %s
+        ORDER BY id
+    ''', (copied_id,))
+    cursor.execute("DROP TABLE activity_logs_unpartitioned")
+
+    cursor.execute(f"DELETE FROM {SUMMARY_TABLE}")
+    cursor.execute(f'''
+        INSERT INTO {SUMMARY_TABLE} (user_id, username, user_name, department, total_actions, last_activity)
+        SELECT user_id, MAX(username), MAX(user_name), MAX(department), COUNT(*), MAX(created_at)
+        FROM activity_logs
+        GROUP BY user_id
+    ''')
+    print(f"[마이그레이션] activity_logs 월별 파티션 변환 완료 ({len(partitions)}개 파티션)")
+
+
+def ensure_future_partitions(cursor, months_ahead=PARTITION_MONTHS_AHEAD):
+    """다음 months_ahead개월 파티션이 없으면 p_future를 나눠 추가
+
+    p_future는 비어 있으므로 REORGANIZE는 데이터 이동 없이 끝남
+    """
+    partitions = list_partitions(cursor)
+    if not partitions:
+        return
+    target = _month_start(datetime.date.today())
+    for _ in range(months_ahead):
+        target = _next_month(target)
+    last = partitions[-1][0]
+    if last >= target:
+        return
+
+    new_months = list(_month_range(_next_month(last), target))
+    definitions = [_partition_definition(month) for month in new_months]
+    definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+    cursor.execute(f"ALTER TABLE activity_logs REORGANIZE PARTITION {FUTURE_PARTITION} INTO ("
+                   + ', '.join(definitions) + ")")
+    print(f"[활동 로그] 파티션 추가: {', '.join(_partition_name(m) for m in new_months)}")
+
+
+def add_to_summary(cursor, entries):
+    """저장한 로그를 사용자별 요약에 반영 (로그 INSERT와 같은 트랜잭션)
+
+    Args:
+        entries: [(user_id, username, user_name, department, created_at), ...]
+    """
+    totals = {}
+    for user_id, username, user_name, department, created_at in entries:
+        count, last, _ = totals.get(user_id, (0, created_at, None))
+        totals[user_id] = (count + 1, max(last, created_at), (username, user_name, department))
+    cursor.executemany(f'''
+        INSERT INTO {SUMMARY_TABLE} (user_id, username, user_name, department, total_actions, last_activity)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            username = VALUES(username), user_name = VALUES(user_name), department = VALUES(department),
+            total_actions = total_actions + VALUES(total_actions),
+            last_activity = GREATEST(COALESCE(last_activity, VALUES(last_activity)), VALUES(last_activity))
+    ''', [(user_id,) + names + (count, last) for user_id, (count, last, names) in totals.items()])
+
+
+def _subtract_from_summary(cursor, counts):
+    """삭제한 로그 수를 사용자별 요약에서 차감"""
+    if not counts:
+        return
+    cursor.executemany(
+        f"UPDATE {SUMMARY_TABLE} SET total_actions = total_actions - %s WHERE user_id = %s",
+        [(row['cnt'], row['user_id']) for row in counts]
+    )
+    cursor.execute(f"DELETE FROM {SUMMARY_TABLE} WHERE total_actions <= 0")
+
+
+def delete_before(cursor, cutoff):
+    """cutoff(날짜) 이전 로그 삭제 - 통째로 지난 달은 파티션 DROP, 경계 달만 범위 DELETE
+
+    DROP PARTITION은 DDL이라 암묵적으로 커밋되므로 먼저 실행하고,
+    요약 차감과 경계 달 DELETE는 그 뒤 호출 측 트랜잭션(commit)에서 함께 반영
+
+    Returns:
+        삭제한 로그 수
+    """
+    cutoff_text = cutoff.strftime('%Y-%m-%d 00:00:00')
+    cutoff_month = _month_start(cutoff)
+    deleted = 0
+
+    # 1. 상한이 cutoff 이전인 파티션 (마지막 파티션 하나는 항상 남김)
+    partitions = list_partitions(cursor)
+    expired = [name for month, name in partitions[:-1] if _next_month(month) <= cutoff_month]
+    if expired:
+        names = ', '.join(expired)
+        cursor.execute(f"SELECT user_id, COUNT(*) AS cnt FROM activity_logs PARTITION ({names}) GROUP BY user_id")
+        counts = cursor.fetchall()
+        cursor.execute(f"ALTER TABLE activity_logs DROP PARTITION {names}")
+        _subtract_from_summary(cursor, counts)
+        deleted += sum(row['cnt'] for row in counts)
+
+    # 2. 경계 달의 나머지 (created_at 범위 조건 - 해당 파티션만 읽음)
+    cursor.execute("SELECT user_id, COUNT(*) AS cnt FROM activity_logs WHERE created_at < %s GROUP BY user_id",
+                   (cutoff_text,))
+    counts = cursor.fetchall()
+    if counts:
+        _subtract_from_summary(cursor, counts)
+        cursor.execute("DELETE FROM activity_logs WHERE created_at < %s", (cutoff_text,))
+        deleted += sum(row['cnt'] for row in counts)
+    return deleted
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+활동 로그 비동기 기록기
+- ActivityLog.log는 메모리 버퍼에 넣고 바로 반환 (사용자 작업에 DB/HTTP 지연 없음)
+- 백그라운드 작업 스레드가 FLUSH_INTERVAL마다 또는 FLUSH_BATCH_SIZE건이 모이면 한 번에 저장
+  (내부망: 다중 행 INSERT 한 번, 외부망: /api/activity-logs/batch 호출 한 번)
+- 버퍼는 MAX_BUFFER건까지만 보관 (서버 장애가 길어지면 오래된 로그부터 버림)
+- 종료 시(MainWindow.closeEvent) stop()으로 남은 로그 저장
+"""
+
+import datetime
+import threading
+import time
+from collections import deque
+
+
+# 저장 주기 (초) / 한 번에 저장하는 최대 건수
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH_SIZE = 200
+
+# 버퍼 최대 건수 (초과 시 가장 오래된 로그부터 버림)
+MAX_BUFFER = 5000
+
+# 저장 실패 시 재시도 대기 (초, 실패할 때마다 두 배, 최대 RETRY_MAX_DELAY)
+RETRY_BASE_DELAY = 2
+RETRY_MAX_DELAY = 60
+
+# 기록 시각과 저장 시각의 최대 허용 차이 (초) - 서버 장애 중 버퍼에 머무를 수 있는 시간
+# 저장 시(ActivityLog.insert_batch) created_at을 DB 시각 기준 [현재 - MAX_QUEUE_LAG, 현재] 범위로 제한
+MAX_QUEUE_LAG = 24 * 60 * 60
+
+
+def _write_entries(entries):
+    """기본 저장 함수 (ActivityLog.write_batch - 내부망/외부망 처리)"""
+    from models.activity_log import ActivityLog
+    ActivityLog.write_batch(entries)
+
+
+class ActivityLogWriter:
+    """활동 로그 버퍼 + 백그라운드 저장 스레드"""
+
+    def __init__(self, write_func=_write_entries, interval=FLUSH_INTERVAL,
+                 batch_size=FLUSH_BATCH_SIZE, max_buffer=MAX_BUFFER):
+        """
+        Args:
+            write_func: write_func(entries) - 실패 시 예외 발생 (버퍼에 남겨 재시도)
+        """
+        self.write_func = write_func
+        self.interval = interval
+        self.batch_size = batch_size
+        self._buffer = deque(maxlen=max_buffer)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 작업 스레드와 flush() 동시 저장 방지
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._dropped = 0
+        self._retry_delay = 0
+
+    def submit(self, entry):
+        """로그 한 건 추가 (바로 반환)"""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(entry)
+            full = len(self._buffer) >= self.batch_size
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='ActivityLogWriter', daemon=True)
+                self._thread.start()
+        if full:
+            self._wakeup.set()
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self):
+        """버퍼의 로그를 지금 저장 (호출 스레드에서 실행)
+
+        Returns:
+            모두 저장했으면 True
+        """
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    return True
+                try:
+                    self.write_func(batch)
+                except Exception as e:
+                    print(f"[활동 로그] 저장 오류 (재시도 예정): {e}")
+                    self._requeue(batch)
+                    return False
+
+    def stop(self, timeout=5):
+        """작업 스레드 중지 + 남은 로그 저장 (종료 시 호출)"""
+        thread = self._thread
+        if thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            thread.join(timeout)
+            self._thread = None
+        if not self.flush():
+            print(f"[활동 로그] 저장하지 못한 로그 {self.pending_count()}건을 버립니다.")
+        if self._dropped:
+            print(f"[활동 로그] 버퍼 초과로 버린 로그: {self._dropped}건")
+
+    def _requeue(self, batch):
+        """저장 실패한 로그를 버퍼 앞에 되돌림 (버퍼가 차 있으면 오래된 것부터 버림)"""
+        with self._lock:
+            room = self._buffer.maxlen - len(self._buffer)
+            if room < len(batch):
+                self._dropped += len(batch) - room
+                batch = batch[len(batch) - room:] if room > 0 else []
+            self._buffer.extendleft(reversed(batch))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self._retry_delay or self.interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            if self.flush():
+                self._retry_delay = 0
+            else:
+                self._retry_delay = min(max(self._retry_delay * 2, RETRY_BASE_DELAY), RETRY_MAX_DELAY)
+
+
+def now_text():
+    """로그 기록 시각 (저장이 늦어져도 실제 작업 시각으로 기록)"""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def clamp_created_at(value, now=None):
+    """클라이언트가 보낸 기록 시각을 [now - MAX_QUEUE_LAG, now] 범위로 제한 (now: DB 시각)
+
+    미래 시각이나 허용 지연보다 오래된 시각이 파티션/보관 기간 정리를 흐트러뜨리지 않도록 함
+    값이 없거나 해석할 수 없으면 now
+
+    Returns:
+        'YYYY-MM-DD HH:MM:SS' 문자열
+    """
+    now = (now or datetime.datetime.now()).replace(microsecond=0)
+    try:
+        created_at = datetime.datetime.fromisoformat(str(value).strip())
+    except (TypeError, ValueError):
+        created_at = now
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone().replace(tzinfo=None)
+    earliest = now - datetime.timedelta(seconds=MAX_QUEUE_LAG)
+    created_at = min(max(created_at.replace(microsecond=0), earliest), now)
+    return created_at.strftime('%Y-%m-%d %H:%M:%S')
+
+
+# 싱글톤 인스턴스
+activity_log_writer = ActivityLogWriter()
@@ -0,0 +1,554 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+엑셀 일괄 가져오기 엔진 (업체 / 수수료 / 식품유형)
+- 검증/정규화는 pandas 열 단위로 처리 (행마다 반복하지 않음)
+- 저장은 연결 하나, 트랜잭션 하나에서 executemany 배치로 처리
+  (기존 행은 id 기준 INSERT ... ON DUPLICATE KEY UPDATE, 새 행은 같은 문장에서 INSERT)
+- 엑셀에 없는 열은 새 행에만 기본값으로 저장하고 기존 행 값은 바꾸지 않음
+- 행별 오류는 엑셀 행 번호와 함께 반환
+- 외부망은 모델의 bulk_upsert()가 API 서버로 전달해 서버에서 같은 엔진 실행
+"""
+
+import pandas as pd
+
+from utils.chosung import client_chosung_values
+
+
+# executemany 한 번에 보내는 행 수
+IMPORT_BATCH_SIZE = 1000
+
+# 정수 열 기본값: 엑셀 행 순서(1부터, 열이 없으면 저장하는 행 순서)
+ROW_NUMBER = 'row_number'
+
+
+class ImportSpec:
+    """가져오기 대상 정의"""
+
+    def __init__(self, name, label, table, key, aliases, int_columns=None,
+                 required=None, defaults=None, catalog=False, derived=None):
+        """
+        Args:
+            name: 대상 이름 ('clients' / 'fees' / 'food_types')
+            label: 메시지용 이름
+            table: 테이블명
+            key: 기존 행 판별 열 (같은 값이면 수정)
+            aliases: [(엑셀 열 이름, DB 열), ...] - 같은 DB 열에 여러 이름 가능, 뒤쪽 열 값 우선
+            int_columns: 정수로 변환할 열
+            required: 값이 없으면 오류로 보고할 열 (키 열이 비면 빈 행으로 건너뜀)
+            defaults: 값이 비었을 때 기본값 (엑셀에 열이 없으면 새 행에만 적용, 기존 행 값은 유지)
+            catalog: 수수료/식품유형 카탈로그 여부 (저장 시 카탈로그 버전 증가)
+            derived: 저장 시 다른 열에서 계산해 함께 저장할 열 (값 dict -> {열: 값}, 예: 초성)
+        """
+        self.name = name
+        self.label = label
+        self.table = table
+        self.key = key
+        self.aliases = aliases
+        self.int_columns = set(int_columns or ())
+        self.required = list(required or ())
+        self.defaults = dict(defaults or {})
+        self.catalog = catalog
+        self.derived = derived
+
+    def column_label(self, column):
+        """DB 열의 엑셀 열 이름 (메시지용)"""
+        for excel_col, c in self.aliases:
+            if c == column and excel_col != column:
+                return excel_col
+        return column
+
+    @property
+    def columns(self):
+        """저장 가능한 DB 열 (정의 순서)"""
+        columns = []
+        for _, column in self.aliases:
+            if column not in columns:
+                columns.append(column)
+        return columns
+
+
+CLIENT_SPEC = ImportSpec(
+    'clients', '업체', 'clients', 'name',
+    aliases=[
+        ("name", "name"), ("고객/회사명", "name"), ("업체명", "name"),
+        ("대표자", "ceo"),
+        ("사업자번호", "business_no"), ("사업자", "business_no"),
+        ("분류", "category"),
+        ("전화번호", "phone"),
+        ("팩스번호", "fax"), ("팩스", "fax"),
+        ("담당자", "contact_person"),
+        ("EMAIL", "email"), ("이메일", "email"),
+        ("영업담당", "sales_rep"), ("영업담당자", "sales_rep"),
+        ("우편번호", "zip_code"),
+        ("소재지", "address"), ("업체주소", "address"), ("주소", "address"),
+        ("상세주소", "detail_address"),
+        ("메모", "notes"),
+        ("영문(업체명)", "sales_business"), ("(영업)업무", "sales_business"), ("영업업무", "sales_business"),
+        ("영문(대표자)", "sales_phone"), ("(영업)대표번호", "sales_phone"), ("영업대표번호", "sales_phone"),
+        ("영문(우편번호)", "sales_mobile"), ("(영업)핸드폰", "sales_mobile"), ("영업핸드폰", "sales_mobile"),
+        ("핸드폰", "mobile"),
+        ("영문(업체주소)", "sales_address"), ("(영업)업체주소", "sales_address"), ("영업업체주소", "sales_address"),
+    ],
+    derived=client_chosung_values
+)
+
+FEE_SPEC = ImportSpec(
+    'fees', '수수료', 'fees', 'test_item',
+    aliases=[
+        ("검사항목", "test_item"),
+        ("식품 카테고리", "food_category"),
+        ("가격", "price"),
+        ("검체 수량(g)", "sample_quantity"),
+        ("정렬순서", "display_order"),
+    ],
+    int_columns=['price', 'sample_quantity', 'display_order'],
+    required=['price'],
+    defaults={'food_category': '', 'sample_quantity': 0, 'display_order': ROW_NUMBER},
+    catalog=True
+)
+
+FOOD_TYPE_SPEC = ImportSpec(
+    'food_types', '식품유형', 'food_types', 'type_name',
+    aliases=[
+        ("식품유형", "type_name"),
+        ("카테고리", "category"),
+        ("단서조항_1", "sterilization"),
+        ("단서조항_2", "pasteurization"),
+        ("성상", "appearance"),
+        ("검사항목", "test_items"),
+    ],
+    defaults={'category': '', 'sterilization': '', 'pasteurization': '',
+              'appearance': '', 'test_items': ''},
+    catalog=True
+)
+
+SPECS = {spec.name: spec for spec in (CLIENT_SPEC, FEE_SPEC, FOOD_TYPE_SPEC)}
+
+
+class ImportResult:
+    """가져오기 결과"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.total = 0        # 엑셀 데이터 행 수
+        self.inserted = 0
+        self.updated = 0
+        self.skipped = 0      # 키 열이 빈 행
+        self.errors = []      # [(엑셀 행 번호, 메시지), ...]
+
+    def summary(self):
+        lines = [
+            f"{self.spec.label} 정보 가져오기가 완료되었습니다.",
+            f"- 새로 추가된 항목: {self.inserted}개",
+            f"- 업데이트된 항목: {self.updated}개",
+            f"- 건너뛴 항목: {self.skipped}개",
+        ]
+        if self.errors:
+            lines.append(f"- 오류: {len(self.errors)}건")
+        return '\n'.join(lines)
+
+    def error_text(self):
+        return '\n'.join(f"{row}행: {message}" for row, message in self.errors)
+
+
+# ==================== 검증 / 정규화 ====================
+
+
+def _normalize_header(name):
+    """열 이름 비교용 (공백 제거, 소문자)"""
+    if isinstance(name, str):
+        return name.lower().replace(" ", "")
+    return ""
+
+
+def _text_column(series):
+    """문자열 정리 (앞뒤 공백 제거, 빈 문자열은 결측값)"""
+    text = series.astype(str).str.strip()
+    # 숫자로 읽힌 우편번호/전화번호 등의 '.0' 제거
+    text = text.where(~(series.map(lambda v: isinstance(v, float))), text.str.replace(r'\.0$', '', regex=True))
+    return text.where(series.notna() & (text != ''))
+
+
+def prepare_rows(df, spec):
+    """엑셀 DataFrame을 저장할 행 목록으로 변환
+
+    Returns:
+        (columns, rows, result)
+        columns: 저장할 DB 열 목록 (키 열이 첫 번째)
+        rows: [(엑셀 행 번호, [값, ...]), ...] - 키가 같은 행은 마지막 행만 남김
+        result: ImportResult (total, skipped, errors 채워짐)
+    """
+    result = ImportResult(spec)
+    result.total = len(df)
+    headers = {_normalize_header(col): col for col in df.columns}
+    excel_rows = pd.Series(range(2, len(df) + 2), index=df.index)  # 1행은 머리글
+
+    # 1. 열 매핑 (같은 DB 열에 여러 엑셀 열이 있으면 뒤쪽 값 우선)
+    data = pd.DataFrame(index=df.index)
+    for excel_col, column in spec.aliases:
+        actual = headers.get(_normalize_header(excel_col))
+        if actual is None:
+            continue
+        values = _text_column(df[actual])
+        if column in data:
+            data[column] = values.where(values.notna(), data[column])
+        else:
+            data[column] = values
+
+    for column in [spec.key] + spec.required:
+        if column not in data:
+            names = [excel for excel, c in spec.aliases if c == column and excel != column]
+            raise ValueError(f"엑셀 파일에 {' 또는 '.join(repr(n) for n in names)} 열이 없습니다.")
+
+    # 2. 키 열이 빈 행은 건너뜀
+    blank = data[spec.key].isna()
+    result.skipped = int(blank.sum())
+    data = data[~blank]
+    excel_rows = excel_rows[~blank]
+
+    # 3. 기본값 / 정수 변환 / 필수 값 검사
+    error_masks = []
+    for column in spec.columns:
+        if column not in data:
+            continue  # 엑셀에 없는 열은 저장 시 새 행에만 기본값 적용
+        default = spec.defaults.get(column)
+        if column in spec.int_columns:
+            raw = data[column].map(lambda v: v.replace(',', '') if isinstance(v, str) else v)
+            numbers = pd.to_numeric(raw, errors='coerce')
+            invalid = data[column].notna() & numbers.isna()
+            if invalid.any():
+                error_masks.append((invalid, f"'{spec.column_label(column)}' 값이 숫자가 아닙니다"))
+            numbers = numbers.round()
+            if default == ROW_NUMBER:
+                numbers = numbers.fillna(excel_rows - 1)
+            elif default is not None:
+                numbers = numbers.fillna(default)
+            data[column] = numbers.astype('Int64')
+        elif default is not None:
+            data[column] = data[column].fillna(default)
+
+    for column in spec.required:
+        error_masks.append((data[column].isna(), f"'{spec.column_label(column)}' 값이 없습니다"))
+
+    invalid_rows = pd.Series(False, index=data.index)
+    for mask, message in error_masks:
+        mask = mask & ~invalid_rows
+        result.errors.extend((int(row), message) for row in excel_rows[mask])
+        invalid_rows |= mask
+    data = data[~invalid_rows]
+    excel_rows = excel_rows[~invalid_rows]
+
+    # 4. 같은 키가 여러 번 나오면 마지막 행 사용
+    duplicated = data[spec.key].duplicated(keep='last')
+    if duplicated.any():
+        last_rows = pd.Series(excel_rows.values, index=data[spec.key].values)
+        last_rows = last_rows[~last_rows.index.duplicated(keep='last')]
+        for row, key in zip(excel_rows[duplicated], data[spec.key][duplicated]):
+            result.errors.append((int(row), f"'{key}' 중복 - {int(last_rows[key])}행 값 사용"))
+        data = data[~duplicated]
+        excel_rows = excel_rows[~duplicated]
+
+    result.errors.sort()
+    columns = [spec.key] + [c for c in spec.columns if c != spec.key and c in data]
+    data = data[columns].astype(object).where(data[columns].notna(), None)
+    rows = list(zip((int(r) for r in excel_rows), data.values.tolist()))
+    return columns, rows, result
+
+
+def read_excel(file_path, spec):
+    """엑셀 파일 읽기 + 검증 (모든 값을 원본 그대로 읽고 열 단위로 변환)"""
+    df = pd.read_excel(file_path, dtype=object)
+    return prepare_rows(df, spec)
+
+
+# ==================== 저장 (내부망 / API 서버) ====================
+
+
+def upsert_rows(spec, columns, rows, progress=None, batch_size=IMPORT_BATCH_SIZE):
+    """일괄 저장 (연결 하나, 트랜잭션 하나) - 내부망 / API 서버 전용
+
+    Args:
+        columns: DB 열 목록 (키 열 포함, spec.columns 안에서만 허용)
+            여기 없는 spec.defaults 열은 새 행에만 기본값으로 저장 (기존 행은 수정하지 않음)
+        rows: [[값, ...], ...]
+        progress: progress(저장한 행 수, 전체 행 수) 콜백
+
+    Returns:
+        {'inserted': 새 행 수, 'updated': 수정한 행 수}
+    """
+    from database import get_connection
+
+    unknown = [c for c in columns if c not in spec.columns]
+    if unknown or spec.key not in columns:
+        raise ValueError(f"허용되지 않는 열: {', '.join(unknown) or spec.key + ' 없음'}")
+    if not rows:
+        return {'inserted': 0, 'updated': 0}
+
+    if spec.table == 'clients' or spec.catalog:
+        # detail_address, display_order 등 추가 컬럼은 스키마 마이그레이션에서 보장
+        from migrations import ensure_schema
+        ensure_schema()
+
+    key_index = columns.index(spec.key)
+    if spec.derived:
+        # 계산 열은 원본 열 뒤에 추가 (검증 대상 아님)
+        derived_columns = list(spec.derived(dict.fromkeys(columns)))
+        rows = [list(values) + list(spec.derived(dict(zip(columns, values))).values()) for values in rows]
+        columns = list(columns) + derived_columns
+    # 엑셀에 없는 기본값 열은 INSERT 값에만 포함 (ON DUPLICATE KEY UPDATE 대상 아님)
+    default_columns = [c for c in spec.defaults if c not in columns]
+    default_values = [spec.defaults[c] for c in default_columns]
+    rows = [list(values) + [position if default == ROW_NUMBER else default for default in default_values]
+            for position, values in enumerate(rows, 1)]
+    update_sql = ', '.join(f"`{c}` = VALUES(`{c}`)" for c in columns)
+    columns = list(columns) + default_columns
+    column_sql = ', '.join(f"`{c}`" for c in columns)
+    placeholders = ', '.join(['%s'] * (len(columns) + 1))
+    sql = (f"INSERT INTO {spec.table} (id, {column_sql}) VALUES ({placeholders}) "
+           f"ON DUPLICATE KEY UPDATE {update_sql}")
+
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        # 기존 행 id (같은 키가 여러 행이면 가장 먼저 등록된 행)
+        cursor.execute(f"SELECT id, `{spec.key}` AS k FROM {spec.table} ORDER BY id")
+        existing = {}
+        for row in cursor.fetchall():
+            existing.setdefault(row['k'], row['id'])
+
+        params = [[existing.get(values[key_index])] + list(values) for values in rows]
+        updated = sum(1 for p in params if p[0] is not None)
+
+        for start in range(0, len(params), batch_size):
+            cursor.executemany(sql, params[start:start + batch_size])
+            if progress:
+                progress(min(start + batch_size, len(params)), len(params))
+
+        if spec.catalog:
+            from utils.catalog_cache import bump_catalog_version
+            bump_catalog_version(cursor)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if spec.catalog:
+        from utils.catalog_cache import catalog_cache
+        catalog_cache.invalidate()
+    return {'inserted': len(params) - updated, 'updated': updated}
+
+
+# ==================== 실행 ====================
+
+
+def import_excel(file_path, spec, upsert_func, progress=None, is_cancelled=None):
+    """엑셀 파일 가져오기 (읽기 -> 검증 -> 일괄 저장)
+
+    Args:
+        spec: ImportSpec
+        upsert_func: upsert_func(columns, rows) -> {'inserted', 'updated'}
+            (모델의 bulk_upsert - 내부망/외부망 처리)
+        progress: progress(단계 메시지) 콜백
+        is_cancelled: 취소 여부 함수 (저장 시작 전까지만 취소 가능 - 저장은 한 트랜잭션)
+
+    Returns:
+        ImportResult
+    """
+    if progress:
+        progress("엑셀 파일 읽는 중...")
+    columns, rows, result = read_excel(file_path, spec)
+
+    if is_cancelled and is_cancelled():
+        return None
+    if progress:
+        progress(f"{len(rows)}건 저장 중...")
+
+    if rows:
+        saved = upsert_func(columns, [values for _, values in rows])
+        result.inserted = saved.get('inserted', 0)
+        result.updated = saved.get('updated', 0)
+    return result
+
+
+# ==================== 수수료 전체 교체 ====================
+
+
+# 수수료 엑셀 기본 열 순서 (머리글로 열을 찾지 못한 경우)
+FEE_SHEET_COLUMNS = ['display_order', 'food_category', 'test_item', 'price', 'sample_quantity']
+
+# 적재용 임시 테이블 / 교체 직후 이전 테이블 / 동시 실행 방지 잠금 이름
+FEE_STAGING_TABLE = 'fees_import'
+FEE_PREVIOUS_TABLE = 'fees_previous'
+FEE_IMPORT_LOCK = 'fees_import'
+
+
+def _to_int(value):
+    """엑셀 셀 값을 정수로 변환 (변환 불가 시 ValueError)"""
+    if isinstance(value, str):
+        value = value.replace(',', '').strip()
+    return int(round(float(value)))
+
+
+def _sample_quantity(value):
+    """검체 수량 (문자열이면 첫 줄의 숫자만 사용, 없으면 0)"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        digits = ''.join(filter(str.isdigit, value.split('\n')[0][:10]))
+        return int(digits) if digits else 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def read_fee_sheet(file_path):
+    """수수료 엑셀을 한 행씩 읽기 (openpyxl read-only 스트리밍, 전체를 메모리에 올리지 않음)
+
+    Yields:
+        (엑셀 행 번호, (test_item, food_category, price, display_order, sample_quantity) 또는 None, 오류 메시지)
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+
+        # 머리글로 열 위치 찾기 (없으면 기본 열 순서)
+        labels = {_normalize_header(excel): column for excel, column in FEE_SPEC.aliases}
+        index = {}
+        for i, name in enumerate(header):
+            column = labels.get(_normalize_header(name))
+            if column and column not in index:
+                index[column] = i
+        if 'test_item' not in index:
+            index = {column: i for i, column in enumerate(FEE_SHEET_COLUMNS)}
+
+        for row_no, row in enumerate(rows, 2):
+            values = {column: (row[i] if i < len(row) else None) for column, i in index.items()}
+            test_item = values.get('test_item')
+            test_item = str(test_item).strip() if test_item is not None else ''
+            if not test_item:
+                continue
+
+            try:
+                price = _to_int(values['price']) if values.get('price') is not None else 0
+            except (ValueError, TypeError):
+                yield row_no, None, f"'가격' 값이 숫자가 아닙니다: {values.get('price')}"
+                continue
+            try:
+                display_order = _to_int(values['display_order']) if values.get('display_order') is not None else 100
+            except (ValueError, TypeError):
+                display_order = 100
+
+            food_category = values.get('food_category')
+            food_category = str(food_category).strip() if food_category else ""
+            yield row_no, (test_item, food_category, price, display_order,
+                           _sample_quantity(values.get('sample_quantity'))), None
+    finally:
+        wb.close()
+
+
+def replace_fees_from_excel(file_path, progress=None, batch_size=IMPORT_BATCH_SIZE):
+    """수수료 엑셀로 fees 테이블 전체 교체 - 내부망 / API 서버 전용
+
+    - 임시 테이블에 검사항목 고유 키를 두고 INSERT ... ON DUPLICATE KEY UPDATE 배치로 적재
+      (같은 검사항목이 여러 행이면 마지막 행 값, 기존 검사항목은 id 유지)
+    - 적재가 끝나면 RENAME TABLE 한 문장으로 교체하므로 조회 중에 반쯤 적재된 수수료가 보이지 않음
+    - 적재 중 오류가 나면 기존 수수료는 그대로 유지
+
+    Args:
+        progress: progress(적재한 행 수) 콜백
+
+    Returns:
+        (교체 후 수수료 수, [(엑셀 행 번호, 오류 메시지), ...])
+    """
+    from database import get_connection
+    from migrations import ensure_schema
+    from utils.catalog_cache import bump_catalog_version, catalog_cache
+
+    # 컬럼 추가 등 스키마 변경은 적재 전에 끝냄
+    ensure_schema()
+
+    insert_sql = f'''
+        INSERT INTO {FEE_STAGING_TABLE}
+            (id, test_item, food_category, price, description, display_order, sample_quantity)
+        VALUES (%s, %s, %s, %s, '', %s, %s)
+        ON DUPLICATE KEY UPDATE
+            food_category = VALUES(food_category), price = VALUES(price),
+            display_order = VALUES(display_order), sample_quantity = VALUES(sample_quantity)
+    '''
+
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT GET_LOCK(%s, 0) AS locked", (FEE_IMPORT_LOCK,))
+        if not cursor.fetchone()['locked']:
+            raise RuntimeError("다른 사용자가 수수료를 가져오는 중입니다. 잠시 후 다시 시도해주세요.")
+
+        swapped = False
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {FEE_STAGING_TABLE}")
+            cursor.execute(f"CREATE TABLE {FEE_STAGING_TABLE} LIKE fees")
+            cursor.execute(f"ALTER TABLE {FEE_STAGING_TABLE} ADD UNIQUE KEY uq_{FEE_STAGING_TABLE}_test_item (test_item)")
+
+            # 기존 검사항목 id 유지, 새 항목은 기존 최대 id 다음부터
+            cursor.execute("SELECT id, test_item FROM fees ORDER BY id")
+            existing = {}
+            for row in cursor.fetchall():
+                existing.setdefault(row['test_item'], row['id'])
+            cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 AS next_id FROM fees")
+            next_id = int(cursor.fetchone()['next_id'])
+            cursor.execute(f"ALTER TABLE {FEE_STAGING_TABLE} AUTO_INCREMENT = {next_id}")
+
+            errors = []
+            batch = []
+            loaded = 0
+            for row_no, values, error in read_fee_sheet(file_path):
+                if error:
+                    errors.append((row_no, error))
+                    continue
+                batch.append((existing.get(values[0]),) + values)
+                if len(batch) >= batch_size:
+                    cursor.executemany(insert_sql, batch)
+                    loaded += len(batch)
+                    batch = []
+                    if progress:
+                        progress(loaded)
+            if batch:
+                cursor.executemany(insert_sql, batch)
+                loaded += len(batch)
+                if progress:
+                    progress(loaded)
+            conn.commit()
+
+            cursor.execute(f"SELECT COUNT(*) AS cnt FROM {FEE_STAGING_TABLE}")
+            count = cursor.fetchone()['cnt']
+            if count == 0:
+                raise ValueError("가져올 수수료 데이터가 없습니다.")
+
+            # 교체 (운영 테이블과 같은 인덱스 구성으로 되돌린 뒤 한 문장으로 이름 교환)
+            cursor.execute(f"ALTER TABLE {FEE_STAGING_TABLE} DROP INDEX uq_{FEE_STAGING_TABLE}_test_item")
+            cursor.execute(f"DROP TABLE IF EXISTS {FEE_PREVIOUS_TABLE}")
+            cursor.execute(f"RENAME TABLE fees TO {FEE_PREVIOUS_TABLE}, {FEE_STAGING_TABLE} TO fees")
+            swapped = True
+            cursor.execute(f"DROP TABLE {FEE_PREVIOUS_TABLE}")
+
+            bump_catalog_version(cursor)
+            conn.commit()
+        finally:
+            if not swapped:
+                conn.rollback()
+                cursor.execute(f"DROP TABLE IF EXISTS {FEE_STAGING_TABLE}")
+            cursor.execute("DO RELEASE_LOCK(%s)", (FEE_IMPORT_LOCK,))
+    finally:
+        conn.close()
+
+    catalog_cache.invalidate()
+    return count, errors
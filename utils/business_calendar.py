@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+한국 영업일 달력 (화면 / 스케줄 모델 공용)
+- 공휴일 = 기본 공휴일 표(고정 공휴일 + 음력 공휴일 + 대체공휴일) + 설정의 custom_holidays
+- 연도 범위의 영업일 서수(ordinal) 배열과 누적 개수 배열을 한 번 만들어 두고 재사용
+  (add_business_days: O(1), business_days_between: O(1), 범위 밖이면 범위를 넓혀 다시 생성)
+- custom_holidays 설정이 바뀌면 다음 조회 때 다시 생성
+"""
+
+import json
+import threading
+from array import array
+from datetime import date, datetime, timedelta
+
+
+# 설정 키: [{"date": "2026-06-03", "name": "지방선거", "type": "holiday"}, ...]
+# type: 'holiday' = 휴무일 추가, 'workday' = 기본 공휴일이지만 근무
+CUSTOM_HOLIDAYS_KEY = 'custom_holidays'
+
+# 처음 만들 때 포함하는 범위 (올해 기준 앞뒤 연도 수)
+YEARS_BEFORE = 1
+YEARS_AFTER = 5
+
+# 고정 공휴일 (월, 일, 이름, 대체공휴일 기준)
+# substitute_type: 'none'=미적용, 'sunday'=일요일만, 'weekend'=토/일 모두
+FIXED_HOLIDAYS = [
+    (1, 1, '신정', 'none'),           # 신정 - 대체공휴일 미적용
+    (3, 1, '삼일절', 'sunday'),       # 삼일절 - 일요일만 대체공휴일
+    (5, 5, '어린이날', 'weekend'),    # 어린이날 - 토/일 모두 대체공휴일
+    (6, 6, '현충일', 'none'),         # 현충일 - 대체공휴일 미적용
+    (8, 15, '광복절', 'sunday'),      # 광복절 - 일요일만 대체공휴일
+    (10, 3, '개천절', 'sunday'),      # 개천절 - 일요일만 대체공휴일
+    (10, 9, '한글날', 'sunday'),      # 한글날 - 일요일만 대체공휴일
+    (12, 25, '크리스마스', 'sunday'), # 크리스마스 - 일요일만 대체공휴일
+]
+
+# 음력 공휴일 (양력 변환 - 연도별 정확한 날짜)
+# 설날 연휴 (전날, 당일, 다음날), 추석 연휴 (전날, 당일, 다음날)
+LUNAR_HOLIDAYS = {
+    # 2025-2030년
+    2025: {
+        'seollal': [(1, 28), (1, 29), (1, 30)],
+        'chuseok': [(10, 5), (10, 6), (10, 7)],
+    },
+    2026: {
+        'seollal': [(2, 16), (2, 17), (2, 18)],
+        'chuseok': [(9, 24), (9, 25), (9, 26)],
+    },
+    2027: {
+        'seollal': [(2, 5), (2, 6), (2, 7)],
+        'chuseok': [(10, 13), (10, 14), (10, 15)],
+    },
+    2028: {
+        'seollal': [(1, 25), (1, 26), (1, 27)],
+        'chuseok': [(10, 1), (10, 2), (10, 3)],
+    },
+    2029: {
+        'seollal': [(2, 12), (2, 13), (2, 14)],
+        'chuseok': [(9, 21), (9, 22), (9, 23)],
+    },
+    2030: {
+        'seollal': [(2, 2), (2, 3), (2, 4)],
+        'chuseok': [(10, 11), (10, 12), (10, 13)],
+    },
+    # 2031-2035년
+    2031: {
+        'seollal': [(1, 22), (1, 23), (1, 24)],
+        'chuseok': [(9, 27), (9, 28), (9, 29)],  # 9/28 일요일 → 대체공휴일
+    },
+    2032: {
+        'seollal': [(2, 10), (2, 11), (2, 12)],
+        'chuseok': [(9, 18), (9, 19), (9, 20)],  # 9/19 일요일 → 대체공휴일
+    },
+    2033: {
+        'seollal': [(1, 30), (1, 31), (2, 1)],   # 1/30 일요일 → 대체공휴일
+        'chuseok': [(9, 7), (9, 8), (9, 9)],
+    },
+    2034: {
+        'seollal': [(2, 18), (2, 19), (2, 20)],  # 2/19 일요일 → 대체공휴일
+        'chuseok': [(9, 26), (9, 27), (9, 28)],
+    },
+    2035: {
+        'seollal': [(2, 7), (2, 8), (2, 9)],
+        'chuseok': [(9, 15), (9, 16), (9, 17)],  # 9/16 일요일 → 대체공휴일
+    },
+}
+
+# 부처님오신날 (음력 4월 8일 - 대체공휴일 적용 2024년~)
+BUDDHA_BIRTHDAY = {
+    2025: (5, 5),
+    2026: (5, 24),   # 일요일 → 5/25 대체공휴일
+    2027: (5, 13),
+    2028: (5, 2),
+    2029: (5, 20),
+    2030: (5, 9),
+    2031: (5, 28),
+    2032: (5, 16),   # 일요일 → 5/17 대체공휴일
+    2033: (5, 6),
+    2034: (5, 25),
+    2035: (5, 15),
+}
+
+
+def builtin_holidays(year):
+    """기본 공휴일 표의 한국 공휴일 (고정 공휴일 + 음력 공휴일 + 대체공휴일)
+
+    대체공휴일 적용 기준:
+    - 설날/추석 연휴: 일요일과 겹치면 연휴 다음 첫 평일 (2014년~)
+    - 어린이날: 토요일 또는 일요일과 겹치면 다음 평일 (2014년~)
+    - 삼일절, 광복절, 개천절, 한글날: 일요일과 겹치면 다음 월요일 (2021년~)
+    - 부처님오신날, 크리스마스: 일요일과 겹치면 다음 월요일 (2023년~)
+    """
+    holidays = set()
+
+    for month, day, name, substitute_type in FIXED_HOLIDAYS:
+        holiday_date = date(year, month, day)
+        holidays.add(holiday_date)
+
+        # 대체공휴일 계산
+        if substitute_type == 'weekend':
+            # 토요일(5) 또는 일요일(6)이면 다음 월요일
+            if holiday_date.weekday() == 5:
+                holidays.add(holiday_date + timedelta(days=2))
+            elif holiday_date.weekday() == 6:
+                holidays.add(holiday_date + timedelta(days=1))
+        elif substitute_type == 'sunday':
+            # 일요일이면 다음 월요일
+            if holiday_date.weekday() == 6:
+                holidays.add(holiday_date + timedelta(days=1))
+
+    # 설날과 추석 연휴
+    for holiday_type in ['seollal', 'chuseok']:
+        holiday_dates = [date(year, month, day)
+                         for month, day in LUNAR_HOLIDAYS.get(year, {}).get(holiday_type, [])]
+        holidays.update(holiday_dates)
+
+        # 대체공휴일 계산: 연휴 중 일요일이 있으면 연휴 다음 첫 평일
+        if any(d.weekday() == 6 for d in holiday_dates):
+            substitute = max(holiday_dates) + timedelta(days=1)
+            # 이미 공휴일이면 다음날로
+            while substitute in holidays or substitute.weekday() >= 5:
+                substitute += timedelta(days=1)
+            holidays.add(substitute)
+
+    if year in BUDDHA_BIRTHDAY:
+        month, day = BUDDHA_BIRTHDAY[year]
+        hdate = date(year, month, day)
+        holidays.add(hdate)
+
+        # 대체공휴일: 일요일이면 다음 월요일
+        if hdate.weekday() == 6:
+            holidays.add(hdate + timedelta(days=1))
+
+    return holidays
+
+
+def parse_custom_holidays(raw):
+    """custom_holidays 설정 값 해석 -> (추가 휴무일 set, 근무일 set)
+
+    잘못된 항목은 건너뜀
+    """
+    extra_holidays = set()
+    workdays = set()
+    if not raw:
+        return extra_holidays, workdays
+    try:
+        entries = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        print(f"공휴일 설정 해석 오류: {e}")
+        return extra_holidays, workdays
+
+    for entry in entries or []:
+        try:
+            day = datetime.strptime(entry['date'], '%Y-%m-%d').date()
+        except (KeyError, ValueError, TypeError):
+            continue
+        if entry.get('type') == 'workday':
+            workdays.add(day)
+        else:
+            extra_holidays.add(day)
+    return extra_holidays, workdays
+
+
+def _to_date(value):
+    """date / datetime / 'YYYY-MM-DD' -> date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+class BusinessCalendar:
+    """first_year ~ last_year 영업일 색인 (만든 뒤에는 읽기 전용)
+
+    - _business: 영업일 서수 (오름차순)
+    - _prefix[i]: 범위 첫날부터 i일 동안의 영업일 수 (첫날 ~ 첫날+i-1)
+    """
+
+    def __init__(self, first_year, last_year, extra_holidays=(), workdays=()):
+        self.first_year = first_year
+        self.last_year = last_year
+
+        holidays = set(extra_holidays)
+        for year in range(first_year, last_year + 1):
+            holidays.update(builtin_holidays(year))
+        holidays.difference_update(workdays)
+        self._holidays = holidays
+        self._workdays = set(workdays)
+
+        self._first = date(first_year, 1, 1).toordinal()
+        self._last = date(last_year, 12, 31).toordinal()
+        self._business = array('l')
+        self._prefix = array('l', [0])
+        count = 0
+        for ordinal in range(self._first, self._last + 1):
+            if self._is_business_ordinal(ordinal):
+                self._business.append(ordinal)
+                count += 1
+            self._prefix.append(count)
+
+    def _is_business_ordinal(self, ordinal):
+        day = date.fromordinal(ordinal)
+        if day in self._holidays:
+            return False
+        return day.weekday() < 5 or day in self._workdays
+
+    def holidays(self, year):
+        """year의 공휴일 (근무일 지정 제외, 사용자 추가 휴무일 포함)"""
+        return {day for day in self._holidays if day.year == year}
+
+    def is_business_day(self, day):
+        ordinal = day.toordinal()
+        if not self._first <= ordinal <= self._last:
+            raise ValueError(f"달력 범위 밖의 날짜: {day}")
+        return self._prefix[ordinal - self._first + 1] != self._prefix[ordinal - self._first]
+
+    def count_through(self, day):
+        """범위 첫날부터 day까지(포함) 영업일 수"""
+        return self._prefix[day.toordinal() - self._first + 1]
+
+    def add_business_days(self, day, business_days):
+        """day 다음 날부터 세어 business_days번째 영업일 (범위를 넘으면 None)"""
+        index = self.count_through(day) + business_days - 1
+        if index >= len(self._business):
+            return None
+        return date.fromordinal(self._business[index])
+
+
+_calendar = None
+_calendar_key = None
+_calendar_lock = threading.Lock()
+
+# custom_holidays 원본 문자열 -> 해석 결과 (조회마다 JSON 해석하지 않도록)
+_parsed_custom = {'raw': None, 'value': (set(), set())}
+
+
+def _load_custom_holidays():
+    """설정 스냅샷에서 custom_holidays 원본 문자열 조회 (오류 / 로그인 전이면 None)"""
+    try:
+        from connection_manager import is_internal_mode
+        if not is_internal_mode():
+            # 외부망: 로그인 전에는 API 조회 불가
+            from api_client import get_api_client
+            if not get_api_client().is_logged_in():
+                return None
+
+        from models.settings import Settings
+        return Settings.get(CUSTOM_HOLIDAYS_KEY)
+    except Exception as e:
+        print(f"공휴일 설정 로드 오류: {e}")
+        return None
+
+
+def get_calendar(first_year=None, last_year=None):
+    """first_year ~ last_year를 포함하는 달력 (설정이 같고 범위를 포함하면 기존 달력 재사용)"""
+    global _calendar, _calendar_key
+    this_year = date.today().year
+    first_year = min(first_year or this_year, this_year - YEARS_BEFORE)
+    last_year = max(last_year or this_year, this_year + YEARS_AFTER)
+    raw = _load_custom_holidays()
+
+    with _calendar_lock:
+        calendar = _calendar
+        if (calendar is not None and _calendar_key == raw
+                and calendar.first_year <= first_year and last_year <= calendar.last_year):
+            return calendar
+
+        if raw != _parsed_custom['raw']:
+            _parsed_custom['value'] = parse_custom_holidays(raw)
+            _parsed_custom['raw'] = raw
+        extra_holidays, workdays = _parsed_custom['value']
+
+        if calendar is not None and _calendar_key == raw:
+            # 범위만 넓힘
+            first_year = min(first_year, calendar.first_year)
+            last_year = max(last_year, calendar.last_year)
+        _calendar = BusinessCalendar(first_year, last_year, extra_holidays, workdays)
+        _calendar_key = raw
+        return _calendar
+
+
+def get_korean_holidays(year):
+    """year의 공휴일 (기본 공휴일 + 설정의 추가 휴무일, 근무일 지정 제외)"""
+    return get_calendar(year, year).holidays(year)
+
+
+def is_business_day(value):
+    """영업일 여부 (토/일, 공휴일이 아니면 영업일 - 설정의 근무일/휴무일 반영)"""
+    day = _to_date(value)
+    return get_calendar(day.year, day.year).is_business_day(day)
+
+
+def add_business_days(start_date, business_days):
+    """시작일로부터 영업일(주말, 공휴일 제외) 기준 날짜 계산
+
+    Args:
+        start_date: 시작일 (datetime, date 또는 'YYYY-MM-DD')
+        business_days: 추가할 영업일 수 (0 이하이면 시작일 그대로 반환)
+
+    Returns:
+        datetime (date를 넣으면 date)
+    """
+    if business_days <= 0:
+        return start_date
+
+    day = _to_date(start_date)
+    # 1년에 영업일은 약 250일 - 넉넉히 한 해를 더 포함
+    last_year = day.year + business_days // 240 + 1
+    result = get_calendar(day.year, last_year).add_business_days(day, business_days)
+
+    if isinstance(start_date, datetime):
+        return datetime.combine(result, start_date.time())
+    if isinstance(start_date, date):
+        return result
+    return datetime(result.year, result.month, result.day)
+
+
+def business_days_between(start_date, end_date):
+    """start_date 다음 날부터 end_date까지(포함) 영업일 수 (end_date가 앞이면 음수)
+
+    add_business_days(start, n) == end 이면 business_days_between(start, end) == n
+    """
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    calendar = get_calendar(min(start, end).year, max(start, end).year)
+    return calendar.count_through(end) - calendar.count_through(start)
+
+
+def experiment_end_date(start_date, days=0, months=0, years=0):
+    """실험 종료일 (달력 일수 기준: 시작일 + 일 + 월×30 + 년×365)
+
+    Returns:
+        'YYYY-MM-DD' (시작일이 없으면 None)
+    """
+    if not start_date:
+        return None
+    total_days = (days or 0) + ((months or 0) * 30) + ((years or 0) * 365)
+    return (_to_date(start_date) + timedelta(days=total_days)).strftime('%Y-%m-%d')
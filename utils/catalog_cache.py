@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+수수료 / 식품 유형 카탈로그 메모리 캐시
+- 한 달에 몇 번 바뀌는 목록이므로 프로세스 메모리에 보관하고 조회는 메모리에서 처리
+- settings 테이블의 catalog_version 값으로 변경 감지
+  (Fee/ProductType 쓰기 시 같은 트랜잭션에서 버전 증가)
+- 버전 확인은 VERSION_CHECK_INTERVAL초에 한 번만 수행 (클릭마다 DB 조회하지 않음)
+- 데스크톱(내부망/외부망), API 서버 모두 같은 모듈 사용
+"""
+
+import threading
+import time
+
+
+# settings 테이블 버전 키
+CATALOG_VERSION_KEY = 'catalog_version'
+
+# 버전 확인 주기 (초) - 다른 PC/워커의 변경은 최대 이 시간 후 반영
+VERSION_CHECK_INTERVAL = 30
+
+
+def bump_catalog_version(cursor):
+    """카탈로그 버전 증가 (수수료/식품 유형 쓰기와 같은 트랜잭션에서 호출, 내부망 전용)"""
+    cursor.execute('''
+        INSERT INTO settings (`key`, value, description)
+        VALUES (%s, '1', '수수료/식품 유형 카탈로그 버전')
+        ON DUPLICATE KEY UPDATE value = CAST(value AS UNSIGNED) + 1
+    ''', (CATALOG_VERSION_KEY,))
+
+
+def get_catalog_version():
+    """DB에 기록된 카탈로그 버전 (내부망/API 서버 전용, 없으면 0)"""
+    from database import get_connection
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT value FROM settings WHERE `key` = %s", (CATALOG_VERSION_KEY,))
+        row = cursor.fetchone()
+    finally:
+        conn.close()
+    try:
+        return int(row['value']) if row else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _fetch_version():
+    """현재 모드에 맞게 카탈로그 버전 조회"""
+    from connection_manager import is_internal_mode
+    if is_internal_mode():
+        return get_catalog_version()
+    from connection_manager import connection_manager
+    return connection_manager.get_api_client().get_catalog_version()
+
+
+class CatalogCache:
+    """수수료 / 식품 유형 목록 캐시"""
+
+    def __init__(self, check_interval=VERSION_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._version = None
+        self._checked_at = 0.0
+        self._fees = None
+        self._fees_by_item = {}
+        self._food_types = None
+        self._food_types_by_name = {}
+        self._food_types_by_id = {}
+
+    def _clear(self):
+        self._fees = None
+        self._fees_by_item = {}
+        self._food_types = None
+        self._food_types_by_name = {}
+        self._food_types_by_id = {}
+
+    def _check_version(self):
+        """확인 주기가 지났으면 버전을 조회하고 바뀌었으면 캐시 비움"""
+        now = time.time()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            version = _fetch_version()
+        except Exception as e:
+            # 버전 조회 실패 시 기존 캐시 유지
+            print(f"카탈로그 버전 확인 오류: {str(e)}")
+            return
+        if version != self._version:
+            self._clear()
+            self._version = version
+
+    def invalidate(self):
+        """캐시 비우기 (이 프로세스에서 수수료/식품 유형을 변경한 직후 호출)"""
+        with self._lock:
+            self._clear()
+            self._checked_at = 0.0
+
+    # ==================== 수수료 ====================
+
+    def _load_fees(self):
+        with self._lock:
+            self._check_version()
+            if self._fees is None:
+                from models.fees import Fee
+                fees = [dict(fee) for fee in (Fee._load_all() or [])]
+                by_item = {}
+                for fee in fees:
+                    # 같은 항목이 여러 행이면 첫 행 사용
+                    by_item.setdefault(fee.get('test_item'), fee)
+                self._fees = fees
+                self._fees_by_item = by_item
+            return self._fees, self._fees_by_item
+
+    def get_fees(self):
+        """전체 수수료 목록 (정렬순서, 검사항목 순)"""
+        fees, _ = self._load_fees()
+        return [dict(fee) for fee in fees]
+
+    def get_fee(self, test_item):
+        _, by_item = self._load_fees()
+        fee = by_item.get(test_item)
+        return dict(fee) if fee else None
+
+    def get_prices(self, test_items):
+        """{검사항목: 단가} (수수료 표에 없는 항목은 제외)"""
+        _, by_item = self._load_fees()
+        return {
+            item: by_item[item].get('price') or 0
+            for item in test_items if item in by_item
+        }
+
+    # ==================== 식품 유형 ====================
+
+    def _load_food_types(self):
+        with self._lock:
+            self._check_version()
+            if self._food_types is None:
+                from models.product_types import ProductType
+                food_types = [dict(t) for t in (ProductType._load_all() or [])]
+                self._food_types = food_types
+                self._food_types_by_name = {t.get('type_name'): t for t in food_types}
+                self._food_types_by_id = {t.get('id'): t for t in food_types}
+            return self._food_types, self._food_types_by_name, self._food_types_by_id
+
+    def get_food_types(self):
+        """전체 식품 유형 목록 (유형명 순)"""
+        food_types, _, _ = self._load_food_types()
+        return [dict(t) for t in food_types]
+
+    def get_food_type_by_name(self, type_name):
+        _, by_name, _ = self._load_food_types()
+        food_type = by_name.get(type_name)
+        return dict(food_type) if food_type else None
+
+    def get_food_type_by_id(self, type_id):
+        _, _, by_id = self._load_food_types()
+        try:
+            type_id = int(type_id)
+        except (TypeError, ValueError):
+            return None
+        food_type = by_id.get(type_id)
+        return dict(food_type) if food_type else None
+
+
+# 싱글톤 인스턴스
+catalog_cache = CatalogCache()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+한글 초성 검색 공용 함수
+- 업체명/대표자/담당자의 초성은 clients 테이블의 *_chosung 컬럼에 미리 저장
+  (저장 시 계산, SQL LIKE로 검색 및 페이지네이션)
+- 스케줄 샘플명 초성은 schedules.product_name_chosung에 저장 (업체명은 clients.name_chosung 사용)
+"""
+
+CHOSUNG_LIST = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+_CHOSUNG_SET = set(CHOSUNG_LIST)
+
+# 업체 검색 컬럼 -> 초성 저장 컬럼
+CLIENT_CHOSUNG_COLUMNS = {
+    'name': 'name_chosung',
+    'ceo': 'ceo_chosung',
+    'contact_person': 'contact_chosung',
+}
+
+
+def get_chosung(text):
+    """문자열에서 초성 추출 (한글 음절 외 문자는 그대로 유지)"""
+    if not text:
+        return ''
+    result = []
+    for char in str(text):
+        if '가' <= char <= '힣':
+            result.append(CHOSUNG_LIST[(ord(char) - ord('가')) // 588])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def is_chosung_only(text):
+    """문자열이 초성(과 공백)만으로 이루어져 있는지 확인"""
+    return bool(text) and all(char in _CHOSUNG_SET or char == ' ' for char in text)
+
+
+def client_chosung_values(values):
+    """업체 값 dict에서 초성 저장 컬럼 값 계산 {초성 컬럼: 값}"""
+    return {target: get_chosung(values.get(source))
+            for source, target in CLIENT_CHOSUNG_COLUMNS.items()
+            if source in values}
+
+
+def match_chosung(text, search_text):
+    """text의 초성에 초성 검색어가 포함되는지 확인"""
+    return search_text.lower() in get_chosung(text).lower()
+
+
+def fill_client_chosung(cursor, batch_size=1000):
+    """기존 업체의 초성 컬럼 채우기 (스키마 마이그레이션에서 한 번 실행)"""
+    cursor.execute("SELECT id, name, ceo, contact_person FROM clients")
+    params = [(get_chosung(row['name']), get_chosung(row['ceo']),
+               get_chosung(row['contact_person']), row['id'])
+              for row in cursor.fetchall()]
+    for start in range(0, len(params), batch_size):
+        cursor.executemany(
+            "UPDATE clients SET name_chosung = %s, ceo_chosung = %s, contact_chosung = %s WHERE id = %s",
+            params[start:start + batch_size]
+        )
+
+
+def fill_schedule_chosung(cursor, batch_size=1000):
+    """기존 스케줄의 샘플명 초성 컬럼 채우기 (스키마 마이그레이션에서 한 번 실행)"""
+    cursor.execute("SELECT id, product_name FROM schedules")
+    params = [(get_chosung(row['product_name']), row['id']) for row in cursor.fetchall()]
+    for start in range(0, len(params), batch_size):
+        cursor.executemany(
+            "UPDATE schedules SET product_name_chosung = %s WHERE id = %s",
+            params[start:start + batch_size]
+        )
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API 서버용 DB 실행기
+- 동기(pymysql) 모델 호출을 이벤트 루프 밖의 스레드 풀에서 실행
+- 스레드 수는 DB 연결 풀 최대 연결 수와 동일하게 제한
+- 엔드포인트 그룹별 동시 실행 수 제한 및 대기열 지표 제공
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from database import POOL_MAX_CONNECTIONS
+
+
+# 엔드포인트 그룹별 최대 동시 실행 수 (없으면 DEFAULT_ENDPOINT_LIMIT 사용)
+# 무거운 목록 조회가 풀 전체를 점유하지 않도록 제한
+ENDPOINT_LIMITS = {
+    'schedules': 8,
+    'clients': 8,
+    'activity_logs': 4,
+    'messages': 6,
+    'email_logs': 4,
+    'attachments': 4,
+    'auth': 6,
+}
+DEFAULT_ENDPOINT_LIMIT = 10
+
+
+class _EndpointStats:
+    """엔드포인트 그룹별 실행 통계"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.waiting = 0          # 동시 실행 제한으로 대기 중
+        self.running = 0          # 실행 중
+        self.max_waiting = 0      # 최대 대기 수
+        self.total = 0            # 완료된 호출 수
+        self.errors = 0           # 예외로 끝난 호출 수
+        self.total_wait_ms = 0.0  # 누적 대기 시간
+        self.total_run_ms = 0.0   # 누적 실행 시간
+
+    def to_dict(self):
+        done = self.total or 1
+        return {
+            'limit': self.limit,
+            'waiting': self.waiting,
+            'running': self.running,
+            'max_waiting': self.max_waiting,
+            'total': self.total,
+            'errors': self.errors,
+            'avg_wait_ms': round(self.total_wait_ms / done, 2),
+            'avg_run_ms': round(self.total_run_ms / done, 2),
+        }
+
+
+class DbExecutor:
+    """DB 연결 풀 크기에 맞춘 스레드 풀 실행기"""
+
+    def __init__(self, max_workers=POOL_MAX_CONNECTIONS, endpoint_limits=None,
+                 default_limit=DEFAULT_ENDPOINT_LIMIT):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='foodlab-db')
+        self._endpoint_limits = dict(ENDPOINT_LIMITS if endpoint_limits is None else endpoint_limits)
+        self._default_limit = default_limit
+        self._semaphores = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        # 스레드 풀 대기열 (제출됐지만 아직 시작하지 않은 작업)
+        self._queued = 0
+        self._max_queued = 0
+        self._active = 0
+
+    def _get_limiter(self, endpoint):
+        """엔드포인트 그룹별 세마포어 반환 (이벤트 루프 안에서 지연 생성)"""
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            limit = min(self._endpoint_limits.get(endpoint, self._default_limit), self.max_workers)
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[endpoint] = semaphore
+            self._stats[endpoint] = _EndpointStats(limit)
+        return semaphore, self._stats[endpoint]
+
+    def _run_in_thread(self, func, args, kwargs):
+        """워커 스레드에서 실제 함수 실행 (대기열 지표 갱신)"""
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    async def run(self, endpoint, func, *args, **kwargs):
+        """동기 함수를 스레드 풀에서 실행하고 결과를 반환
+
+        Args:
+            endpoint: 엔드포인트 그룹명 (동시 실행 제한/통계 단위)
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+        """
+        semaphore, stats = self._get_limiter(endpoint)
+
+        wait_start = time.perf_counter()
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+
+        run_start = time.perf_counter()
+        stats.total_wait_ms += (run_start - wait_start) * 1000
+        stats.running += 1
+        try:
+            with self._lock:
+                self._queued += 1
+                self._max_queued = max(self._max_queued, self._queued)
+            loop = asyncio.get_running_loop()
+            call = functools.partial(self._run_in_thread, func, args, kwargs)
+            return await loop.run_in_executor(self._executor, call)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.running -= 1
+            stats.total += 1
+            stats.total_run_ms += (time.perf_counter() - run_start) * 1000
+            semaphore.release()
+
+    def get_stats(self):
+        """실행기 지표 반환 (진단 API용)"""
+        with self._lock:
+            pool = {
+                'max_workers': self.max_workers,
+                'active': self._active,
+                'queued': self._queued,
+                'max_queued': self._max_queued,
+            }
+        return {
+            'pool': pool,
+            'endpoints': {name: stats.to_dict() for name, stats in self._stats.items()},
+        }
+
+    def shutdown(self, wait=True):
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+# 싱글톤 인스턴스
+db_executor = DbExecutor()
+
+
+async def run_db(endpoint, func, *args, **kwargs):
+    """db_executor.run 축약 함수"""
+    return await db_executor.run(endpoint, func, *args, **kwargs)
@@ -0,0 +1,545 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+견적서 일괄 PDF 생성 / 발송
+- 월말 대량 발송용: 스케줄 ID 목록을 받아 견적서 PDF를 작업자 풀에서 생성하고 발송 대기열에 추가
+- 견적서 PDF 배치(머리글/견적 정보/품목/합계/Remark)는 render_estimate_pdf 하나뿐이며,
+  견적서 탭의 단건 PDF 저장/메일 첨부도 같은 함수로 생성 (GUI 스레드가 필요 없는 reportlab)
+- 스케줄 조회와 견적 내용 계산(utils.estimate_document)은 호출한 프로세스에서 수행하고,
+  PDF 렌더링만 프로세스 풀에서 수행 (프로세스 풀을 쓸 수 없으면 스레드 풀)
+- 단독 실행 시 가상 스케줄로 처리량 측정 (DB 불필요)
+    python -m utils.estimate_batch --count 200 --workers 4
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from xml.sax.saxutils import escape
+
+from utils.estimate_document import build_email_content, build_estimate, estimate_filename
+
+
+# 기본 작업자 수 (CPU 수 - 1, 최소 1, 최대 8)
+DEFAULT_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# PDF 한글 글꼴 (reportlab 내장 CID 글꼴, 별도 글꼴 파일 불필요)
+PDF_FONT = 'HYGothic-Medium'
+
+# 견적서 오른쪽 회사 정보 (견적서 화면과 같은 고정값)
+COMPANY_NAME = '(주)바이오푸드랩'
+COMPANY_CEO = '이용표'
+COMPANY_FAX = '070-7410-1430'
+COMPANY_ADDRESS = '서울특별시 구로구 디지털로 30길 28, 마리오타워 1410~1414호'
+
+if getattr(sys, 'frozen', False):
+    BASE_PATH = os.path.dirname(sys.executable)
+else:
+    BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ==================== PDF 렌더링 (작업자 프로세스) ====================
+
+
+_font_registered = False
+
+
+def _register_font():
+    """한글 CID 글꼴 등록 (프로세스당 한 번)"""
+    global _font_registered
+    if _font_registered:
+        return
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    pdfmetrics.registerFont(UnicodeCIDFont(PDF_FONT))
+    _font_registered = True
+
+
+def _para(text, style):
+    """여러 줄 문자열을 Paragraph로 변환"""
+    from reportlab.platypus import Paragraph
+    return Paragraph(escape(str(text or '')).replace('\n', '<br/>'), style)
+
+
+def render_estimate_pdf(estimate, file_path):
+    """견적서 PDF 생성 (A4 세로 - 일괄 생성과 견적서 탭 단건 저장 공용)
+
+    Args:
+        estimate: utils.estimate_document.build_estimate() 결과 + 'company' 정보
+                  ('discount_text'가 있으면 합계 아래에 원가/할인 내역 표시)
+        file_path: 저장할 PDF 경로
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Image, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    _register_font()
+
+    base = ParagraphStyle('base', fontName=PDF_FONT, fontSize=9, leading=13)
+    small = ParagraphStyle('small', parent=base, fontSize=8, leading=11)
+    center = ParagraphStyle('center', parent=base, alignment=TA_CENTER)
+    right = ParagraphStyle('right', parent=base, alignment=TA_RIGHT)
+    title = ParagraphStyle('title', parent=base, fontSize=22, leading=28, alignment=TA_CENTER)
+    header = ParagraphStyle('header', parent=base, fontSize=12, leading=15)
+
+    company = estimate.get('company') or {}
+    width = A4[0] - 30 * mm
+    grid = [
+        ('FONTNAME', (0, 0), (-1, -1), PDF_FONT),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]
+
+    story = []
+
+    # 머리글 (로고 + 회사명/주소)
+    logo_path = company.get('logo_path')
+    if logo_path and os.path.exists(logo_path):
+        logo = Image(logo_path, width=30 * mm, height=15 * mm, kind='proportional')
+    else:
+        logo = _para('BFL', header)
+    story.append(Table(
+        [[logo, _para(f"{company.get('name', COMPANY_NAME)}\n{company.get('address', COMPANY_ADDRESS)}", base)]],
+        colWidths=[35 * mm, width - 35 * mm],
+        style=TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                          ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black)])
+    ))
+    story.append(Spacer(1, 6 * mm))
+    story.append(_para('견 적 서', title))
+    story.append(Spacer(1, 6 * mm))
+
+    # 견적 정보 (왼쪽) / 회사 정보 + 직인 (오른쪽)
+    info_rows = [
+        [_para('견적번호', base), _para(estimate['estimate_no'], base)],
+        [_para('견적일자', base), _para(estimate['estimate_date'], base)],
+        [_para('수    신', base), _para(f"{estimate['receiver']} 귀하", base)],
+        [_para('발    신', base), _para(company.get('name', COMPANY_NAME), base)],
+        [_para('견적명칭', base), _para(estimate['title'], base)],
+    ]
+    left = Table(info_rows, colWidths=[20 * mm, 70 * mm],
+                 style=TableStyle([('LINEBELOW', (0, 0), (-1, -1), 0.3, colors.grey)]))
+    stamp_path = company.get('stamp_path')
+    company_info = _para(company.get('info', ''), small)
+    if stamp_path and os.path.exists(stamp_path):
+        company_cell = [company_info, Image(stamp_path, width=18 * mm, height=18 * mm, kind='proportional')]
+    else:
+        company_cell = company_info
+    story.append(Table([[left, company_cell]], colWidths=[95 * mm, width - 95 * mm],
+                       style=TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')])))
+    story.append(Spacer(1, 5 * mm))
+
+    # 합계 금액 (할인 견적서는 원가/할인 내역 함께 표시)
+    total_lines = f"{estimate['total_text']}  (₩{estimate['total']:,})"
+    if estimate.get('discount_text'):
+        total_lines += f"\n{estimate['discount_text']}"
+    story.append(Table(
+        [[_para('합계금액\n(VAT 포함)', center), _para(total_lines, base)]],
+        colWidths=[30 * mm, width - 30 * mm],
+        style=TableStyle(grid + [('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                                 ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#f0f0f0'))])
+    ))
+    story.append(Spacer(1, 4 * mm))
+
+    # 품목 테이블
+    subtotal = estimate['subtotal']
+    items = [
+        [_para(h, center) for h in ('No.', '식품유형', '검사항목', '계', '소계')],
+        [_para('1', center), _para(estimate['food_type_text'], base),
+         _para(estimate['test_items_text'], base),
+         _para(f"{subtotal:,}", right), _para(f"{subtotal:,} 원", right)],
+        ['', '', _para('공급가액', center), '', _para(f"{subtotal:,} 원", right)],
+        ['', '', _para('부가세', center), '', _para(f"{estimate['vat']:,} 원", right)],
+        ['', '', _para('합계', center), '', _para(f"{estimate['total']:,} 원", right)],
+    ]
+    story.append(Table(
+        items, colWidths=[12 * mm, 68 * mm, 50 * mm, 25 * mm, width - 155 * mm],
+        style=TableStyle(grid + [('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+                                 ('SPAN', (0, 2), (1, 4)),
+                                 ('SPAN', (2, 2), (3, 2)),
+                                 ('SPAN', (2, 3), (3, 3)),
+                                 ('SPAN', (2, 4), (3, 4))])
+    ))
+    story.append(Spacer(1, 4 * mm))
+
+    # Remark
+    story.append(Table([[_para('Remark', base)], [_para(estimate['remark'], small)]],
+                       colWidths=[width], style=TableStyle(grid)))
+
+    doc = SimpleDocTemplate(file_path, pagesize=A4,
+                            leftMargin=15 * mm, rightMargin=15 * mm,
+                            topMargin=12 * mm, bottomMargin=12 * mm,
+                            title=estimate['estimate_no'])
+    doc.build(story)
+
+
+def _render_job(estimate, file_path):
+    """작업자에서 실행되는 렌더링 작업 (프로세스 풀 전달용 최상위 함수)"""
+    render_estimate_pdf(estimate, file_path)
+    return file_path
+
+
+# ==================== 작업 준비 (호출 프로세스) ====================
+
+
+def _resolve_image(path):
+    """설정의 로고/직인 경로를 로컬 파일 경로로 변환 (서버 이미지는 캐시된 파일만 사용)"""
+    if not path or path.startswith('server:'):
+        return ''
+    if not os.path.isabs(path):
+        path = os.path.join(BASE_PATH, path)
+    path = os.path.normpath(path)
+    return path if os.path.exists(path) else ''
+
+
+def load_company(settings_dict):
+    """견적서 머리글/회사 정보 (공용 설정 기반)"""
+    info_lines = [f"회사명 : {COMPANY_NAME}", f"대표자 : {COMPANY_CEO}"]
+    for label, key in (('담당자', 'company_manager'), ('연락처', 'company_phone'), ('핸드폰', 'company_mobile')):
+        value = settings_dict.get(key, '') or ''
+        if value:
+            info_lines.append(f"{label} : {value}")
+    info_lines.append(f"팩  스 : {COMPANY_FAX}")
+    info_lines.append(f"주  소 : {COMPANY_ADDRESS}")
+
+    return {
+        'name': settings_dict.get('company_name', COMPANY_NAME) or COMPANY_NAME,
+        'address': settings_dict.get('company_address', COMPANY_ADDRESS) or COMPANY_ADDRESS,
+        'info': '\n'.join(info_lines),
+        'logo_path': _resolve_image(settings_dict.get('logo_path', '') or ''),
+        'stamp_path': _resolve_image(settings_dict.get('stamp_path', '') or ''),
+    }
+
+
+def _unique_path(output_dir, filename, used):
+    """같은 파일명이 겹치면 (2), (3) ... 붙이기"""
+    stem, ext = os.path.splitext(filename)
+    candidate = filename
+    index = 2
+    while candidate.lower() in used or os.path.exists(os.path.join(output_dir, candidate)):
+        candidate = f"{stem} ({index}){ext}"
+        index += 1
+    used.add(candidate.lower())
+    return os.path.join(output_dir, candidate)
+
+
+def _load_schedule(schedule_id):
+    """스케줄 조회 (식품유형명이 없으면 카탈로그 캐시에서 채움)"""
+    from models.schedules import Schedule
+    from utils.catalog_cache import catalog_cache
+
+    schedule = Schedule.get_by_id(schedule_id)
+    if not schedule:
+        return None
+    schedule = dict(schedule)
+    if not schedule.get('food_type_name') and schedule.get('food_type_id'):
+        food_type = catalog_cache.get_food_type_by_id(schedule['food_type_id'])
+        if food_type:
+            schedule['food_type_name'] = food_type.get('type_name')
+    return schedule
+
+
+def _load_sender(user):
+    """발송 계정 (사용자별 이메일 설정)"""
+    from models.settings import UserSettings
+
+    if not user or not user.get('id'):
+        raise ValueError("로그인 사용자 정보가 없습니다.")
+    user_settings = UserSettings.get_all(user['id'])
+    smtp_email = user_settings.get('smtp_email', '') or ''
+    if not smtp_email or not (user_settings.get('smtp_password', '') or ''):
+        raise ValueError("이메일 계정 설정이 완료되지 않았습니다.\n"
+                         "설정 > 이메일 탭에서 발신 이메일과 비밀번호를 설정해주세요.")
+    return {
+        'user_id': user['id'],
+        'email': smtp_email,
+        'name': user_settings.get('smtp_sender_name', '') or COMPANY_NAME,
+    }
+
+
+def _enqueue_mail(job, estimate_type, settings_dict, sender):
+    """생성된 견적서를 발송 대기열에 추가 (견적서 탭 단건 발송과 같은 로그/대기열 흐름)"""
+    from models.communications import EmailLog
+    from utils.mail_queue import (
+        mail_queue, STATUS_QUEUED,
+        DEFAULT_SMTP_SERVER, DEFAULT_SMTP_PORT, DEFAULT_SMTP_SECURITY
+    )
+
+    schedule = job['schedule']
+    to_list = [email.strip() for email in job['to_email'].replace(';', ',').split(',') if email.strip()]
+    subject, body = build_email_content(schedule, settings_dict, estimate_type)
+
+    log_id = None
+    try:
+        log_id = EmailLog.save(
+            schedule_id=schedule.get('id'),
+            estimate_type=estimate_type,
+            sender_email=sender['email'],
+            to_emails=', '.join(to_list),
+            cc_emails=None,
+            subject=subject,
+            body=body,
+            attachment_name=os.path.basename(job['file_path']),
+            sent_by=sender['user_id'],
+            client_name=schedule.get('client_name', '')
+        )
+        if log_id:
+            EmailLog.update_status(log_id, status=STATUS_QUEUED)
+    except Exception as log_err:
+        print(f"이메일 로그 저장 오류: {log_err}")
+
+    mail_queue.enqueue(
+        smtp={'server': DEFAULT_SMTP_SERVER, 'port': DEFAULT_SMTP_PORT,
+              'security': DEFAULT_SMTP_SECURITY, 'username': sender['email']},
+        credential={'scope': 'user', 'user_id': sender['user_id']},
+        sender_name=sender['name'],
+        to_list=to_list,
+        cc_list=[],
+        subject=subject,
+        body=body,
+        attachments=[job['file_path']],
+        log_id=log_id,
+        owner_id=sender['user_id']
+    )
+
+
+# ==================== 일괄 처리 ====================
+
+
+def render_all(jobs, workers=DEFAULT_WORKERS, progress=None, is_cancelled=None, use_processes=True):
+    """견적서 PDF 병렬 생성
+
+    Args:
+        jobs: [{'estimate': ..., 'file_path': ...}, ...]
+        workers: 작업자 수
+        progress: progress(완료 수, 전체 수, job, 오류 메시지 또는 None) 콜백 (호출 스레드에서 실행)
+        is_cancelled: 취소 여부를 반환하는 함수 (True면 남은 작업 취소)
+        use_processes: False면 스레드 풀만 사용
+
+    Returns:
+        (성공 job 목록, [(job, 오류 메시지), ...])
+    """
+    done, failed = [], []
+    pending = list(jobs)
+    total = len(pending)
+
+    def run(executor):
+        futures = {executor.submit(_render_job, job['estimate'], job['file_path']): job for job in pending}
+        try:
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    failed.append((job, str(e)))
+                    error = str(e)
+                else:
+                    done.append(job)
+                    error = None
+                pending.remove(job)
+                if progress:
+                    progress(len(done) + len(failed), total, job, error)
+                if is_cancelled and is_cancelled():
+                    for f in futures:
+                        f.cancel()
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if use_processes and workers > 1 and pending:
+        try:
+            run(ProcessPoolExecutor(max_workers=workers))
+        except (BrokenProcessPool, OSError, NotImplementedError) as e:
+            # 프로세스 생성이 막힌 환경 등 - 남은 작업은 스레드 풀에서 처리
+            print(f"[견적서 일괄] 프로세스 풀 사용 불가, 스레드로 처리: {e}")
+    if pending and not (is_cancelled and is_cancelled()):
+        run(ThreadPoolExecutor(max_workers=max(1, workers)))
+    return done, failed
+
+
+def run_batch(schedule_ids, estimate_type='first', output_dir=None, user=None,
+              send_mail=False, workers=DEFAULT_WORKERS, progress=None, is_cancelled=None):
+    """견적서 일괄 생성 (+ 발송 대기열 추가)
+
+    Args:
+        schedule_ids: 스케줄 ID 목록
+        estimate_type: 'first' / 'suspend' / 'extend'
+        output_dir: PDF 저장 폴더 (None이면 설정의 output_path 또는 ~/Documents)
+        user: 로그인 사용자 (Remark 문의처, 발송 계정)
+        send_mail: True면 업체 이메일로 발송 대기열에 추가
+        progress: progress(단계, 완료 수, 전체 수, 메시지) 콜백
+            단계: 'prepare' (스케줄 조회/계산), 'render' (PDF 생성), 'mail' (대기열 추가)
+        is_cancelled: 취소 여부를 반환하는 함수
+
+    Returns:
+        {'total', 'created', 'queued', 'failed': [(schedule_id, 오류 메시지), ...],
+         'files': [PDF 경로, ...], 'output_dir', 'elapsed', 'per_second'}
+    """
+    from models.settings import Settings
+
+    started = time.perf_counter()
+    settings_dict = Settings.get_all()
+    sender = _load_sender(user) if send_mail else None
+
+    if not output_dir:
+        output_dir = settings_dict.get('output_path', '') or ''
+        if not os.path.isdir(output_dir):
+            output_dir = os.path.expanduser("~/Documents")
+            if not os.path.exists(output_dir):
+                output_dir = os.path.expanduser("~")
+    os.makedirs(output_dir, exist_ok=True)
+
+    company = load_company(settings_dict)
+    total = len(schedule_ids)
+    failed = []
+    jobs = []
+    used_names = set()
+
+    # 1. 스케줄 조회 + 견적 내용 계산 (DB 접근은 호출 프로세스에서만)
+    for index, schedule_id in enumerate(schedule_ids, 1):
+        if is_cancelled and is_cancelled():
+            break
+        try:
+            schedule = _load_schedule(schedule_id)
+            if not schedule:
+                failed.append((schedule_id, "스케줄을 찾을 수 없습니다."))
+                continue
+            to_email = (schedule.get('client_email') or '').strip()
+            if send_mail and not to_email:
+                failed.append((schedule_id, "업체 이메일이 없습니다."))
+                continue
+            estimate = build_estimate(schedule, estimate_type, user)
+            estimate['company'] = company
+            jobs.append({
+                'schedule': schedule,
+                'estimate': estimate,
+                'to_email': to_email,
+                'file_path': _unique_path(output_dir, estimate_filename(schedule), used_names),
+            })
+        except Exception as e:
+            failed.append((schedule_id, str(e)))
+        finally:
+            if progress:
+                progress('prepare', index, total, f"스케줄 {schedule_id}")
+
+    # 2. PDF 병렬 생성
+    def on_rendered(count, render_total, job, error):
+        if progress:
+            message = f"{os.path.basename(job['file_path'])}" + (f" - 오류: {error}" if error else "")
+            progress('render', count, render_total, message)
+
+    created, render_failed = render_all(jobs, workers, on_rendered, is_cancelled)
+    failed.extend((job['schedule'].get('id'), error) for job, error in render_failed)
+
+    # 3. 발송 대기열 추가 (실제 발송은 mail_queue 백그라운드 스레드)
+    queued = 0
+    if send_mail:
+        for index, job in enumerate(created, 1):
+            if is_cancelled and is_cancelled():
+                break
+            try:
+                _enqueue_mail(job, estimate_type, settings_dict, sender)
+                queued += 1
+            except Exception as e:
+                failed.append((job['schedule'].get('id'), f"발송 대기열 추가 오류: {e}"))
+            if progress:
+                progress('mail', index, len(created), job['to_email'])
+
+    elapsed = time.perf_counter() - started
+    return {
+        'total': total,
+        'created': len(created),
+        'queued': queued,
+        'failed': failed,
+        'files': [job['file_path'] for job in created],
+        'output_dir': output_dir,
+        'elapsed': elapsed,
+        'per_second': len(created) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+# ==================== 처리량 측정 ====================
+
+
+def _sample_schedule(index):
+    """측정용 가상 스케줄 (회차 비용을 채워 수수료 DB 조회 없이 계산)"""
+    methods = ['real', 'acceleration', 'custom_real', 'custom_acceleration']
+    storages = ['room_temp', 'warm', 'cool', 'freeze']
+    return {
+        'id': index,
+        'created_at': '2025-01-31',
+        'client_name': f"측정업체{index:04d}",
+        'client_email': f"client{index}@example.com",
+        'food_type_name': '과자',
+        'storage_condition': storages[index % len(storages)],
+        'test_method': methods[index % len(methods)],
+        'test_period_months': 6 + index % 18,
+        'sampling_count': 6,
+        'test_items': '관능평가, 세균수, 대장균군, 수분, 산가, 과산화물가',
+        'cost_per_test': 185000,
+        'suspend_rounds_cost': 185000 * 3,
+        'extend_rounds_cost': 185000 * 3,
+        'extend_rounds': 3,
+        'packaging_weight': 100,
+        'packaging_unit': 'g',
+        'start_date': '2025-02-03',
+    }
+
+
+def benchmark(count=100, workers=DEFAULT_WORKERS, estimate_type='first', output_dir=None):
+    """가상 스케줄로 순차 처리 / 스레드 풀 / 프로세스 풀 처리량 비교 (DB 불필요)"""
+    import shutil
+    import tempfile
+
+    own_dir = output_dir is None
+    output_dir = output_dir or tempfile.mkdtemp(prefix='estimate_batch_')
+    company = load_company({})
+    jobs = []
+    for i in range(1, count + 1):
+        schedule = _sample_schedule(i)
+        estimate = build_estimate(schedule, estimate_type)
+        estimate['company'] = company
+        jobs.append({'schedule': schedule, 'estimate': estimate,
+                     'file_path': os.path.join(output_dir, f"estimate_{i:05d}.pdf")})
+
+    results = {}
+    try:
+        started = time.perf_counter()
+        for job in jobs:
+            render_estimate_pdf(job['estimate'], job['file_path'])
+        results['순차'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        render_all(jobs, workers, use_processes=False)
+        results[f'스레드 {workers}개'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        render_all(jobs, workers)
+        results[f'프로세스 {workers}개'] = time.perf_counter() - started
+    finally:
+        if own_dir:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    print(f"견적서 {count}건 PDF 생성 ({estimate_type})")
+    for name, elapsed in results.items():
+        print(f"  {name:<12} {elapsed:8.2f}초  {count / elapsed:8.1f}건/초")
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='견적서 일괄 PDF 생성 처리량 측정')
+    parser.add_argument('--count', type=int, default=100, help='생성할 견적서 수')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='작업자 수')
+    parser.add_argument('--type', dest='estimate_type', default='first',
+                        choices=['first', 'suspend', 'extend'], help='견적서 유형')
+    parser.add_argument('--output', default=None, help='PDF 저장 폴더 (지정 시 파일 유지)')
+    args = parser.parse_args()
+    benchmark(args.count, args.workers, args.estimate_type, args.output)
@@ -0,0 +1,886 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+견적서 내용 생성 (화면 없이 사용 가능)
+- 견적번호, 품목 문구, 금액, Remark, 발송 메일 문구를 스케줄 데이터만으로 생성
+- 견적서 탭 화면과 일괄 PDF 생성/발송(utils.estimate_batch)이 같은 계산을 사용
+"""
+
+from datetime import datetime, timedelta
+
+from models.fees import Fee
+
+
+# 견적서 유형별 명칭
+ESTIMATE_TITLES = {
+    "first": "소비기한설정시험의 건",
+    "suspend": "소비기한설정시험 중단정산의 건",
+    "extend": "소비기한설정시험 연장의 건"
+}
+
+# 견적번호 접미사
+ESTIMATE_NO_SUFFIX = {
+    "first": "",
+    "suspend": "_중단",
+    "extend": "_연장"
+}
+
+# 보관조건 / 실험방법 (파일명용 약칭)
+STORAGE_NAMES = {'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'}
+METHOD_FILE_NAMES = {
+    'real': '실측', 'acceleration': '가속',
+    'custom_real': '의뢰자요청_실측', 'custom_accel': '의뢰자요청_가속',
+    'custom_acceleration': '의뢰자요청_가속'
+}
+
+# 부가세율
+VAT_RATE = 0.1
+
+
+def number_to_korean(num):
+    """숫자를 한글로 변환"""
+    units = ['', '만', '억', '조']
+    nums = ['', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
+    small_units = ['', '십', '백', '천']
+
+    if num == 0:
+        return '영'
+
+    result = ''
+    unit_idx = 0
+
+    while num > 0:
+        part = num % 10000
+        num //= 10000
+
+        if part > 0:
+            part_str = ''
+            for i in range(4):
+                digit = part % 10
+                part //= 10
+                if digit > 0:
+                    if digit == 1 and i > 0:
+                        part_str = small_units[i] + part_str
+                    else:
+                        part_str = nums[digit] + small_units[i] + part_str
+
+            result = part_str + units[unit_idx] + result
+
+        unit_idx += 1
+
+    return result
+
+
+def estimate_number(schedule, estimate_type='first'):
+    """견적번호 (BFL_소비기한_<등록일>-<스케줄 ID><유형 접미사>)"""
+    schedule_id = schedule.get('id', '')
+    created_at = schedule.get('created_at', '')
+    if created_at:
+        try:
+            # datetime 객체인 경우 직접 사용, 문자열인 경우 파싱
+            if isinstance(created_at, datetime):
+                date_obj = created_at
+            else:
+                date_obj = datetime.strptime(str(created_at)[:10], '%Y-%m-%d')
+            date_str = date_obj.strftime('%Y%m%d')
+        except (ValueError, TypeError):
+            date_str = datetime.now().strftime('%Y%m%d')
+    else:
+        date_str = datetime.now().strftime('%Y%m%d')
+
+    suffix = ESTIMATE_NO_SUFFIX.get(estimate_type, "")
+    return f"BFL_소비기한_{date_str}-{schedule_id}{suffix}"
+
+
+def estimate_filename(schedule, discount_rate=0):
+    """견적서 PDF 파일명 (업체명_식품유형_날짜_보관조건_실험방법[_할인N%].pdf)"""
+    client_name = schedule.get('client_name', '업체명') or '업체명'
+    food_type = schedule.get('food_type_name', '식품유형') or '식품유형'
+    estimate_date = datetime.now().strftime('%Y%m%d')
+
+    storage_code = schedule.get('storage_condition', 'room_temp')
+    storage = STORAGE_NAMES.get(storage_code, storage_code)
+    test_method = schedule.get('test_method', 'real')
+    method_str = METHOD_FILE_NAMES.get(test_method, test_method)
+
+    if discount_rate > 0:
+        filename = f"{client_name}_{food_type}_{estimate_date}_{storage}_{method_str}_할인{discount_rate}%.pdf"
+    else:
+        filename = f"{client_name}_{food_type}_{estimate_date}_{storage}_{method_str}.pdf"
+
+    invalid_chars = '<>:"/\\|?*'
+    for char in invalid_chars:
+        filename = filename.replace(char, '_')
+    return filename
+
+
+def build_estimate(schedule, estimate_type='first', user=None, discount_rate=0):
+    """견적서 한 장의 내용 (PDF 렌더링용, 프로세스 간 전달 가능한 dict)
+
+    discount_rate가 있으면 할인 적용 금액 + 'discount_text'(원가/할인 내역) 포함
+    """
+    subtotal = calculate_total_price(schedule, estimate_type)
+    original_total = subtotal + round(subtotal * VAT_RATE)
+    if discount_rate > 0:
+        subtotal = round(subtotal * (100 - discount_rate) / 100)
+    vat = round(subtotal * VAT_RATE)
+    total = subtotal + vat
+    items = build_items_text(schedule, estimate_type)
+
+    estimate = {
+        'schedule_id': schedule.get('id'),
+        'estimate_type': estimate_type,
+        'estimate_no': estimate_number(schedule, estimate_type),
+        'estimate_date': datetime.now().strftime('%Y년 %m월 %d일'),
+        'receiver': schedule.get('client_name', '') or '',
+        'title': ESTIMATE_TITLES.get(estimate_type, ESTIMATE_TITLES['first']),
+        'food_type_text': items['food_type_text'],
+        'test_items_text': items['test_items_text'],
+        'subtotal': subtotal,
+        'vat': vat,
+        'total': total,
+        'total_text': f"일금 {number_to_korean(total)} 원정",
+        'remark': build_remark_text(schedule, estimate_type, user),
+    }
+    if discount_rate > 0:
+        estimate['discount_text'] = (f"원가 ₩{original_total:,} - 할인 {discount_rate}% "
+                                     f"(₩{original_total - total:,})")
+    return estimate
+
+
+# ==================== 품목 ====================
+
+
+def build_items_text(schedule, estimate_type='first'):
+    """품목 테이블 셀 문구 생성 (화면/일괄 PDF 공용)
+
+    Returns:
+        {'food_type_text': 식품유형 열, 'test_items_text': 검사항목 열,
+         'test_items_list': 검사항목 목록, 'temps': 실험 온도 목록}
+    """
+    # 식품유형
+    food_type = schedule.get('food_type_name', '기타가공품')
+
+    # 검사 항목 정보 구성
+    test_period_days = schedule.get('test_period_days', 0) or 0
+    test_period_months = schedule.get('test_period_months', 0) or 0
+    test_period_years = schedule.get('test_period_years', 0) or 0
+
+    # 소비기한 문자열
+    period_parts = []
+    if test_period_years > 0:
+        period_parts.append(f"{test_period_years}년")
+    if test_period_months > 0:
+        period_parts.append(f"{test_period_months}개월")
+    if test_period_days > 0:
+        period_parts.append(f"{test_period_days}일")
+    period_str = " ".join(period_parts) if period_parts else "0개월"
+
+    # 보관조건
+    storage_code = schedule.get('storage_condition', 'room_temp')
+    storage_map = {
+        'room_temp': '상온',
+        'warm': '실온',
+        'cool': '냉장',
+        'freeze': '냉동'
+    }
+    storage = storage_map.get(storage_code, storage_code)
+
+    # 실험방법
+    test_method = schedule.get('test_method', 'real')
+    method_map = {
+        'real': '실측실험',
+        'acceleration': '가속실험',
+        'custom_real': '의뢰자요청(실측)',
+        'custom_accel': '의뢰자요청(가속)',
+        'custom_acceleration': '의뢰자요청(가속)'
+    }
+    method_str = method_map.get(test_method, '실측실험')
+
+    # 시험기간 계산 (스케줄 관리에서 수정된 값 우선 사용)
+    total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
+
+    # 실제 실험일수가 저장되어 있으면 사용 (날짜 수정 반영)
+    actual_experiment_days = schedule.get('actual_experiment_days')
+    if actual_experiment_days is not None and actual_experiment_days > 0:
+        experiment_days = actual_experiment_days
+    else:
+        # 기본 계산 방식
+        if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
+            experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
+        else:
+            experiment_days = int(total_expiry_days * 1.5)
+
+    # 시험기간 문자열 생성 (년/월/일 형식)
+    exp_years = experiment_days // 365
+    exp_months = (experiment_days % 365) // 30
+    exp_days_remaining = experiment_days % 30
+
+    duration_parts = []
+    if exp_years > 0: duration_parts.append(f"{exp_years}년")
+    if exp_months > 0: duration_parts.append(f"{exp_months}개월")
+    if exp_days_remaining > 0: duration_parts.append(f"{exp_days_remaining}일")
+    test_duration = ' '.join(duration_parts) if duration_parts else f"{experiment_days}일"
+
+    # 온도 구간 처리 (스케줄 관리와 동일한 방식)
+    # 보관조건별 기본 온도 설정
+    real_temps = {'room_temp': '15', 'warm': '25', 'cool': '10', 'freeze': '-18'}
+    accel_temps = {
+        'room_temp': ['15', '25', '35'],
+        'warm': ['25', '35', '45'],
+        'cool': ['5', '10', '15'],
+        'freeze': ['-6', '-12', '-18']
+    }
+
+    custom_temps = schedule.get('custom_temperatures', '')
+    if custom_temps:
+        # 의뢰자 요청온도 사용
+        temps = [t.strip().replace('℃', '') for t in custom_temps.split(',')]
+    else:
+        if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
+            # 가속실험: 3구간 온도
+            temps = accel_temps.get(storage_code, ['25', '35', '45'])
+        else:
+            # 실측실험: 1구간 온도
+            temps = [real_temps.get(storage_code, '15')]
+
+    # 샘플링 횟수
+    sampling_count = schedule.get('sampling_count', 6) or 6
+
+    # 실험 주기 계산 (실험일수 / 샘플링 횟수)
+    if experiment_days > 0 and sampling_count > 0:
+        experiment_interval = experiment_days // sampling_count
+    else:
+        experiment_interval = 15  # 기본값
+
+    # 검사항목 (스케줄에서 동적으로 가져오기)
+    test_items_str = schedule.get('test_items', '')
+    if test_items_str:
+        test_items_list = [item.strip() for item in test_items_str.split(',') if item.strip()]
+    else:
+        test_items_list = ['관능평가', '세균수', '대장균(정량)', 'pH']
+
+    # 식품유형 열 텍스트 (식품유형 위에 + 상세정보 아래)
+    # 온도 문자열 생성
+    if len(temps) == 1:
+        temp_str = f"{temps[0]}℃"
+    else:
+        # 여러 온도는 슬래시로 구분하여 한 줄에 표시
+        temp_str = " / ".join([f"{t}℃" for t in temps])
+
+    # 견적 유형에 따라 표시 내용 변경
+    if estimate_type == "suspend":
+        # 중단 견적서: 완료 회차 표시
+        completed_rounds = schedule.get('completed_rounds', 0)
+        if completed_rounds is None or completed_rounds == 0:
+            completed_rounds = max(1, sampling_count // 2)  # 기본값
+        food_type_text = f"""{food_type}
+
+소비기한 : {storage} {period_str}
+시험기간 : {test_duration}
+실험방법 : {method_str}
+실험 온도: {temp_str}
+※ 중단 정산
+완료 회차: {completed_rounds}회 / 전체 {sampling_count}회
+실험 주기: {experiment_interval}일"""
+    elif estimate_type == "extend":
+        # 연장 견적서: 연장 회차 표시
+        extend_rounds = schedule.get('extend_rounds', 0)
+        if extend_rounds is None or extend_rounds == 0:
+            extend_rounds = 3  # 기본값
+        food_type_text = f"""{food_type}
+
+소비기한 : {storage} {period_str}
+시험기간 : {test_duration}
+실험방법 : {method_str}
+실험 온도: {temp_str}
+※ 연장 실험
+연장 회차: {extend_rounds}회
+실험 주기: {experiment_interval}일"""
+    else:
+        # 1차 견적서: 기존 내용
+        food_type_text = f"""{food_type}
+
+소비기한 : {storage} {period_str}
+시험기간 : {test_duration}
+실험방법 : {method_str}
+실험 온도: {temp_str}
+연장시험 : {'진행' if schedule.get('extension_test') else '미진행'}
+실험 횟수: {sampling_count}회
+실험 주기: {experiment_interval}일"""
+
+    # 검사항목 목록 텍스트 (위에 배치)
+    test_items_text = '\n'.join([f"{i+1})  {item}" for i, item in enumerate(test_items_list)])
+
+    return {
+        'food_type_text': food_type_text,
+        'test_items_text': test_items_text,
+        'test_items_list': test_items_list,
+        'temps': temps,
+    }
+
+
+# ==================== 금액 ====================
+
+
+def calculate_total_price(schedule, estimate_type='first', completed_rounds=None):
+    """총 금액(공급가액) 계산 - 스케줄 관리에서 전달받은 비용 데이터 사용"""
+    # 실험방법 확인
+    test_method = schedule.get('test_method', 'real')
+    sampling_count = schedule.get('sampling_count', 6) or 6
+
+    # 온도 구간 수 결정 (실측=1구간, 가속=3구간)
+    if test_method in ['real', 'custom_real']:
+        zone_count = 1
+    else:
+        zone_count = 3
+
+    # 견적 유형에 따른 계산
+    if estimate_type == "suspend":
+        # 중단 견적: 완료된 회차만 계산
+        if completed_rounds is not None:
+            completed = completed_rounds
+        else:
+            completed = schedule.get('completed_rounds', 0)
+            # 완료 회차가 없으면 기본값으로 전체 회차의 절반 사용
+            if completed is None or completed == 0:
+                completed = max(1, sampling_count // 2)
+        return calculate_suspend_price(schedule, completed, zone_count)
+    elif estimate_type == "extend":
+        # 연장 견적: 연장 비용만 계산
+        return calculate_extend_price(schedule, zone_count)
+    else:
+        # 1차 견적: 전체 비용 계산
+        return calculate_first_price(schedule, zone_count, sampling_count)
+
+
+def calculate_first_price(schedule, zone_count, sampling_count):
+    """1차 견적 금액 계산 - DB에 저장된 값 우선 사용
+
+    O/X 상태 변경과 관계없이 모든 검사항목이 O인 것으로 가정한 원래 비용 계산
+    1차 견적 전용 보고서/중간보고서 비용 사용 (first_report_cost, first_interim_cost)
+    """
+    # DB에 저장된 1차 견적 값이 있으면 사용 (최우선)
+    saved_first_supply = schedule.get('first_supply_amount', 0) or 0
+    if saved_first_supply > 0:
+        return saved_first_supply
+
+    # 저장된 값이 없으면 계산
+    total = 0
+    test_method = schedule.get('test_method', 'real')
+
+    # cost_per_test (1회 기준 비용)가 있으면 사용하여 원래 전체 비용 계산
+    cost_per_test = schedule.get('cost_per_test', 0) or 0
+    if cost_per_test > 0:
+        # 원래 전체 비용 = 1회기준 × 샘플링횟수 × 구간수
+        total += cost_per_test * sampling_count * zone_count
+    else:
+        # cost_per_test가 없으면 test_items로 계산 (호환성 유지)
+        test_items = schedule.get('test_items', '')
+        if test_items:
+            item_cost = Fee.calculate_total_fee(test_items)
+            total += item_cost * sampling_count * zone_count
+
+    # 1차 견적 전용 보고서 비용 (first_report_cost 우선 사용)
+    report_cost = schedule.get('first_report_cost', 0) or schedule.get('report_cost', 0) or 0
+    if report_cost == 0:
+        # 중간보고서 여부 확인
+        report_interim = schedule.get('report_interim', False)
+        # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
+        if report_interim:
+            report_cost = 200000
+        elif test_method in ['acceleration', 'custom_acceleration']:
+            report_cost = 300000
+        else:
+            report_cost = 200000
+    total += report_cost
+
+    # 1차 견적 전용 중간보고서 비용 (first_interim_cost 우선 사용)
+    interim_report_cost = schedule.get('first_interim_cost', 0) or schedule.get('interim_report_cost', 0) or 0
+    total += interim_report_cost
+
+    return int(total)
+
+
+def calculate_suspend_price(schedule, completed_rounds, zone_count):
+    """중단 견적 금액 계산 - DB에 저장된 값 우선 사용
+
+    상태가 '중단'이고 체크 설정이 O인 경우만 비용에 포함
+    중단 견적 전용 보고서/중간보고서 비용 사용 (suspend_report_cost, suspend_interim_cost)
+    """
+    # DB에 저장된 중단 견적 값이 있으면 사용 (최우선)
+    saved_suspend_supply = schedule.get('suspend_supply_amount', 0) or 0
+    if saved_suspend_supply > 0:
+        return saved_suspend_supply
+
+    # 저장된 값이 없으면 계산
+    total = 0
+    test_method = schedule.get('test_method', 'real')
+
+    # 스케줄 관리에서 계산된 중단 비용 정보 사용 (O로 체크된 항목만 포함됨)
+    # 중단 견적은 suspend_rounds_cost 사용 (total_rounds_cost는 1차 견적용)
+    suspend_rounds_cost = schedule.get('suspend_rounds_cost', 0) or 0
+    if suspend_rounds_cost > 0:
+        # O로 체크된 항목의 비용 × 구간수
+        total += suspend_rounds_cost * zone_count
+    else:
+        # suspend_rounds_cost가 없으면 기존 방식으로 계산 (호환성 유지)
+        test_items = schedule.get('test_items', '')
+        if test_items:
+            item_cost = Fee.calculate_total_fee(test_items)
+            total += item_cost * completed_rounds * zone_count
+
+    # 중단 견적 전용 보고서 비용 (suspend_report_cost 우선 사용)
+    report_cost = schedule.get('suspend_report_cost', 0) or schedule.get('report_cost', 0) or 0
+    if report_cost == 0:
+        # 중간보고서 여부 확인
+        report_interim = schedule.get('report_interim', False)
+        # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
+        if report_interim:
+            report_cost = 200000
+        elif test_method in ['acceleration', 'custom_acceleration']:
+            report_cost = 300000
+        else:
+            report_cost = 200000
+    total += report_cost
+
+    # 중단 견적 전용 중간보고서 비용 (suspend_interim_cost 우선 사용)
+    interim_report_cost = schedule.get('suspend_interim_cost', 0) or schedule.get('interim_report_cost', 0) or 0
+    total += interim_report_cost
+
+    return int(total)
+
+
+def calculate_extend_price(schedule, zone_count):
+    """연장 견적 금액 계산 - DB에 저장된 값 우선 사용
+
+    연장 견적 전용 보고서/중간보고서 비용 사용 (extend_report_cost, extend_interim_cost)
+    """
+    # DB에 저장된 연장 견적 값이 있으면 사용 (최우선)
+    saved_extend_supply = schedule.get('extend_supply_amount', 0) or 0
+    if saved_extend_supply > 0:
+        return saved_extend_supply
+
+    # 저장된 값이 없으면 계산
+    total = 0
+    test_method = schedule.get('test_method', 'real')
+
+    # 스케줄 관리에서 계산된 연장 회차 비용이 있으면 사용 (O/X 상태 반영됨)
+    extend_rounds_cost = schedule.get('extend_rounds_cost', 0) or 0
+    if extend_rounds_cost > 0:
+        total += extend_rounds_cost * zone_count
+    else:
+        # 계산된 비용이 없으면 기존 방식으로 계산 (호환성 유지)
+        extend_rounds = schedule.get('extend_rounds', 0)
+        if extend_rounds is None or extend_rounds == 0:
+            extend_rounds = 3  # 기본값
+
+        # 검사항목 수수료 계산 (연장 회차)
+        test_items = schedule.get('test_items', '')
+        if test_items:
+            item_cost = Fee.calculate_total_fee(test_items)
+            total += item_cost * extend_rounds * zone_count
+
+    # 연장 견적 전용 보고서 비용 (extend_report_cost 우선 사용)
+    report_cost = schedule.get('extend_report_cost', 0) or schedule.get('report_cost', 0) or 0
+    if report_cost == 0:
+        # 중간보고서 여부 확인
+        report_interim = schedule.get('report_interim', False)
+        # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
+        if report_interim:
+            report_cost = 200000
+        elif test_method in ['acceleration', 'custom_acceleration']:
+            report_cost = 300000
+        else:
+            report_cost = 200000
+    total += report_cost
+
+    # 연장 견적 전용 중간보고서 비용 (extend_interim_cost 우선 사용)
+    interim_report_cost = schedule.get('extend_interim_cost', 0) or 0
+    total += interim_report_cost
+
+    return int(total)
+
+
+# ==================== Remark / 메일 ====================
+
+
+def build_remark_text(schedule, estimate_type='first', user=None):
+    """Remark 문구 생성 (저장된 Remark가 있으면 그대로 사용)
+
+    Args:
+        user: 로그인 사용자 (중단 견적 문의처 표시용)
+    """
+    # 저장된 Remark 내용이 있는지 확인
+    field_name = {
+        'first': 'remark_first',
+        'suspend': 'remark_suspend',
+        'extend': 'remark_extend'
+    }.get(estimate_type, 'remark_first')
+
+    saved_remark = schedule.get(field_name, '') or ''
+    if saved_remark:
+        # 저장된 내용이 있으면 그대로 사용
+        return saved_remark
+
+    sampling_count = schedule.get('sampling_count', 6) or 6
+    test_method = schedule.get('test_method', 'real')
+
+    # 온도 구간 수 결정
+    if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
+        zone_count = 3
+        zone_text = "3온도"
+    else:
+        zone_count = 1
+        zone_text = "1온도"
+
+    total_samples = sampling_count * zone_count
+
+    # 연장실험 여부 확인 (연장×2)
+    extension_test = schedule.get('extension_test', 0)
+    if extension_test:
+        total_samples = total_samples * 2
+
+    # 포장단위 정보 가져오기
+    packaging_weight = schedule.get('packaging_weight', 0) or 0
+    packaging_unit = schedule.get('packaging_unit', 'g') or 'g'
+    if packaging_weight > 0:
+        packaging_text = f"{packaging_weight}{packaging_unit}"
+    else:
+        packaging_text = "100g"
+
+    # 소비기한을 일수로 변환
+    test_period_days = schedule.get('test_period_days', 0) or 0
+    test_period_months = schedule.get('test_period_months', 0) or 0
+    test_period_years = schedule.get('test_period_years', 0) or 0
+    total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
+
+    # 실험기간 계산 (실측: 소비기한×1.5, 가속: 소비기한÷2)
+    if test_method in ['real', 'custom_real']:
+        total_experiment_days = int(total_expiry_days * 1.5)
+    else:
+        total_experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
+
+    # 샘플링 간격 계산
+    if total_experiment_days > 0 and sampling_count > 0:
+        interval = total_experiment_days // sampling_count
+    else:
+        interval = 15  # 기본값
+
+    # 중간보고서 실험일수 (6회차 기준)
+    interim_experiment_days = interval * 6
+
+    # 시작일과 예상 날짜 계산
+    start_date_str = schedule.get('start_date', '')
+    interim_expected_date = ""
+    final_expected_date = ""
+
+    if start_date_str:
+        try:
+            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+            # 중간보고서 예상일 (실험 완료 + 분석시간 약 15일)
+            interim_date = start_date + timedelta(days=interim_experiment_days + 15)
+            interim_expected_date = interim_date.strftime('%Y-%m-%d')
+            # 최종보고서 예상일 (실험 완료 + 분석시간 약 15일)
+            final_date = start_date + timedelta(days=total_experiment_days + 15)
+            final_expected_date = final_date.strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            pass
+
+    # 소비기한 개월 수 계산
+    total_months = test_period_months + (test_period_years * 12)
+    if test_period_days >= 15:
+        total_months += 1
+
+    # 검사 소요기간 문구 생성
+    # 중간 보고서 날짜 및 회차 정보 가져오기 (스케쥴 관리에서)
+    report1_date = schedule.get('report1_date', '') or ''
+    report2_date = schedule.get('report2_date', '') or ''
+    report3_date = schedule.get('report3_date', '') or ''
+    interim1_round = schedule.get('interim1_round', 0) or 0
+    interim2_round = schedule.get('interim2_round', 0) or 0
+    interim3_round = schedule.get('interim3_round', 0) or 0
+    report_interim = schedule.get('report_interim', False)
+
+    # 회차별 제조후 일수 계산 함수
+    def get_days_for_round(round_num):
+        if round_num <= 0 or sampling_count <= 0:
+            return 0
+        if round_num == 1:
+            return 0
+        if round_num >= sampling_count:
+            return total_experiment_days
+        # 중간 회차: 균등 분배
+        if sampling_count > 1:
+            interval = total_experiment_days / (sampling_count - 1)
+            return int(round((round_num - 1) * interval))
+        return 0
+
+    test_period_text = ""
+
+    # 중간 보고서 날짜가 있는 경우 (스케쥴 관리에서 입력된 날짜 사용)
+    has_report_dates = False
+
+    # 중간 보고서 1 날짜가 있는 경우
+    if report1_date and report1_date != '-':
+        days_for_interim1 = get_days_for_round(interim1_round)
+        test_period_text += f"→ 실험 기간 : {days_for_interim1}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 1 / {report1_date})\n"
+        has_report_dates = True
+
+    # 중간 보고서 2 날짜가 있는 경우
+    if report2_date and report2_date != '-':
+        days_for_interim2 = get_days_for_round(interim2_round)
+        test_period_text += f"→ 실험 기간 : {days_for_interim2}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 2 / {report2_date})\n"
+        has_report_dates = True
+
+    # 중간 보고서 3 날짜가 있는 경우
+    if report3_date and report3_date != '-':
+        days_for_interim3 = get_days_for_round(interim3_round)
+        test_period_text += f"→ 실험 기간 : {days_for_interim3}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 3 / {report3_date})\n"
+        has_report_dates = True
+
+    # 날짜가 없고 report_interim이 체크된 경우 기존 로직 사용
+    if not has_report_dates and report_interim:
+        interim_date_text = f" / {interim_expected_date}" if interim_expected_date else ""
+        test_period_text += f"→ 실험 기간 : {interim_experiment_days}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. ({total_months}개월 중간 보고서{interim_date_text})\n"
+
+    # 최종 보고서 라인
+    final_date_text = f" / {final_expected_date}" if final_expected_date else ""
+    test_period_text += f"→ 실험 기간 : {total_experiment_days}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (최종 보고서{final_date_text})"
+
+    # 견적 유형에 따른 Remark 생성
+    if estimate_type == "suspend":
+        # 중단 견적서 Remark
+        completed_rounds = schedule.get('completed_rounds', 0)
+        if completed_rounds is None or completed_rounds == 0:
+            completed_rounds = max(1, sampling_count // 2)  # 기본값: 전체의 절반
+
+        # 1차 견적 금액 계산 (부가세 포함)
+        first_price = calculate_first_price(schedule, zone_count, sampling_count)
+        first_price_with_vat = round(first_price * 1.1)  # 부가세 10% 포함, round 사용
+
+        # 중단 시 진행한 실험 비용 계산 (부가세 포함)
+        suspend_price = calculate_suspend_price(schedule, completed_rounds, zone_count)
+        suspend_price_with_vat = round(suspend_price * 1.1)  # 부가세 10% 포함, round 사용
+
+        # 잔여 금액 계산
+        remaining_price = first_price_with_vat - suspend_price_with_vat
+
+        # 로그인 사용자 정보
+        user_name = ""
+        user_phone = ""
+        user_mobile = ""
+        if user:
+            user_name = user.get('name', '')
+            user_phone = user.get('phone', '')
+            user_mobile = user.get('mobile', '')
+
+        remark_text = f"""※ 중단 정산 내역
+
+→ 실험 중단 사유: 품질한계 도달 / 의뢰자 요청
+→ 완료된 실험 회차: {completed_rounds}회 / 전체 {sampling_count}회 (온도 {zone_count}구간)
+→ 정산 기준: 1차 견적 = {first_price_with_vat:,}원(부가세 포함) - {suspend_price_with_vat:,}원(중단 시 진행한 실험 비용) = {remaining_price:,}원(잔여)
+
+※ 정산 안내
+* 본 견적서는 실험 중단에 따른 정산 견적서입니다.
+* 완료된 실험 회차까지의 비용만 청구됩니다.
+* 이미 입금이 완료된 경우 환불 또는 다른 검사 비용으로 사용이 가능합니다.
+* 추가 문의사항은 {user_name}, {user_phone}, {user_mobile} 연락 주시기 바랍니다.
+
+※ 입금 계좌 안내
+- 기업 은행 : 024-088021-01-017
+- 우리 은행 : 1005-702-799176
+- 농협 은행 : 301-0178-1722-11
+★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
+★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
+   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
+
+    elif estimate_type == "extend":
+        # 연장 견적서 Remark
+        extend_rounds = schedule.get('extend_rounds', 0)
+        if extend_rounds is None or extend_rounds == 0:
+            extend_rounds = 3  # 기본값: 3회
+
+        # 연장 실험 간격 계산
+        extend_experiment_days = schedule.get('extend_experiment_days', 0)
+        sampling_interval = schedule.get('sampling_interval', 15) or 15
+        if extend_rounds > 0 and extend_experiment_days > 0:
+            extend_interval = extend_experiment_days // extend_rounds
+        else:
+            extend_interval = sampling_interval
+
+        remark_text = f"""※ 연장실험 안내
+
+→ 연장 실험 회차: {extend_rounds}회 (온도 {zone_count}구간)
+→ 연장 샘플링 간격: 약 {extend_interval}일
+
+※ 연장실험 진행 절차
+1. 본 견적서 확인 후 입금
+2. 연장실험 진행 (기존 보관 검체 사용)
+3. 최종 보고서 발행
+
+* 연장실험은 기존 실험 데이터와 연계하여 진행됩니다.
+* 기존 보관 중인 검체를 사용하여 연장 실험을 진행합니다.
+* 연장실험 후 최종 보고서가 발행됩니다.
+
+※ 입금 계좌 안내
+- 기업 은행 : 024-088021-01-017
+- 우리 은행 : 1005-702-799176
+- 농협 은행 : 301-0178-1722-11
+★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
+★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
+   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
+
+    else:
+        # 1차 견적서 Remark (기존 내용)
+        remark_text = f"""※ 검체량
+→ 검체는 판매 또는 판매 예정인 제품과 동일하게 검사제품을 준비해주시기 바랍니다.
+→ 검체량 : 온도 구간별({zone_text}) 총 {sampling_count}회씩 실험 = {total_samples}ea
+    => 포장단위 {packaging_text} 이상 제품 기준 총 {total_samples}ea 이상 준비
+
+※ 검사 소요기간
+{test_period_text}
+→ 실험스케쥴(구간 및 횟수)은 실험결과의 유의성에 따라 보고서 발행일 수가 변경될 수 있습니다.
+
+* 예상 소비기한은 견적이며, 품질안전한계기간 미도달 시에도 실험연장 불가합니다.
+* 견적 금액은 검사비용 외 보관비 및 보고서작성 비용 포함입니다.
+* 지표 항목의 수정(추가)이나 삭제가 필요한 경우 사전 연락을 해주시고 문의사항은 연락 바랍니다.
+* 온도 구간별 1회 시험을 하며, 반복 실험이 필요한 경우 연락 바랍니다.
+* 소비기한 설정 실험은 입금 후 진행되며, 검사 중 품질한계 도달로 실험 중단 시, 중단 전까지의 비용 청구됩니다.
+
+※ 입금 계좌 안내
+- 기업 은행 : 024-088021-01-017
+- 우리 은행 : 1005-702-799176
+- 농협 은행 : 301-0178-1722-11
+★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
+★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
+   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
+
+    return remark_text
+
+
+def build_email_content(schedule, company, estimate_type='first', discount_rate=0):
+    """견적서 발송 메일 제목/본문 생성 (화면/일괄 발송 공용)
+
+    Args:
+        company: 공용 설정 {key: value} (회사명/연락처/이메일)
+        discount_rate: 할인율 (%, 0이면 할인 없음)
+
+    Returns:
+        (subject, body)
+    """
+    # 동적 데이터 추출
+    client_name = schedule.get('client_name', '') or ''
+    food_type = schedule.get('food_type_name', '') or ''
+
+    # 보관조건 변환
+    storage_code = schedule.get('storage_condition', 'room_temp')
+    storage_map = {
+        'room_temp': '상온',
+        'warm': '실온',
+        'cool': '냉장',
+        'freeze': '냉동'
+    }
+    storage = storage_map.get(storage_code, storage_code)
+
+    # 실험방법 변환
+    test_method = schedule.get('test_method', 'real')
+    method_map = {
+        'real': '실측실험',
+        'acceleration': '가속실험',
+        'custom_real': '의뢰자요청(실측)',
+        'custom_accel': '의뢰자요청(가속)',
+        'custom_acceleration': '의뢰자요청(가속)'
+    }
+    method_str = method_map.get(test_method, test_method)
+
+    # 실험 횟수
+    sampling_count = schedule.get('sampling_count', 6) or 6
+
+    # 온도 구간 수
+    if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
+        zone_count = 3
+    else:
+        zone_count = 1
+
+    # 실험 주기 계산
+    test_period_days = schedule.get('test_period_days', 0) or 0
+    test_period_months = schedule.get('test_period_months', 0) or 0
+    test_period_years = schedule.get('test_period_years', 0) or 0
+    total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
+
+    if test_method in ['real', 'custom_real']:
+        experiment_days = int(total_expiry_days * 1.5)
+    else:
+        experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
+
+    if experiment_days > 0 and sampling_count > 0:
+        experiment_interval = experiment_days // sampling_count
+    else:
+        experiment_interval = 15
+
+    # 필요 시료량 계산
+    total_samples = sampling_count * zone_count
+    packaging_weight = schedule.get('packaging_weight', 0) or 0
+    packaging_unit = schedule.get('packaging_unit', 'g') or 'g'
+    if packaging_weight > 0:
+        sample_text = f"포장단위 {packaging_weight}{packaging_unit} 이상 제품 기준 총 {total_samples}ea 이상"
+    else:
+        sample_text = f"총 {total_samples}ea 이상"
+
+    # 총액 계산 (할인 적용 여부에 따라)
+    total_price = calculate_total_price(schedule, estimate_type)
+    if discount_rate > 0:
+        # 할인 적용
+        discount_amount = int(total_price * discount_rate / 100)
+        total_price = total_price - discount_amount
+        price_note = f" ({discount_rate}% 할인 적용)"
+    else:
+        price_note = ""
+    vat = round(total_price * 0.1)
+    total_with_vat = total_price + vat
+
+    # 제목
+    subject = f"[바이오푸드랩] {client_name} 견적서 송부의 건"
+
+    # 서명 정보 구성
+    company_name = company.get('company_name', '(주)바이오푸드랩') or '(주)바이오푸드랩'
+    company_phone = company.get('company_phone', '') or ''
+    company_mobile = company.get('company_mobile', '') or ''
+    company_email = company.get('company_email', '') or company.get('smtp_email', '') or ''
+    signature_lines = [company_name]
+    if company_phone:
+        signature_lines.append(f"Tel: {company_phone}")
+    if company_mobile:
+        signature_lines.append(f"Mobile: {company_mobile}")
+    if company_email:
+        signature_lines.append(f"Email: {company_email}")
+    signature = '\n'.join(signature_lines)
+
+    # 본문 템플릿
+    body_template = f"""안녕하세요, {company_name}입니다.
+
+{client_name} 귀하
+
+요청하신 소비기한 설정시험 견적서를 송부드립니다.
+
+■ 견적 정보
+  - 식품유형: {food_type}
+  - 보관조건: {storage}
+  - 실험방법: {method_str}
+  - 실험횟수: {sampling_count}회 (온도 {zone_count}구간)
+  - 실험주기: {experiment_interval}일
+  - 필요시료: {sample_text}
+  - 견적금액: {total_with_vat:,}원 (VAT 포함){price_note}
+
+첨부된 견적서를 확인해 주시기 바랍니다.
+문의사항이 있으시면 언제든 연락 부탁드립니다.
+
+감사합니다.
+
+─────────────────────────
+{signature}
+─────────────────────────"""
+
+    return subject, body_template
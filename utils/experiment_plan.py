@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+온도조건별 실험 계획 계산 (Qt 없이 동작 - 스케줄 관리 탭 / API 서버 공용)
+- 회차별 제조후 일수, 구간 수, 견적 금액 계산
+- ExperimentPlan: 검사항목 × 회차 O/X를 bool 행렬로 보관하고 비용을 행렬 연산으로 집계
+  (셀 하나를 바꿔도 전체 재계산이 배열 연산 몇 번으로 끝남)
+"""
+
+import numpy as np
+
+
+MARK_DONE = 'O'
+MARK_SKIP = 'X'
+
+# 실측 실험 방법 (1구간, 실험기간 = 유통기한 × 1.5) / 그 외는 가속 (3구간, 유통기한 ÷ 2)
+REAL_TEST_METHODS = ('real', 'custom_real')
+ACCELERATION_TEST_METHODS = ('acceleration', 'custom_acceleration')
+
+# 기본 보고서 비용 (가속 / 실측) 및 중간보고서 비용
+ACCELERATION_REPORT_COST = 300000
+REAL_REPORT_COST = 200000
+INTERIM_REPORT_COST = 200000
+
+VAT_RATE = 0.1
+
+
+def zone_count(test_method):
+    """실험 방법별 구간 수 (실측=1구간, 가속=3구간)"""
+    return 1 if test_method in REAL_TEST_METHODS else 3
+
+
+def default_report_cost(test_method):
+    """실험 방법별 기본 보고서 비용"""
+    if test_method in ACCELERATION_TEST_METHODS:
+        return ACCELERATION_REPORT_COST
+    return REAL_REPORT_COST
+
+
+def experiment_days(test_method, days=0, months=0, years=0):
+    """유통기한(일/월/년)에서 실험 일수 계산 (실측: ×1.5, 가속: ÷2)"""
+    total_days = (days or 0) + ((months or 0) * 30) + ((years or 0) * 365)
+    if test_method in REAL_TEST_METHODS:
+        return int(total_days * 1.5)
+    return total_days // 2 if total_days > 0 else 0
+
+
+def round_offsets(total_days, sampling_count):
+    """회차별 제조후 일수 (첫 회차 0일 ~ 마지막 회차 total_days, 그 사이는 균등 분배)"""
+    if sampling_count <= 0:
+        return []
+    interval_days = total_days / (sampling_count - 1) if sampling_count > 1 else 0
+    offsets = [int(round(i * interval_days)) for i in range(sampling_count)]
+    # 마지막 회차는 정확히 total_days
+    offsets[-1] = total_days
+    return offsets
+
+
+def estimate_amounts(rounds_cost, zones, report_cost, interim_cost=0):
+    """견적 금액 계산 (회차 비용 × 구간 수 + 보고서 비용 + 중간보고서 비용)
+
+    Returns:
+        {'supply': 공급가액, 'tax': 부가세, 'total': 합계, 'formula': 계산식 문자열}
+    """
+    supply = int(rounds_cost * zones + report_cost + interim_cost)
+    if interim_cost > 0:
+        formula = f"{rounds_cost:,}×{zones}+{report_cost:,}+{interim_cost:,}={supply:,}원"
+    else:
+        formula = f"{rounds_cost:,}×{zones}+{report_cost:,}={supply:,}원"
+    tax = int(supply * VAT_RATE)
+    return {'supply': supply, 'tax': tax, 'total': supply + tax, 'formula': formula}
+
+
+class ExperimentPlan:
+    """검사항목 × 회차 O/X 계획
+
+    - marks[i, j]: i번째 검사항목의 j번째 회차(0부터) 실시 여부 (True = 'O')
+    - 회차 열은 기본 회차(sampling_count) 다음에 연장 회차(extend_rounds)가 이어짐
+    """
+
+    def __init__(self, test_items, fees, sampling_count, extend_rounds=0, saved_marks=None):
+        """
+        Args:
+            test_items: 검사항목 이름 목록 (테이블 행 순서)
+            fees: {검사항목: 단가}
+            saved_marks: 저장된 O/X 상태 {검사항목: ['O', 'X', ...]} (빈 값은 'O')
+        """
+        self.test_items = list(test_items)
+        self.sampling_count = sampling_count
+        self.prices = np.array([int(fees.get(item, 0) or 0) for item in self.test_items], dtype=np.int64)
+        self.marks = np.ones((len(self.test_items), sampling_count + extend_rounds), dtype=bool)
+        if saved_marks:
+            self.apply_marks(saved_marks)
+
+    @property
+    def total_rounds(self):
+        return self.marks.shape[1]
+
+    @property
+    def extend_rounds(self):
+        return self.total_rounds - self.sampling_count
+
+    # ==================== O/X 변경 ====================
+
+    def apply_marks(self, saved_marks, first_round=0):
+        """저장된 O/X 상태 반영 (first_round 회차부터, 값이 없으면 그대로)"""
+        for row, test_item in enumerate(self.test_items):
+            values = saved_marks.get(test_item) or []
+            for col in range(first_round, min(len(values), self.total_rounds)):
+                if values[col]:
+                    self.marks[row, col] = values[col] != MARK_SKIP
+
+    def set_extend_rounds(self, extend_rounds):
+        """연장 회차 수 변경 (새로 생기는 회차는 모두 'O', 줄어든 회차는 제거)"""
+        total_rounds = self.sampling_count + extend_rounds
+        if total_rounds <= self.total_rounds:
+            self.marks = self.marks[:, :total_rounds].copy()
+        else:
+            added = np.ones((len(self.test_items), total_rounds - self.total_rounds), dtype=bool)
+            self.marks = np.hstack([self.marks, added])
+
+    def mark(self, row, col):
+        """셀 표시 문자 ('O' / 'X')"""
+        return MARK_DONE if self.marks[row, col] else MARK_SKIP
+
+    def toggle(self, row, col):
+        """O ↔ X 전환 후 새 표시 문자 반환"""
+        self.marks[row, col] = not self.marks[row, col]
+        return self.mark(row, col)
+
+    def set_mark(self, row, col, value):
+        """셀 표시 변경 (바뀌었으면 True)"""
+        checked = value != MARK_SKIP
+        if self.marks[row, col] == checked:
+            return False
+        self.marks[row, col] = checked
+        return True
+
+    def to_dict(self):
+        """저장 형식 {검사항목: ['O', 'X', ...]} (연장 회차 포함)"""
+        return {
+            test_item: [MARK_DONE if checked else MARK_SKIP for checked in self.marks[row]]
+            for row, test_item in enumerate(self.test_items)
+        }
+
+    # ==================== 비용 집계 ====================
+
+    def cost_per_test(self):
+        """1회 기준 비용 (전체 검사항목 단가 합계, O/X 무관)"""
+        return int(self.prices.sum())
+
+    def column_costs(self):
+        """회차별 비용 (O인 항목 단가 합계) - 길이 total_rounds 배열"""
+        return self.prices @ self.marks
+
+    def base_rounds_cost(self):
+        """기본 회차 비용 합계"""
+        return int(self.column_costs()[:self.sampling_count].sum())
+
+    def extend_rounds_cost(self):
+        """연장 회차 비용 합계"""
+        return int(self.column_costs()[self.sampling_count:].sum())
+
+    def item_counts(self, first_round=0, last_round=None):
+        """검사항목별 O 개수 (first_round ~ last_round-1 회차)"""
+        return self.marks[:, first_round:last_round].sum(axis=1)
+
+    def item_detail(self, first_round=0, last_round=None):
+        """검사항목별 비용 내역 문자열 (O가 있는 항목만, 없으면 '-')"""
+        counts = self.item_counts(first_round, last_round)
+        costs = counts * self.prices
+        parts = [f"{test_item}({count}회)={cost:,}원"
+                 for test_item, count, cost in zip(self.test_items, counts.tolist(), costs.tolist())
+                 if count > 0]
+        return " | ".join(parts) if parts else "-"
+
+    def completed_rounds(self):
+        """앞에서부터 연속으로 모든 항목이 'O'인 회차 수 (중단 견적 정산용)
+
+        검사항목이 없으면 0
+        """
+        if not self.test_items:
+            return 0
+        incomplete = np.flatnonzero(~self.marks.all(axis=0))
+        return int(incomplete[0]) if incomplete.size else self.total_rounds
@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+외부 이메일 발송 대기열
+- 발송 요청은 mail_queue 폴더에 작업 파일(JSON)로 저장하고 바로 반환 (UI 멈춤 없음)
+- 백그라운드 작업 스레드 하나가 순서대로 발송하며, 같은 계정의 SMTP 연결은 로그인한 채로 재사용
+- 일시적인 오류는 점점 긴 간격으로 재시도, 프로그램을 다시 시작해도 남은 작업 이어서 발송
+- 발송 결과는 EmailLog.update_status로 이메일 로그에 반영 (대기 → 정상/발송실패)
+- SMTP 비밀번호는 작업 파일에 저장하지 않고 발송 시점에 설정에서 조회
+"""
+
+import json
+import os
+import smtplib
+import sys
+import threading
+import time
+import uuid
+from email import encoders
+from email.header import Header
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+
+# 이메일 로그 상태값
+STATUS_QUEUED = '대기'
+STATUS_SENT = '정상'
+STATUS_FAILED = '발송실패'
+
+# 견적서 발송 SMTP 서버 (고정값, 계정은 사용자 설정)
+DEFAULT_SMTP_SERVER = 'spam.biofl.co.kr'
+DEFAULT_SMTP_PORT = 25
+DEFAULT_SMTP_SECURITY = 'TLS'
+
+# 재시도 설정 (30초, 1분, 2분, 4분 ... 간격, 최대 MAX_ATTEMPTS회)
+MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 30 * 60
+
+# 사용하지 않는 SMTP 연결을 닫기까지 대기 시간 (초)
+SMTP_IDLE_TIMEOUT = 60
+SMTP_TIMEOUT = 30
+
+# 작업 파일 저장 경로
+if getattr(sys, 'frozen', False):
+    BASE_PATH = os.path.dirname(sys.executable)
+else:
+    BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QUEUE_DIR = os.path.join(BASE_PATH, 'mail_queue')
+
+# 첨부파일 확장자별 MIME 타입
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+}
+
+# 재시도해도 소용없는 오류 (바로 발송실패 처리)
+_PERMANENT_ERRORS = (
+    smtplib.SMTPAuthenticationError,
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    FileNotFoundError,
+)
+
+
+def build_message(sender_email, sender_name, to_list, cc_list, subject, body, attachments=None):
+    """MIME 메일 메시지 생성 (한글 첨부파일명은 RFC 2231 인코딩)"""
+    msg = MIMEMultipart()
+    msg['From'] = f"{sender_name} <{sender_email}>" if sender_name else sender_email
+    msg['To'] = ', '.join(to_list)
+    if cc_list:
+        msg['Cc'] = ', '.join(cc_list)
+    msg['Subject'] = Header(subject, 'utf-8')
+
+    msg.attach(MIMEText(body, 'plain', 'utf-8'))
+
+    for file_path in attachments or []:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"첨부파일을 찾을 수 없습니다: {file_path}")
+        filename = os.path.basename(file_path)
+        mime_type = MIME_TYPES.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
+        maintype, subtype = mime_type.split('/', 1)
+
+        part = MIMEBase(maintype, subtype)
+        with open(file_path, 'rb') as f:
+            part.set_payload(f.read())
+        encoders.encode_base64(part)
+        part.add_header('Content-Disposition', 'attachment', filename=('utf-8', '', filename))
+        part.set_param('name', Header(filename, 'utf-8').encode())
+        msg.attach(part)
+
+    return msg
+
+
+def _lookup_password(credential):
+    """작업의 인증 정보 출처에 따라 SMTP 비밀번호 조회
+
+    Args:
+        credential: {'scope': 'user', 'user_id': ID} (사용자별 설정)
+                    또는 {'scope': 'global'} (공용 설정)
+    """
+    if credential.get('scope') == 'user':
+        from models.settings import UserSettings
+        return UserSettings.get(credential.get('user_id'), 'smtp_password', '') or ''
+    from models.settings import Settings
+    return Settings.get('smtp_password', '') or ''
+
+
+def _update_log_status(log_id, status):
+    if not log_id:
+        return
+    try:
+        from models.communications import EmailLog
+        EmailLog.update_status(log_id, status=status)
+    except Exception as e:
+        print(f"[메일 대기열] 이메일 로그 상태 업데이트 오류: {e}")
+
+
+class SmtpConnectionPool:
+    """계정별 SMTP 연결 재사용 (작업 스레드 전용)"""
+
+    def __init__(self, idle_timeout=SMTP_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._connections = {}  # {(서버, 포트, 보안, 사용자): (연결, 마지막 사용 시각)}
+
+    def get(self, smtp, password):
+        """로그인된 연결 반환 (끊긴 연결은 다시 연결)"""
+        key = (smtp['server'], int(smtp['port']), smtp.get('security', 'TLS'), smtp['username'])
+        entry = self._connections.pop(key, None)
+        if entry is not None:
+            server = entry[0]
+            try:
+                if server.noop()[0] == 250:
+                    self._connections[key] = (server, time.time())
+                    return server
+            except smtplib.SMTPException:
+                pass
+            self._quit(server)
+
+        server_host, port, security, username = key
+        if security == 'SSL':
+            server = smtplib.SMTP_SSL(server_host, port, timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(server_host, port, timeout=SMTP_TIMEOUT)
+            if security == 'TLS':
+                server.starttls()
+        server.login(username, password)
+        self._connections[key] = (server, time.time())
+        return server
+
+    def discard(self, smtp):
+        """오류가 난 연결 폐기"""
+        key = (smtp['server'], int(smtp['port']), smtp.get('security', 'TLS'), smtp['username'])
+        entry = self._connections.pop(key, None)
+        if entry is not None:
+            self._quit(entry[0])
+
+    def close_idle(self):
+        now = time.time()
+        for key, (server, used_at) in list(self._connections.items()):
+            if now - used_at >= self.idle_timeout:
+                del self._connections[key]
+                self._quit(server)
+
+    def close_all(self):
+        for server, _ in self._connections.values():
+            self._quit(server)
+        self._connections = {}
+
+    @staticmethod
+    def _quit(server):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+
+class MailQueue:
+    """외부 이메일 발송 대기열 (작업 파일 + 백그라운드 작업 스레드)"""
+
+    def __init__(self, directory=QUEUE_DIR):
+        self.directory = directory
+        self.failed_directory = os.path.join(directory, 'failed')
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._owner_id = None
+
+    # ==================== 작업 파일 ====================
+
+    def _job_path(self, job_id):
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def _write_job(self, job):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._job_path(job['id'])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        # 원자적 교체 (쓰다 만 작업 파일을 읽지 않도록)
+        os.replace(tmp_path, path)
+
+    def _load_jobs(self):
+        """대기 중인 작업 목록 (생성 순)"""
+        jobs = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return jobs
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                    jobs.append(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"[메일 대기열] 작업 파일 읽기 오류 ({name}): {e}")
+        jobs.sort(key=lambda job: job.get('created_at', 0))
+        return jobs
+
+    def _finish_job(self, job, failed=False):
+        """완료된 작업 파일 정리 (실패한 작업은 failed 폴더로 이동)"""
+        path = self._job_path(job['id'])
+        try:
+            if failed:
+                os.makedirs(self.failed_directory, exist_ok=True)
+                self._write_job(job)
+                os.replace(path, os.path.join(self.failed_directory, f"{job['id']}.json"))
+            else:
+                os.remove(path)
+        except OSError as e:
+            print(f"[메일 대기열] 작업 파일 정리 오류: {e}")
+
+    # ==================== 공개 API ====================
+
+    def enqueue(self, smtp, credential, sender_name, to_list, cc_list, subject, body,
+                attachments=None, log_id=None, owner_id=None):
+        """발송 작업 추가 (파일 저장 후 바로 반환)
+
+        Args:
+            smtp: {'server', 'port', 'security', 'username'} (비밀번호 제외)
+            credential: 비밀번호 조회 출처 ({'scope': 'user', 'user_id'} / {'scope': 'global'})
+            sender_name: 발신자 이름
+            to_list, cc_list: 수신자/참조 이메일 목록
+            subject, body: 제목, 본문
+            attachments: 첨부파일 경로 목록 (발송 시점에 읽음)
+            log_id: 이메일 로그 ID (있으면 발송 결과로 상태 갱신)
+            owner_id: 작업을 만든 사용자 ID (해당 사용자 로그인 중에만 발송)
+
+        Returns:
+            작업 ID
+        """
+        job = {
+            'id': f"{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}",
+            'created_at': time.time(),
+            'owner_id': owner_id,
+            'smtp': dict(smtp),
+            'credential': dict(credential),
+            'sender_name': sender_name,
+            'to': list(to_list),
+            'cc': list(cc_list or []),
+            'subject': subject,
+            'body': body,
+            'attachments': list(attachments or []),
+            'log_id': log_id,
+            'attempts': 0,
+            'next_attempt_at': 0,
+            'last_error': None,
+        }
+        with self._lock:
+            self._write_job(job)
+        self.start(owner_id)
+        self._wakeup.set()
+        return job['id']
+
+    def pending_count(self):
+        return len(self._load_jobs())
+
+    def start(self, owner_id=None):
+        """작업 스레드 시작 (로그인 시 호출, 남은 작업 이어서 발송)"""
+        with self._lock:
+            self._owner_id = owner_id
+            self._stop.clear()
+            if self._thread is not None:
+                # 아직 종료하지 않은 스레드(중지 요청 후 발송 중 포함)는 중지를 취소하고 계속 사용
+                self._wakeup.set()
+                return
+            self._thread = threading.Thread(target=self._run, name='MailQueue', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        """작업 스레드 중지 (로그아웃/종료 시 호출, 남은 작업은 파일로 유지)
+
+        SMTP 발송 중이면 timeout 안에 끝나지 않을 수 있음 - 스레드 참조는 작업 스레드가
+        실제로 종료할 때 지우므로, 그 사이 start()가 호출되어도 작업 스레드가 둘이 되지 않음
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stop.set()
+            self._wakeup.set()
+        thread.join(timeout)
+
+    # ==================== 작업 스레드 ====================
+
+    def _run(self):
+        pool = SmtpConnectionPool()
+        try:
+            while not self._should_exit():
+                wait = self._process_due_jobs(pool)
+                pool.close_idle()
+                self._wakeup.wait(wait)
+                self._wakeup.clear()
+        finally:
+            pool.close_all()
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _should_exit(self):
+        """중지 요청 확인 (종료할 때는 잠금 안에서 스레드 참조를 지워 start()가 새 스레드를 만들 수 있게 함)"""
+        with self._lock:
+            if not self._stop.is_set():
+                return False
+            if self._thread is threading.current_thread():
+                self._thread = None
+            return True
+
+    def _process_due_jobs(self, pool):
+        """발송 시각이 된 작업 처리, 다음 확인까지 대기 시간(초) 반환"""
+        wait = SMTP_IDLE_TIMEOUT
+        for job in self._load_jobs():
+            if self._stop.is_set():
+                break
+            if job.get('owner_id') != self._owner_id:
+                continue  # 다른 사용자가 만든 작업은 그 사용자 로그인 시 발송
+            delay = job.get('next_attempt_at', 0) - time.time()
+            if delay > 0:
+                wait = min(wait, delay)
+                continue
+            self._send_job(job, pool)
+        return max(wait, 1)
+
+    def _send_job(self, job, pool):
+        smtp = job['smtp']
+        try:
+            password = _lookup_password(job['credential'])
+            if not password:
+                raise smtplib.SMTPAuthenticationError(535, "SMTP 비밀번호가 설정되지 않았습니다.")
+
+            msg = build_message(smtp['username'], job.get('sender_name'), job['to'], job['cc'],
+                                job['subject'], job['body'], job['attachments'])
+            recipients = job['to'] + job['cc']
+            try:
+                pool.get(smtp, password).sendmail(smtp['username'], recipients, msg.as_string())
+            except smtplib.SMTPServerDisconnected:
+                # 재사용하던 연결이 서버에서 끊긴 경우 한 번 다시 연결
+                pool.discard(smtp)
+                pool.get(smtp, password).sendmail(smtp['username'], recipients, msg.as_string())
+        except Exception as e:
+            pool.discard(smtp)
+            job['attempts'] = job.get('attempts', 0) + 1
+            job['last_error'] = str(e)
+            if isinstance(e, _PERMANENT_ERRORS) or job['attempts'] >= MAX_ATTEMPTS:
+                print(f"[메일 대기열] 발송 실패 ({job['subject']}): {e}")
+                _update_log_status(job.get('log_id'), STATUS_FAILED)
+                self._finish_job(job, failed=True)
+            else:
+                delay = min(RETRY_BASE_DELAY * 2 ** (job['attempts'] - 1), RETRY_MAX_DELAY)
+                print(f"[메일 대기열] 발송 오류, {delay}초 후 재시도 ({job['attempts']}/{MAX_ATTEMPTS}): {e}")
+                job['next_attempt_at'] = time.time() + delay
+                with self._lock:
+                    self._write_job(job)
+            return False
+
+        _update_log_status(job.get('log_id'), STATUS_SENT)
+        self._finish_job(job)
+        return True
+
+
+# 싱글톤 인스턴스
+mail_queue = MailQueue()
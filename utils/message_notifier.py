@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API 서버용 메시지 변경 알림
+- long-poll 요청은 이벤트 루프에서 대기하며 DB 스레드를 점유하지 않음
+- 워커당 감시 작업 하나만 전역 변경 토큰을 주기적으로 조회하고,
+  바뀌면 대기 중인 요청을 모두 깨움 (요청마다 DB를 조회하지 않음)
+- 같은 워커에서 메시지를 보낸 경우 notify()로 즉시 깨움
+- 요청은 상태를 조회하기 전에 current_event()로 이벤트를 받아 두고 wait()에 넘김
+  (조회와 대기 사이에 온 알림도 놓치지 않음)
+- 대기 중인 요청이 없으면 감시 작업 종료
+"""
+
+import asyncio
+
+from utils.db_executor import run_db
+
+
+# 전역 변경 토큰 조회 주기 (초) - 다른 워커에서 보낸 메시지는 최대 이 시간 후 전달
+CHANGE_CHECK_INTERVAL = 1.0
+
+
+class MessageNotifier:
+    """메시지 변경 감지 및 long-poll 대기열"""
+
+    def __init__(self, token_func, interval=CHANGE_CHECK_INTERVAL):
+        """
+        Args:
+            token_func: 전역 변경 토큰을 반환하는 동기 함수 (DB 스레드 풀에서 실행)
+            interval: 토큰 조회 주기 (초)
+        """
+        self._token_func = token_func
+        self.interval = interval
+        self._token = None
+        self._event = None
+        self._task = None
+        self._waiters = 0
+
+    def _wake_all(self):
+        """대기 중인 요청을 모두 깨우고 새 이벤트로 교체"""
+        if self._event is not None:
+            self._event.set()
+        self._event = asyncio.Event()
+
+    async def _watch(self):
+        """대기 중인 요청이 있는 동안 변경 토큰 감시"""
+        try:
+            while self._waiters > 0:
+                try:
+                    token = await run_db('messages', self._token_func)
+                except Exception as e:
+                    print(f"[메시지 알림] 변경 확인 오류: {e}")
+                    token = self._token
+                if token != self._token:
+                    self._token = token
+                    self._wake_all()
+                await asyncio.sleep(self.interval)
+        finally:
+            self._task = None
+
+    def notify(self):
+        """같은 워커에서 메시지 변경 시 즉시 알림"""
+        self._wake_all()
+
+    def current_event(self):
+        """현재 대기 이벤트 (상태 조회 전에 받아 두고 wait()에 넘김)"""
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    async def wait(self, timeout, event=None):
+        """변경 알림 또는 시간 초과까지 대기
+
+        Args:
+            event: 상태 조회 전에 current_event()로 받은 이벤트
+                   (그 사이 알림이 왔으면 이미 설정되어 있어 바로 반환)
+
+        Returns:
+            True: 변경 알림 수신 / False: 시간 초과
+        """
+        if event is None:
+            event = self.current_event()
+
+        self._waiters += 1
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._watch())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters -= 1
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API 서버 로그인 세션 저장소
+- 백엔드: memory(단일 프로세스), mysql(api_sessions 테이블), file(세션 디렉토리)
+- mysql/file 백엔드는 여러 워커 프로세스가 공유하며 서버 재시작 후에도 유지
+- 프로세스별 LRU 캐시를 앞단에 두어 토큰 검증은 대부분 메모리 조회로 처리
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+# 세션 백엔드 선택 환경변수 (memory / mysql / file)
+SESSION_BACKEND_ENV = 'FOODLAB_SESSION_BACKEND'
+DEFAULT_SESSION_BACKEND = 'mysql'
+
+# 세션 유효 기간 (로그인 후 7일)
+SESSION_MAX_AGE = 7 * 24 * 60 * 60
+
+# LRU 캐시 설정
+# - 다른 워커에서 로그아웃한 토큰은 최대 CACHE_TTL초까지 캐시에 남을 수 있음
+CACHE_MAX_SIZE = 1000
+CACHE_TTL = 60
+
+# 파일 백엔드 저장 경로
+if getattr(sys, 'frozen', False):
+    BASE_PATH = os.path.dirname(sys.executable)
+else:
+    BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SESSION_DIR = os.path.join(BASE_PATH, 'sessions')
+
+
+def _json_default(value):
+    """datetime 등 JSON 직렬화 불가 값 처리"""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dump_user(user):
+    return json.dumps(user, ensure_ascii=False, default=_json_default)
+
+
+class MemorySessionStore:
+    """프로세스 메모리 세션 저장소 (단일 워커 개발용, 재시작 시 초기화)"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        with self._lock:
+            entry = self._sessions.get(token)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at < time.time():
+                del self._sessions[token]
+                return None
+            return user
+
+    def set(self, token, user):
+        with self._lock:
+            self._sessions[token] = (user, time.time() + SESSION_MAX_AGE)
+
+    def delete(self, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+
+class MySQLSessionStore:
+    """MySQL api_sessions 테이블 세션 저장소 (워커 간 공유, 재시작 후 유지)"""
+
+    _table_checked = False
+
+    def _ensure_table(self):
+        """api_sessions 테이블 확인 (스키마 마이그레이션) 및 만료 세션 정리"""
+        if MySQLSessionStore._table_checked:
+            return
+
+        from migrations import ensure_schema
+        ensure_schema()
+
+        from database import get_connection
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            # 만료된 세션 정리
+            cursor.execute("DELETE FROM api_sessions WHERE expires_at < NOW()")
+            conn.commit()
+            MySQLSessionStore._table_checked = True
+        finally:
+            conn.close()
+
+    def get(self, token):
+        self._ensure_table()
+        from database import get_connection
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT user_data FROM api_sessions WHERE token = %s AND expires_at > NOW()",
+                (token,)
+            )
+            row = cursor.fetchone()
+        finally:
+            conn.close()
+        return json.loads(row['user_data']) if row else None
+
+    def set(self, token, user):
+        self._ensure_table()
+        from database import get_connection
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                REPLACE INTO api_sessions (token, user_id, user_data, expires_at)
+                VALUES (%s, %s, %s, NOW() + INTERVAL %s SECOND)
+            ''', (token, user.get('id'), _dump_user(user), SESSION_MAX_AGE))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete(self, token):
+        self._ensure_table()
+        from database import get_connection
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM api_sessions WHERE token = %s", (token,))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class FileSessionStore:
+    """세션 디렉토리 파일 저장소 (DB 없이 같은 서버의 워커 간 공유)"""
+
+    def __init__(self, directory=SESSION_DIR):
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, token):
+        # 토큰을 그대로 파일명으로 쓰지 않도록 해시 사용
+        name = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, token):
+        path = self._path(token)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('expires_at', 0) < time.time():
+            self.delete(token)
+            return None
+        return data.get('user')
+
+    def set(self, token, user):
+        path = self._path(token)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'user': user,
+                'expires_at': time.time() + SESSION_MAX_AGE,
+            }, ensure_ascii=False, default=_json_default))
+        # 원자적 교체 (다른 워커가 쓰다 만 파일을 읽지 않도록)
+        os.replace(tmp_path, path)
+
+    def delete(self, token):
+        try:
+            os.remove(self._path(token))
+        except OSError:
+            pass
+
+
+class CachedSessionStore:
+    """백엔드 저장소 앞단의 프로세스별 LRU 캐시"""
+
+    def __init__(self, backend, max_size=CACHE_MAX_SIZE, ttl=CACHE_TTL):
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(token)
+            if entry is not None:
+                user, cached_at = entry
+                if now - cached_at < self.ttl:
+                    self._cache.move_to_end(token)
+                    return user
+                del self._cache[token]
+
+        user = self.backend.get(token)
+        if user is not None:
+            self._remember(token, user)
+        return user
+
+    def set(self, token, user):
+        self.backend.set(token, user)
+        self._remember(token, user)
+
+    def delete(self, token):
+        with self._lock:
+            self._cache.pop(token, None)
+        self.backend.delete(token)
+
+    def _remember(self, token, user):
+        with self._lock:
+            self._cache[token] = (user, time.time())
+            self._cache.move_to_end(token)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+
+def create_session_store(backend=None):
+    """환경변수(FOODLAB_SESSION_BACKEND) 또는 인자에 따라 세션 저장소 생성
+
+    Args:
+        backend: 'memory', 'mysql', 'file' 중 하나 (None이면 환경변수/기본값)
+    """
+    backend = (backend or os.environ.get(SESSION_BACKEND_ENV) or DEFAULT_SESSION_BACKEND).lower()
+
+    if backend == 'memory':
+        return MemorySessionStore()
+    if backend == 'file':
+        return CachedSessionStore(FileSessionStore())
+    if backend == 'mysql':
+        return CachedSessionStore(MySQLSessionStore())
+
+    print(f"[세션] 알 수 없는 세션 백엔드 '{backend}' - memory 사용")
+    return MemorySessionStore()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+목록 내보내기 (엑셀 / CSV) 공용 파이프라인
+- 행을 생성기로 받아 openpyxl write-only 워크북 또는 CSV에 한 행씩 기록
+- 전체 목록을 DataFrame으로 만들지 않으므로 10만 건 이상도 메모리 사용량이 일정함
+- GUI 없이 동작 (작업 스레드는 views/export_worker.py)
+"""
+
+import csv
+import os
+import datetime
+
+
+# 페이지 단위 조회 크기 (서버 커서 fetchmany / API 페이지)
+EXPORT_PAGE_SIZE = 1000
+
+# 진행 상황 알림 간격 (행)
+PROGRESS_INTERVAL = 1000
+
+EXCEL_FILTER = "Excel Files (*.xlsx)"
+CSV_FILTER = "CSV Files (*.csv)"
+EXPORT_FILE_FILTERS = f"{EXCEL_FILTER};;{CSV_FILTER};;All Files (*)"
+
+
+def normalize_export_path(file_path, selected_filter=None):
+    """저장 경로 확장자 보정 (.csv가 아니면 .xlsx)"""
+    lower = file_path.lower()
+    if lower.endswith('.csv') or lower.endswith('.xlsx'):
+        return file_path
+    if selected_filter == CSV_FILTER:
+        return file_path + '.csv'
+    return file_path + '.xlsx'
+
+
+def _excel_value(value, illegal_re):
+    """엑셀 셀 값 변환 (None -> 빈칸, 제어 문자 제거)"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return illegal_re.sub('', value)
+    return value
+
+
+def _csv_value(value):
+    """CSV 셀 값 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()
+    return value
+
+
+def write_rows(file_path, headers, rows, sheet_title=None, progress=None, is_cancelled=None):
+    """행 생성기를 엑셀(.xlsx) 또는 CSV(.csv) 파일에 스트리밍 기록
+
+    Args:
+        headers: 머리글 목록
+        rows: 행(값 목록) 생성기 - 한 행씩 소비
+        sheet_title: 엑셀 시트 이름
+        progress: progress(기록한 행 수) 콜백
+        is_cancelled: 취소 여부 확인 함수 (취소되면 파일을 지우고 None 반환)
+
+    Returns:
+        기록한 행 수 (취소 시 None)
+    """
+    count = 0
+    cancelled = False
+    is_csv = file_path.lower().endswith('.csv')
+
+    try:
+        if is_csv:
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8
+            with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                for row in rows:
+                    if is_cancelled and is_cancelled():
+                        cancelled = True
+                        break
+                    writer.writerow([_csv_value(value) for value in row])
+                    count += 1
+                    if progress and count % PROGRESS_INTERVAL == 0:
+                        progress(count)
+        else:
+            from openpyxl import Workbook
+            from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+            # write-only 모드: 행을 임시 파일에 바로 기록 (셀 객체를 메모리에 유지하지 않음)
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(title=sheet_title)
+            ws.append(headers)
+            for row in rows:
+                if is_cancelled and is_cancelled():
+                    cancelled = True
+                    break
+                ws.append([_excel_value(value, ILLEGAL_CHARACTERS_RE) for value in row])
+                count += 1
+                if progress and count % PROGRESS_INTERVAL == 0:
+                    progress(count)
+            if not cancelled:
+                wb.save(file_path)
+            wb.close()
+    except Exception:
+        _remove_partial(file_path)
+        raise
+
+    if cancelled:
+        _remove_partial(file_path)
+        return None
+    if progress:
+        progress(count)
+    return count
+
+
+def _remove_partial(file_path):
+    """중단된 내보내기 파일 삭제"""
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    except OSError:
+        pass
+
+
+def iter_query(sql, params=None, batch_size=EXPORT_PAGE_SIZE):
+    """서버 측 커서(SSDictCursor)로 조회 결과를 한 행씩 반환 - 내부망 / API 서버 전용
+
+    결과 전체를 클라이언트 메모리에 올리지 않고 batch_size씩 받아옴
+    """
+    import pymysql
+    from database import get_connection
+
+    conn = get_connection()
+    try:
+        cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            cursor.execute(sql, params or ())
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield row
+        finally:
+            # 남은 결과를 모두 읽어야 연결을 다시 쓸 수 있음
+            cursor.close()
+    finally:
+        conn.close()
+
+
+def project_rows(records, fields):
+    """dict 목록을 fields 순서의 값 목록으로 변환 (생성기)
+
+    Args:
+        fields: 키 또는 record -> 값 함수 목록
+    """
+    for record in records:
+        yield [field(record) if callable(field) else record.get(field) for field in fields]
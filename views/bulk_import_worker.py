@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+엑셀 일괄 가져오기 작업 스레드 (업체 / 수수료 / 식품유형 탭 공용)
+- 읽기/검증/저장은 utils.bulk_import에서 백그라운드 스레드로 실행
+- 진행 상황과 결과는 시그널로 GUI 스레드에 전달
+"""
+
+import threading
+
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog
+
+from utils.bulk_import import import_excel
+
+
+# 결과 메시지에 바로 보여줄 오류 수 (나머지는 '자세히'에서 확인)
+MAX_ERRORS_SHOWN = 10
+
+
+class BulkImportWorker(QObject):
+    """엑셀 일괄 가져오기 (백그라운드 스레드)"""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(object)  # ImportResult (취소 시 None)
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path, spec, upsert_func):
+        super().__init__()
+        self.file_path = file_path
+        self.spec = spec
+        self.upsert_func = upsert_func
+        self._cancel_event = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _run(self):
+        try:
+            result = import_excel(self.file_path, self.spec, self.upsert_func,
+                                  progress=self.progress.emit,
+                                  is_cancelled=self._cancel_event.is_set)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(result)
+
+
+def start_excel_import(parent, file_path, spec, upsert_func, on_done=None):
+    """엑셀 가져오기 시작 (진행 대화상자 표시, 완료 시 결과 메시지 후 on_done 호출)"""
+    dialog = QProgressDialog(f"{spec.label} 정보 가져오는 중...", "취소", 0, 0, parent)
+    dialog.setWindowTitle("데이터 가져오기")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(0)
+
+    worker = BulkImportWorker(file_path, spec, upsert_func)
+    # 작업 중 가비지 컬렉션 방지
+    parent._bulk_import_worker = worker
+
+    def finish():
+        parent._bulk_import_worker = None
+        dialog.close()
+
+    def on_finished(result):
+        finish()
+        if result is None:
+            return
+        message = QMessageBox(QMessageBox.Information, "가져오기 완료", result.summary(), QMessageBox.Ok, parent)
+        if result.errors:
+            shown = '\n'.join(f"  {row}행: {text}" for row, text in result.errors[:MAX_ERRORS_SHOWN])
+            more = len(result.errors) - MAX_ERRORS_SHOWN
+            message.setInformativeText(shown + (f"\n  ... 외 {more}건" if more > 0 else ""))
+            message.setDetailedText(result.error_text())
+        message.exec_()
+        if on_done:
+            on_done()
+
+    def on_error(text):
+        finish()
+        QMessageBox.critical(parent, "오류", f"엑셀 파일을 처리하는 중 오류가 발생했습니다.\n{text}")
+
+    worker.progress.connect(dialog.setLabelText)
+    worker.finished.connect(on_finished)
+    worker.error.connect(on_error)
+    dialog.canceled.connect(worker.cancel)
+    dialog.show()
+    worker.start()
+
+
+class FeeReplaceWorker(QObject):
+    """수수료 엑셀 전체 교체 (백그라운드 스레드)"""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str)  # (성공 여부, 메시지)
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def _run(self):
+        from models.fees import Fee
+        success, message = Fee.import_from_excel(
+            self.file_path, progress=lambda count: self.progress.emit(f"수수료 {count:,}건 적재 중..."))
+        self.finished.emit(success, message)
+
+
+def start_fee_replace(parent, file_path, on_done=None):
+    """수수료 전체 교체 시작 (교체가 끝날 때까지 기존 수수료가 그대로 조회됨)"""
+    dialog = QProgressDialog("수수료 정보 가져오는 중...", None, 0, 0, parent)
+    dialog.setWindowTitle("데이터 가져오기")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(0)
+
+    worker = FeeReplaceWorker(file_path)
+    parent._bulk_import_worker = worker
+
+    def on_finished(success, message):
+        parent._bulk_import_worker = None
+        dialog.close()
+        if success:
+            QMessageBox.information(parent, "가져오기 완료", message)
+            if on_done:
+                on_done()
+        else:
+            QMessageBox.critical(parent, "오류", message)
+
+    worker.progress.connect(dialog.setLabelText)
+    worker.finished.connect(on_finished)
+    dialog.show()
+    worker.start()
@@ -6,22 +6,22 @@
 '''
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                          QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
+                          QLabel, QHeaderView,
                           QFrame, QMessageBox, QDialog, QFormLayout, QLineEdit,
-                          QFileDialog, QProgressDialog, QGridLayout, QScrollArea,
+                          QFileDialog, QGridLayout, QScrollArea,
                           QGroupBox, QComboBox, QCheckBox, QListWidget, QListWidgetItem)
-from PyQt5.QtCore import Qt, QCoreApplication, QSettings, QTimer
+from PyQt5.QtCore import Qt, QSettings, QTimer
 from PyQt5.QtGui import QColor
-import pandas as pd
 import os
 
 from models.clients import Client
+from utils.bulk_import import CLIENT_SPEC
+from .bulk_import_worker import start_excel_import
+from .export_worker import ask_export_path, start_export
+from .table_models import RowTableModel, create_list_view
 from utils.logger import log_message, log_error, log_exception
 
 class ClientTab(QWidget):
-    # 한글 초성 매핑
-    CHOSUNG_LIST = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-
     def __init__(self, parent=None):
         super().__init__(parent)
         self.all_clients = []  # 현재 페이지 업체 목록 저장
@@ -75,7 +75,7 @@ class ClientTab(QWidget):
         self._needs_refresh = True
         self._data_loaded = False
         if hasattr(self, 'client_table') and self.client_table:
-            self.client_table.setRowCount(0)
+            self.client_model.set_rows([])
 
     def apply_permissions(self):
         """사용자 권한에 따라 버튼 활성화/비활성화"""
@@ -306,8 +306,9 @@ class ClientTab(QWidget):
 
         layout.addWidget(pagination_frame)
 
-        # 2. 업체 목록 테이블
-        self.client_table = QTableWidget()
+        # 2. 업체 목록 테이블 (모델/뷰: 화면에 보이는 행만 그림, 정렬은 프록시에서 처리)
+        self.client_model = RowTableModel(cell_text=self.list_cell_text, check_column=0)
+        self.client_table, self.client_proxy = create_list_view(self.client_model, self)
 
         # 컬럼 정의 (선택 열 추가, 무료번호 삭제, 필드명 변경)
         self.all_columns = [
@@ -357,8 +358,7 @@ class ClientTab(QWidget):
             if col[0] == "선택" or col[0] in self.visible_columns:
                 self.columns.append(col)
 
-        self.client_table.setColumnCount(len(self.columns))
-        self.client_table.setHorizontalHeaderLabels([col[0] for col in self.columns])
+        self.client_model.set_columns([(field, header) for header, field in self.columns])
 
         # 열 너비 설정
         header = self.client_table.horizontalHeader()
@@ -381,12 +381,7 @@ class ClientTab(QWidget):
             if col_name in column_widths:
                 self.client_table.setColumnWidth(i, column_widths[col_name])
 
-        self.client_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.client_table.setEditTriggers(QTableWidget.NoEditTriggers)
-
-        # 헤더 클릭으로 정렬 기능 활성화
-        self.client_table.setSortingEnabled(True)
-        self.client_table.horizontalHeader().setSortIndicatorShown(True)
+        # 헤더 클릭으로 정렬 (프록시 모델에서 정렬)
         self.client_table.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
 
         # 기존 연결 해제 후 재연결 (중복 연결 방지)
@@ -407,13 +402,10 @@ class ClientTab(QWidget):
         if row < 0:
             return
 
-        # 고객/회사명 컬럼 인덱스 찾기
-        name_col = self.get_name_column_index()
-        name_item = self.client_table.item(row, name_col)
-        if not name_item:
+        client_name = self.client_proxy.row_data(row).get('name') or ''
+        if not client_name:
             return
 
-        client_name = name_item.text()
         clients = Client.search(client_name)
         if not clients:
             QMessageBox.warning(self, "데이터 오류", "선택한 업체 정보를 찾을 수 없습니다.")
@@ -427,15 +419,7 @@ class ClientTab(QWidget):
     def select_all_rows(self, checked):
         """모든 행 선택/해제"""
         try:
-            if self.client_table.rowCount() == 0:
-                return
-
-            for row in range(self.client_table.rowCount()):
-                checkbox_widget = self.client_table.cellWidget(row, 0)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.setChecked(checked)
+            self.client_proxy.set_all_checked(checked)
         except Exception as e:
             print(f"전체 선택 중 오류 발생: {str(e)}")
 
@@ -486,20 +470,7 @@ class ClientTab(QWidget):
             search_keyword = self.search_input.text().strip() if hasattr(self, 'search_input') else None
             search_field = self.search_field_combo.currentText() if hasattr(self, 'search_field_combo') else None
 
-            # 초성 검색인 경우 DB 검색 대신 전체 로드 후 필터링 (초성은 DB에서 처리 불가)
-            if search_keyword and self.is_chosung_only(search_keyword):
-                # 초성 검색은 기존 방식 유지 (전체 로드 후 필터링)
-                raw_clients = Client.get_all() or []
-                self.all_clients = [dict(c) for c in raw_clients]
-
-                # 영업담당 필터 적용
-                if sales_rep_filter:
-                    self.all_clients = [c for c in self.all_clients if c.get('sales_rep') == sales_rep_filter]
-
-                self.filter_clients_chosung(search_keyword, search_field)
-                return
-
-            # 페이지네이션 데이터 로드
+            # 페이지네이션 데이터 로드 (초성 검색도 서버에서 저장된 초성 컬럼으로 처리)
             result = Client.get_paginated(
                 page=self.current_page,
                 per_page=self.per_page,
@@ -520,36 +491,6 @@ class ClientTab(QWidget):
             log_exception('ClientTab', f'업체 로드 중 오류: {str(e)}')
             QMessageBox.critical(self, "오류", f"업체 로드 중 오류 발생: {str(e)}")
 
-    def filter_clients_chosung(self, search_text, search_field):
-        """초성 검색 필터링 (DB에서 처리할 수 없는 초성 검색용)"""
-        filtered = []
-        for client in self.all_clients:
-            name = str(client.get('name', '') or '')
-            ceo = str(client.get('ceo', '') or '')
-            contact_person = str(client.get('contact_person', '') or '')
-
-            match = False
-            if search_field == "전체":
-                match = (self.match_chosung(name, search_text) or
-                         self.match_chosung(ceo, search_text) or
-                         self.match_chosung(contact_person, search_text))
-            elif search_field == "고객/회사명":
-                match = self.match_chosung(name, search_text)
-            elif search_field == "대표자":
-                match = self.match_chosung(ceo, search_text)
-            elif search_field == "담당자":
-                match = self.match_chosung(contact_person, search_text)
-
-            if match:
-                filtered.append(client)
-
-        # 초성 검색은 페이지네이션 없이 모두 표시 (결과가 적을 것으로 예상)
-        self.total_count = len(filtered)
-        self.total_pages = 1
-        self.current_page = 1
-        self.display_clients(filtered)
-        self.update_pagination_ui()
-
     def update_pagination_ui(self):
         """페이지네이션 UI 업데이트"""
         self.page_info_label.setText(f"{self.current_page} / {self.total_pages} 페이지")
@@ -592,58 +533,13 @@ class ClientTab(QWidget):
         self.load_clients()
 
     def display_clients(self, clients):
-        """업체 목록을 테이블에 표시"""
-        # UI 업데이트 일시 중지 (성능 최적화)
-        self.client_table.setUpdatesEnabled(False)
-        try:
-            self.client_table.setRowCount(len(clients) if clients else 0)
-
-            if clients:
-                for row, client in enumerate(clients):
-                    for col, (header, field) in enumerate(self.columns):
-                        if header == "선택":
-                            # 체크박스 추가
-                            checkbox = QCheckBox()
-                            checkbox_widget = QWidget()
-                            checkbox_layout = QHBoxLayout(checkbox_widget)
-                            checkbox_layout.addWidget(checkbox)
-                            checkbox_layout.setAlignment(Qt.AlignCenter)
-                            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                            self.client_table.setCellWidget(row, col, checkbox_widget)
-                        else:
-                            value = client.get(field, '') or ''
-                            self.client_table.setItem(row, col, QTableWidgetItem(str(value)))
-        finally:
-            # UI 업데이트 재개
-            self.client_table.setUpdatesEnabled(True)
-
-    def get_chosung(self, text):
-        """문자열에서 초성 추출"""
-        result = ""
-        for char in text:
-            if '가' <= char <= '힣':
-                char_code = ord(char) - ord('가')
-                chosung_idx = char_code // 588
-                # 인덱스 범위 확인 (0-18)
-                if 0 <= chosung_idx < len(self.CHOSUNG_LIST):
-                    result += self.CHOSUNG_LIST[chosung_idx]
-                else:
-                    result += char  # 범위 밖이면 원래 문자 유지
-            else:
-                result += char
-        return result
+        """업체 목록을 테이블 모델에 설정"""
+        self.client_model.set_rows(clients or [])
 
-    def is_chosung_only(self, text):
-        """문자열이 초성만으로 이루어져 있는지 확인"""
-        for char in text:
-            if char not in self.CHOSUNG_LIST and char != ' ':
-                return False
-        return True
-
-    def match_chosung(self, text, search_text):
-        """초성 검색 매칭"""
-        text_chosung = self.get_chosung(text)
-        return search_text.lower() in text_chosung.lower()
+    @staticmethod
+    def list_cell_text(client, field):
+        """목록 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출)"""
+        return str(client.get(field, '') or '')
 
     def on_search_text_changed(self):
         """검색어 변경 시 타이머 시작 (디바운싱)"""
@@ -683,7 +579,7 @@ class ClientTab(QWidget):
             self.current_sort_order = Qt.AscendingOrder
 
         # 정렬 실행
-        self.client_table.sortItems(logical_index, self.current_sort_order)
+        self.client_table.sortByColumn(logical_index, self.current_sort_order)
 
     def create_new_client(self):
         """신규 업체 등록"""
@@ -691,36 +587,18 @@ class ClientTab(QWidget):
         if dialog.exec_():
             self.load_clients()
 
-    def get_name_column_index(self):
-        """고객/회사명 컬럼의 인덱스 반환"""
-        for i, (header, _) in enumerate(self.columns):
-            if header == "고객/회사명":
-                return i
-        return 1  # 기본값
-
     def edit_client(self):
         """업체 정보 수정"""
-        # 체크박스가 선택된 행 찾기
-        selected_row = -1
-        for row in range(self.client_table.rowCount()):
-            checkbox_widget = self.client_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_row = row
-                    break
-
-        if selected_row == -1:
+        # 체크박스가 선택된 첫 번째 업체
+        checked_clients = self.client_proxy.checked_rows()
+        if not checked_clients:
             QMessageBox.warning(self, "선택 오류", "수정할 업체를 선택하세요.")
             return
 
-        # 고객/회사명 컬럼 인덱스 찾기
-        name_col = self.get_name_column_index()
-        name_item = self.client_table.item(selected_row, name_col)
-        if not name_item:
+        client_name = checked_clients[0].get('name') or ''
+        if not client_name:
             QMessageBox.warning(self, "데이터 오류", "업체명을 찾을 수 없습니다.")
             return
-        client_name = name_item.text()
 
         clients = Client.search(client_name)
         if not clients:
@@ -735,14 +613,8 @@ class ClientTab(QWidget):
 
     def delete_client(self):
         """업체 삭제"""
-        # 체크박스가 선택된 모든 행 찾기
-        selected_rows = []
-        for row in range(self.client_table.rowCount()):
-            checkbox_widget = self.client_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_rows.append(row)
+        # 체크박스가 선택된 모든 업체
+        selected_rows = self.client_proxy.checked_rows()
 
         if not selected_rows:
             QMessageBox.warning(self, "선택 오류", "삭제할 업체를 선택하세요.")
@@ -759,14 +631,11 @@ class ClientTab(QWidget):
 
         if reply == QMessageBox.Yes:
             deleted_count = 0
-            name_col = self.get_name_column_index()
 
-            # 선택된 행의 역순으로 삭제 (인덱스 변화 방지)
-            for row in sorted(selected_rows, reverse=True):
-                name_item = self.client_table.item(row, name_col)
-                if not name_item:
+            for client in selected_rows:
+                client_name = client.get('name') or ''
+                if not client_name:
                     continue  # 이름을 찾을 수 없으면 건너뛰기
-                client_name = name_item.text()
 
                 clients = Client.search(client_name)
                 if clients and Client.delete(clients[0]['id']):
@@ -780,7 +649,7 @@ class ClientTab(QWidget):
                 QMessageBox.warning(self, "삭제 실패", "업체 삭제 중 오류가 발생했습니다.")
 
     def import_from_excel(self):
-        """엑셀 파일에서 업체 정보 가져오기"""
+        """엑셀 파일에서 업체 정보 가져오기 (작업 스레드에서 일괄 저장)"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls);;All Files (*)"
         )
@@ -788,177 +657,28 @@ class ClientTab(QWidget):
         if not file_path:
             return
 
-        try:
-            df = pd.read_excel(file_path)
-
-            # 컬럼 매핑 (엑셀 컬럼명 -> DB 필드명)
-            column_mapping = {
-                "고객/회사명": "name", "업체명": "name",
-                "대표자": "ceo",
-                "사업자번호": "business_no", "사업자": "business_no",
-                "분류": "category",
-                "전화번호": "phone",
-                "팩스번호": "fax", "팩스": "fax",
-                "담당자": "contact_person",
-                "EMAIL": "email", "이메일": "email",
-                "영업담당": "sales_rep", "영업담당자": "sales_rep",
-                "우편번호": "zip_code",
-                "소재지": "address", "업체주소": "address", "주소": "address",
-                "상세주소": "detail_address",
-                "메모": "notes",
-                "영문(업체명)": "sales_business", "(영업)업무": "sales_business", "영업업무": "sales_business",
-                "영문(대표자)": "sales_phone", "(영업)대표번호": "sales_phone", "영업대표번호": "sales_phone",
-                "영문(우편번호)": "sales_mobile", "(영업)핸드폰": "sales_mobile", "영업핸드폰": "sales_mobile", "핸드폰": "mobile",
-                "영문(업체주소)": "sales_address", "(영업)업체주소": "sales_address", "영업업체주소": "sales_address",
-            }
-
-            # 필수 열 확인
-            name_col = None
-            for col in ["고객/회사명", "업체명", "name"]:
-                if col in df.columns:
-                    name_col = col
-                    break
-
-            if not name_col:
-                QMessageBox.warning(self, "파일 오류", "엑셀 파일에 '고객/회사명' 또는 '업체명' 열이 없습니다.")
-                return
-
-            progress = QProgressDialog("업체 정보 가져오는 중...", "취소", 0, len(df), self)
-            progress.setWindowTitle("데이터 가져오기")
-            progress.setWindowModality(Qt.WindowModal)
-            progress.show()
-
-            imported_count = 0
-            updated_count = 0
-            skipped_count = 0
-
-            for i, row in df.iterrows():
-                progress.setValue(i)
-                QCoreApplication.processEvents()
-
-                if progress.wasCanceled():
-                    break
-
-                if pd.isna(row[name_col]) or str(row[name_col]).strip() == "":
-                    skipped_count += 1
-                    continue
-
-                client_data = {}
-                for excel_col, db_field in column_mapping.items():
-                    if excel_col in df.columns and not pd.isna(row[excel_col]):
-                        client_data[db_field] = str(row[excel_col]).strip()
-
-                if 'name' not in client_data:
-                    client_data['name'] = str(row[name_col]).strip()
-
-                existing_clients = Client.search(client_data["name"])
-
-                if existing_clients:
-                    client = existing_clients[0]
-                    if Client.update(
-                        client["id"],
-                        client_data.get("name"),
-                        client_data.get("ceo"),
-                        client_data.get("business_no"),
-                        client_data.get("category"),
-                        client_data.get("phone"),
-                        client_data.get("fax"),
-                        client_data.get("contact_person"),
-                        client_data.get("email"),
-                        client_data.get("sales_rep"),
-                        None,  # toll_free (사용 안 함)
-                        client_data.get("zip_code"),
-                        client_data.get("address"),
-                        client_data.get("notes"),
-                        client_data.get("sales_business"),
-                        client_data.get("sales_phone"),
-                        client_data.get("sales_mobile"),
-                        client_data.get("sales_address"),
-                        client_data.get("mobile"),
-                        client_data.get("detail_address")
-                    ):
-                        updated_count += 1
-                else:
-                    if Client.create(
-                        client_data.get("name"),
-                        client_data.get("ceo"),
-                        client_data.get("business_no"),
-                        client_data.get("category"),
-                        client_data.get("phone"),
-                        client_data.get("fax"),
-                        client_data.get("contact_person"),
-                        client_data.get("email"),
-                        client_data.get("sales_rep"),
-                        None,  # toll_free (사용 안 함)
-                        client_data.get("zip_code"),
-                        client_data.get("address"),
-                        client_data.get("notes"),
-                        client_data.get("sales_business"),
-                        client_data.get("sales_phone"),
-                        client_data.get("sales_mobile"),
-                        client_data.get("sales_address"),
-                        client_data.get("mobile"),
-                        client_data.get("detail_address")
-                    ):
-                        imported_count += 1
-
-            progress.setValue(len(df))
-            self.load_clients()
-
-            QMessageBox.information(
-                self, "가져오기 완료",
-                f"업체 정보 가져오기가 완료되었습니다.\n"
-                f"- 새로 추가된 업체: {imported_count}개\n"
-                f"- 업데이트된 업체: {updated_count}개\n"
-                f"- 건너뛴 항목: {skipped_count}개"
-            )
-
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일을 처리하는 중 오류가 발생했습니다.\n{str(e)}")
+        start_excel_import(self, file_path, CLIENT_SPEC, Client.bulk_upsert, self.load_clients)
 
     def export_to_excel(self):
-        """업체 정보를 엑셀 파일로 내보내기"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "엑셀 파일 저장", "", "Excel Files (*.xlsx);;All Files (*)"
-        )
-
+        """업체 정보를 엑셀/CSV 파일로 내보내기 (작업 스레드에서 한 행씩 기록)"""
+        file_path = ask_export_path(self)
         if not file_path:
             return
 
-        if not file_path.lower().endswith('.xlsx'):
-            file_path += '.xlsx'
-
-        try:
-            clients = Client.get_all()
-
-            if not clients:
-                QMessageBox.warning(self, "데이터 없음", "내보낼 업체 정보가 없습니다.")
-                return
+        # "선택" 컬럼은 제외 (표시 설정에서 보이는 컬럼만)
+        columns = [(header, field) for header, field in self.columns if header != "선택"]
+        headers = [header for header, _ in columns]
+        fields = [field for _, field in columns]
 
-            data = []
-            for client in clients:
-                row_data = {}
-                for header, field in self.columns:
-                    # "선택" 컬럼은 제외
-                    if header == "선택":
-                        continue
-                    row_data[header] = client.get(field, '') or ''
-                data.append(row_data)
-
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False)
-
-            QMessageBox.information(
-                self, "내보내기 완료",
-                f"업체 정보가 엑셀 파일로 저장되었습니다.\n파일 위치: {file_path}"
-            )
+        def make_rows():
+            for client in Client.iter_all():
+                yield [client.get(field, '') or '' for field in fields]
 
-            if os.path.exists(file_path):
-                import subprocess
-                os.startfile(file_path) if os.name == 'nt' else subprocess.call(('xdg-open', file_path))
+        def open_file(path, count):
+            import subprocess
+            os.startfile(path) if os.name == 'nt' else subprocess.call(('xdg-open', path))
 
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일로 내보내는 중 오류가 발생했습니다.\n{str(e)}")
+        start_export(self, file_path, headers, make_rows, "업체", on_done=open_file)
 
 
 class ClientDialog(QDialog):
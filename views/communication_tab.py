@@ -11,9 +11,62 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                            QTableWidgetItem, QHeaderView, QDialog, QFormLayout,
                            QComboBox, QMessageBox, QScrollArea, QCheckBox,
                            QGroupBox, QDialogButtonBox, QPlainTextEdit, QDateEdit)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDate
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal, QDate
 from PyQt5.QtGui import QColor, QFont, QBrush
 import os
+import threading
+
+
+class MessageWatcher(QObject):
+    """새 메시지 / 미읽음 변경 감시 (백그라운드 스레드)
+
+    - 외부망: API 서버 long-poll로 대기하다가 변경 시 바로 알림
+    - 내부망: 메시지 상태(etag)만 주기적으로 조회하고 바뀐 경우에만 알림
+    - 앱 종료를 막지 않도록 daemon 스레드 사용
+    """
+
+    # 상태 변경 시그널 ({'last_message_id', 'message_count', 'unread_count', 'etag'})
+    state_changed = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    # 오류 후 재시도 대기 (초)
+    ERROR_RETRY_INTERVAL = 10
+
+    def __init__(self, user_id):
+        super().__init__()
+        self.user_id = user_id
+        self._etag = None
+        self._stop_event = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        from models.communications import Message
+
+        while not self._stop_event.is_set():
+            try:
+                state = Message.wait_for_changes(self.user_id, self._etag)
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                self.error.emit(str(e))
+                self._stop_event.wait(self.ERROR_RETRY_INTERVAL)
+                continue
+
+            if self._stop_event.is_set():
+                break
+            if state is None:
+                # 상태 조회 실패 - 잠시 후 재시도
+                self._stop_event.wait(self.ERROR_RETRY_INTERVAL)
+                continue
+            if state.get('etag') != self._etag:
+                self._etag = state.get('etag')
+                self.state_changed.emit(state)
 
 
 class CommunicationTab(QWidget):
@@ -37,10 +90,8 @@ class CommunicationTab(QWidget):
         self._messaging_api_fail_count = 0
         self._MAX_API_FAIL_COUNT = 3  # 3회 연속 실패시 폴링 중단
 
-        # 자동 새로고침 타이머 (5초마다) - 탭 활성화 후에만 시작
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_data)
-        # 초기에는 시작하지 않음 - 탭 활성화 시에만 시작
+        # 새 메시지 감시 (로그인 시 시작, 변경이 있을 때만 목록/미읽음 갱신)
+        self._message_watcher = None
 
         # API 재확인 타이머 (60초마다) - API가 다시 사용 가능해졌는지 확인
         self.api_recheck_timer = QTimer()
@@ -55,6 +106,53 @@ class CommunicationTab(QWidget):
         # 사용자 변경 시 데이터 새로고침 플래그 설정 (Lazy Loading)
         self._needs_refresh = True
         self._data_loaded = False
+        # 미읽음 배지가 탭 활성화 전에도 갱신되도록 로그인 시 감시 시작
+        self.start_message_watcher()
+
+    def start_message_watcher(self):
+        """새 메시지 감시 시작 (기존 감시는 중지)"""
+        self.stop_message_watcher()
+        if not self.current_user:
+            return
+        self._message_watcher = MessageWatcher(self.current_user['id'])
+        self._message_watcher.state_changed.connect(self.on_message_state_changed)
+        self._message_watcher.error.connect(self.on_message_watcher_error)
+        self._message_watcher.start()
+
+    def stop_message_watcher(self):
+        """새 메시지 감시 중지"""
+        if self._message_watcher:
+            self._message_watcher.stop()
+            try:
+                self._message_watcher.state_changed.disconnect()
+                self._message_watcher.error.disconnect()
+            except TypeError:
+                pass
+            self._message_watcher = None
+
+    def on_message_state_changed(self, state):
+        """메시지 상태 변경 알림 처리 (변경이 있을 때만 호출됨)"""
+        if not self.current_user:
+            return
+
+        # 감시 성공 - 메시징 API 사용 가능
+        self._messaging_api_available = True
+        self._messaging_api_fail_count = 0
+        if self.api_recheck_timer.isActive():
+            self.api_recheck_timer.stop()
+
+        self.unread_changed.emit(state.get('unread_count', 0))
+
+        if self._data_loaded and self.isVisible():
+            # 화면에 보이는 경우에만 목록/대화 다시 로드
+            self.refresh_data()
+        else:
+            # 다음 탭 활성화 시 다시 로드
+            self._needs_refresh = True
+
+    def on_message_watcher_error(self, error):
+        """메시지 감시 오류 처리"""
+        self._handle_messaging_api_error(error)
 
     def on_tab_activated(self):
         """탭이 활성화될 때 호출 (Lazy Loading)"""
@@ -65,9 +163,9 @@ class CommunicationTab(QWidget):
             self.check_unread()
             self._needs_refresh = False
             self._data_loaded = True
-        # 탭이 활성화되면 자동 새로고침 타이머 시작
-        if not self.refresh_timer.isActive():
-            self.refresh_timer.start(5000)
+        # 감시가 멈춰 있으면 다시 시작 (변경 시 on_message_state_changed에서 갱신)
+        if self._message_watcher is None:
+            self.start_message_watcher()
 
     def clear_data(self):
         """탭 데이터 초기화 (로그아웃 시 호출)"""
@@ -76,9 +174,8 @@ class CommunicationTab(QWidget):
         self.all_users = []
         self._needs_refresh = True
         self._data_loaded = False
-        # 타이머 중지
-        if self.refresh_timer.isActive():
-            self.refresh_timer.stop()
+        # 메시지 감시 중지
+        self.stop_message_watcher()
         # 채팅 목록 초기화
         if hasattr(self, 'chat_list') and self.chat_list:
             self.chat_list.clear()
@@ -722,11 +819,13 @@ class CommunicationTab(QWidget):
             sent_by_name = log.get('sent_by_name', '') or ''
             self.email_log_table.setItem(row, 5, QTableWidgetItem(sent_by_name))
 
-            # 상태 (정상/반송)
+            # 상태 (대기/정상/반송/발송실패)
             status = log.get('status', '정상') or '정상'
             status_item = QTableWidgetItem(status)
-            if status == '반송':
+            if status in ('반송', '발송실패'):
                 status_item.setForeground(Qt.red)
+            elif status == '대기':
+                status_item.setForeground(Qt.gray)
             self.email_log_table.setItem(row, 6, status_item)
 
             # 수신여부 (예/아니오)
@@ -784,16 +883,15 @@ class CommunicationTab(QWidget):
                 print(f"미읽음 확인 오류: {e}")
 
     def refresh_data(self):
-        """데이터 자동 새로고침"""
+        """데이터 새로고침 (메시지 상태가 바뀌었을 때 호출)"""
         if not self.current_user:
             return
 
-        # 메시징 API가 사용 불가능하면 폴링 건너뛰기
+        # 메시징 API가 사용 불가능하면 건너뛰기
         if self._messaging_api_available is False:
             return
 
         self.load_chat_partners()
-        self.check_unread()
 
         # 현재 대화 중이면 대화 내용도 새로고침
         if self.current_chat_partner_id:
@@ -970,10 +1068,12 @@ class ViewEmailLogDialog(QDialog):
         status_frame.setStyleSheet("background-color: #e8f4e8; padding: 10px;")
         status_layout = QFormLayout(status_frame)
 
-        # 상태 (정상/반송)
+        # 상태 (정상/반송, 발송 대기열 상태 대기/발송실패)
         self.status_combo = QComboBox()
         self.status_combo.addItems(["정상", "반송"])
         current_status = self.log.get('status', '정상') or '정상'
+        if self.status_combo.findText(current_status) < 0:
+            self.status_combo.addItem(current_status)
         self.status_combo.setCurrentText(current_status)
         status_layout.addRow("상태:", self.status_combo)
 
@@ -1,15 +1,21 @@
 # views/estimate_tab.py
+import threading
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QTableWidget, QTableWidgetItem, QHeaderView,
     QScrollArea, QGridLayout, QGroupBox, QTextEdit, QMessageBox,
     QLineEdit, QSizePolicy, QSplitter, QFormLayout, QComboBox,
-    QDialog, QRadioButton, QButtonGroup, QDialogButtonBox
+    QDialog, QRadioButton, QButtonGroup, QDialogButtonBox,
+    QCheckBox, QProgressBar
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
-from models.fees import Fee
+from utils.estimate_document import (
+    ESTIMATE_TITLES, build_email_content, build_estimate, build_items_text, build_remark_text,
+    calculate_total_price, estimate_filename, estimate_number, number_to_korean
+)
 
 
 class EstimateTab(QWidget):
@@ -65,10 +71,14 @@ class EstimateTab(QWidget):
         self.email_toggle_btn = QPushButton("이메일 전송 ▼")
         self.email_toggle_btn.clicked.connect(self.toggle_email_panel)
 
+        self.batch_btn = QPushButton("일괄 생성/발송")
+        self.batch_btn.clicked.connect(self.show_batch_dialog)
+
         button_layout.addWidget(self.print_btn)
         button_layout.addWidget(self.pdf_btn)
         button_layout.addWidget(self.excel_btn)
         button_layout.addWidget(self.email_toggle_btn)
+        button_layout.addWidget(self.batch_btn)
         button_layout.addStretch()
 
         # 견적서 유형 버튼 (1차, 중단, 연장)
@@ -988,137 +998,11 @@ class EstimateTab(QWidget):
         # 원본 테이블과 동일한 구조로 복사하고 금액만 변경
         self.disc_items_table.setRowCount(1)
 
-        # 식품유형
-        food_type = schedule.get('food_type_name', '기타가공품')
-
-        # 검사 항목 정보 구성 (원본과 동일)
-        test_period_days = schedule.get('test_period_days', 0) or 0
-        test_period_months = schedule.get('test_period_months', 0) or 0
-        test_period_years = schedule.get('test_period_years', 0) or 0
-
-        period_parts = []
-        if test_period_years > 0:
-            period_parts.append(f"{test_period_years}년")
-        if test_period_months > 0:
-            period_parts.append(f"{test_period_months}개월")
-        if test_period_days > 0:
-            period_parts.append(f"{test_period_days}일")
-        period_str = " ".join(period_parts) if period_parts else "0개월"
-
-        storage_code = schedule.get('storage_condition', 'room_temp')
-        storage_map = {
-            'room_temp': '상온',
-            'warm': '실온',
-            'cool': '냉장',
-            'freeze': '냉동'
-        }
-        storage = storage_map.get(storage_code, storage_code)
-
-        test_method = schedule.get('test_method', 'real')
-        method_map = {
-            'real': '실측실험',
-            'acceleration': '가속실험',
-            'custom_real': '의뢰자요청(실측)',
-            'custom_accel': '의뢰자요청(가속)',
-            'custom_acceleration': '의뢰자요청(가속)'
-        }
-        method_str = method_map.get(test_method, '실측실험')
-
-        total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
-
-        actual_experiment_days = schedule.get('actual_experiment_days')
-        if actual_experiment_days is not None and actual_experiment_days > 0:
-            experiment_days = actual_experiment_days
-        else:
-            if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-                experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
-            else:
-                experiment_days = int(total_expiry_days * 1.5)
-
-        exp_years = experiment_days // 365
-        exp_months = (experiment_days % 365) // 30
-        exp_days_remaining = experiment_days % 30
-
-        duration_parts = []
-        if exp_years > 0: duration_parts.append(f"{exp_years}년")
-        if exp_months > 0: duration_parts.append(f"{exp_months}개월")
-        if exp_days_remaining > 0: duration_parts.append(f"{exp_days_remaining}일")
-        test_duration = ' '.join(duration_parts) if duration_parts else f"{experiment_days}일"
-
-        real_temps = {'room_temp': '15', 'warm': '25', 'cool': '10', 'freeze': '-18'}
-        accel_temps = {
-            'room_temp': ['15', '25', '35'],
-            'warm': ['25', '35', '45'],
-            'cool': ['5', '10', '15'],
-            'freeze': ['-6', '-12', '-18']
-        }
-
-        custom_temps = schedule.get('custom_temperatures', '')
-        if custom_temps:
-            temps = [t.strip().replace('℃', '') for t in custom_temps.split(',')]
-        else:
-            if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-                temps = accel_temps.get(storage_code, ['25', '35', '45'])
-            else:
-                temps = [real_temps.get(storage_code, '15')]
-
-        sampling_count = schedule.get('sampling_count', 6) or 6
-
-        if experiment_days > 0 and sampling_count > 0:
-            experiment_interval = experiment_days // sampling_count
-        else:
-            experiment_interval = 15
-
-        test_items_str = schedule.get('test_items', '')
-        if test_items_str:
-            test_items_list = [item.strip() for item in test_items_str.split(',') if item.strip()]
-        else:
-            test_items_list = ['관능평가', '세균수', '대장균(정량)', 'pH']
-
-        if len(temps) == 1:
-            temp_str = f"{temps[0]}℃"
-        else:
-            temp_str = " / ".join([f"{t}℃" for t in temps])
-
-        # 견적 유형에 따라 표시
-        if self.estimate_type == "suspend":
-            completed_rounds = schedule.get('completed_rounds', 0)
-            if completed_rounds is None or completed_rounds == 0:
-                completed_rounds = max(1, sampling_count // 2)
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-※ 중단 정산
-완료 회차: {completed_rounds}회 / 전체 {sampling_count}회
-실험 주기: {experiment_interval}일"""
-        elif self.estimate_type == "extend":
-            extend_rounds = schedule.get('extend_rounds', 0)
-            if extend_rounds is None or extend_rounds == 0:
-                extend_rounds = 3
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-※ 연장 실험
-연장 회차: {extend_rounds}회
-실험 주기: {experiment_interval}일"""
-        else:
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-연장시험 : {'진행' if schedule.get('extension_test') else '미진행'}
-실험 횟수: {sampling_count}회
-실험 주기: {experiment_interval}일"""
-
-        test_items_text = '\n'.join([f"{i+1})  {item}" for i, item in enumerate(test_items_list)])
+        items = build_items_text(schedule, self.estimate_type)
+        food_type_text = items['food_type_text']
+        test_items_text = items['test_items_text']
+        test_items_list = items['test_items_list']
+        temps = items['temps']
 
         base_height = 140
         item_height = 18
@@ -1407,30 +1291,7 @@ class EstimateTab(QWidget):
         self.load_company_info()
 
         # 견적번호
-        schedule_id = schedule.get('id', '')
-        created_at = schedule.get('created_at', '')
-        if created_at:
-            try:
-                # datetime 객체인 경우 직접 사용, 문자열인 경우 파싱
-                if isinstance(created_at, datetime):
-                    date_obj = created_at
-                else:
-                    date_obj = datetime.strptime(str(created_at)[:10], '%Y-%m-%d')
-                date_str = date_obj.strftime('%Y%m%d')
-            except (ValueError, TypeError):
-                date_str = datetime.now().strftime('%Y%m%d')
-        else:
-            date_str = datetime.now().strftime('%Y%m%d')
-
-        # 견적서 유형에 따른 접미사
-        type_suffix = {
-            "first": "",
-            "suspend": "_중단",
-            "extend": "_연장"
-        }
-        suffix = type_suffix.get(self.estimate_type, "")
-
-        self.estimate_no_input.setText(f"BFL_소비기한_{date_str}-{schedule_id}{suffix}")
+        self.estimate_no_input.setText(estimate_number(schedule, self.estimate_type))
 
         # 견적일자
         self.estimate_date_input.setText(f"{datetime.now().strftime('%Y년 %m월 %d일')}")
@@ -1440,12 +1301,7 @@ class EstimateTab(QWidget):
         self.receiver_input.setText(client_name)
 
         # 견적 명칭 (유형에 따라 다르게 표시)
-        title_names = {
-            "first": "소비기한설정시험의 건",
-            "suspend": "소비기한설정시험 중단정산의 건",
-            "extend": "소비기한설정시험 연장의 건"
-        }
-        self.title_value.setText(title_names.get(self.estimate_type, "소비기한설정시험의 건"))
+        self.title_value.setText(ESTIMATE_TITLES.get(self.estimate_type, ESTIMATE_TITLES["first"]))
 
         # 품목 테이블 업데이트
         self.update_items_table(schedule)
@@ -1463,159 +1319,12 @@ class EstimateTab(QWidget):
         """품목 테이블 업데이트"""
         self.items_table.setRowCount(1)
 
-        # 식품유형
-        food_type = schedule.get('food_type_name', '기타가공품')
-
-        # 검사 항목 정보 구성
-        test_period_days = schedule.get('test_period_days', 0) or 0
-        test_period_months = schedule.get('test_period_months', 0) or 0
-        test_period_years = schedule.get('test_period_years', 0) or 0
-
-        # 소비기한 문자열
-        period_parts = []
-        if test_period_years > 0:
-            period_parts.append(f"{test_period_years}년")
-        if test_period_months > 0:
-            period_parts.append(f"{test_period_months}개월")
-        if test_period_days > 0:
-            period_parts.append(f"{test_period_days}일")
-        period_str = " ".join(period_parts) if period_parts else "0개월"
-
-        # 보관조건
-        storage_code = schedule.get('storage_condition', 'room_temp')
-        storage_map = {
-            'room_temp': '상온',
-            'warm': '실온',
-            'cool': '냉장',
-            'freeze': '냉동'
-        }
-        storage = storage_map.get(storage_code, storage_code)
-
-        # 실험방법
-        test_method = schedule.get('test_method', 'real')
-        method_map = {
-            'real': '실측실험',
-            'acceleration': '가속실험',
-            'custom_real': '의뢰자요청(실측)',
-            'custom_accel': '의뢰자요청(가속)',
-            'custom_acceleration': '의뢰자요청(가속)'
-        }
-        method_str = method_map.get(test_method, '실측실험')
-
-        # 시험기간 계산 (스케줄 관리에서 수정된 값 우선 사용)
-        total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
-
-        # 실제 실험일수가 저장되어 있으면 사용 (날짜 수정 반영)
-        actual_experiment_days = schedule.get('actual_experiment_days')
-        if actual_experiment_days is not None and actual_experiment_days > 0:
-            experiment_days = actual_experiment_days
-        else:
-            # 기본 계산 방식
-            if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-                experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
-            else:
-                experiment_days = int(total_expiry_days * 1.5)
-
-        # 시험기간 문자열 생성 (년/월/일 형식)
-        exp_years = experiment_days // 365
-        exp_months = (experiment_days % 365) // 30
-        exp_days_remaining = experiment_days % 30
-
-        duration_parts = []
-        if exp_years > 0: duration_parts.append(f"{exp_years}년")
-        if exp_months > 0: duration_parts.append(f"{exp_months}개월")
-        if exp_days_remaining > 0: duration_parts.append(f"{exp_days_remaining}일")
-        test_duration = ' '.join(duration_parts) if duration_parts else f"{experiment_days}일"
-
-        # 온도 구간 처리 (스케줄 관리와 동일한 방식)
-        # 보관조건별 기본 온도 설정
-        real_temps = {'room_temp': '15', 'warm': '25', 'cool': '10', 'freeze': '-18'}
-        accel_temps = {
-            'room_temp': ['15', '25', '35'],
-            'warm': ['25', '35', '45'],
-            'cool': ['5', '10', '15'],
-            'freeze': ['-6', '-12', '-18']
-        }
-
-        custom_temps = schedule.get('custom_temperatures', '')
-        if custom_temps:
-            # 의뢰자 요청온도 사용
-            temps = [t.strip().replace('℃', '') for t in custom_temps.split(',')]
-        else:
-            if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-                # 가속실험: 3구간 온도
-                temps = accel_temps.get(storage_code, ['25', '35', '45'])
-            else:
-                # 실측실험: 1구간 온도
-                temps = [real_temps.get(storage_code, '15')]
-
-        # 샘플링 횟수
-        sampling_count = schedule.get('sampling_count', 6) or 6
-
-        # 실험 주기 계산 (실험일수 / 샘플링 횟수)
-        if experiment_days > 0 and sampling_count > 0:
-            experiment_interval = experiment_days // sampling_count
-        else:
-            experiment_interval = 15  # 기본값
-
-        # 검사항목 (스케줄에서 동적으로 가져오기)
-        test_items_str = schedule.get('test_items', '')
-        if test_items_str:
-            test_items_list = [item.strip() for item in test_items_str.split(',') if item.strip()]
-        else:
-            test_items_list = ['관능평가', '세균수', '대장균(정량)', 'pH']
-
-        # 식품유형 열 텍스트 (식품유형 위에 + 상세정보 아래)
-        # 온도 문자열 생성
-        if len(temps) == 1:
-            temp_str = f"{temps[0]}℃"
-        else:
-            # 여러 온도는 슬래시로 구분하여 한 줄에 표시
-            temp_str = " / ".join([f"{t}℃" for t in temps])
-
-        # 견적 유형에 따라 표시 내용 변경
-        if self.estimate_type == "suspend":
-            # 중단 견적서: 완료 회차 표시
-            completed_rounds = schedule.get('completed_rounds', 0)
-            if completed_rounds is None or completed_rounds == 0:
-                completed_rounds = max(1, sampling_count // 2)  # 기본값
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-※ 중단 정산
-완료 회차: {completed_rounds}회 / 전체 {sampling_count}회
-실험 주기: {experiment_interval}일"""
-        elif self.estimate_type == "extend":
-            # 연장 견적서: 연장 회차 표시
-            extend_rounds = schedule.get('extend_rounds', 0)
-            if extend_rounds is None or extend_rounds == 0:
-                extend_rounds = 3  # 기본값
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-※ 연장 실험
-연장 회차: {extend_rounds}회
-실험 주기: {experiment_interval}일"""
-        else:
-            # 1차 견적서: 기존 내용
-            food_type_text = f"""{food_type}
-
-소비기한 : {storage} {period_str}
-시험기간 : {test_duration}
-실험방법 : {method_str}
-실험 온도: {temp_str}
-연장시험 : {'진행' if schedule.get('extension_test') else '미진행'}
-실험 횟수: {sampling_count}회
-실험 주기: {experiment_interval}일"""
-
-        # 검사항목 목록 텍스트 (위에 배치)
-        test_items_text = '\n'.join([f"{i+1})  {item}" for i, item in enumerate(test_items_list)])
+        # 식품유형 상세 / 검사항목 문구 (utils.estimate_document 공용 생성)
+        items = build_items_text(schedule, self.estimate_type)
+        food_type_text = items['food_type_text']
+        test_items_text = items['test_items_text']
+        test_items_list = items['test_items_list']
+        temps = items['temps']
 
         # 행 높이 동적 조정 (먼저 계산)
         base_height = 140
@@ -1665,178 +1374,7 @@ class EstimateTab(QWidget):
 
     def calculate_total_price(self, schedule, completed_rounds=None):
         """총 금액 계산 - 스케줄 관리에서 전달받은 비용 데이터 사용"""
-        # 실험방법 확인
-        test_method = schedule.get('test_method', 'real')
-        sampling_count = schedule.get('sampling_count', 6) or 6
-
-        # 온도 구간 수 결정 (실측=1구간, 가속=3구간)
-        if test_method in ['real', 'custom_real']:
-            zone_count = 1
-        else:
-            zone_count = 3
-
-        # 견적 유형에 따른 계산
-        if self.estimate_type == "suspend":
-            # 중단 견적: 완료된 회차만 계산
-            if completed_rounds is not None:
-                completed = completed_rounds
-            else:
-                completed = schedule.get('completed_rounds', 0)
-                # 완료 회차가 없으면 기본값으로 전체 회차의 절반 사용
-                if completed is None or completed == 0:
-                    completed = max(1, sampling_count // 2)
-            return self._calculate_suspend_price(schedule, completed, zone_count)
-        elif self.estimate_type == "extend":
-            # 연장 견적: 연장 비용만 계산
-            return self._calculate_extend_price(schedule, zone_count)
-        else:
-            # 1차 견적: 전체 비용 계산
-            return self._calculate_first_price(schedule, zone_count, sampling_count)
-
-    def _calculate_first_price(self, schedule, zone_count, sampling_count):
-        """1차 견적 금액 계산 - DB에 저장된 값 우선 사용
-
-        O/X 상태 변경과 관계없이 모든 검사항목이 O인 것으로 가정한 원래 비용 계산
-        1차 견적 전용 보고서/중간보고서 비용 사용 (first_report_cost, first_interim_cost)
-        """
-        # DB에 저장된 1차 견적 값이 있으면 사용 (최우선)
-        saved_first_supply = schedule.get('first_supply_amount', 0) or 0
-        if saved_first_supply > 0:
-            return saved_first_supply
-
-        # 저장된 값이 없으면 계산
-        total = 0
-        test_method = schedule.get('test_method', 'real')
-
-        # cost_per_test (1회 기준 비용)가 있으면 사용하여 원래 전체 비용 계산
-        cost_per_test = schedule.get('cost_per_test', 0) or 0
-        if cost_per_test > 0:
-            # 원래 전체 비용 = 1회기준 × 샘플링횟수 × 구간수
-            total += cost_per_test * sampling_count * zone_count
-        else:
-            # cost_per_test가 없으면 test_items로 계산 (호환성 유지)
-            test_items = schedule.get('test_items', '')
-            if test_items:
-                item_cost = Fee.calculate_total_fee(test_items)
-                total += item_cost * sampling_count * zone_count
-
-        # 1차 견적 전용 보고서 비용 (first_report_cost 우선 사용)
-        report_cost = schedule.get('first_report_cost', 0) or schedule.get('report_cost', 0) or 0
-        if report_cost == 0:
-            # 중간보고서 여부 확인
-            report_interim = schedule.get('report_interim', False)
-            # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
-            if report_interim:
-                report_cost = 200000
-            elif test_method in ['acceleration', 'custom_acceleration']:
-                report_cost = 300000
-            else:
-                report_cost = 200000
-        total += report_cost
-
-        # 1차 견적 전용 중간보고서 비용 (first_interim_cost 우선 사용)
-        interim_report_cost = schedule.get('first_interim_cost', 0) or schedule.get('interim_report_cost', 0) or 0
-        total += interim_report_cost
-
-        return int(total)
-
-    def _calculate_suspend_price(self, schedule, completed_rounds, zone_count):
-        """중단 견적 금액 계산 - DB에 저장된 값 우선 사용
-
-        상태가 '중단'이고 체크 설정이 O인 경우만 비용에 포함
-        중단 견적 전용 보고서/중간보고서 비용 사용 (suspend_report_cost, suspend_interim_cost)
-        """
-        # DB에 저장된 중단 견적 값이 있으면 사용 (최우선)
-        saved_suspend_supply = schedule.get('suspend_supply_amount', 0) or 0
-        if saved_suspend_supply > 0:
-            return saved_suspend_supply
-
-        # 저장된 값이 없으면 계산
-        total = 0
-        test_method = schedule.get('test_method', 'real')
-
-        # 스케줄 관리에서 계산된 중단 비용 정보 사용 (O로 체크된 항목만 포함됨)
-        # 중단 견적은 suspend_rounds_cost 사용 (total_rounds_cost는 1차 견적용)
-        suspend_rounds_cost = schedule.get('suspend_rounds_cost', 0) or 0
-        if suspend_rounds_cost > 0:
-            # O로 체크된 항목의 비용 × 구간수
-            total += suspend_rounds_cost * zone_count
-        else:
-            # suspend_rounds_cost가 없으면 기존 방식으로 계산 (호환성 유지)
-            test_items = schedule.get('test_items', '')
-            if test_items:
-                item_cost = Fee.calculate_total_fee(test_items)
-                total += item_cost * completed_rounds * zone_count
-
-        # 중단 견적 전용 보고서 비용 (suspend_report_cost 우선 사용)
-        report_cost = schedule.get('suspend_report_cost', 0) or schedule.get('report_cost', 0) or 0
-        if report_cost == 0:
-            # 중간보고서 여부 확인
-            report_interim = schedule.get('report_interim', False)
-            # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
-            if report_interim:
-                report_cost = 200000
-            elif test_method in ['acceleration', 'custom_acceleration']:
-                report_cost = 300000
-            else:
-                report_cost = 200000
-        total += report_cost
-
-        # 중단 견적 전용 중간보고서 비용 (suspend_interim_cost 우선 사용)
-        interim_report_cost = schedule.get('suspend_interim_cost', 0) or schedule.get('interim_report_cost', 0) or 0
-        total += interim_report_cost
-
-        return int(total)
-
-    def _calculate_extend_price(self, schedule, zone_count):
-        """연장 견적 금액 계산 - DB에 저장된 값 우선 사용
-
-        연장 견적 전용 보고서/중간보고서 비용 사용 (extend_report_cost, extend_interim_cost)
-        """
-        # DB에 저장된 연장 견적 값이 있으면 사용 (최우선)
-        saved_extend_supply = schedule.get('extend_supply_amount', 0) or 0
-        if saved_extend_supply > 0:
-            return saved_extend_supply
-
-        # 저장된 값이 없으면 계산
-        total = 0
-        test_method = schedule.get('test_method', 'real')
-
-        # 스케줄 관리에서 계산된 연장 회차 비용이 있으면 사용 (O/X 상태 반영됨)
-        extend_rounds_cost = schedule.get('extend_rounds_cost', 0) or 0
-        if extend_rounds_cost > 0:
-            total += extend_rounds_cost * zone_count
-        else:
-            # 계산된 비용이 없으면 기존 방식으로 계산 (호환성 유지)
-            extend_rounds = schedule.get('extend_rounds', 0)
-            if extend_rounds is None or extend_rounds == 0:
-                extend_rounds = 3  # 기본값
-
-            # 검사항목 수수료 계산 (연장 회차)
-            test_items = schedule.get('test_items', '')
-            if test_items:
-                item_cost = Fee.calculate_total_fee(test_items)
-                total += item_cost * extend_rounds * zone_count
-
-        # 연장 견적 전용 보고서 비용 (extend_report_cost 우선 사용)
-        report_cost = schedule.get('extend_report_cost', 0) or schedule.get('report_cost', 0) or 0
-        if report_cost == 0:
-            # 중간보고서 여부 확인
-            report_interim = schedule.get('report_interim', False)
-            # 기본 보고서 비용: 가속=300,000원, 실측=200,000원, 중간보고서 있으면=200,000원
-            if report_interim:
-                report_cost = 200000
-            elif test_method in ['acceleration', 'custom_acceleration']:
-                report_cost = 300000
-            else:
-                report_cost = 200000
-        total += report_cost
-
-        # 연장 견적 전용 중간보고서 비용 (extend_interim_cost 우선 사용)
-        interim_report_cost = schedule.get('extend_interim_cost', 0) or 0
-        total += interim_report_cost
-
-        return int(total)
+        return calculate_total_price(schedule, self.estimate_type, completed_rounds)
 
     def calculate_and_display_totals(self, schedule):
         """금액 계산 및 표시"""
@@ -1854,288 +1392,11 @@ class EstimateTab(QWidget):
 
     def number_to_korean(self, num):
         """숫자를 한글로 변환"""
-        units = ['', '만', '억', '조']
-        nums = ['', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
-        small_units = ['', '십', '백', '천']
-
-        if num == 0:
-            return '영'
-
-        result = ''
-        unit_idx = 0
-
-        while num > 0:
-            part = num % 10000
-            num //= 10000
-
-            if part > 0:
-                part_str = ''
-                for i in range(4):
-                    digit = part % 10
-                    part //= 10
-                    if digit > 0:
-                        if digit == 1 and i > 0:
-                            part_str = small_units[i] + part_str
-                        else:
-                            part_str = nums[digit] + small_units[i] + part_str
-
-                result = part_str + units[unit_idx] + result
-
-            unit_idx += 1
-
-        return result
+        return number_to_korean(num)
 
     def update_remark(self, schedule):
         """Remark 섹션 업데이트"""
-        from datetime import datetime, timedelta
-
-        # 저장된 Remark 내용이 있는지 확인
-        field_name = {
-            'first': 'remark_first',
-            'suspend': 'remark_suspend',
-            'extend': 'remark_extend'
-        }.get(self.estimate_type, 'remark_first')
-
-        saved_remark = schedule.get(field_name, '') or ''
-        if saved_remark:
-            # 저장된 내용이 있으면 그대로 사용
-            self.remark_text.setPlainText(saved_remark)
-            return
-
-        sampling_count = schedule.get('sampling_count', 6) or 6
-        test_method = schedule.get('test_method', 'real')
-
-        # 온도 구간 수 결정
-        if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-            zone_count = 3
-            zone_text = "3온도"
-        else:
-            zone_count = 1
-            zone_text = "1온도"
-
-        total_samples = sampling_count * zone_count
-
-        # 연장실험 여부 확인 (연장×2)
-        extension_test = schedule.get('extension_test', 0)
-        if extension_test:
-            total_samples = total_samples * 2
-
-        # 포장단위 정보 가져오기
-        packaging_weight = schedule.get('packaging_weight', 0) or 0
-        packaging_unit = schedule.get('packaging_unit', 'g') or 'g'
-        if packaging_weight > 0:
-            packaging_text = f"{packaging_weight}{packaging_unit}"
-        else:
-            packaging_text = "100g"
-
-        # 소비기한을 일수로 변환
-        test_period_days = schedule.get('test_period_days', 0) or 0
-        test_period_months = schedule.get('test_period_months', 0) or 0
-        test_period_years = schedule.get('test_period_years', 0) or 0
-        total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
-
-        # 실험기간 계산 (실측: 소비기한×1.5, 가속: 소비기한÷2)
-        if test_method in ['real', 'custom_real']:
-            total_experiment_days = int(total_expiry_days * 1.5)
-        else:
-            total_experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
-
-        # 샘플링 간격 계산
-        if total_experiment_days > 0 and sampling_count > 0:
-            interval = total_experiment_days // sampling_count
-        else:
-            interval = 15  # 기본값
-
-        # 중간보고서 실험일수 (6회차 기준)
-        interim_experiment_days = interval * 6
-
-        # 시작일과 예상 날짜 계산
-        start_date_str = schedule.get('start_date', '')
-        interim_expected_date = ""
-        final_expected_date = ""
-
-        if start_date_str:
-            try:
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-                # 중간보고서 예상일 (실험 완료 + 분석시간 약 15일)
-                interim_date = start_date + timedelta(days=interim_experiment_days + 15)
-                interim_expected_date = interim_date.strftime('%Y-%m-%d')
-                # 최종보고서 예상일 (실험 완료 + 분석시간 약 15일)
-                final_date = start_date + timedelta(days=total_experiment_days + 15)
-                final_expected_date = final_date.strftime('%Y-%m-%d')
-            except (ValueError, TypeError):
-                pass
-
-        # 소비기한 개월 수 계산
-        total_months = test_period_months + (test_period_years * 12)
-        if test_period_days >= 15:
-            total_months += 1
-
-        # 검사 소요기간 문구 생성
-        # 중간 보고서 날짜 및 회차 정보 가져오기 (스케쥴 관리에서)
-        report1_date = schedule.get('report1_date', '') or ''
-        report2_date = schedule.get('report2_date', '') or ''
-        report3_date = schedule.get('report3_date', '') or ''
-        interim1_round = schedule.get('interim1_round', 0) or 0
-        interim2_round = schedule.get('interim2_round', 0) or 0
-        interim3_round = schedule.get('interim3_round', 0) or 0
-        report_interim = schedule.get('report_interim', False)
-
-        # 회차별 제조후 일수 계산 함수
-        def get_days_for_round(round_num):
-            if round_num <= 0 or sampling_count <= 0:
-                return 0
-            if round_num == 1:
-                return 0
-            if round_num >= sampling_count:
-                return total_experiment_days
-            # 중간 회차: 균등 분배
-            if sampling_count > 1:
-                interval = total_experiment_days / (sampling_count - 1)
-                return int(round((round_num - 1) * interval))
-            return 0
-
-        test_period_text = ""
-
-        # 중간 보고서 날짜가 있는 경우 (스케쥴 관리에서 입력된 날짜 사용)
-        has_report_dates = False
-
-        # 중간 보고서 1 날짜가 있는 경우
-        if report1_date and report1_date != '-':
-            days_for_interim1 = get_days_for_round(interim1_round)
-            test_period_text += f"→ 실험 기간 : {days_for_interim1}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 1 / {report1_date})\n"
-            has_report_dates = True
-
-        # 중간 보고서 2 날짜가 있는 경우
-        if report2_date and report2_date != '-':
-            days_for_interim2 = get_days_for_round(interim2_round)
-            test_period_text += f"→ 실험 기간 : {days_for_interim2}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 2 / {report2_date})\n"
-            has_report_dates = True
-
-        # 중간 보고서 3 날짜가 있는 경우
-        if report3_date and report3_date != '-':
-            days_for_interim3 = get_days_for_round(interim3_round)
-            test_period_text += f"→ 실험 기간 : {days_for_interim3}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (중간 보고서 3 / {report3_date})\n"
-            has_report_dates = True
-
-        # 날짜가 없고 report_interim이 체크된 경우 기존 로직 사용
-        if not has_report_dates and report_interim:
-            interim_date_text = f" / {interim_expected_date}" if interim_expected_date else ""
-            test_period_text += f"→ 실험 기간 : {interim_experiment_days}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. ({total_months}개월 중간 보고서{interim_date_text})\n"
-
-        # 최종 보고서 라인
-        final_date_text = f" / {final_expected_date}" if final_expected_date else ""
-        test_period_text += f"→ 실험 기간 : {total_experiment_days}일 + 데이터 분석시간(약 7일~15일) 소요 예정입니다. (최종 보고서{final_date_text})"
-
-        # 견적 유형에 따른 Remark 생성
-        if self.estimate_type == "suspend":
-            # 중단 견적서 Remark
-            completed_rounds = schedule.get('completed_rounds', 0)
-            if completed_rounds is None or completed_rounds == 0:
-                completed_rounds = max(1, sampling_count // 2)  # 기본값: 전체의 절반
-
-            # 1차 견적 금액 계산 (부가세 포함)
-            first_price = self._calculate_first_price(schedule, zone_count, sampling_count)
-            first_price_with_vat = round(first_price * 1.1)  # 부가세 10% 포함, round 사용
-
-            # 중단 시 진행한 실험 비용 계산 (부가세 포함)
-            suspend_price = self._calculate_suspend_price(schedule, completed_rounds, zone_count)
-            suspend_price_with_vat = round(suspend_price * 1.1)  # 부가세 10% 포함, round 사용
-
-            # 잔여 금액 계산
-            remaining_price = first_price_with_vat - suspend_price_with_vat
-
-            # 로그인 사용자 정보
-            user_name = ""
-            user_phone = ""
-            user_mobile = ""
-            if self.current_user:
-                user_name = self.current_user.get('name', '')
-                user_phone = self.current_user.get('phone', '')
-                user_mobile = self.current_user.get('mobile', '')
-
-            remark_text = f"""※ 중단 정산 내역
-
-→ 실험 중단 사유: 품질한계 도달 / 의뢰자 요청
-→ 완료된 실험 회차: {completed_rounds}회 / 전체 {sampling_count}회 (온도 {zone_count}구간)
-→ 정산 기준: 1차 견적 = {first_price_with_vat:,}원(부가세 포함) - {suspend_price_with_vat:,}원(중단 시 진행한 실험 비용) = {remaining_price:,}원(잔여)
-
-※ 정산 안내
-* 본 견적서는 실험 중단에 따른 정산 견적서입니다.
-* 완료된 실험 회차까지의 비용만 청구됩니다.
-* 이미 입금이 완료된 경우 환불 또는 다른 검사 비용으로 사용이 가능합니다.
-* 추가 문의사항은 {user_name}, {user_phone}, {user_mobile} 연락 주시기 바랍니다.
-
-※ 입금 계좌 안내
-- 기업 은행 : 024-088021-01-017
-- 우리 은행 : 1005-702-799176
-- 농협 은행 : 301-0178-1722-11
-★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
-★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
-   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
-
-        elif self.estimate_type == "extend":
-            # 연장 견적서 Remark
-            extend_rounds = schedule.get('extend_rounds', 0)
-            if extend_rounds is None or extend_rounds == 0:
-                extend_rounds = 3  # 기본값: 3회
-
-            # 연장 실험 간격 계산
-            extend_experiment_days = schedule.get('extend_experiment_days', 0)
-            sampling_interval = schedule.get('sampling_interval', 15) or 15
-            if extend_rounds > 0 and extend_experiment_days > 0:
-                extend_interval = extend_experiment_days // extend_rounds
-            else:
-                extend_interval = sampling_interval
-
-            remark_text = f"""※ 연장실험 안내
-
-→ 연장 실험 회차: {extend_rounds}회 (온도 {zone_count}구간)
-→ 연장 샘플링 간격: 약 {extend_interval}일
-
-※ 연장실험 진행 절차
-1. 본 견적서 확인 후 입금
-2. 연장실험 진행 (기존 보관 검체 사용)
-3. 최종 보고서 발행
-
-* 연장실험은 기존 실험 데이터와 연계하여 진행됩니다.
-* 기존 보관 중인 검체를 사용하여 연장 실험을 진행합니다.
-* 연장실험 후 최종 보고서가 발행됩니다.
-
-※ 입금 계좌 안내
-- 기업 은행 : 024-088021-01-017
-- 우리 은행 : 1005-702-799176
-- 농협 은행 : 301-0178-1722-11
-★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
-★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
-   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
-
-        else:
-            # 1차 견적서 Remark (기존 내용)
-            remark_text = f"""※ 검체량
-→ 검체는 판매 또는 판매 예정인 제품과 동일하게 검사제품을 준비해주시기 바랍니다.
-→ 검체량 : 온도 구간별({zone_text}) 총 {sampling_count}회씩 실험 = {total_samples}ea
-    => 포장단위 {packaging_text} 이상 제품 기준 총 {total_samples}ea 이상 준비
-
-※ 검사 소요기간
-{test_period_text}
-→ 실험스케쥴(구간 및 횟수)은 실험결과의 유의성에 따라 보고서 발행일 수가 변경될 수 있습니다.
-
-* 예상 소비기한은 견적이며, 품질안전한계기간 미도달 시에도 실험연장 불가합니다.
-* 견적 금액은 검사비용 외 보관비 및 보고서작성 비용 포함입니다.
-* 지표 항목의 수정(추가)이나 삭제가 필요한 경우 사전 연락을 해주시고 문의사항은 연락 바랍니다.
-* 온도 구간별 1회 시험을 하며, 반복 실험이 필요한 경우 연락 바랍니다.
-* 소비기한 설정 실험은 입금 후 진행되며, 검사 중 품질한계 도달로 실험 중단 시, 중단 전까지의 비용 청구됩니다.
-
-※ 입금 계좌 안내
-- 기업 은행 : 024-088021-01-017
-- 우리 은행 : 1005-702-799176
-- 농협 은행 : 301-0178-1722-11
-★ 입금시 '대표자명' 또는 '업체명'으로 입금 부탁드립니다.
-★ 업체명으로 입금 진행시, [농업회사법인 주식회]에서 잘리는 경우가 있습니다.
-   이와 같은 경우, 입금 확인이 늦어질 수 있으니 업체명을 식별할 수 있도록 표시 부탁드립니다."""
-
-        self.remark_text.setPlainText(remark_text)
+        self.remark_text.setPlainText(build_remark_text(schedule, self.estimate_type, self.current_user))
 
     def save_remark_content(self):
         """Remark 내용 저장"""
@@ -2161,17 +1422,14 @@ class EstimateTab(QWidget):
                 'extend': 'remark_extend'
             }.get(self.estimate_type, 'remark_first')
 
+            # remark_* 컬럼은 스키마 마이그레이션에서 보장
+            from migrations import ensure_schema
+            ensure_schema()
+
             # 데이터베이스 업데이트
             conn = get_connection()
             cursor = conn.cursor()
 
-            # 컬럼이 없으면 추가
-            cursor.execute("SHOW COLUMNS FROM schedules")
-            columns = [col['Field'] for col in cursor.fetchall()]
-            for col in ['remark_first', 'remark_suspend', 'remark_extend']:
-                if col not in columns:
-                    cursor.execute(f"ALTER TABLE schedules ADD COLUMN {col} TEXT")
-
             cursor.execute(f"""
                 UPDATE schedules SET {field_name} = %s WHERE id = %s
             """, (remark_content, schedule_id))
@@ -2371,8 +1629,6 @@ class EstimateTab(QWidget):
         import os
         from datetime import datetime
         from PyQt5.QtWidgets import QFileDialog
-        from PyQt5.QtCore import QMarginsF
-        from PyQt5.QtGui import QPainter, QPageLayout, QPageSize
 
         if not self.current_schedule:
             QMessageBox.warning(self, "알림", "저장할 견적서가 없습니다. 먼저 스케줄을 선택해주세요.")
@@ -2472,91 +1728,12 @@ class EstimateTab(QWidget):
             if not file_path:
                 return
 
-        # PDF 생성
+        # PDF 생성 (일괄 생성과 같은 배치)
         try:
-            # 저장 버튼 숨기기
-            self.save_btn_widget.setVisible(False)
-
-            # 사용할 컨테이너 및 Remark 선택
-            if use_discounted:
-                widget = self.discounted_container
-                remark_widget = self.disc_remark_text
-            else:
-                widget = self.estimate_container
-                remark_widget = self.remark_text
-
-            # Remark 텍스트 전체 표시를 위해 높이 조정
-            original_min_height = remark_widget.minimumHeight()
-            original_max_height = remark_widget.maximumHeight()
-            doc_height = remark_widget.document().size().height() + 20
-            remark_widget.setMinimumHeight(int(doc_height))
-            remark_widget.setMaximumHeight(int(doc_height))
-
-            # 레이아웃 업데이트
-            widget.adjustSize()
-            from PyQt5.QtWidgets import QApplication
-            QApplication.processEvents()
-
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.PdfFormat)
-            printer.setOutputFileName(file_path)
-            printer.setResolution(300)  # 300 DPI로 고해상도 설정
-
-            # A4 사이즈 설정
-            page_layout = QPageLayout(
-                QPageSize(QPageSize.A4),
-                QPageLayout.Portrait,
-                QMarginsF(10, 10, 10, 10)  # 여백 설정 (mm)
-            )
-            printer.setPageLayout(page_layout)
-
-            painter = QPainter()
-            if painter.begin(printer):
-                # 고품질 렌더링 설정
-                painter.setRenderHint(QPainter.Antialiasing, True)
-                painter.setRenderHint(QPainter.TextAntialiasing, True)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-
-                # 페이지 크기
-                page_rect = printer.pageRect(QPrinter.DevicePixel)
-
-                # 위젯의 실제 내용 크기 계산
-                widget_width = widget.sizeHint().width() if widget.sizeHint().width() > 0 else widget.width()
-                widget_height = widget.sizeHint().height() if widget.sizeHint().height() > 0 else widget.height()
-
-                # A4 너비에 맞게 스케일 계산
-                scale = page_rect.width() / widget_width
-
-                # 세로가 넘치면 세로 기준으로 스케일 조정
-                if widget_height * scale > page_rect.height():
-                    scale = page_rect.height() / widget_height
-
-                # 여유 공간 확보
-                scale = scale * 0.95
-
-                # 왼쪽 상단에서 시작
-                painter.scale(scale, scale)
-                widget.render(painter)
-                painter.end()
-
-                version_text = "할인 적용 견적서" if use_discounted else "원본 견적서"
-                QMessageBox.information(self, "저장 완료", f"{version_text}가 PDF로 저장되었습니다.\n\n{file_path}")
-            else:
-                QMessageBox.critical(self, "오류", "PDF 생성에 실패했습니다.")
-
-            # Remark 텍스트 높이 복원
-            remark_widget.setMinimumHeight(original_min_height)
-            remark_widget.setMaximumHeight(original_max_height)
-
-            # 저장 버튼 다시 표시
-            self.save_btn_widget.setVisible(True)
-
+            self._write_estimate_pdf(file_path, use_discounted)
+            version_text = "할인 적용 견적서" if use_discounted else "원본 견적서"
+            QMessageBox.information(self, "저장 완료", f"{version_text}가 PDF로 저장되었습니다.\n\n{file_path}")
         except Exception as e:
-            # Remark 텍스트 높이 복원
-            self.remark_text.setMinimumHeight(300)
-            self.remark_text.setMaximumHeight(16777215)
-            # 저장 버튼 다시 표시
-            self.save_btn_widget.setVisible(True)
             QMessageBox.critical(self, "오류", f"PDF 저장 중 오류가 발생했습니다:\n{str(e)}")
 
     def save_as_excel(self):
@@ -2702,10 +1879,7 @@ class EstimateTab(QWidget):
             return
 
         # 설정에서 회사 정보 가져오기
-        company_name = "(주)바이오푸드랩"
-        company_phone = ""
-        company_mobile = ""
-        company_email = ""
+        settings_dict = {}
         try:
             from database import get_connection
             conn = get_connection()
@@ -2714,134 +1888,24 @@ class EstimateTab(QWidget):
             settings = cursor.fetchall()
             conn.close()
             settings_dict = {s['key']: s['value'] for s in settings}
-            company_name = settings_dict.get('company_name', '(주)바이오푸드랩') or '(주)바이오푸드랩'
-            company_phone = settings_dict.get('company_phone', '') or ''
-            company_mobile = settings_dict.get('company_mobile', '') or ''
-            company_email = settings_dict.get('company_email', '') or settings_dict.get('smtp_email', '') or ''
         except Exception as e:
             print(f"설정 로드 오류: {e}")
 
-        # 동적 데이터 추출
-        client_name = self.current_schedule.get('client_name', '') or ''
-        food_type = self.current_schedule.get('food_type_name', '') or ''
-
-        # 보관조건 변환
-        storage_code = self.current_schedule.get('storage_condition', 'room_temp')
-        storage_map = {
-            'room_temp': '상온',
-            'warm': '실온',
-            'cool': '냉장',
-            'freeze': '냉동'
-        }
-        storage = storage_map.get(storage_code, storage_code)
-
-        # 실험방법 변환
-        test_method = self.current_schedule.get('test_method', 'real')
-        method_map = {
-            'real': '실측실험',
-            'acceleration': '가속실험',
-            'custom_real': '의뢰자요청(실측)',
-            'custom_accel': '의뢰자요청(가속)',
-            'custom_acceleration': '의뢰자요청(가속)'
-        }
-        method_str = method_map.get(test_method, test_method)
-
-        # 실험 횟수
-        sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-
-        # 온도 구간 수
-        if test_method in ['acceleration', 'custom_accel', 'custom_acceleration']:
-            zone_count = 3
-        else:
-            zone_count = 1
-
-        # 실험 주기 계산
-        test_period_days = self.current_schedule.get('test_period_days', 0) or 0
-        test_period_months = self.current_schedule.get('test_period_months', 0) or 0
-        test_period_years = self.current_schedule.get('test_period_years', 0) or 0
-        total_expiry_days = test_period_days + (test_period_months * 30) + (test_period_years * 365)
-
-        if test_method in ['real', 'custom_real']:
-            experiment_days = int(total_expiry_days * 1.5)
-        else:
-            experiment_days = total_expiry_days // 2 if total_expiry_days > 0 else 0
-
-        if experiment_days > 0 and sampling_count > 0:
-            experiment_interval = experiment_days // sampling_count
-        else:
-            experiment_interval = 15
-
-        # 필요 시료량 계산
-        total_samples = sampling_count * zone_count
-        packaging_weight = self.current_schedule.get('packaging_weight', 0) or 0
-        packaging_unit = self.current_schedule.get('packaging_unit', 'g') or 'g'
-        if packaging_weight > 0:
-            sample_text = f"포장단위 {packaging_weight}{packaging_unit} 이상 제품 기준 총 {total_samples}ea 이상"
-        else:
-            sample_text = f"총 {total_samples}ea 이상"
-
-        # 총액 계산 (할인 적용 여부에 따라)
-        total_price = self.calculate_total_price(self.current_schedule)
-        if self.email_use_discount and self.discount_rate > 0:
-            # 할인 적용
-            discount_amount = int(total_price * self.discount_rate / 100)
-            total_price = total_price - discount_amount
-            price_note = f" ({self.discount_rate}% 할인 적용)"
-        else:
-            price_note = ""
-        vat = round(total_price * 0.1)
-        total_with_vat = total_price + vat
-
-        # 제목 설정
-        self.email_subject_input.setText(f"[바이오푸드랩] {client_name} 견적서 송부의 건")
-
-        # 서명 정보 구성
-        signature_lines = [company_name]
-        if company_phone:
-            signature_lines.append(f"Tel: {company_phone}")
-        if company_mobile:
-            signature_lines.append(f"Mobile: {company_mobile}")
-        if company_email:
-            signature_lines.append(f"Email: {company_email}")
-        signature = '\n'.join(signature_lines)
-
-        # 본문 템플릿
-        body_template = f"""안녕하세요, {company_name}입니다.
-
-{client_name} 귀하
-
-요청하신 소비기한 설정시험 견적서를 송부드립니다.
-
-■ 견적 정보
-  - 식품유형: {food_type}
-  - 보관조건: {storage}
-  - 실험방법: {method_str}
-  - 실험횟수: {sampling_count}회 (온도 {zone_count}구간)
-  - 실험주기: {experiment_interval}일
-  - 필요시료: {sample_text}
-  - 견적금액: {total_with_vat:,}원 (VAT 포함){price_note}
-
-첨부된 견적서를 확인해 주시기 바랍니다.
-문의사항이 있으시면 언제든 연락 부탁드립니다.
-
-감사합니다.
-
-─────────────────────────
-{signature}
-─────────────────────────"""
+        # 할인 적용 여부에 따라 견적금액 표시
+        discount_rate = self.discount_rate if self.email_use_discount else 0
+        subject, body_template = build_email_content(
+            self.current_schedule, settings_dict, self.estimate_type, discount_rate)
 
+        self.email_subject_input.setText(subject)
         self.email_body_input.setPlainText(body_template)
 
     def send_email(self):
-        """이메일 발송"""
+        """이메일 발송 (발송 대기열에 추가 - 실제 발송은 백그라운드에서 처리)"""
         import os
-        import smtplib
-        from email.mime.multipart import MIMEMultipart
-        from email.mime.text import MIMEText
-        from email.mime.base import MIMEBase
-        from email import encoders
-        from email.header import Header
-        from datetime import datetime
+        from utils.mail_queue import (
+            mail_queue, STATUS_QUEUED,
+            DEFAULT_SMTP_SERVER, DEFAULT_SMTP_PORT, DEFAULT_SMTP_SECURITY
+        )
 
         # 입력 검증
         to_emails = self.email_to_input.text().strip()
@@ -2868,9 +1932,9 @@ class EstimateTab(QWidget):
             settings_dict = {s['key']: s['value'] for s in settings}
 
             # SMTP 서버 설정 (고정값)
-            smtp_server = 'spam.biofl.co.kr'
-            smtp_port = 25
-            smtp_security = 'TLS'
+            smtp_server = DEFAULT_SMTP_SERVER
+            smtp_port = DEFAULT_SMTP_PORT
+            smtp_security = DEFAULT_SMTP_SECURITY
             output_path = settings_dict.get('output_path', '')
 
             # 사용자별 이메일 계정 설정 로드
@@ -2905,84 +1969,55 @@ class EstimateTab(QWidget):
         if not pdf_path:
             return
 
-        # 이메일 구성
+        # 발송 대기열에 추가
         try:
-            msg = MIMEMultipart()
-            msg['From'] = f"{sender_name} <{smtp_email}>"
-
-            # 수신자 처리 (여러 명)
+            # 수신자/참조 처리 (여러 명)
             to_list = [email.strip() for email in to_emails.split(',') if email.strip()]
-            msg['To'] = ', '.join(to_list)
-
-            # 참조 처리 (여러 명)
             cc_emails = self.email_cc_input.text().strip()
-            cc_list = []
-            if cc_emails:
-                cc_list = [email.strip() for email in cc_emails.split(',') if email.strip()]
-                msg['Cc'] = ', '.join(cc_list)
+            cc_list = [email.strip() for email in cc_emails.split(',') if email.strip()] if cc_emails else []
 
-            msg['Subject'] = self.email_subject_input.text()
-
-            # 본문
+            subject = self.email_subject_input.text()
             body = self.email_body_input.toPlainText()
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
-
-            # PDF 첨부 (한글 파일명 인코딩 처리)
-            with open(pdf_path, 'rb') as attachment:
-                part = MIMEBase('application', 'pdf')
-                part.set_payload(attachment.read())
-                encoders.encode_base64(part)
-
-                # 한글 파일명을 위한 RFC 2231 인코딩
-                filename = os.path.basename(pdf_path)
-                encoded_filename = Header(filename, 'utf-8').encode()
-                part.add_header(
-                    'Content-Disposition',
-                    'attachment',
-                    filename=('utf-8', '', filename)
-                )
-                part.add_header('Content-Type', 'application/pdf', name=encoded_filename)
-                msg.attach(part)
-
-            # SMTP 연결 및 발송
-            all_recipients = to_list + cc_list
-
-            if smtp_security == "SSL":
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-            else:
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                if smtp_security == "TLS":
-                    server.starttls()
+            sent_by = self.current_user.get('id') if hasattr(self, 'current_user') and self.current_user else None
 
-            server.login(smtp_email, smtp_password)
-            server.sendmail(smtp_email, all_recipients, msg.as_string())
-            server.quit()
-
-            # 이메일 발송 로그 저장
+            # 이메일 발송 로그 저장 (발송 완료 시 대기열에서 상태 갱신)
+            log_id = None
             try:
                 from models.communications import EmailLog
-                schedule_id = self.current_schedule.get('id')
-                client_name = self.current_schedule.get('client_name', '')
-                estimate_type = getattr(self, 'estimate_type', 'first')
-                sent_by = self.current_user.get('id') if hasattr(self, 'current_user') and self.current_user else None
-
-                EmailLog.save(
-                    schedule_id=schedule_id,
-                    estimate_type=estimate_type,
+                log_id = EmailLog.save(
+                    schedule_id=self.current_schedule.get('id'),
+                    estimate_type=getattr(self, 'estimate_type', 'first'),
                     sender_email=smtp_email,
                     to_emails=', '.join(to_list),
                     cc_emails=', '.join(cc_list) if cc_list else None,
-                    subject=self.email_subject_input.text(),
+                    subject=subject,
                     body=body,
                     attachment_name=os.path.basename(pdf_path),
                     sent_by=sent_by,
-                    client_name=client_name
+                    client_name=self.current_schedule.get('client_name', '')
                 )
+                if log_id:
+                    EmailLog.update_status(log_id, status=STATUS_QUEUED)
             except Exception as log_err:
                 print(f"이메일 로그 저장 오류: {log_err}")
 
-            QMessageBox.information(self, "발송 완료",
-                f"이메일이 성공적으로 발송되었습니다.\n\n"
+            mail_queue.enqueue(
+                smtp={'server': smtp_server, 'port': smtp_port,
+                      'security': smtp_security, 'username': smtp_email},
+                credential={'scope': 'user', 'user_id': sent_by},
+                sender_name=sender_name,
+                to_list=to_list,
+                cc_list=cc_list,
+                subject=subject,
+                body=body,
+                attachments=[pdf_path],
+                log_id=log_id,
+                owner_id=sent_by
+            )
+
+            QMessageBox.information(self, "발송 요청 완료",
+                f"이메일을 발송 대기열에 추가했습니다.\n"
+                f"발송 결과는 이메일 로그에서 확인할 수 있습니다.\n\n"
                 f"수신자: {', '.join(to_list)}\n"
                 f"{'참조: ' + ', '.join(cc_list) if cc_list else ''}\n"
                 f"첨부파일: {os.path.basename(pdf_path)}")
@@ -2990,51 +2025,16 @@ class EstimateTab(QWidget):
             # 첨부파일 경로 업데이트
             self.attachment_path_label.setText(f"첨부됨: {os.path.basename(pdf_path)}")
 
-        except smtplib.SMTPAuthenticationError:
-            QMessageBox.critical(self, "인증 오류",
-                "SMTP 인증에 실패했습니다.\n이메일 또는 비밀번호를 확인해주세요.\n\n"
-                "Gmail의 경우 '앱 비밀번호'를 사용해야 합니다.")
-        except smtplib.SMTPException as e:
-            QMessageBox.critical(self, "발송 오류", f"이메일 발송 중 오류가 발생했습니다:\n{str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"오류가 발생했습니다:\n{str(e)}")
 
     def _save_pdf_for_email(self, output_path, use_discounted=False):
         """이메일 첨부용 PDF 저장"""
         import os
-        from datetime import datetime
-        from PyQt5.QtCore import QMarginsF
-        from PyQt5.QtGui import QPainter, QPageLayout, QPageSize
 
-        # 파일명 생성
-        client_name = self.current_schedule.get('client_name', '업체명') or '업체명'
-        food_type = self.current_schedule.get('food_type_name', '식품유형') or '식품유형'
-        estimate_date = datetime.now().strftime('%Y%m%d')
-
-        storage_code = self.current_schedule.get('storage_condition', 'room_temp')
-        storage_map = {'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'}
-        storage = storage_map.get(storage_code, storage_code)
-
-        test_method = self.current_schedule.get('test_method', 'real')
-        method_map = {
-            'real': '실측', 'acceleration': '가속',
-            'custom_real': '의뢰자요청_실측', 'custom_accel': '의뢰자요청_가속',
-            'custom_acceleration': '의뢰자요청_가속'
-        }
-        method_str = method_map.get(test_method, test_method)
-
-        def sanitize_filename(name):
-            invalid_chars = '<>:"/\\|?*'
-            for char in invalid_chars:
-                name = name.replace(char, '_')
-            return name
-
-        # 할인 적용 시 파일명에 할인율 추가
-        if use_discounted and self.discount_rate > 0:
-            filename = f"{client_name}_{food_type}_{estimate_date}_{storage}_{method_str}_할인{self.discount_rate}%.pdf"
-        else:
-            filename = f"{client_name}_{food_type}_{estimate_date}_{storage}_{method_str}.pdf"
-        filename = sanitize_filename(filename)
+        # 파일명 생성 (할인 적용 시 파일명에 할인율 추가)
+        discount_rate = self.discount_rate if use_discounted else 0
+        filename = estimate_filename(self.current_schedule, discount_rate)
 
         # 저장 경로 결정
         if output_path and os.path.isdir(output_path):
@@ -3045,55 +2045,31 @@ class EstimateTab(QWidget):
                 default_path = os.path.expanduser("~")
             file_path = os.path.join(default_path, filename)
 
-        # 사용할 컨테이너 선택
-        if use_discounted:
-            widget = self.discounted_container
-        else:
-            widget = self.estimate_container
-
-        # PDF 생성
         try:
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.PdfFormat)
-            printer.setOutputFileName(file_path)
-            printer.setResolution(300)  # 300 DPI로 고해상도 설정
-
-            page_layout = QPageLayout(
-                QPageSize(QPageSize.A4),
-                QPageLayout.Portrait,
-                QMarginsF(10, 10, 10, 10)
-            )
-            printer.setPageLayout(page_layout)
-
-            painter = QPainter()
-            if painter.begin(printer):
-                # 고품질 렌더링 설정
-                painter.setRenderHint(QPainter.Antialiasing, True)
-                painter.setRenderHint(QPainter.TextAntialiasing, True)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-
-                page_rect = printer.pageRect(QPrinter.DevicePixel)
-                widget_width = widget.sizeHint().width() if widget.sizeHint().width() > 0 else widget.width()
-                widget_height = widget.sizeHint().height() if widget.sizeHint().height() > 0 else widget.height()
-
-                scale = page_rect.width() / widget_width
-                if widget_height * scale > page_rect.height():
-                    scale = page_rect.height() / widget_height
-                scale = scale * 0.95
-
-                painter.scale(scale, scale)
-                widget.render(painter)
-                painter.end()
-
-                return file_path
-            else:
-                QMessageBox.critical(self, "오류", "PDF 생성에 실패했습니다.")
-                return None
-
+            self._write_estimate_pdf(file_path, use_discounted)
+            return file_path
         except Exception as e:
             QMessageBox.critical(self, "오류", f"PDF 저장 중 오류: {str(e)}")
             return None
 
+    def _write_estimate_pdf(self, file_path, use_discounted=False):
+        """견적서 PDF 생성 (일괄 생성과 같은 utils.estimate_batch.render_estimate_pdf 배치)
+
+        화면에서 수정한 견적번호/견적일자/수신/Remark는 그대로 반영
+        """
+        from models.settings import Settings
+        from utils.estimate_batch import load_company, render_estimate_pdf
+
+        discount_rate = self.discount_rate if use_discounted else 0
+        estimate = build_estimate(self.current_schedule, self.estimate_type, self.current_user, discount_rate)
+        remark_widget = self.disc_remark_text if use_discounted else self.remark_text
+        estimate['estimate_no'] = self.estimate_no_input.text() or estimate['estimate_no']
+        estimate['estimate_date'] = self.estimate_date_input.text() or estimate['estimate_date']
+        estimate['receiver'] = self.receiver_input.text()
+        estimate['remark'] = remark_widget.toPlainText()
+        estimate['company'] = load_company(Settings.get_all())
+        render_estimate_pdf(estimate, file_path)
+
     def switch_estimate_type(self, estimate_type):
         """견적서 유형 전환 (1차, 중단, 연장)"""
         self.estimate_type = estimate_type
@@ -3127,3 +2103,248 @@ class EstimateTab(QWidget):
             "extend": "연장"
         }
         return type_names.get(self.estimate_type, "1차")
+
+    def show_batch_dialog(self):
+        """견적서 일괄 생성/발송 다이얼로그"""
+        dialog = EstimateBatchDialog(self, self.current_user, self.estimate_type)
+        dialog.exec_()
+
+
+class EstimateBatchWorker(QObject):
+    """견적서 일괄 생성 작업 (백그라운드 스레드, 진행 상황은 시그널로 전달)"""
+
+    # (단계, 완료 수, 전체 수, 메시지)
+    progress = pyqtSignal(str, int, int, str)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    def __init__(self, schedule_ids, estimate_type, output_dir, user, send_mail):
+        super().__init__()
+        self.schedule_ids = schedule_ids
+        self.estimate_type = estimate_type
+        self.output_dir = output_dir
+        self.user = user
+        self.send_mail = send_mail
+        self._cancel_event = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _run(self):
+        from utils.estimate_batch import run_batch
+
+        try:
+            result = run_batch(
+                self.schedule_ids, self.estimate_type, self.output_dir, self.user,
+                send_mail=self.send_mail,
+                progress=lambda stage, done, total, message: self.progress.emit(stage, done, total, message),
+                is_cancelled=self._cancel_event.is_set
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(result)
+
+
+class EstimateBatchDialog(QDialog):
+    """견적서 일괄 생성/발송 다이얼로그"""
+
+    STAGE_NAMES = {'prepare': '견적 계산', 'render': 'PDF 생성', 'mail': '발송 대기열 추가'}
+
+    def __init__(self, parent, user, estimate_type="first"):
+        super().__init__(parent)
+        self.setWindowTitle("견적서 일괄 생성 / 발송")
+        self.setMinimumSize(760, 600)
+        self.user = user
+        self.worker = None
+        self.initUI(estimate_type)
+        self.load_schedules()
+
+    def initUI(self, estimate_type):
+        layout = QVBoxLayout(self)
+
+        # 검색
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("업체명 / 제목 / 제품명 검색...")
+        self.search_input.returnPressed.connect(self.load_schedules)
+        search_btn = QPushButton("조회")
+        search_btn.clicked.connect(self.load_schedules)
+        self.select_all_check = QCheckBox("전체 선택")
+        self.select_all_check.toggled.connect(self.toggle_all)
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(search_btn)
+        search_layout.addWidget(self.select_all_check)
+        layout.addLayout(search_layout)
+
+        # 스케줄 목록
+        self.schedule_table = QTableWidget()
+        self.schedule_table.setColumnCount(4)
+        self.schedule_table.setHorizontalHeaderLabels(["선택", "ID", "업체명", "제품명"])
+        self.schedule_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.schedule_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.schedule_table.verticalHeader().setVisible(False)
+        header = self.schedule_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        layout.addWidget(self.schedule_table)
+
+        # 옵션
+        option_layout = QFormLayout()
+        self.type_combo = QComboBox()
+        for code, name in (("first", "1차 견적"), ("suspend", "중단 견적"), ("extend", "연장 견적")):
+            self.type_combo.addItem(name, code)
+        self.type_combo.setCurrentIndex(max(0, self.type_combo.findData(estimate_type)))
+        option_layout.addRow("견적서 유형:", self.type_combo)
+
+        folder_layout = QHBoxLayout()
+        self.output_input = QLineEdit()
+        self.output_input.setPlaceholderText("비워두면 설정의 출력 경로 사용")
+        folder_btn = QPushButton("찾기")
+        folder_btn.clicked.connect(self.select_output_dir)
+        folder_layout.addWidget(self.output_input)
+        folder_layout.addWidget(folder_btn)
+        option_layout.addRow("저장 폴더:", folder_layout)
+
+        self.send_mail_check = QCheckBox("생성 후 업체 이메일로 발송 (발송 대기열)")
+        option_layout.addRow("", self.send_mail_check)
+        layout.addLayout(option_layout)
+
+        # 진행 상황
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        self.status_label = QLabel("")
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+
+        # 버튼
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self.start_btn = QPushButton("시작")
+        self.start_btn.clicked.connect(self.start_batch)
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_batch)
+        self.close_btn = QPushButton("닫기")
+        self.close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.cancel_btn)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+
+    def load_schedules(self):
+        """스케줄 목록 조회"""
+        from models.schedules import Schedule
+
+        keyword = self.search_input.text().strip() or None
+        schedules = Schedule.get_filtered(keyword=keyword) or []
+
+        self.schedule_table.setRowCount(len(schedules))
+        for row, schedule in enumerate(schedules):
+            check_item = QTableWidgetItem()
+            check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            check_item.setCheckState(Qt.Unchecked)
+            check_item.setData(Qt.UserRole, schedule.get('id'))
+            self.schedule_table.setItem(row, 0, check_item)
+            self.schedule_table.setItem(row, 1, QTableWidgetItem(str(schedule.get('id', ''))))
+            self.schedule_table.setItem(row, 2, QTableWidgetItem(schedule.get('client_name', '') or ''))
+            self.schedule_table.setItem(row, 3, QTableWidgetItem(
+                schedule.get('product_name', '') or schedule.get('title', '') or ''))
+        self.select_all_check.setChecked(False)
+        self.status_label.setText(f"스케줄 {len(schedules)}건")
+
+    def toggle_all(self, checked):
+        state = Qt.Checked if checked else Qt.Unchecked
+        for row in range(self.schedule_table.rowCount()):
+            self.schedule_table.item(row, 0).setCheckState(state)
+
+    def checked_schedule_ids(self):
+        ids = []
+        for row in range(self.schedule_table.rowCount()):
+            item = self.schedule_table.item(row, 0)
+            if item.checkState() == Qt.Checked:
+                ids.append(item.data(Qt.UserRole))
+        return ids
+
+    def select_output_dir(self):
+        from PyQt5.QtWidgets import QFileDialog
+        folder = QFileDialog.getExistingDirectory(self, "저장 폴더 선택", self.output_input.text())
+        if folder:
+            self.output_input.setText(folder)
+
+    def set_running(self, running):
+        self.start_btn.setEnabled(not running)
+        self.cancel_btn.setEnabled(running)
+        self.close_btn.setEnabled(not running)
+        self.schedule_table.setEnabled(not running)
+
+    def start_batch(self):
+        schedule_ids = self.checked_schedule_ids()
+        if not schedule_ids:
+            QMessageBox.warning(self, "선택 오류", "견적서를 생성할 스케줄을 선택해주세요.")
+            return
+
+        send_mail = self.send_mail_check.isChecked()
+        if send_mail:
+            reply = QMessageBox.question(
+                self, "발송 확인",
+                f"{len(schedule_ids)}건의 견적서를 업체 이메일로 발송합니다.\n계속하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
+        self.progress_bar.setValue(0)
+        self.set_running(True)
+        self.worker = EstimateBatchWorker(
+            schedule_ids, self.type_combo.currentData(),
+            self.output_input.text().strip() or None, self.user, send_mail)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.error.connect(self.on_error)
+        self.worker.start()
+
+    def cancel_batch(self):
+        if self.worker:
+            self.worker.cancel()
+            self.status_label.setText("취소 중... (진행 중인 작업 완료 후 중단)")
+
+    def on_progress(self, stage, done, total, message):
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"[{self.STAGE_NAMES.get(stage, stage)}] {done}/{total}  {message}")
+
+    def on_finished(self, result):
+        self.worker = None
+        self.set_running(False)
+
+        lines = [
+            f"선택: {result['total']}건",
+            f"PDF 생성: {result['created']}건 ({result['elapsed']:.1f}초, {result['per_second']:.1f}건/초)",
+        ]
+        if self.send_mail_check.isChecked():
+            lines.append(f"발송 대기열 추가: {result['queued']}건")
+        lines.append(f"저장 폴더: {result['output_dir']}")
+        if result['failed']:
+            lines.append(f"\n실패: {len(result['failed'])}건")
+            for schedule_id, message in result['failed'][:10]:
+                lines.append(f"  - 스케줄 {schedule_id}: {message}")
+            if len(result['failed']) > 10:
+                lines.append(f"  ... 외 {len(result['failed']) - 10}건")
+        self.status_label.setText(f"완료 - PDF {result['created']}건")
+        QMessageBox.information(self, "일괄 처리 완료", '\n'.join(lines))
+
+    def on_error(self, message):
+        self.worker = None
+        self.set_running(False)
+        self.status_label.setText("")
+        QMessageBox.critical(self, "오류", message)
+
+    def reject(self):
+        # 작업 중에는 닫지 않음
+        if self.worker:
+            return
+        super().reject()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+목록 내보내기 작업 스레드 (스케줄 / 업체 / 수수료 / 식품유형 탭 공용)
+- 조회와 파일 기록은 utils.streaming_export로 백그라운드 스레드에서 실행
+- 진행 상황과 결과는 시그널로 GUI 스레드에 전달
+"""
+
+import threading
+
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog, QFileDialog
+
+from utils.streaming_export import write_rows, normalize_export_path, EXPORT_FILE_FILTERS
+
+
+class ExportWorker(QObject):
+    """목록 내보내기 (백그라운드 스레드)"""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(object)  # 기록한 행 수 (취소 시 None)
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path, headers, make_rows, sheet_title=None):
+        """
+        Args:
+            make_rows: 행(값 목록) 생성기를 반환하는 함수 - 작업 스레드에서 호출
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.headers = headers
+        self.make_rows = make_rows
+        self.sheet_title = sheet_title
+        self._cancel_event = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _run(self):
+        try:
+            count = write_rows(self.file_path, self.headers, self.make_rows(),
+                               sheet_title=self.sheet_title,
+                               progress=lambda n: self.progress.emit(f"{n:,}건 저장 중..."),
+                               is_cancelled=self._cancel_event.is_set)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(count)
+
+
+def ask_export_path(parent, default_name=""):
+    """내보내기 파일 경로 선택 (엑셀 / CSV, 취소 시 None)"""
+    file_path, selected_filter = QFileDialog.getSaveFileName(
+        parent, "엑셀 파일 저장", default_name, EXPORT_FILE_FILTERS
+    )
+    if not file_path:
+        return None
+    return normalize_export_path(file_path, selected_filter)
+
+
+def start_export(parent, file_path, headers, make_rows, label, on_done=None):
+    """내보내기 시작 (진행 대화상자 표시, 완료 시 결과 메시지 후 on_done(file_path, count) 호출)
+
+    Args:
+        label: 메시지에 표시할 대상 이름 (예: '업체')
+    """
+    dialog = QProgressDialog(f"{label} 정보 내보내는 중...", "취소", 0, 0, parent)
+    dialog.setWindowTitle("데이터 내보내기")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(0)
+
+    worker = ExportWorker(file_path, headers, make_rows, sheet_title=label)
+    # 작업 중 가비지 컬렉션 방지
+    parent._export_worker = worker
+
+    def finish():
+        parent._export_worker = None
+        dialog.close()
+
+    def on_finished(count):
+        finish()
+        if count is None:
+            return
+        if count == 0:
+            QMessageBox.warning(parent, "데이터 없음", f"내보낼 {label} 정보가 없습니다.")
+            return
+        QMessageBox.information(
+            parent, "내보내기 완료",
+            f"{label} 정보 {count:,}건이 저장되었습니다.\n파일 위치: {file_path}"
+        )
+        if on_done:
+            on_done(file_path, count)
+
+    def on_error(text):
+        finish()
+        QMessageBox.critical(parent, "오류", f"파일로 내보내는 중 오류가 발생했습니다.\n{text}")
+
+    worker.progress.connect(dialog.setLabelText)
+    worker.finished.connect(on_finished)
+    worker.error.connect(on_error)
+    dialog.canceled.connect(worker.cancel)
+    dialog.show()
+    worker.start()
@@ -1,12 +1,15 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                          QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
-                          QFrame, QMessageBox, QFileDialog, QProgressDialog,
+                          QLabel, QHeaderView,
+                          QFrame, QMessageBox, QFileDialog,
                           QDialog, QFormLayout, QLineEdit, QSpinBox, QCheckBox,
                           QComboBox)
-from PyQt5.QtCore import Qt, QCoreApplication, QTimer
-import pandas as pd
+from PyQt5.QtCore import Qt, QTimer
 
 from models.fees import Fee
+from utils.bulk_import import FEE_SPEC
+from .bulk_import_worker import start_excel_import, start_fee_replace
+from .export_worker import ask_export_path, start_export
+from .table_models import RowTableModel, create_list_view
 from utils.logger import log_message, log_error, log_exception
 
 class FeeTab(QWidget):
@@ -61,7 +64,7 @@ class FeeTab(QWidget):
         self._needs_refresh = True
         self._data_loaded = False
         if hasattr(self, 'fee_table') and self.fee_table:
-            self.fee_table.setRowCount(0)
+            self.fee_model.set_rows([])
 
     def apply_permissions(self):
         """사용자 권한에 따라 버튼 활성화/비활성화"""
@@ -211,12 +214,13 @@ class FeeTab(QWidget):
 
         layout.addWidget(search_frame)
 
-        # 2. 수수료 목록 테이블
-        self.fee_table = QTableWidget()
-        self.fee_table.setColumnCount(7)  # 정렬순서 열 추가로 7개 열로 증가
-        self.fee_table.setHorizontalHeaderLabels([
-            "선택", "검사항목", "식품 카테고리", "가격", "검체 수량(g)", "정렬순서", "생성일"
-        ])
+        # 2. 수수료 목록 테이블 (모델/뷰: 화면에 보이는 행만 그림, 검색/정렬은 프록시에서 처리)
+        self.fee_model = RowTableModel([
+            ('select', "선택"), ('test_item', "검사항목"), ('food_category', "식품 카테고리"),
+            ('price', "가격"), ('sample_quantity', "검체 수량(g)"), ('display_order', "정렬순서"),
+            ('created_at', "생성일")
+        ], cell_text=self.list_cell_text, cell_style=self.list_cell_style, check_column=0)
+        self.fee_table, self.fee_proxy = create_list_view(self.fee_model, self)
         # 열 너비 조절 설정
         header = self.fee_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)  # 사용자가 마우스로 조절 가능
@@ -240,35 +244,16 @@ class FeeTab(QWidget):
         }
         for col, width in column_widths.items():
             self.fee_table.setColumnWidth(col, width)
-            
-        self.fee_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.fee_table.setEditTriggers(QTableWidget.NoEditTriggers)
 
-        # 헤더 클릭으로 정렬 기능 활성화
-        self.fee_table.setSortingEnabled(True)
-        self.fee_table.horizontalHeader().setSortIndicatorShown(True)
+        # 헤더 클릭으로 정렬 (프록시 모델에서 정렬)
         self.fee_table.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
 
         layout.addWidget(self.fee_table)
     
     def select_all_rows(self, checked):
-        """모든 행 선택/해제"""
+        """표시 중인 모든 행 선택/해제"""
         try:
-            # 행이 없는 경우 처리
-            if self.fee_table.rowCount() == 0:
-                return
-                
-            for row in range(self.fee_table.rowCount()):
-                checkbox_widget = self.fee_table.cellWidget(row, 0)
-                if checkbox_widget:
-                    # 위젯 내의 체크박스 찾기
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.setChecked(checked)
-                    else:
-                        print(f"행 {row}의 체크박스를 찾을 수 없습니다.")
-                else:
-                    print(f"행 {row}의 위젯을 찾을 수 없습니다.")
+            self.fee_proxy.set_all_checked(checked)
         except Exception as e:
             print(f"전체 선택 중 오류 발생: {str(e)}")
     
@@ -279,64 +264,43 @@ class FeeTab(QWidget):
             raw_fees = Fee.get_all() or []
             # sqlite3.Row를 딕셔너리로 변환하여 .get() 메서드 사용 가능하게 함
             self.all_fees = [dict(f) for f in raw_fees]
+            # 정렬순서가 없으면 목록 순서로 표시 (0도 유효한 값으로 처리)
+            for index, fee in enumerate(self.all_fees):
+                if fee.get('display_order') is None:
+                    fee['display_order'] = index + 1
             self.display_fees(self.all_fees)
             log_message('FeeTab', f'수수료 {len(self.all_fees)}개 로드 완료')
         except Exception as e:
             log_exception('FeeTab', f'수수료 로드 중 오류: {str(e)}')
 
     def display_fees(self, fees):
-        """수수료 목록을 테이블에 표시"""
-        # UI 업데이트 일시 중지 (성능 최적화)
-        self.fee_table.setUpdatesEnabled(False)
+        """수수료 목록을 테이블 모델에 설정 (검색어가 있으면 프록시에서 필터링)"""
         try:
-            self.fee_table.setRowCount(len(fees) if fees else 0)
-
-            if fees:
-                for row, fee in enumerate(fees):
-                    # 체크박스 추가
-                    checkbox = QCheckBox()
-                    checkbox_widget = QWidget()
-                    checkbox_layout = QHBoxLayout(checkbox_widget)
-                    checkbox_layout.addWidget(checkbox)
-                    checkbox_layout.setAlignment(Qt.AlignCenter)
-                    checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                    self.fee_table.setCellWidget(row, 0, checkbox_widget)
-
-                    # 나머지 데이터 설정 (안전한 .get() 사용)
-                    self.fee_table.setItem(row, 1, QTableWidgetItem(str(fee.get('test_item', '') or '')))
-                    self.fee_table.setItem(row, 2, QTableWidgetItem(fee.get('food_category', '') or ""))
-
-                    price = fee.get('price', 0) or 0
-                    price_item = QTableWidgetItem(f"{int(price):,}")
-                    price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.fee_table.setItem(row, 3, price_item)
-
-                    # 검체 수량 표시
-                    sample_qty = fee.get('sample_quantity', 0) or 0
-                    sample_qty_item = QTableWidgetItem(str(sample_qty))
-                    sample_qty_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.fee_table.setItem(row, 4, sample_qty_item)
-
-                    # 정렬순서 설정 (0도 유효한 값으로 처리)
-                    display_order = fee.get('display_order')
-                    if display_order is None:
-                        display_order = row + 1
-                    order_item = QTableWidgetItem(str(display_order))
-                    order_item.setTextAlignment(Qt.AlignCenter)
-                    self.fee_table.setItem(row, 5, order_item)
-
-                    # datetime 객체를 문자열로 변환
-                    created_at = fee.get('created_at', '')
-                    if created_at and not isinstance(created_at, str):
-                        created_at = str(created_at)
-                    self.fee_table.setItem(row, 6, QTableWidgetItem(created_at or ""))
-
+            self.fee_model.set_rows(fees)
+            self.fee_proxy.set_row_filter(self.search_row_filter())
             log_message('FeeTab', f'수수료 {len(fees) if fees else 0}개 표시 완료')
         except Exception as e:
             log_exception('FeeTab', f'수수료 표시 중 오류: {str(e)}')
-        finally:
-            # UI 업데이트 재개
-            self.fee_table.setUpdatesEnabled(True)
+
+    @staticmethod
+    def list_cell_text(fee, key):
+        """목록 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출)"""
+        if key == 'price':
+            return f"{int(fee.get('price', 0) or 0):,}"
+        if key == 'sample_quantity':
+            return str(fee.get('sample_quantity', 0) or 0)
+        value = fee.get(key, '')
+        # datetime 객체 등은 문자열로 변환
+        return str(value) if value is not None and value != '' else ''
+
+    @staticmethod
+    def list_cell_style(fee, key):
+        """가격/검체 수량 오른쪽 정렬, 정렬순서 가운데 정렬"""
+        if key in ('price', 'sample_quantity'):
+            return {'alignment': Qt.AlignRight | Qt.AlignVCenter}
+        if key == 'display_order':
+            return {'alignment': Qt.AlignCenter}
+        return None
 
     def get_chosung(self, text):
         """문자열에서 초성 추출"""
@@ -368,58 +332,49 @@ class FeeTab(QWidget):
         self.search_timer.start(300)  # 300ms 후 필터링 실행
 
     def filter_fees(self):
-        """실시간 검색 필터링 (초성 검색 지원)"""
+        """실시간 검색 필터링 (초성 검색 지원, 목록을 다시 만들지 않고 프록시에서 필터링)"""
         try:
             search_text = self.search_input.text().strip()
-            search_field = self.search_field_combo.currentText()
-
-            if not search_text:
-                self.display_fees(self.all_fees)
-                return
-
-            log_message('FeeTab', f'수수료 검색 시작: "{search_text}" (필드: {search_field})')
-
-            filtered = []
-            is_chosung = self.is_chosung_only(search_text)
-
-            for fee in self.all_fees:
-                test_item = fee.get('test_item', '') or ''
-                food_category = fee.get('food_category', '') or ''
-
-                match = False
-
-                if search_field == "전체":
-                    if is_chosung:
-                        match = (self.match_chosung(test_item, search_text) or
-                                 self.match_chosung(food_category, search_text))
-                    else:
-                        search_lower = search_text.lower()
-                        match = (search_lower in test_item.lower() or
-                                 search_lower in food_category.lower())
-                elif search_field == "검사항목":
-                    if is_chosung:
-                        match = self.match_chosung(test_item, search_text)
-                    else:
-                        match = search_text.lower() in test_item.lower()
-                elif search_field == "식품 카테고리":
-                    if is_chosung:
-                        match = self.match_chosung(food_category, search_text)
-                    else:
-                        match = search_text.lower() in food_category.lower()
-
-                if match:
-                    filtered.append(fee)
-
-            log_message('FeeTab', f'수수료 검색 완료: {len(filtered)}개 결과')
-            self.display_fees(filtered)
+            if search_text:
+                log_message('FeeTab', f'수수료 검색: "{search_text}" (필드: {self.search_field_combo.currentText()})')
+            self.fee_proxy.set_row_filter(self.search_row_filter())
+            if search_text:
+                log_message('FeeTab', f'수수료 검색 완료: {self.fee_proxy.rowCount()}개 결과')
         except Exception as e:
             log_exception('FeeTab', f'수수료 검색 중 오류: {str(e)}')
 
+    def search_row_filter(self):
+        """검색어가 있으면 테이블 프록시용 행 필터 함수 반환 (없으면 None)"""
+        search_text = self.search_input.text().strip() if hasattr(self, 'search_input') else ''
+        if not search_text:
+            return None
+        search_field = self.search_field_combo.currentText()
+        is_chosung = self.is_chosung_only(search_text)
+        search_lower = search_text.lower()
+
+        def matches(text):
+            if is_chosung:
+                return self.match_chosung(text, search_text)
+            return search_lower in text.lower()
+
+        def match(fee):
+            test_item = fee.get('test_item', '') or ''
+            food_category = fee.get('food_category', '') or ''
+            if search_field == "전체":
+                return matches(test_item) or matches(food_category)
+            if search_field == "검사항목":
+                return matches(test_item)
+            if search_field == "식품 카테고리":
+                return matches(food_category)
+            return False
+
+        return match
+
     def reset_search(self):
         """검색 초기화"""
         self.search_input.clear()
         self.search_field_combo.setCurrentIndex(0)
-        self.display_fees(self.all_fees)
+        self.fee_proxy.set_row_filter(None)
 
     def on_header_clicked(self, logical_index):
         """헤더 클릭 시 해당 컬럼으로 정렬"""
@@ -438,7 +393,7 @@ class FeeTab(QWidget):
             self.current_sort_order = Qt.AscendingOrder
 
         # 정렬 실행
-        self.fee_table.sortItems(logical_index, self.current_sort_order)
+        self.fee_table.sortByColumn(logical_index, self.current_sort_order)
     
     def create_new_fee(self):
         """새 수수료 등록"""
@@ -448,26 +403,18 @@ class FeeTab(QWidget):
     
     def edit_fee(self):
         """수수료 정보 수정"""
-        # 체크박스가 선택된 행 찾기
-        selected_row = -1
-        for row in range(self.fee_table.rowCount()):
-            checkbox_widget = self.fee_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_row = row
-                    break
-        
-        if selected_row == -1:
+        # 체크박스가 선택된 첫 번째 수수료
+        checked_fees = self.fee_proxy.checked_rows()
+        if not checked_fees:
             QMessageBox.warning(self, "선택 오류", "수정할 수수료를 선택하세요.")
             return
 
         # 선택된 행의 데이터 가져오기
-        test_item_cell = self.fee_table.item(selected_row, 1)
-        if not test_item_cell:
+        selected_fee = checked_fees[0]
+        test_item = str(selected_fee.get('test_item', '') or '')
+        if not test_item:
             QMessageBox.warning(self, "데이터 오류", "검사항목을 찾을 수 없습니다.")
             return
-        test_item = test_item_cell.text()
         
         # 해당 수수료 정보 가져오기
         fee = Fee.get_by_item(test_item)
@@ -475,22 +422,12 @@ class FeeTab(QWidget):
             QMessageBox.warning(self, "데이터 오류", "선택한 수수료 정보를 찾을 수 없습니다.")
             return
         
-        # 정렬순서 값 가져오기
-        order_item = self.fee_table.item(selected_row, 5)
-        if order_item and order_item.text():
-            try:
-                # 딕셔너리로 변환하여 display_order 추가
-                fee_dict = dict(fee)
-                fee_dict['display_order'] = int(order_item.text())
-                fee = fee_dict
-            except ValueError:
-                fee_dict = dict(fee)
-                fee_dict['display_order'] = selected_row + 1
-                fee = fee_dict
-        else:
-            fee_dict = dict(fee)
-            fee_dict['display_order'] = selected_row + 1
-            fee = fee_dict
+        # 정렬순서 값 (목록에 표시된 값)
+        fee = dict(fee)
+        try:
+            fee['display_order'] = int(selected_fee.get('display_order'))
+        except (ValueError, TypeError):
+            fee['display_order'] = self.fee_model.rows.index(selected_fee) + 1
         
         # 수정 다이얼로그 표시
         dialog = FeeDialog(self, fee)
@@ -499,14 +436,8 @@ class FeeTab(QWidget):
     
     def delete_fee(self):
         """수수료 삭제"""
-        # 체크박스가 선택된 모든 행 찾기
-        selected_rows = []
-        for row in range(self.fee_table.rowCount()):
-            checkbox_widget = self.fee_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_rows.append(row)
+        # 체크박스가 선택된 모든 수수료 (검색으로 숨겨진 행 제외)
+        selected_rows = self.fee_proxy.checked_rows()
         
         if not selected_rows:
             QMessageBox.warning(self, "선택 오류", "삭제할 수수료를 선택하세요.")
@@ -523,27 +454,25 @@ class FeeTab(QWidget):
         
         if reply == QMessageBox.Yes:
             deleted_count = 0
-            # 선택된 행의 역순으로 삭제 (인덱스 변화 방지)
-            for row in sorted(selected_rows, reverse=True):
-                test_item_cell = self.fee_table.item(row, 1)
-                if not test_item_cell:
+            for selected_fee in selected_rows:
+                test_item = str(selected_fee.get('test_item', '') or '')
+                if not test_item:
                     continue
-                test_item = test_item_cell.text()
 
                 # 해당 수수료 정보 가져오기
                 fee = Fee.get_by_item(test_item)
                 if fee and Fee.delete(fee['id']):
-                    self.fee_table.removeRow(row)
                     deleted_count += 1
             
-            # 삭제 결과 메시지
+            # 삭제 결과 메시지 (목록은 다시 불러오고 검색 조건은 유지)
             if deleted_count > 0:
+                self.load_fees()
                 QMessageBox.information(self, "삭제 완료", f"{deleted_count}개의 수수료가 삭제되었습니다.")
             else:
                 QMessageBox.warning(self, "삭제 실패", "수수료 삭제 중 오류가 발생했습니다.")
     
     def import_from_excel(self):
-        """엑셀 파일에서 수수료 정보 가져오기"""
+        """엑셀 파일에서 수수료 정보 가져오기 (작업 스레드에서 일괄 저장)"""
         # 파일 선택 대화상자 표시
         file_path, _ = QFileDialog.getOpenFileName(
             self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls);;All Files (*)"
@@ -552,176 +481,45 @@ class FeeTab(QWidget):
         if not file_path:
             return
         
-        try:
-            # 엑셀 파일 읽기
-            df = pd.read_excel(file_path)
-            
-            # 필수 열 확인
-            required_columns = ["검사항목", "가격"]
-            for col in required_columns:
-                if col not in df.columns:
-                    QMessageBox.warning(self, "파일 오류", f"엑셀 파일에 '{col}' 열이 없습니다.")
-                    return
-            
-            # 컬럼 매핑 (엑셀 컬럼명 -> DB 필드명)
-            column_mapping = {
-                "검사항목": "test_item",
-                "식품 카테고리": "food_category",
-                "가격": "price",
-                "검체 수량(g)": "sample_quantity",
-                "정렬순서": "display_order"
-            }
-            
-            # 진행 상황 대화상자 표시
-            progress = QProgressDialog("수수료 정보 가져오는 중...", "취소", 0, len(df), self)
-            progress.setWindowTitle("데이터 가져오기")
-            progress.setWindowModality(Qt.WindowModal)
-            progress.show()
-            
-            # 각 행 처리
-            imported_count = 0
-            updated_count = 0
-            skipped_count = 0
-            
-            for i, row in df.iterrows():
-                # 진행 상황 업데이트
-                progress.setValue(i)
-                QCoreApplication.processEvents()
-                
-                # 사용자 취소 확인
-                if progress.wasCanceled():
-                    break
-                
-                # 필수 필드가 비어있는지 확인
-                if pd.isna(row["검사항목"]) or str(row["검사항목"]).strip() == "" or pd.isna(row["가격"]):
-                    skipped_count += 1
-                    continue
-                
-                # 데이터 준비
-                fee_data = {}
-                for excel_col, db_field in column_mapping.items():
-                    if excel_col in df.columns and not pd.isna(row[excel_col]):
-                        if excel_col == "가격":
-                            fee_data[db_field] = int(float(row[excel_col]))
-                        elif excel_col == "정렬순서":
-                            fee_data[db_field] = int(float(row[excel_col]))
-                        elif excel_col == "검체 수량(g)":
-                            fee_data[db_field] = int(float(row[excel_col]))
-                        else:
-                            fee_data[db_field] = str(row[excel_col]).strip()
-                    else:
-                        if excel_col == "가격":
-                            fee_data[db_field] = 0
-                        elif excel_col == "정렬순서":
-                            fee_data[db_field] = i + 1
-                        elif excel_col == "검체 수량(g)":
-                            fee_data[db_field] = 0
-                        else:
-                            fee_data[db_field] = ""
-                
-                # 이미 존재하는 수수료인지 확인
-                existing_fee = Fee.get_by_item(fee_data["test_item"])
-                
-                if existing_fee:
-                    # 기존 수수료 정보 업데이트
-                    if Fee.update(
-                        existing_fee["id"],
-                        fee_data["test_item"],
-                        fee_data.get("food_category", ""),
-                        fee_data.get("price", 0),
-                        "",  # description
-                        fee_data.get("display_order", i + 1),
-                        fee_data.get("sample_quantity", 0)
-                    ):
-                        updated_count += 1
-                else:
-                    # 새 수수료 생성
-                    if Fee.create(
-                        fee_data["test_item"],
-                        fee_data.get("food_category", ""),
-                        fee_data.get("price", 0),
-                        "",  # description
-                        fee_data.get("display_order", i + 1),
-                        fee_data.get("sample_quantity", 0)
-                    ):
-                        imported_count += 1
-            
-            # 진행 상황 대화상자 종료
-            progress.setValue(len(df))
-            
-            # 테이블 새로고침
-            self.load_fees()
-            
-            # 결과 메시지 표시
-            QMessageBox.information(
-                self, "가져오기 완료",
-                f"수수료 정보 가져오기가 완료되었습니다.\n"
-                f"- 새로 추가된 항목: {imported_count}개\n"
-                f"- 업데이트된 항목: {updated_count}개\n"
-                f"- 건너뛴 항목: {skipped_count}개"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일을 처리하는 중 오류가 발생했습니다.\n{str(e)}")
+        # 전체 교체: 엑셀에 없는 수수료는 삭제 / 추가·수정: 기존 수수료 유지
+        box = QMessageBox(QMessageBox.Question, "가져오기 방식",
+                          "수수료를 어떻게 가져올까요?\n\n"
+                          "전체 교체: 엑셀 내용으로 수수료 목록을 바꿉니다 (엑셀에 없는 항목은 삭제).\n"
+                          "추가/수정: 검사항목이 같으면 수정하고 나머지는 추가합니다.",
+                          QMessageBox.NoButton, self)
+        replace_btn = box.addButton("전체 교체", QMessageBox.AcceptRole)
+        upsert_btn = box.addButton("추가/수정", QMessageBox.AcceptRole)
+        box.addButton("취소", QMessageBox.RejectRole)
+        box.exec_()
+
+        if box.clickedButton() == replace_btn:
+            start_fee_replace(self, file_path, self.load_fees)
+        elif box.clickedButton() == upsert_btn:
+            start_excel_import(self, file_path, FEE_SPEC, Fee.bulk_upsert, self.load_fees)
     
     def export_to_excel(self):
-        """수수료 정보를 엑셀 파일로 내보내기"""
-        # 파일 저장 대화상자 표시
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "엑셀 파일 저장", "", "Excel Files (*.xlsx);;All Files (*)"
-        )
-        
+        """수수료 정보를 엑셀/CSV 파일로 내보내기 (작업 스레드에서 한 행씩 기록)"""
+        file_path = ask_export_path(self)
         if not file_path:
             return
-        
-        # 파일 확장자 확인 및 추가
-        if not file_path.lower().endswith('.xlsx'):
-            file_path += '.xlsx'
-        
-        try:
-            # DB에서 모든 수수료 정보 가져오기
-            fees = Fee.get_all()
-            
-            if not fees:
-                QMessageBox.warning(self, "데이터 없음", "내보낼 수수료 정보가 없습니다.")
-                return
-            
-            # 데이터 변환
-            data = []
-            for i, fee in enumerate(fees):
-                # sqlite3.Row 객체를 딕셔너리로 변환
-                fee_dict = dict(fee)
-                
-                # 정렬순서 필드가 없으면 기본값 추가
-                if 'display_order' not in fee_dict:
-                    fee_dict['display_order'] = i + 1
-                
-                # datetime 객체를 문자열로 변환
-                created_at_val = fee_dict["created_at"]
-                if created_at_val and not isinstance(created_at_val, str):
-                    created_at_val = str(created_at_val)
-                data.append({
-                    "검사항목": fee_dict["test_item"],
-                    "식품 카테고리": fee_dict["food_category"] or "",
-                    "가격": fee_dict["price"],
-                    "검체 수량(g)": fee_dict.get("sample_quantity", "") or "",  # 수정: description -> sample_quantity
-                    "정렬순서": fee_dict["display_order"],
-                    "생성일": created_at_val or ""
-                })
-            
-            # DataFrame 생성 및 엑셀 파일로 저장
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False)
-            
-            # 성공 메시지
-            QMessageBox.information(
-                self, "내보내기 완료", 
-                f"수수료 정보가 엑셀 파일로 저장되었습니다.\n파일 위치: {file_path}"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일로 내보내는 중 오류가 발생했습니다.\n{str(e)}")
-            
+
+        headers = ["검사항목", "식품 카테고리", "가격", "검체 수량(g)", "정렬순서", "생성일"]
+
+        def make_rows():
+            # 카탈로그 캐시의 수수료 목록 (DB 조회 없음)
+            for i, fee in enumerate(Fee.get_all()):
+                created_at = fee.get("created_at")
+                yield [
+                    fee["test_item"],
+                    fee.get("food_category") or "",
+                    fee.get("price"),
+                    fee.get("sample_quantity") or "",
+                    fee.get("display_order", i + 1),
+                    str(created_at) if created_at else "",
+                ]
+
+        start_export(self, file_path, headers, make_rows, "수수료")
+
 class FeeDialog(QDialog):
     def __init__(self, parent=None, fee=None):
         super().__init__(parent)
@@ -1,13 +1,17 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                          QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
-                          QFrame, QMessageBox, QFileDialog, QProgressDialog,
+                          QLabel, QHeaderView,
+                          QFrame, QMessageBox, QFileDialog,
                           QDialog, QFormLayout, QLineEdit, QCheckBox, QApplication,
                           QComboBox)
-from PyQt5.QtCore import Qt, QCoreApplication, QTimer
+from PyQt5.QtCore import Qt, QTimer
 import pandas as pd
 import os
 
 from models.product_types import ProductType
+from utils.bulk_import import FOOD_TYPE_SPEC
+from .bulk_import_worker import start_excel_import
+from .export_worker import ask_export_path, start_export
+from .table_models import RowTableModel, create_list_view
 from database import get_connection
 from utils.logger import log_message, log_error, log_exception
 
@@ -66,7 +70,7 @@ class FoodTypeTab(QWidget):
         self._needs_refresh = True
         self._data_loaded = False
         if hasattr(self, 'food_type_table') and self.food_type_table:
-            self.food_type_table.setRowCount(0)
+            self.food_type_model.set_rows([])
 
     def apply_permissions(self):
         """사용자 권한에 따라 버튼 활성화/비활성화"""
@@ -253,12 +257,13 @@ class FoodTypeTab(QWidget):
 
         layout.addWidget(search_frame)
 
-        # 2. 식품유형 목록 테이블
-        self.food_type_table = QTableWidget()
-        self.food_type_table.setColumnCount(8)  # 8개 열 (검사항목 필드 추가)
-        self.food_type_table.setHorizontalHeaderLabels([
-            "선택", "식품유형", "카테고리", "단서조항_1", "단서조항_2", "성상", "검사항목", "생성일"
-        ])
+        # 2. 식품유형 목록 테이블 (모델/뷰: 화면에 보이는 행만 그림, 검색/정렬은 프록시에서 처리)
+        self.food_type_model = RowTableModel([
+            ('select', "선택"), ('type_name', "식품유형"), ('category', "카테고리"),
+            ('sterilization', "단서조항_1"), ('pasteurization', "단서조항_2"), ('appearance', "성상"),
+            ('test_items', "검사항목"), ('created_at', "생성일")
+        ], cell_text=self.list_cell_text, check_column=0)
+        self.food_type_table, self.food_type_proxy = create_list_view(self.food_type_model, self)
         
         # 열 너비 조절 설정
         header = self.food_type_table.horizontalHeader()
@@ -281,35 +286,16 @@ class FoodTypeTab(QWidget):
         }
         for col, width in column_widths.items():
             self.food_type_table.setColumnWidth(col, width)
-            
-        self.food_type_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.food_type_table.setEditTriggers(QTableWidget.NoEditTriggers)
 
-        # 헤더 클릭으로 정렬 기능 활성화
-        self.food_type_table.setSortingEnabled(True)
-        self.food_type_table.horizontalHeader().setSortIndicatorShown(True)
+        # 헤더 클릭으로 정렬 (프록시 모델에서 정렬)
         self.food_type_table.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
 
         layout.addWidget(self.food_type_table)
     
     def select_all_rows(self, checked):
-        """모든 행 선택/해제"""
+        """표시 중인 모든 행 선택/해제"""
         try:
-            # 행이 없는 경우 처리
-            if self.food_type_table.rowCount() == 0:
-                return
-                
-            for row in range(self.food_type_table.rowCount()):
-                checkbox_widget = self.food_type_table.cellWidget(row, 0)
-                if checkbox_widget:
-                    # 위젯 내의 체크박스 찾기
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.setChecked(checked)
-                    else:
-                        print(f"행 {row}의 체크박스를 찾을 수 없습니다.")
-                else:
-                    print(f"행 {row}의 위젯을 찾을 수 없습니다.")
+            self.food_type_proxy.set_all_checked(checked)
         except Exception as e:
             print(f"전체 선택 중 오류 발생: {str(e)}")
     
@@ -327,38 +313,15 @@ class FoodTypeTab(QWidget):
             QMessageBox.critical(self, "오류", f"식품유형 로드 중 오류 발생: {str(e)}")
 
     def display_food_types(self, food_types):
-        """식품유형 목록을 테이블에 표시"""
-        # UI 업데이트 일시 중지 (성능 최적화)
-        self.food_type_table.setUpdatesEnabled(False)
-        try:
-            self.food_type_table.setRowCount(len(food_types) if food_types else 0)
-
-            if food_types:
-                for row, food_type in enumerate(food_types):
-                    # 체크박스 추가
-                    checkbox = QCheckBox()
-                    checkbox_widget = QWidget()
-                    checkbox_layout = QHBoxLayout(checkbox_widget)
-                    checkbox_layout.addWidget(checkbox)
-                    checkbox_layout.setAlignment(Qt.AlignCenter)
-                    checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                    self.food_type_table.setCellWidget(row, 0, checkbox_widget)
-
-                    # 나머지 데이터 설정
-                    self.food_type_table.setItem(row, 1, QTableWidgetItem(str(food_type['type_name'] or '')))
-                    self.food_type_table.setItem(row, 2, QTableWidgetItem(food_type['category'] or ""))
-                    self.food_type_table.setItem(row, 3, QTableWidgetItem(food_type['sterilization'] or ""))
-                    self.food_type_table.setItem(row, 4, QTableWidgetItem(food_type['pasteurization'] or ""))
-                    self.food_type_table.setItem(row, 5, QTableWidgetItem(food_type['appearance'] or ""))
-                    self.food_type_table.setItem(row, 6, QTableWidgetItem(food_type['test_items'] or ""))
-                    # datetime 객체를 문자열로 변환
-                    created_at = food_type['created_at']
-                    if created_at:
-                        created_at = str(created_at) if not isinstance(created_at, str) else created_at
-                    self.food_type_table.setItem(row, 7, QTableWidgetItem(created_at or ""))
-        finally:
-            # UI 업데이트 재개
-            self.food_type_table.setUpdatesEnabled(True)
+        """식품유형 목록을 테이블 모델에 설정 (검색어가 있으면 프록시에서 필터링)"""
+        self.food_type_model.set_rows(food_types)
+        self.food_type_proxy.set_row_filter(self.search_row_filter())
+
+    @staticmethod
+    def list_cell_text(food_type, key):
+        """목록 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출, datetime은 문자열로 변환)"""
+        value = food_type.get(key)
+        return str(value) if value else ''
 
     def get_chosung(self, text):
         """문자열에서 초성 추출"""
@@ -394,64 +357,47 @@ class FoodTypeTab(QWidget):
         self.search_timer.start(300)  # 300ms 후 필터링 실행
 
     def filter_food_types(self):
-        """실시간 검색 필터링 (초성 검색 지원)"""
+        """실시간 검색 필터링 (초성 검색 지원, 목록을 다시 만들지 않고 프록시에서 필터링)"""
         try:
-            search_text = self.search_input.text().strip()
-            search_field = self.search_field_combo.currentText()
-
-            if not search_text:
-                self.display_food_types(self.all_food_types)
-                return
-
-            filtered = []
-            is_chosung = self.is_chosung_only(search_text)
-
-            for food_type in self.all_food_types:
-                # 안전한 값 접근 (딕셔너리로 변환됨)
-                type_name = str(food_type.get('type_name', '') or '')
-                category = str(food_type.get('category', '') or '')
-                test_items = str(food_type.get('test_items', '') or '')
-
-                match = False
-
-                if search_field == "전체":
-                    if is_chosung:
-                        match = (self.match_chosung(type_name, search_text) or
-                                 self.match_chosung(category, search_text) or
-                                 self.match_chosung(test_items, search_text))
-                    else:
-                        search_lower = search_text.lower()
-                        match = (search_lower in type_name.lower() or
-                                 search_lower in category.lower() or
-                                 search_lower in test_items.lower())
-                elif search_field == "식품유형":
-                    if is_chosung:
-                        match = self.match_chosung(type_name, search_text)
-                    else:
-                        match = search_text.lower() in type_name.lower()
-                elif search_field == "카테고리":
-                    if is_chosung:
-                        match = self.match_chosung(category, search_text)
-                    else:
-                        match = search_text.lower() in category.lower()
-                elif search_field == "검사항목":
-                    if is_chosung:
-                        match = self.match_chosung(test_items, search_text)
-                    else:
-                        match = search_text.lower() in test_items.lower()
-
-                if match:
-                    filtered.append(food_type)
-
-            self.display_food_types(filtered)
+            self.food_type_proxy.set_row_filter(self.search_row_filter())
         except Exception as e:
             log_exception('FoodTypeTab', f'검색 필터링 중 오류: {str(e)}')
 
+    def search_row_filter(self):
+        """검색어가 있으면 테이블 프록시용 행 필터 함수 반환 (없으면 None)"""
+        search_text = self.search_input.text().strip() if hasattr(self, 'search_input') else ''
+        if not search_text:
+            return None
+        search_field = self.search_field_combo.currentText()
+        is_chosung = self.is_chosung_only(search_text)
+        search_lower = search_text.lower()
+
+        def matches(text):
+            if is_chosung:
+                return self.match_chosung(text, search_text)
+            return search_lower in text.lower()
+
+        def match(food_type):
+            type_name = str(food_type.get('type_name', '') or '')
+            category = str(food_type.get('category', '') or '')
+            test_items = str(food_type.get('test_items', '') or '')
+            if search_field == "전체":
+                return matches(type_name) or matches(category) or matches(test_items)
+            if search_field == "식품유형":
+                return matches(type_name)
+            if search_field == "카테고리":
+                return matches(category)
+            if search_field == "검사항목":
+                return matches(test_items)
+            return False
+
+        return match
+
     def reset_search(self):
         """검색 초기화"""
         self.search_input.clear()
         self.search_field_combo.setCurrentIndex(0)
-        self.display_food_types(self.all_food_types)
+        self.food_type_proxy.set_row_filter(None)
 
     def on_header_clicked(self, logical_index):
         """헤더 클릭 시 해당 컬럼으로 정렬"""
@@ -470,7 +416,7 @@ class FoodTypeTab(QWidget):
             self.current_sort_order = Qt.AscendingOrder
 
         # 정렬 실행
-        self.food_type_table.sortItems(logical_index, self.current_sort_order)
+        self.food_type_table.sortByColumn(logical_index, self.current_sort_order)
 
     def create_new_food_type(self):
         """새 식품유형 등록"""
@@ -488,27 +434,18 @@ class FoodTypeTab(QWidget):
         """식품유형 정보 수정"""
         try:
             log_message('FoodTypeTab', '식품유형 수정 시작')
-            # 체크박스가 선택된 행 찾기
-            selected_row = -1
-            for row in range(self.food_type_table.rowCount()):
-                checkbox_widget = self.food_type_table.cellWidget(row, 0)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox and checkbox.isChecked():
-                        selected_row = row
-                        break
-
-            if selected_row == -1:
+            # 체크박스가 선택된 첫 번째 식품유형
+            checked_food_types = self.food_type_proxy.checked_rows()
+            if not checked_food_types:
                 log_message('FoodTypeTab', '수정할 식품유형이 선택되지 않음', 'WARNING')
                 QMessageBox.warning(self, "선택 오류", "수정할 식품유형을 선택하세요.")
                 return
 
             # 선택된 행의 데이터 가져오기
-            type_name_item = self.food_type_table.item(selected_row, 1)
-            if not type_name_item:
+            type_name = str(checked_food_types[0].get('type_name', '') or '')
+            if not type_name:
                 QMessageBox.warning(self, "데이터 오류", "식품유형명을 찾을 수 없습니다.")
                 return
-            type_name = type_name_item.text()
             log_message('FoodTypeTab', f"식품유형 '{type_name}' 수정 시도")
 
             # 해당 식품유형 정보 가져오기
@@ -534,14 +471,8 @@ class FoodTypeTab(QWidget):
     
     def delete_food_type(self):
         """식품유형 삭제"""
-        # 체크박스가 선택된 모든 행 찾기
-        selected_rows = []
-        for row in range(self.food_type_table.rowCount()):
-            checkbox_widget = self.food_type_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_rows.append(row)
+        # 체크박스가 선택된 모든 식품유형 (검색으로 숨겨진 행 제외)
+        selected_rows = self.food_type_proxy.checked_rows()
         
         if not selected_rows:
             QMessageBox.warning(self, "선택 오류", "삭제할 식품유형을 선택하세요.")
@@ -558,21 +489,19 @@ class FoodTypeTab(QWidget):
         
         if reply == QMessageBox.Yes:
             deleted_count = 0
-            # 선택된 행의 역순으로 삭제 (인덱스 변화 방지)
-            for row in sorted(selected_rows, reverse=True):
-                type_name_item = self.food_type_table.item(row, 1)
-                if not type_name_item:
+            for selected_food_type in selected_rows:
+                type_name = str(selected_food_type.get('type_name', '') or '')
+                if not type_name:
                     continue
-                type_name = type_name_item.text()
 
                 # 해당 식품유형 정보 가져오기
                 food_type = ProductType.get_by_name(type_name)
                 if food_type and ProductType.delete(food_type['id']):
-                    self.food_type_table.removeRow(row)
                     deleted_count += 1
             
-            # 삭제 결과 메시지
+            # 삭제 결과 메시지 (목록은 다시 불러오고 검색 조건은 유지)
             if deleted_count > 0:
+                self.load_food_types()
                 QMessageBox.information(self, "삭제 완료", f"{deleted_count}개의 식품유형이 삭제되었습니다.")
             else:
                 QMessageBox.warning(self, "삭제 실패", "식품유형 삭제 중 오류가 발생했습니다.")
@@ -623,7 +552,6 @@ class FoodTypeTab(QWidget):
                 conn.close()
 
                 # 테이블 갱신
-                self.food_type_table.setRowCount(0)
                 self.load_food_types()
 
                 log_message('FoodTypeTab', f'식품유형 전체 초기화 완료: {len(backup_data)}개 항목 삭제')
@@ -749,7 +677,7 @@ class FoodTypeTab(QWidget):
             QMessageBox.critical(self, "업데이트 실패", f"데이터 업데이트 중 오류가 발생했습니다:\n{str(e)}")
     
     def import_from_excel(self):
-        """엑셀 파일에서 식품유형 정보 가져오기"""
+        """엑셀 파일에서 식품유형 정보 가져오기 (작업 스레드에서 일괄 저장)"""
         # 파일 선택 대화상자 표시
         file_path, _ = QFileDialog.getOpenFileName(
             self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls);;All Files (*)"
@@ -758,196 +686,32 @@ class FoodTypeTab(QWidget):
         if not file_path:
             return
         
-        try:
-            # 엑셀 파일 읽기
-            df = pd.read_excel(file_path)
-            
-            # 열 이름 표준화 함수
-            def normalize_column_name(name):
-                if isinstance(name, str):
-                    return name.lower().replace(" ", "")
-                return ""
-            
-            # 표준화된 열 이름으로 매핑 생성
-            normalized_columns = {normalize_column_name(col): col for col in df.columns}
-            
-            # 필수 열 확인
-            required_column = "식품유형"
-            required_normalized = normalize_column_name(required_column)
-            
-            if required_normalized not in normalized_columns.keys():
-                QMessageBox.warning(self, "파일 오류", f"엑셀 파일에 '{required_column}' 열이 없습니다.")
-                return
-            
-            actual_required_col = normalized_columns[required_normalized]
-            
-            # 컬럼 매핑 (엑셀 컬럼명 -> DB 필드명)
-            column_mapping = {
-                "식품유형": "type_name",
-                "카테고리": "category",
-                "단서조항_1": "sterilization",
-                "단서조항_2": "pasteurization",
-                "성상": "appearance",
-                "검사항목": "test_items"
-            }
-            
-            # 표준화된 컬럼 매핑 생성
-            normalized_mapping = {normalize_column_name(k): v for k, v in column_mapping.items()}
-            
-            # 디버깅 - 엑셀 열 이름 및 정규화된 매핑 출력
-            print("엑셀 원본 열 이름:", df.columns.tolist())
-            print("정규화된 열 이름 매핑:", normalized_columns)
-            print("정규화된 컬럼 매핑:", normalized_mapping)
-            
-            # 진행 상황 대화상자 표시
-            progress = QProgressDialog("식품유형 정보 가져오는 중...", "취소", 0, len(df), self)
-            progress.setWindowTitle("데이터 가져오기")
-            progress.setWindowModality(Qt.WindowModal)
-            progress.show()
-            
-            # 각 행 처리
-            imported_count = 0
-            updated_count = 0
-            skipped_count = 0
-            
-            for i, row in df.iterrows():
-                # 진행 상황 업데이트
-                progress.setValue(i)
-                QCoreApplication.processEvents()
-                
-                # 사용자 취소 확인
-                if progress.wasCanceled():
-                    break
-                
-                # 필수 필드가 비어있는지 확인
-                if pd.isna(row[actual_required_col]) or str(row[actual_required_col]).strip() == "":
-                    skipped_count += 1
-                    continue
-                
-                # 데이터 준비
-                food_type_data = {}
-                food_type_data["type_name"] = str(row[actual_required_col]).strip()
-                
-                # 디버깅 - 현재 처리 중인 행 정보 출력
-                print(f"\n처리 중인 행 {i+1}: 식품유형 = {food_type_data['type_name']}")
-                
-                # 다른 필드 처리
-                for excel_col, db_field in column_mapping.items():
-                    if excel_col == "식품유형":  # 이미 처리함
-                        continue
-                        
-                    norm_excel_col = normalize_column_name(excel_col)
-                    if norm_excel_col in normalized_columns:
-                        actual_col = normalized_columns[norm_excel_col]
-                        if actual_col in row and not pd.isna(row[actual_col]):
-                            food_type_data[db_field] = str(row[actual_col]).strip()
-                            print(f"  - {excel_col}({actual_col}) -> {db_field}: {food_type_data[db_field]}")
-                        else:
-                            food_type_data[db_field] = ""
-                            print(f"  - {excel_col}({actual_col}) -> {db_field}: 값 없음")
-                    else:
-                        food_type_data[db_field] = ""
-                        print(f"  - {excel_col} 열을 찾을 수 없음")
-                
-                # 이미 존재하는 식품유형인지 확인
-                existing_type = ProductType.get_by_name(food_type_data["type_name"])
-                
-                if existing_type:
-                    # 기존 식품유형 정보 업데이트
-                    print(f"  -> 기존 항목 업데이트: ID = {existing_type['id']}")
-                    if ProductType.update(
-                        existing_type["id"],
-                        food_type_data["type_name"],
-                        food_type_data.get("category", ""),
-                        food_type_data.get("sterilization", ""),
-                        food_type_data.get("pasteurization", ""),
-                        food_type_data.get("appearance", ""),
-                        food_type_data.get("test_items", "")
-                    ):
-                        updated_count += 1
-                else:
-                    # 새 식품유형 생성
-                    print(f"  -> 새 항목 추가")
-                    if ProductType.create(
-                        food_type_data["type_name"],
-                        food_type_data.get("category", ""),
-                        food_type_data.get("sterilization", ""),
-                        food_type_data.get("pasteurization", ""),
-                        food_type_data.get("appearance", ""),
-                        food_type_data.get("test_items", "")
-                    ):
-                        imported_count += 1
-            
-            # 진행 상황 대화상자 종료
-            progress.setValue(len(df))
-            
-            # 테이블 새로고침
-            self.load_food_types()
-            
-            # 결과 메시지 표시
-            QMessageBox.information(
-                self, "가져오기 완료",
-                f"식품유형 정보 가져오기가 완료되었습니다.\n"
-                f"- 새로 추가된 항목: {imported_count}개\n"
-                f"- 업데이트된 항목: {updated_count}개\n"
-                f"- 건너뛴 항목: {skipped_count}개"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일을 처리하는 중 오류가 발생했습니다.\n{str(e)}")
+        start_excel_import(self, file_path, FOOD_TYPE_SPEC, ProductType.bulk_upsert, self.load_food_types)
     
     def export_to_excel(self):
-        """식품유형 정보를 엑셀 파일로 내보내기"""
-        # 파일 저장 대화상자 표시
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "엑셀 파일 저장", "", "Excel Files (*.xlsx);;All Files (*)"
-        )
-        
+        """식품유형 정보를 엑셀/CSV 파일로 내보내기 (작업 스레드에서 한 행씩 기록)"""
+        file_path = ask_export_path(self)
         if not file_path:
             return
-        
-        # 파일 확장자 확인 및 추가
-        if not file_path.lower().endswith('.xlsx'):
-            file_path += '.xlsx'
-        
-        try:
-            # DB에서 모든 식품유형 정보 가져오기
-            food_types = ProductType.get_all()
-            
-            if not food_types:
-                QMessageBox.warning(self, "데이터 없음", "내보낼 식품유형 정보가 없습니다.")
-                return
-            
-            # 데이터 변환
-            data = []
-            for food_type in food_types:
-                # datetime 객체를 문자열로 변환
-                created_at_val = food_type["created_at"]
-                if created_at_val and not isinstance(created_at_val, str):
-                    created_at_val = str(created_at_val)
-                data.append({
-                    "식품유형": food_type["type_name"],
-                    "카테고리": food_type["category"] or "",
-                    "단서조항_1": food_type["sterilization"] or "",
-                    "단서조항_2": food_type["pasteurization"] or "",
-                    "성상": food_type["appearance"] or "",
-                    "검사항목": food_type["test_items"] or "",
-                    "생성일": created_at_val or ""
-                })
-            
-            # DataFrame 생성 및 엑셀 파일로 저장
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False)
-            
-            # 성공 메시지
-            QMessageBox.information(
-                self, "내보내기 완료", 
-                f"식품유형 정보가 엑셀 파일로 저장되었습니다.\n파일 위치: {file_path}"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"엑셀 파일로 내보내는 중 오류가 발생했습니다.\n{str(e)}")
-    
+
+        headers = ["식품유형", "카테고리", "단서조항_1", "단서조항_2", "성상", "검사항목", "생성일"]
+
+        def make_rows():
+            # 카탈로그 캐시의 식품유형 목록 (DB 조회 없음)
+            for food_type in ProductType.get_all():
+                created_at = food_type.get("created_at")
+                yield [
+                    food_type["type_name"],
+                    food_type.get("category") or "",
+                    food_type.get("sterilization") or "",
+                    food_type.get("pasteurization") or "",
+                    food_type.get("appearance") or "",
+                    food_type.get("test_items") or "",
+                    str(created_at) if created_at else "",
+                ]
+
+        start_export(self, file_path, headers, make_rows, "식품유형")
+
     def check_database_location(self):
         """데이터베이스 파일 위치 확인"""
         try:
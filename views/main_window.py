@@ -1,12 +1,13 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QTabWidget, QPushButton, QLabel, QMessageBox,
-                           QTableWidget, QTableWidgetItem, QHeaderView, QFrame,
+                           QTableWidget, QHeaderView, QFrame,
                            QDialog, QCheckBox, QScrollArea, QGroupBox,
                            QDialogButtonBox)
 from PyQt5.QtCore import Qt, QSize, QSettings, QTimer
 from PyQt5.QtGui import QIcon, QFont, QColor, QCursor
 
 from .login import LoginWindow
+from .table_models import RowTableModel, create_list_view
 
 # 탭 식별자 상수
 TAB_IDS = {
@@ -286,15 +287,18 @@ class MainWindow(QMainWindow):
 
         detail_layout.addLayout(detail_header_layout)
 
-        # 세부 내역 테이블
-        self.dashboard_detail_table = QTableWidget(0, 0)
-        self.dashboard_detail_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.dashboard_detail_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # 세부 내역 테이블 (모델/뷰: 화면에 보이는 행만 그림, 정렬은 프록시에서 처리)
+        self._dashboard_status_map = {}
+        self._dashboard_status_colors = {}
+        self.dashboard_detail_model = RowTableModel(
+            cell_text=self.dashboard_cell_text,
+            cell_style=self.dashboard_cell_style
+        )
+        self.dashboard_detail_table, self.dashboard_detail_proxy = create_list_view(self.dashboard_detail_model, self)
         self.dashboard_detail_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.dashboard_detail_table.horizontalHeader().setStretchLastSection(True)
-        # 헤더 이동(드래그) 및 정렬 기능 추가
+        # 헤더 이동(드래그) 기능 추가
         self.dashboard_detail_table.horizontalHeader().setSectionsMovable(True)
-        self.dashboard_detail_table.setSortingEnabled(True)
         self.dashboard_detail_table.horizontalHeader().sortIndicatorChanged.connect(self.on_dashboard_sort_changed)
         self.dashboard_detail_table.doubleClicked.connect(self.on_dashboard_detail_double_click)
         detail_layout.addWidget(self.dashboard_detail_table)
@@ -361,8 +365,8 @@ class MainWindow(QMainWindow):
             from models.users import User
             from .settings_dialog import get_status_map
 
-            # 모든 스케줄 가져오기
-            all_schedules = Schedule.get_all() or []
+            # 모든 스케줄 가져오기 (대시보드 표시용 요약 컬럼)
+            all_schedules = Schedule.get_summary() or []
             self.dashboard_all_schedules = [dict(s) for s in all_schedules]
 
             # 사용자 권한에 따라 필터링
@@ -556,129 +560,107 @@ class MainWindow(QMainWindow):
             # 표시할 컬럼만 필터링
             display_columns = [(key, name) for key, name in all_columns if key in visible_columns]
 
-            # 테이블 설정
-            self.dashboard_detail_table.setColumnCount(len(display_columns) + 1)  # +1 for hidden ID
-            headers = ['ID'] + [col[1] for col in display_columns]
-            self.dashboard_detail_table.setHorizontalHeaderLabels(headers)
-            self.dashboard_detail_table.setColumnHidden(0, True)  # ID 숨김
-
-            self.dashboard_detail_table.setRowCount(0)
-
-            status_map = get_status_map()
-            status_colors = get_status_colors()
-
-            for row, schedule in enumerate(schedules):
-                self.dashboard_detail_table.insertRow(row)
-
-                # ID 저장 (숨김)
-                self.dashboard_detail_table.setItem(row, 0, QTableWidgetItem(str(schedule.get('id', ''))))
-
-                for col_idx, (col_key, col_name) in enumerate(display_columns):
-                    value = ''
-
-                    if col_key == 'client_name':
-                        value = schedule.get('client_name', '') or ''
-                    elif col_key == 'product_name':
-                        value = schedule.get('product_name', '') or ''
-                    elif col_key == 'sales_rep':
-                        value = schedule.get('sales_rep', '') or ''
-                    elif col_key == 'food_type':
-                        food_type_id = schedule.get('food_type_id')
-                        if food_type_id:
-                            try:
-                                from models.product_types import ProductType
-                                food_type = ProductType.get_by_id(food_type_id)
-                                if food_type:
-                                    value = food_type.get('type_name', '') or ''
-                            except Exception:
-                                pass
-                    elif col_key == 'test_method':
-                        method = schedule.get('test_method', '') or ''
-                        method_map = {'real': '실측', 'acceleration': '가속',
-                                     'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'}
-                        value = method_map.get(method, method)
-                    elif col_key == 'storage_condition':
-                        storage = schedule.get('storage_condition', '') or ''
-                        storage_map = {'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'}
-                        value = storage_map.get(storage, storage)
-                    elif col_key == 'expiry_period':
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        parts = []
-                        if years > 0:
-                            parts.append(f"{years}년")
-                        if months > 0:
-                            parts.append(f"{months}개월")
-                        if days > 0:
-                            parts.append(f"{days}일")
-                        value = ' '.join(parts) if parts else ''
-                    elif col_key == 'sampling_count':
-                        value = str(schedule.get('sampling_count', '') or '')
-                    elif col_key == 'start_date':
-                        value = schedule.get('start_date', '') or ''
-                    elif col_key == 'end_date':
-                        value = schedule.get('end_date', '') or ''
-                    elif col_key == 'interim_date':
-                        # 중간보고일 계산
-                        report_interim = schedule.get('report_interim', False)
-                        start_date = schedule.get('start_date', '') or ''
-                        sampling_count = schedule.get('sampling_count', 6) or 6
-
-                        test_method = schedule.get('test_method', 'real') or 'real'
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        total_expiry_days = days + (months * 30) + (years * 365)
-
-                        if test_method in ['acceleration', 'custom_acceleration']:
-                            experiment_days = total_expiry_days // 2
-                        else:
-                            experiment_days = int(total_expiry_days * 1.5)
-
-                        value = '-'
-                        if report_interim and start_date and experiment_days > 0 and sampling_count >= 6:
-                            try:
-                                from datetime import datetime, timedelta
-                                start = datetime.strptime(start_date, '%Y-%m-%d')
-                                interval = experiment_days // sampling_count
-                                interim_date = start + timedelta(days=interval * 6)
-                                value = interim_date.strftime('%Y-%m-%d')
-                            except (ValueError, TypeError, ZeroDivisionError):
-                                value = '-'
-                    elif col_key == 'extension_test':
-                        ext = schedule.get('extension_test', False)
-                        value = '진행' if ext else '미진행'
-                    elif col_key == 'status':
-                        status = schedule.get('status', 'pending') or 'pending'
-                        value = status_map.get(status, status)
-                    elif col_key == 'memo':
-                        value = schedule.get('memo', '') or ''
-
-                    item = QTableWidgetItem(str(value))
-
-                    # 상태 컬럼에 색상 적용
-                    if col_key == 'status':
-                        status = schedule.get('status', 'pending') or 'pending'
-                        if status in status_colors:
-                            color = QColor(status_colors[status])
-                            item.setBackground(color)
-                            if color.lightness() < 128:
-                                item.setForeground(QColor('#FFFFFF'))
-
-                    self.dashboard_detail_table.setItem(row, col_idx + 1, item)
+            # 상태 이름/색상은 한 번만 읽어 셀마다 재사용
+            self._dashboard_status_map = get_status_map()
+            self._dashboard_status_colors = get_status_colors()
+
+            # 테이블 설정 (ID 열은 숨김)
+            self.dashboard_detail_model.set_columns([('id', 'ID')] + display_columns)
+            self.dashboard_detail_model.set_rows(schedules)
+            self.dashboard_detail_table.setColumnHidden(0, True)
 
         except Exception as e:
             print(f"세부 내역 표시 오류: {e}")
             import traceback
             traceback.print_exc()
 
+    def dashboard_cell_text(self, schedule, col_key):
+        """세부 내역 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출)"""
+        if col_key == 'food_type':
+            food_type_id = schedule.get('food_type_id')
+            if food_type_id:
+                try:
+                    from models.product_types import ProductType
+                    food_type = ProductType.get_by_id(food_type_id)
+                    if food_type:
+                        return food_type.get('type_name', '') or ''
+                except Exception:
+                    pass
+            return ''
+        if col_key == 'test_method':
+            method = schedule.get('test_method', '') or ''
+            method_map = {'real': '실측', 'acceleration': '가속',
+                          'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'}
+            return method_map.get(method, method)
+        if col_key == 'storage_condition':
+            storage = schedule.get('storage_condition', '') or ''
+            storage_map = {'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'}
+            return storage_map.get(storage, storage)
+        if col_key == 'expiry_period':
+            days = schedule.get('test_period_days', 0) or 0
+            months = schedule.get('test_period_months', 0) or 0
+            years = schedule.get('test_period_years', 0) or 0
+            parts = []
+            if years > 0:
+                parts.append(f"{years}년")
+            if months > 0:
+                parts.append(f"{months}개월")
+            if days > 0:
+                parts.append(f"{days}일")
+            return ' '.join(parts)
+        if col_key == 'interim_date':
+            # 중간보고일 계산
+            report_interim = schedule.get('report_interim', False)
+            start_date = schedule.get('start_date', '') or ''
+            sampling_count = schedule.get('sampling_count', 6) or 6
+
+            test_method = schedule.get('test_method', 'real') or 'real'
+            days = schedule.get('test_period_days', 0) or 0
+            months = schedule.get('test_period_months', 0) or 0
+            years = schedule.get('test_period_years', 0) or 0
+            total_expiry_days = days + (months * 30) + (years * 365)
+
+            if test_method in ['acceleration', 'custom_acceleration']:
+                experiment_days = total_expiry_days // 2
+            else:
+                experiment_days = int(total_expiry_days * 1.5)
+
+            if report_interim and start_date and experiment_days > 0 and sampling_count >= 6:
+                try:
+                    from datetime import datetime, timedelta
+                    start = datetime.strptime(start_date, '%Y-%m-%d')
+                    interval = experiment_days // sampling_count
+                    interim_date = start + timedelta(days=interval * 6)
+                    return interim_date.strftime('%Y-%m-%d')
+                except (ValueError, TypeError, ZeroDivisionError):
+                    pass
+            return '-'
+        if col_key == 'extension_test':
+            return '진행' if schedule.get('extension_test', False) else '미진행'
+        if col_key == 'status':
+            status = schedule.get('status', 'pending') or 'pending'
+            return self._dashboard_status_map.get(status, status)
+        # ID, 업체명, 샘플명, 영업담당, 샘플링횟수, 시작일, 종료일, 메모
+        return str(schedule.get(col_key, '') or '')
+
+    def dashboard_cell_style(self, schedule, col_key):
+        """상태 컬럼에 색상 적용 (배경이 어두우면 흰색 글씨)"""
+        if col_key != 'status':
+            return None
+        status = schedule.get('status', 'pending') or 'pending'
+        if status not in self._dashboard_status_colors:
+            return None
+        color = QColor(self._dashboard_status_colors[status])
+        style = {'background': color}
+        if color.lightness() < 128:
+            style['foreground'] = QColor('#FFFFFF')
+        return style
+
     def on_dashboard_detail_double_click(self, index):
         """세부 내역 더블클릭 시 스케줄 관리 탭으로 이동"""
-        row = index.row()
-        id_item = self.dashboard_detail_table.item(row, 0)
-        if id_item:
-            schedule_id = int(id_item.text())
+        schedule = self.dashboard_detail_proxy.row_data(index.row())
+        if schedule.get('id'):
+            schedule_id = int(schedule['id'])
             self.show_schedule_detail(schedule_id)
 
     def on_dashboard_sort_changed(self, logical_index, order):
@@ -710,6 +692,20 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
+            # 이메일 발송 대기열 중지 (남은 작업은 다음 실행 시 발송)
+            try:
+                from utils.mail_queue import mail_queue
+                mail_queue.stop()
+            except:
+                pass
+
+            # 남은 활동 로그 저장 (외부망은 API 토큰이 필요하므로 로그아웃 전에)
+            try:
+                from utils.activity_log_writer import activity_log_writer
+                activity_log_writer.stop()
+            except Exception as e:
+                print(f"활동 로그 저장 오류: {e}")
+
             # API 클라이언트 로그아웃
             try:
                 from api_client import api
@@ -781,6 +777,13 @@ class MainWindow(QMainWindow):
         """로그인 성공 시 처리"""
         self.current_user = user_data
         department = user_data.get('department', '')
+
+        # 이메일 발송 대기열 시작 (이전에 남은 작업 이어서 발송)
+        try:
+            from utils.mail_queue import mail_queue
+            mail_queue.start(user_data.get('id'))
+        except Exception as e:
+            print(f"메일 대기열 시작 오류: {e}")
         self.user_label.setText(f"사용자: {user_data['name']} ({department or user_data['role']})")
 
         # 각 탭에 현재 사용자 설정 (권한 적용) - 데이터 로드는 지연 (Lazy Loading)
@@ -942,6 +945,20 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             self.current_user = None
 
+            # 이메일 발송 대기열 중지 (남은 작업은 다음 로그인 시 발송)
+            try:
+                from utils.mail_queue import mail_queue
+                mail_queue.stop()
+            except Exception as e:
+                print(f"메일 대기열 중지 오류: {e}")
+
+            # 남은 활동 로그 저장 (외부망은 API 토큰이 필요하므로 로그아웃 전에)
+            try:
+                from utils.activity_log_writer import activity_log_writer
+                activity_log_writer.flush()
+            except Exception as e:
+                print(f"활동 로그 저장 오류: {e}")
+
             # API 클라이언트 로그아웃 (캐시 초기화 포함)
             try:
                 from api_client import api
@@ -992,7 +1009,7 @@ class MainWindow(QMainWindow):
         # 대시보드 데이터 초기화
         self.dashboard_all_schedules = []
         if hasattr(self, 'dashboard_detail_table') and self.dashboard_detail_table:
-            self.dashboard_detail_table.setRowCount(0)
+            self.dashboard_detail_model.set_rows([])
         if hasattr(self, 'dashboard_estimate_table') and self.dashboard_estimate_table:
             self.dashboard_estimate_table.setRowCount(0)
 
@@ -25,7 +25,12 @@ from models.product_types import ProductType
 from models.activity_log import ActivityLog
 from models.schedule_attachments import ScheduleAttachment
 from utils.logger import log_message, log_error, log_exception, safe_get
+from utils.business_calendar import add_business_days, is_business_day
+from utils import experiment_plan as plan_engine
+from utils.experiment_plan import ExperimentPlan
 from .settings_dialog import get_status_settings, get_status_map, get_status_colors, get_status_names, get_status_code_by_name
+from .table_models import RowTableModel, create_list_view, selected_row_data
+from .schedule_pager import SchedulePager, schedule_search_filters
 
 
 class ScheduleLoaderThread(QThread):
@@ -45,199 +50,6 @@ class ScheduleLoaderThread(QThread):
             self.error.emit(str(e))
 
 
-def get_korean_holidays(year):
-    """한국 공휴일 목록 반환 (고정 공휴일 + 음력 공휴일 + 대체공휴일)
-
-    대체공휴일 적용 기준:
-    - 설날/추석 연휴: 일요일과 겹치면 연휴 다음 첫 평일 (2014년~)
-    - 어린이날: 토요일 또는 일요일과 겹치면 다음 평일 (2014년~)
-    - 삼일절, 광복절, 개천절, 한글날: 일요일과 겹치면 다음 월요일 (2021년~)
-    - 부처님오신날, 크리스마스: 일요일과 겹치면 다음 월요일 (2023년~)
-    """
-    from datetime import date, timedelta
-
-    holidays = set()
-
-    # 고정 공휴일 처리
-    # substitute_type: 'none'=미적용, 'sunday'=일요일만, 'weekend'=토/일 모두
-    fixed_holidays = [
-        (1, 1, '신정', 'none'),           # 신정 - 대체공휴일 미적용
-        (3, 1, '삼일절', 'sunday'),       # 삼일절 - 일요일만 대체공휴일
-        (5, 5, '어린이날', 'weekend'),    # 어린이날 - 토/일 모두 대체공휴일
-        (6, 6, '현충일', 'none'),         # 현충일 - 대체공휴일 미적용
-        (8, 15, '광복절', 'sunday'),      # 광복절 - 일요일만 대체공휴일
-        (10, 3, '개천절', 'sunday'),      # 개천절 - 일요일만 대체공휴일
-        (10, 9, '한글날', 'sunday'),      # 한글날 - 일요일만 대체공휴일
-        (12, 25, '크리스마스', 'sunday'), # 크리스마스 - 일요일만 대체공휴일
-    ]
-
-    for month, day, name, substitute_type in fixed_holidays:
-        try:
-            holiday_date = date(year, month, day)
-            holidays.add(holiday_date)
-
-            # 대체공휴일 계산
-            if substitute_type == 'weekend':
-                # 토요일(5) 또는 일요일(6)이면 다음 월요일
-                if holiday_date.weekday() == 5:  # 토요일
-                    substitute = holiday_date + timedelta(days=2)
-                    holidays.add(substitute)
-                elif holiday_date.weekday() == 6:  # 일요일
-                    substitute = holiday_date + timedelta(days=1)
-                    holidays.add(substitute)
-            elif substitute_type == 'sunday':
-                # 일요일이면 다음 월요일
-                if holiday_date.weekday() == 6:
-                    substitute = holiday_date + timedelta(days=1)
-                    holidays.add(substitute)
-        except (ValueError, TypeError):
-            pass
-
-    # 음력 공휴일 (양력 변환 - 연도별 정확한 날짜)
-    # 설날 연휴 (전날, 당일, 다음날), 추석 연휴 (전날, 당일, 다음날)
-    lunar_holidays = {
-        # 2025-2030년
-        2025: {
-            'seollal': [(1, 28), (1, 29), (1, 30)],
-            'chuseok': [(10, 5), (10, 6), (10, 7)],
-        },
-        2026: {
-            'seollal': [(2, 16), (2, 17), (2, 18)],
-            'chuseok': [(9, 24), (9, 25), (9, 26)],
-        },
-        2027: {
-            'seollal': [(2, 5), (2, 6), (2, 7)],
-            'chuseok': [(10, 13), (10, 14), (10, 15)],
-        },
-        2028: {
-            'seollal': [(1, 25), (1, 26), (1, 27)],
-            'chuseok': [(10, 1), (10, 2), (10, 3)],
-        },
-        2029: {
-            'seollal': [(2, 12), (2, 13), (2, 14)],
-            'chuseok': [(9, 21), (9, 22), (9, 23)],
-        },
-        2030: {
-            'seollal': [(2, 2), (2, 3), (2, 4)],
-            'chuseok': [(10, 11), (10, 12), (10, 13)],
-        },
-        # 2031-2035년
-        2031: {
-            'seollal': [(1, 22), (1, 23), (1, 24)],
-            'chuseok': [(9, 27), (9, 28), (9, 29)],  # 9/28 일요일 → 대체공휴일
-        },
-        2032: {
-            'seollal': [(2, 10), (2, 11), (2, 12)],
-            'chuseok': [(9, 18), (9, 19), (9, 20)],  # 9/19 일요일 → 대체공휴일
-        },
-        2033: {
-            'seollal': [(1, 30), (1, 31), (2, 1)],   # 1/30 일요일 → 대체공휴일
-            'chuseok': [(9, 7), (9, 8), (9, 9)],
-        },
-        2034: {
-            'seollal': [(2, 18), (2, 19), (2, 20)],  # 2/19 일요일 → 대체공휴일
-            'chuseok': [(9, 26), (9, 27), (9, 28)],
-        },
-        2035: {
-            'seollal': [(2, 7), (2, 8), (2, 9)],
-            'chuseok': [(9, 15), (9, 16), (9, 17)],  # 9/16 일요일 → 대체공휴일
-        },
-    }
-
-    if year in lunar_holidays:
-        # 설날과 추석 연휴 처리
-        for holiday_type in ['seollal', 'chuseok']:
-            dates = lunar_holidays[year].get(holiday_type, [])
-            holiday_dates = []
-
-            for month, day in dates:
-                try:
-                    hdate = date(year, month, day)
-                    holidays.add(hdate)
-                    holiday_dates.append(hdate)
-                except (ValueError, TypeError):
-                    pass
-
-            # 대체공휴일 계산: 연휴 중 일요일이 있으면 연휴 다음 첫 평일
-            if holiday_dates:
-                has_sunday = any(d.weekday() == 6 for d in holiday_dates)
-                if has_sunday:
-                    last_holiday = max(holiday_dates)
-                    substitute = last_holiday + timedelta(days=1)
-                    # 이미 공휴일이면 다음날로
-                    while substitute in holidays or substitute.weekday() >= 5:
-                        substitute += timedelta(days=1)
-                    holidays.add(substitute)
-
-    # 부처님오신날 (음력 4월 8일 - 대체공휴일 적용 2024년~)
-    buddha_birthday = {
-        2025: (5, 5),
-        2026: (5, 24),   # 일요일 → 5/25 대체공휴일
-        2027: (5, 13),
-        2028: (5, 2),
-        2029: (5, 20),
-        2030: (5, 9),
-        2031: (5, 28),
-        2032: (5, 16),   # 일요일 → 5/17 대체공휴일
-        2033: (5, 6),
-        2034: (5, 25),
-        2035: (5, 15),
-    }
-
-    if year in buddha_birthday:
-        month, day = buddha_birthday[year]
-        try:
-            hdate = date(year, month, day)
-            holidays.add(hdate)
-
-            # 대체공휴일: 일요일이면 다음 월요일
-            if hdate.weekday() == 6:
-                substitute = hdate + timedelta(days=1)
-                holidays.add(substitute)
-        except (ValueError, TypeError):
-            pass
-
-    return holidays
-
-
-def add_business_days(start_date, business_days):
-    """시작일로부터 영업일(주말, 공휴일 제외) 기준 날짜 계산
-
-    Args:
-        start_date: 시작일 (datetime 또는 date 객체)
-        business_days: 추가할 영업일 수
-
-    Returns:
-        영업일 기준 계산된 날짜 (datetime 객체)
-    """
-    from datetime import timedelta, date
-
-    if business_days <= 0:
-        return start_date
-
-    # datetime을 date로 변환
-    if hasattr(start_date, 'date'):
-        current_date = start_date.date()
-    else:
-        current_date = start_date
-
-    # 해당 연도와 다음 연도의 공휴일 가져오기
-    holidays = get_korean_holidays(current_date.year)
-    holidays.update(get_korean_holidays(current_date.year + 1))
-
-    days_added = 0
-
-    while days_added < business_days:
-        current_date += timedelta(days=1)
-
-        # 토요일(5), 일요일(6) 또는 공휴일이면 건너뛰기
-        if current_date.weekday() < 5 and current_date not in holidays:
-            days_added += 1
-
-    # datetime으로 반환
-    return datetime(current_date.year, current_date.month, current_date.day)
-
-
 class ClickableLabel(QLabel):
     """클릭 가능한 라벨 - 클릭 시 시그널 발생"""
     clicked = pyqtSignal()
@@ -572,9 +384,6 @@ class DateSelectDialog(QDialog):
 class ScheduleSelectDialog(QDialog):
     """스케줄 선택 팝업 다이얼로그 - 스케줄 작성 탭과 동일한 컬럼 표시"""
 
-    # 한글 초성 매핑
-    CHOSUNG_LIST = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-
     # 컬럼 정의 (key, header_name, data_key, default_visible)
     ALL_COLUMNS = [
         ('id', 'ID', 'id', False),
@@ -594,10 +403,26 @@ class ScheduleSelectDialog(QDialog):
         ('status', '상태', 'status', True),
     ]
 
+    # 한 번에 불러올 스케줄 수
+    PAGE_SIZE = 200
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_schedule_id = None
-        self.all_schedules = []  # 전체 스케줄 목록 저장
+        self.all_schedules = []  # 불러온 스케줄 목록 저장 (페이지 단위로 누적)
+        self._status_map = {}  # 목록 표시용 상태 이름/색상 (목록을 표시할 때 한 번 읽음)
+        self._status_colors = {}
+        # 열람권한 필터용 (부모 탭의 로그인 사용자)
+        self.current_user = getattr(parent, 'current_user', None)
+
+        # 페이지 조회 상태 (키셋 페이지네이션)
+        self.pager = SchedulePager(self.PAGE_SIZE)
+
+        # 검색 디바운싱 타이머 (서버 조회 횟수 제한)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.filter_schedules)
+
         self.initUI()
 
     def initUI(self):
@@ -645,11 +470,11 @@ class ScheduleSelectDialog(QDialog):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("검색어 입력... (초성 검색 가능: ㅂㅇㅍㄷㄹ)")
         self.search_input.setMinimumWidth(300)
-        self.search_input.textChanged.connect(self.filter_schedules)
+        self.search_input.textChanged.connect(self.on_search_text_changed)
         search_layout.addWidget(self.search_input)
 
         # 검색 필드 변경 시에도 필터 적용
-        self.search_field_combo.currentIndexChanged.connect(self.filter_schedules)
+        self.search_field_combo.currentIndexChanged.connect(self.on_search_text_changed)
 
         # 초기화 버튼
         reset_btn = QPushButton("초기화")
@@ -659,11 +484,14 @@ class ScheduleSelectDialog(QDialog):
         search_layout.addStretch()
         layout.addWidget(search_frame)
 
-        # 스케줄 목록 테이블
-        self.schedule_table = QTableWidget()
-        self.schedule_table.setColumnCount(len(self.ALL_COLUMNS))
-        headers = [col[1] for col in self.ALL_COLUMNS]
-        self.schedule_table.setHorizontalHeaderLabels(headers)
+        # 스케줄 목록 테이블 (모델/뷰: 화면에 보이는 행만 그림, 정렬/초성 검색은 프록시에서 처리)
+        self._column_data_keys = {col[0]: col[2] for col in self.ALL_COLUMNS}
+        self.schedule_model = RowTableModel(
+            [(col[0], col[1]) for col in self.ALL_COLUMNS],
+            cell_text=self.list_cell_text,
+            cell_style=self.list_cell_style
+        )
+        self.schedule_table, self.schedule_proxy = create_list_view(self.schedule_model, self)
 
         # 열 너비 조절 설정
         header = self.schedule_table.horizontalHeader()
@@ -693,16 +521,19 @@ class ScheduleSelectDialog(QDialog):
             if col_key in column_widths:
                 self.schedule_table.setColumnWidth(col_index, column_widths[col_key])
 
-        self.schedule_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.schedule_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.schedule_table.doubleClicked.connect(self.accept)
 
-        # 헤더 클릭으로 정렬 기능 활성화
-        self.schedule_table.setSortingEnabled(True)
-        self.schedule_table.horizontalHeader().setSortIndicatorShown(True)
+        # 스크롤이 끝에 닿으면 다음 페이지 로드
+        self.schedule_table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
 
         layout.addWidget(self.schedule_table)
 
+        # 다음 페이지 불러오기 버튼
+        self.load_more_btn = QPushButton("더 보기")
+        self.load_more_btn.clicked.connect(self.load_more_schedules)
+        self.load_more_btn.setVisible(False)
+        layout.addWidget(self.load_more_btn)
+
         # 버튼
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -753,271 +584,200 @@ class ScheduleSelectDialog(QDialog):
                 is_hidden = col_key not in visible_columns
                 self.schedule_table.setColumnHidden(col_index, is_hidden)
 
-    def load_schedules(self):
-        """스케줄 목록 로드"""
-        try:
-            raw_schedules = Schedule.get_all() or []
-            all_schedules = [dict(s) for s in raw_schedules]
+    def get_permission_filters(self):
+        """열람권한에 따른 서버 필터 (권한 없으면 본인 담당 스케줄만)"""
+        if not self.current_user:
+            return {}
+        role = self.current_user.get('role', '')
+        can_view_all = self.current_user.get('can_view_all', 0)
+        if role == 'admin' or can_view_all:
+            return {}
+        return {'sales_rep': self.current_user.get('name', '')}
 
-            # 열람권한에 따라 스케줄 필터링
-            if self.current_user:
-                user_name = self.current_user.get('name', '')
-                role = self.current_user.get('role', '')
-                can_view_all = self.current_user.get('can_view_all', 0)
+    def get_search_filters(self):
+        """검색어를 서버 필터로 변환 (초성 검색도 서버에서 필터링)"""
+        return schedule_search_filters(self.search_input.text().strip(), self.search_field_combo.currentText())
 
-                # 관리자 또는 열람권한이 있는 사용자는 전체 조회 가능
-                if role == 'admin' or can_view_all:
-                    self.all_schedules = all_schedules
-                else:
-                    # 본인 담당 업체의 스케줄만 필터링
-                    self.all_schedules = [
-                        s for s in all_schedules
-                        if (s.get('sales_rep', '') or '') == user_name
-                    ]
-            else:
-                self.all_schedules = all_schedules
+    def load_schedules(self):
+        """스케줄 목록 로드 (첫 페이지, 서버 필터 적용)"""
+        try:
+            # 목록 표시용 요약 컬럼만 조회 (선택 후 select_schedule_by_id에서 전체 조회)
+            self.all_schedules = self.pager.first_page(
+                self.get_permission_filters(), self.get_search_filters())
 
             self.display_schedules(self.all_schedules)
+            self.update_load_more_button()
         except Exception as e:
             print(f"스케줄 로드 오류: {e}")
 
-    def display_schedules(self, schedules):
-        """스케줄 목록을 테이블에 표시"""
-        self.schedule_table.setUpdatesEnabled(False)
+    def load_more_schedules(self):
+        """다음 페이지 스케줄 로드 (테이블 끝에 추가)"""
         try:
-            self.schedule_table.setRowCount(0)
-
-            for row, schedule in enumerate(schedules):
-                self.schedule_table.insertRow(row)
-
-                for col_index, col_def in enumerate(self.ALL_COLUMNS):
-                    col_key = col_def[0]
-                    data_key = col_def[2]
-
-                    if col_key == 'id':
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(str(schedule.get('id', ''))))
-
-                    elif col_key == 'test_method':
-                        test_method = schedule.get('test_method', '') or ''
-                        test_method_text = {
-                            'real': '실측', 'acceleration': '가속',
-                            'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'
-                        }.get(test_method, test_method)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(test_method_text))
-
-                    elif col_key == 'storage_condition':
-                        storage = schedule.get('storage_condition', '') or ''
-                        storage_text = {
-                            'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'
-                        }.get(storage, storage)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(storage_text))
-
-                    elif col_key == 'food_type':
-                        food_type_id = schedule.get('food_type_id', '')
-                        food_type_name = ''
-                        if food_type_id:
-                            try:
-                                food_type = ProductType.get_by_id(food_type_id)
-                                if food_type:
-                                    food_type_name = food_type.get('type_name', '') or ''
-                            except Exception:
-                                pass
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(food_type_name))
-
-                    elif col_key == 'expiry_period':
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        parts = []
-                        if years > 0:
-                            parts.append(f"{years}년")
-                        if months > 0:
-                            parts.append(f"{months}개월")
-                        if days > 0:
-                            parts.append(f"{days}일")
-                        expiry_text = ' '.join(parts) if parts else ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(expiry_text))
-
-                    elif col_key == 'test_period':
-                        test_method = schedule.get('test_method', 'real')
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        total_days = days + (months * 30) + (years * 365)
-                        if test_method in ['acceleration', 'custom_acceleration']:
-                            test_days = total_days // 2
-                        else:
-                            test_days = int(total_days * 1.5)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(f"{test_days}일" if test_days > 0 else ''))
-
-                    elif col_key == 'report_type':
-                        types = []
-                        if schedule.get('report_interim'):
-                            types.append('중간')
-                        if schedule.get('report_korean'):
-                            types.append('국문')
-                        if schedule.get('report_english'):
-                            types.append('영문')
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(', '.join(types)))
-
-                    elif col_key == 'status':
-                        # 상태 (커스텀 설정 사용)
-                        status = schedule.get('status', 'pending') or 'pending'
-                        status_map = get_status_map()
-                        status_colors = get_status_colors()
-                        status_text = status_map.get(status, status)
-                        status_item = QTableWidgetItem(status_text)
-                        # 커스텀 색상 적용
-                        if status in status_colors:
-                            color = QColor(status_colors[status])
-                            status_item.setBackground(color)
-                            # 배경색이 어두우면 흰색 글씨, 밝으면 검정색 글씨
-                            if color.lightness() < 128:
-                                status_item.setForeground(QColor('#FFFFFF'))
-                            else:
-                                status_item.setForeground(QColor('#000000'))
-                        self.schedule_table.setItem(row, col_index, status_item)
-
-                    elif col_key == 'last_experiment_date':
-                        # 마지막 실험일 계산 (마지막 샘플링 날짜)
-                        start_date = schedule.get('start_date', '') or ''
-                        sampling_count = schedule.get('sampling_count', 6) or 6
-
-                        test_method = schedule.get('test_method', 'real') or 'real'
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        total_expiry_days = days + (months * 30) + (years * 365)
-
-                        if test_method in ['acceleration', 'custom_acceleration']:
-                            experiment_days = total_expiry_days // 2
-                        else:
-                            experiment_days = int(total_expiry_days * 1.5)
-
-                        last_experiment_date_text = '-'
-                        if start_date and experiment_days > 0 and sampling_count > 0:
-                            try:
-                                from datetime import timedelta
-                                start = datetime.strptime(start_date, '%Y-%m-%d')
-                                interval = experiment_days // sampling_count
-                                # 마지막 회차 날짜 (sampling_count번째 회차)
-                                last_experiment_date = start + timedelta(days=interval * sampling_count)
-                                last_experiment_date_text = last_experiment_date.strftime('%Y-%m-%d')
-                            except (ValueError, TypeError, ZeroDivisionError):
-                                last_experiment_date_text = '-'
-
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(last_experiment_date_text))
-
-                    else:
-                        value = schedule.get(data_key, '') if data_key else ''
-                        if value is None:
-                            value = ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(str(value)))
+            new_schedules = self.pager.next_page()
+            if not new_schedules:
+                return
+            self.all_schedules.extend(new_schedules)
 
+            self.display_schedules(new_schedules, append=True)
+            self.update_load_more_button()
         except Exception as e:
-            print(f"스케줄 표시 중 오류: {e}")
-        finally:
-            self.schedule_table.setUpdatesEnabled(True)
-
-    def get_chosung(self, text):
-        """문자열에서 초성 추출"""
-        result = ""
-        for char in text:
-            if '가' <= char <= '힣':
-                char_code = ord(char) - ord('가')
-                chosung_idx = char_code // 588
-                # 인덱스 범위 확인 (0-18)
-                if 0 <= chosung_idx < len(self.CHOSUNG_LIST):
-                    result += self.CHOSUNG_LIST[chosung_idx]
-                else:
-                    result += char  # 범위 밖이면 원래 문자 유지
-            else:
-                result += char
-        return result
-
-    def is_chosung_only(self, text):
-        """문자열이 초성만으로 이루어져 있는지 확인"""
-        for char in text:
-            if char not in self.CHOSUNG_LIST and char != ' ':
-                return False
-        return True
+            print(f"스케줄 추가 로드 오류: {e}")
 
-    def match_chosung(self, text, search_text):
-        """초성 검색 매칭"""
-        text_chosung = self.get_chosung(text)
-        return search_text.lower() in text_chosung.lower()
+    def on_table_scrolled(self, value):
+        """스크롤이 끝에 가까워지면 다음 페이지 로드"""
+        scroll_bar = self.schedule_table.verticalScrollBar()
+        if self.pager.has_more and value >= scroll_bar.maximum() - 5:
+            self.load_more_schedules()
 
-    def filter_schedules(self):
-        """실시간 검색 필터링 (초성 검색 지원)"""
-        try:
-            search_text = self.search_input.text().strip()
-            search_field = self.search_field_combo.currentText()
+    def update_load_more_button(self):
+        """'더 보기' 버튼 표시 상태 갱신"""
+        self.load_more_btn.setVisible(self.pager.has_more)
+        self.load_more_btn.setText(f"더 보기 (현재 {len(self.all_schedules)}건)")
 
-            if not search_text:
-                self.display_schedules(self.all_schedules)
-                return
+    def display_schedules(self, schedules, append=False):
+        """스케줄 목록을 테이블 모델에 설정
 
-            filtered = []
-            is_chosung = self.is_chosung_only(search_text)
+        Args:
+            append: True면 기존 행 뒤에 추가 (다음 페이지 로드)
+        """
+        try:
+            if append:
+                self.schedule_model.append_rows(schedules)
+            else:
+                self._status_map = get_status_map()
+                self._status_colors = get_status_colors()
+                self.schedule_model.set_rows(schedules)
+        except Exception as e:
+            print(f"스케줄 표시 중 오류: {e}")
 
-            for schedule in self.all_schedules:
-                client_name = schedule.get('client_name', '') or ''
-                product_name = schedule.get('product_name', '') or ''
-                status = schedule.get('status', '') or ''
-                status_map = get_status_map()
-                status_text = status_map.get(status, status)
+    def list_cell_text(self, schedule, col_key):
+        """목록 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출)"""
+        if col_key == 'id':
+            return str(schedule.get('id', ''))
+
+        if col_key == 'test_method':
+            test_method = schedule.get('test_method', '') or ''
+            return {
+                'real': '실측', 'acceleration': '가속',
+                'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'
+            }.get(test_method, test_method)
+
+        if col_key == 'storage_condition':
+            storage = schedule.get('storage_condition', '') or ''
+            return {
+                'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'
+            }.get(storage, storage)
+
+        if col_key == 'food_type':
+            food_type_id = schedule.get('food_type_id', '')
+            if food_type_id:
+                try:
+                    food_type = ProductType.get_by_id(food_type_id)
+                    if food_type:
+                        return food_type.get('type_name', '') or ''
+                except Exception:
+                    pass
+            return ''
+
+        if col_key == 'expiry_period':
+            days = schedule.get('test_period_days', 0) or 0
+            months = schedule.get('test_period_months', 0) or 0
+            years = schedule.get('test_period_years', 0) or 0
+            parts = []
+            if years > 0:
+                parts.append(f"{years}년")
+            if months > 0:
+                parts.append(f"{months}개월")
+            if days > 0:
+                parts.append(f"{days}일")
+            return ' '.join(parts)
+
+        if col_key == 'test_period':
+            test_days = plan_engine.experiment_days(
+                schedule.get('test_method', 'real') or 'real',
+                schedule.get('test_period_days', 0),
+                schedule.get('test_period_months', 0),
+                schedule.get('test_period_years', 0)
+            )
+            return f"{test_days}일" if test_days > 0 else ''
+
+        if col_key == 'report_type':
+            types = []
+            if schedule.get('report_interim'):
+                types.append('중간')
+            if schedule.get('report_korean'):
+                types.append('국문')
+            if schedule.get('report_english'):
+                types.append('영문')
+            return ', '.join(types)
+
+        if col_key == 'status':
+            # 상태 (커스텀 설정 사용)
+            status = schedule.get('status', 'pending') or 'pending'
+            return self._status_map.get(status, status)
+
+        if col_key == 'last_experiment_date':
+            # 마지막 실험일 계산 (마지막 샘플링 날짜)
+            start_date = schedule.get('start_date', '') or ''
+            sampling_count = schedule.get('sampling_count', 6) or 6
+            experiment_days = plan_engine.experiment_days(
+                schedule.get('test_method', 'real') or 'real',
+                schedule.get('test_period_days', 0),
+                schedule.get('test_period_months', 0),
+                schedule.get('test_period_years', 0)
+            )
+            if start_date and experiment_days > 0 and sampling_count > 0:
+                try:
+                    from datetime import timedelta
+                    start = datetime.strptime(start_date, '%Y-%m-%d')
+                    interval = experiment_days // sampling_count
+                    # 마지막 회차 날짜 (sampling_count번째 회차)
+                    last_experiment_date = start + timedelta(days=interval * sampling_count)
+                    return last_experiment_date.strftime('%Y-%m-%d')
+                except (ValueError, TypeError, ZeroDivisionError):
+                    pass
+            return '-'
 
-                match = False
+        data_key = self._column_data_keys.get(col_key)
+        value = schedule.get(data_key, '') if data_key else ''
+        return '' if value is None else str(value)
 
-                if search_field == "전체":
-                    if is_chosung:
-                        match = (self.match_chosung(client_name, search_text) or
-                                 self.match_chosung(product_name, search_text) or
-                                 self.match_chosung(status_text, search_text))
-                    else:
-                        search_lower = search_text.lower()
-                        match = (search_lower in client_name.lower() or
-                                 search_lower in product_name.lower() or
-                                 search_lower in status_text.lower())
-                elif search_field == "업체명":
-                    if is_chosung:
-                        match = self.match_chosung(client_name, search_text)
-                    else:
-                        match = search_text.lower() in client_name.lower()
-                elif search_field == "샘플명":
-                    if is_chosung:
-                        match = self.match_chosung(product_name, search_text)
-                    else:
-                        match = search_text.lower() in product_name.lower()
-                elif search_field == "상태":
-                    if is_chosung:
-                        match = self.match_chosung(status_text, search_text)
-                    else:
-                        match = search_text.lower() in status_text.lower()
+    def list_cell_style(self, schedule, col_key):
+        """상태 열 커스텀 색상 (배경이 어두우면 흰색 글씨, 밝으면 검정색 글씨)"""
+        if col_key != 'status':
+            return None
+        status = schedule.get('status', 'pending') or 'pending'
+        if status not in self._status_colors:
+            return None
+        color = QColor(self._status_colors[status])
+        return {
+            'background': color,
+            'foreground': QColor('#FFFFFF') if color.lightness() < 128 else QColor('#000000')
+        }
 
-                if match:
-                    filtered.append(schedule)
+    def on_search_text_changed(self):
+        """검색어 변경 시 타이머 시작 (디바운싱)"""
+        self.search_timer.stop()
+        self.search_timer.start(300)
 
-            self.display_schedules(filtered)
-        except Exception as e:
-            print(f"스케줄 검색 중 오류: {e}")
+    def filter_schedules(self):
+        """실시간 검색 필터링 (초성 검색 포함 서버 필터로 첫 페이지부터 다시 조회)"""
+        self.load_schedules()
 
     def reset_search(self):
         """검색 초기화"""
         self.search_input.clear()
         self.search_field_combo.setCurrentIndex(0)
-        self.display_schedules(self.all_schedules)
+        self.search_timer.stop()
+        self.load_schedules()
 
     def accept(self):
-        selected = self.schedule_table.selectedIndexes()
-        if selected:
-            row = selected[0].row()
-            id_item = self.schedule_table.item(row, 0)
-            if id_item:
-                try:
-                    self.selected_schedule_id = int(id_item.text())
-                except (ValueError, TypeError):
-                    pass
+        schedule = selected_row_data(self.schedule_table)
+        if schedule:
+            try:
+                self.selected_schedule_id = int(schedule.get('id'))
+            except (ValueError, TypeError):
+                pass
         super().accept()
 
 
@@ -1638,6 +1398,9 @@ class ScheduleManagementTab(QWidget):
         # 저장된 O/X 상태 데이터
         self.saved_experiment_data = {}
 
+        # 검사항목 × 회차 O/X 계획 (테이블은 이 계획을 그려서 표시)
+        self.experiment_plan = None
+
         # 사용자 정의 날짜 저장용 딕셔너리 {column_index: datetime}
         self.custom_dates = {}
 
@@ -2572,22 +2335,15 @@ class ScheduleManagementTab(QWidget):
         test_method = schedule.get('test_method', '') or ''
         sampling_count = schedule.get('sampling_count', 6) or 6
 
-        days = schedule.get('test_period_days', 0) or 0
-        months = schedule.get('test_period_months', 0) or 0
-        years = schedule.get('test_period_years', 0) or 0
-        total_days = days + (months * 30) + (years * 365)
-
-        if test_method in ['real', 'custom_real']:
-            experiment_days = int(total_days * 1.5)
-        else:
-            experiment_days = total_days // 2 if total_days > 0 else 0
+        experiment_days = plan_engine.experiment_days(
+            test_method,
+            schedule.get('test_period_days', 0),
+            schedule.get('test_period_months', 0),
+            schedule.get('test_period_years', 0)
+        )
 
-        # 시작일(0일)과 마지막실험일(experiment_days) 사이를 균등 분배
-        # 첫 회차(0일)부터 마지막 회차(experiment_days)까지
-        if sampling_count > 1:
-            interval_days = experiment_days / (sampling_count - 1)
-        else:
-            interval_days = 0
+        # 시작일(0일)과 마지막실험일(experiment_days) 사이를 균등 분배한 회차별 제조후 일수
+        offsets = plan_engine.round_offsets(experiment_days, sampling_count)
 
         # 시작일 파싱
         start_date_str = schedule.get('start_date', '')
@@ -2603,15 +2359,17 @@ class ScheduleManagementTab(QWidget):
         test_items = base_items + self.additional_test_items
 
         fees = {}
-        sample_quantities = {}
         try:
             all_fees = Fee.get_all()
             for fee in all_fees:
                 fees[fee['test_item']] = fee['price']
-                sample_quantities[fee['test_item']] = fee['sample_quantity'] or 0
         except Exception:
             pass
 
+        # O/X 계획 생성 (기본 회차, 연장 회차는 아래에서 추가)
+        plan = ExperimentPlan(test_items, fees, sampling_count, saved_marks=self.saved_experiment_data)
+        self.experiment_plan = plan
+
         # 단일 테이블 업데이트
         table = self.experiment_table
         col_count = sampling_count + 2
@@ -2676,12 +2434,6 @@ class ScheduleManagementTab(QWidget):
         # 각 회차별 날짜 저장 (제조후 일수 계산용 + 중간보고서 날짜 계산용)
         self.sample_dates = {}
 
-        # 공휴일 목록 가져오기 (날짜 색상 결정용)
-        holidays = set()
-        if start_date:
-            holidays = get_korean_holidays(start_date.year)
-            holidays.update(get_korean_holidays(start_date.year + 1))
-
         for i in range(sampling_count):
             col_idx = i + 1
 
@@ -2694,32 +2446,21 @@ class ScheduleManagementTab(QWidget):
                 date_item.setTextAlignment(Qt.AlignCenter)
 
                 # 사용자 정의 날짜도 주말/공휴일 체크
-                sample_date_only = sample_date.date() if hasattr(sample_date, 'date') else sample_date
-                is_weekend = sample_date.weekday() >= 5
-                is_holiday = sample_date_only in holidays
-                if is_weekend or is_holiday:
+                if not is_business_day(sample_date):
                     date_item.setBackground(QColor('#FF8C00'))  # 진한 주황색 (수정됨 + 검토 필요)
                     date_item.setToolTip("수정됨 - 주말 또는 공휴일 검토 필요")
                 else:
                     date_item.setBackground(QColor('#FFE4B5'))  # 수정된 날짜 강조 (평일)
             elif start_date:
                 from datetime import timedelta
-                # 마지막 회차는 정확히 experiment_days, 그 외는 균등 분배
-                if i == sampling_count - 1:
-                    days_offset = experiment_days
-                else:
-                    days_offset = round(i * interval_days)
-                sample_date = start_date + timedelta(days=days_offset)
+                sample_date = start_date + timedelta(days=offsets[i])
                 date_value = sample_date.strftime('%Y-%m-%d')  # 연-월-일 형식
                 self.sample_dates[col_idx] = sample_date
                 date_item = QTableWidgetItem(date_value)
                 date_item.setTextAlignment(Qt.AlignCenter)
 
                 # 토요일(5), 일요일(6), 공휴일이면 주황색으로 표시
-                sample_date_only = sample_date.date() if hasattr(sample_date, 'date') else sample_date
-                is_weekend = sample_date.weekday() >= 5  # 토요일(5) 또는 일요일(6)
-                is_holiday = sample_date_only in holidays
-                if is_weekend or is_holiday:
+                if not is_business_day(sample_date):
                     date_item.setBackground(QColor('#FFA500'))  # 주황색 (검토 필요)
                     date_item.setToolTip("주말 또는 공휴일 - 검토 필요")
                 else:
@@ -2747,11 +2488,7 @@ class ScheduleManagementTab(QWidget):
                 # 사용자 정의 날짜인 경우 강조 표시
                 is_custom = col_idx in self.custom_dates
             else:
-                # 마지막 회차는 정확히 experiment_days
-                if i == sampling_count - 1:
-                    days_elapsed = experiment_days
-                else:
-                    days_elapsed = int(round(i * interval_days))
+                days_elapsed = offsets[i]
                 is_custom = False
 
             time_value = f"{days_elapsed}일"
@@ -2762,27 +2499,16 @@ class ScheduleManagementTab(QWidget):
             table.setItem(2, col_idx, item)
         table.setItem(2, col_count - 1, QTableWidgetItem(""))
 
-        total_price_per_test = 0
         for row_idx, test_item in enumerate(test_items):
             item_label = QTableWidgetItem(test_item)
             item_label.setBackground(QColor('#90EE90'))
             table.setItem(row_idx + 3, 0, item_label)  # +3 because of interim, date and time rows
 
-            # 저장된 O/X 상태 불러오기
-            saved_row_data = self.saved_experiment_data.get(test_item, [])
-
+            # O/X 상태 (계획에서)
             for i in range(sampling_count):
-                # 저장된 상태가 있으면 사용, 없으면 기본값 "O"
-                if i < len(saved_row_data) and saved_row_data[i]:
-                    check_value = saved_row_data[i]
-                else:
-                    check_value = "O"
-                check_item = QTableWidgetItem(check_value)
-                check_item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row_idx + 3, i + 1, check_item)
+                table.setItem(row_idx + 3, i + 1, self._make_mark_item(plan.mark(row_idx, i)))
 
-            price = int(fees.get(test_item, 0))
-            total_price_per_test += price
+            price = int(plan.prices[row_idx])
             price_item = QTableWidgetItem(f"{price:,}")
             price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             table.setItem(row_idx + 3, col_count - 1, price_item)
@@ -2791,13 +2517,14 @@ class ScheduleManagementTab(QWidget):
         basis_item.setBackground(QColor('#FFFF99'))
         table.setItem(row_count - 1, 0, basis_item)
 
+        column_costs = plan.column_costs()
         for i in range(sampling_count):
-            cost_item = QTableWidgetItem(f"{total_price_per_test:,}")
+            cost_item = QTableWidgetItem(f"{int(column_costs[i]):,}")
             cost_item.setTextAlignment(Qt.AlignCenter)
             cost_item.setBackground(QColor('#FFFF99'))
             table.setItem(row_count - 1, i + 1, cost_item)
 
-        total_item = QTableWidgetItem(f"{total_price_per_test:,}")
+        total_item = QTableWidgetItem(f"{plan.cost_per_test():,}")
         total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
         total_item.setBackground(QColor('#FFFF99'))
         table.setItem(row_count - 1, col_count - 1, total_item)
@@ -2813,34 +2540,49 @@ class ScheduleManagementTab(QWidget):
         if extend_rounds > 0:
             self._add_extension_rounds_to_table(extend_rounds)
             # 저장된 연장 회차 O/X 상태 복원
-            self._restore_extension_rounds_state(schedule, sampling_count, extend_rounds, test_items)
+            self._restore_extension_rounds_state(sampling_count, extend_rounds)
             # 연장 회차 O/X 상태가 복원되었으므로 비용 재계산
             self.recalculate_costs()
 
         self.update_cost_summary(schedule, test_items, fees, sampling_count)
 
+    @staticmethod
+    def _make_mark_item(value, background=None):
+        """O/X 셀 생성 (X는 빨간색 글자)"""
+        item = QTableWidgetItem(value)
+        item.setTextAlignment(Qt.AlignCenter)
+        if value == plan_engine.MARK_SKIP:
+            item.setForeground(QBrush(QColor('#e74c3c')))
+        if background:
+            item.setBackground(QColor(background))
+        return item
+
+    def _set_mark_cell(self, row_idx, round_idx):
+        """계획의 O/X 값을 테이블 셀에 반영 (row_idx: 검사항목 순번, round_idx: 회차 순번, 0부터)"""
+        item = self.experiment_table.item(row_idx + 3, round_idx + 1)
+        if item is None:
+            return
+        value = self.experiment_plan.mark(row_idx, round_idx)
+        item.setText(value)
+        if value == plan_engine.MARK_SKIP:
+            item.setForeground(QBrush(QColor('#e74c3c')))  # 빨간색
+        else:
+            item.setForeground(QBrush(QColor('#000000')))  # 검정색
+
     def update_cost_summary(self, schedule, test_items, fees, sampling_count):
         """비용 요약 업데이트"""
         test_method = schedule.get('test_method', '') or ''
         schedule_id = schedule.get('id')
 
         # 실험 방법에 따른 구간 수 결정 (실측=1구간, 가속=3구간)
-        if test_method in ['real', 'custom_real']:
-            zone_count = 1
-        else:
-            zone_count = 3
+        zone_count = plan_engine.zone_count(test_method)
 
         # 중간보고서 여부 확인
         report_interim = schedule.get('report_interim', False)
 
-        # 기본 보고서 비용 설정:
-        # - 가속 또는 의뢰자요청(가속): 300,000원
-        # - 실측 또는 의뢰자요청(실측): 200,000원
-        if test_method in ['acceleration', 'custom_acceleration']:
-            default_report_cost = 300000
-        else:
-            default_report_cost = 200000
-        default_interim_cost = 200000 if report_interim else 0
+        # 기본 보고서 비용 (가속: 300,000원, 실측: 200,000원)
+        default_report_cost = plan_engine.default_report_cost(test_method)
+        default_interim_cost = plan_engine.INTERIM_REPORT_COST if report_interim else 0
 
         # 중간 보고서 필드 표시/숨김
         if report_interim:
@@ -2905,15 +2647,13 @@ class ScheduleManagementTab(QWidget):
             self.first_interim_cost_input.setText(f"{first_interim:,}")
 
             first_total_rounds = cost_per_test * sampling_count
-            first_cost_no_vat = int(first_total_rounds * zone_count + first_report + first_interim)
-            if first_interim > 0:
-                formula_text = f"{first_total_rounds:,}×{zone_count}+{first_report:,}+{first_interim:,}={first_cost_no_vat:,}원"
-            else:
-                formula_text = f"{first_total_rounds:,}×{zone_count}+{first_report:,}={first_cost_no_vat:,}원"
+            amounts = plan_engine.estimate_amounts(first_total_rounds, zone_count, first_report, first_interim)
+            formula_text = amounts['formula']
             self.first_cost_formula.setText(formula_text)
 
-            first_vat = int(first_cost_no_vat * 0.1)
-            first_with_vat = first_cost_no_vat + first_vat
+            first_cost_no_vat = amounts['supply']
+            first_vat = amounts['tax']
+            first_with_vat = amounts['total']
             self.first_cost_vat.setText(f"{first_with_vat:,}원")
 
             # 1차 견적 DB 저장
@@ -2973,15 +2713,13 @@ class ScheduleManagementTab(QWidget):
                 self.suspend_interim_cost_input.setText(f"{suspend_interim:,}")
 
                 suspend_total_rounds = cost_per_test * sampling_count
-                suspend_cost_no_vat = int(suspend_total_rounds * zone_count + suspend_report + suspend_interim)
-                if suspend_interim > 0:
-                    suspend_formula = f"{suspend_total_rounds:,}×{zone_count}+{suspend_report:,}+{suspend_interim:,}={suspend_cost_no_vat:,}원"
-                else:
-                    suspend_formula = f"{suspend_total_rounds:,}×{zone_count}+{suspend_report:,}={suspend_cost_no_vat:,}원"
+                amounts = plan_engine.estimate_amounts(suspend_total_rounds, zone_count, suspend_report, suspend_interim)
+                suspend_formula = amounts['formula']
                 self.suspend_cost_formula.setText(suspend_formula)
 
-                suspend_vat = int(suspend_cost_no_vat * 0.1)
-                suspend_with_vat = suspend_cost_no_vat + suspend_vat
+                suspend_cost_no_vat = amounts['supply']
+                suspend_vat = amounts['tax']
+                suspend_with_vat = amounts['total']
                 self.suspend_cost_vat.setText(f"{suspend_with_vat:,}원")
 
                 # 중단 견적 DB 저장
@@ -3043,15 +2781,13 @@ class ScheduleManagementTab(QWidget):
                 self.extend_report_cost_input.setText(f"{extend_report:,}")
                 self.extend_interim_cost_input.setText(f"{extend_interim:,}")
 
-                extend_cost_no_vat = int(extend_total_rounds * zone_count + extend_report + extend_interim)
-                if extend_interim > 0:
-                    extend_formula = f"{extend_total_rounds:,}×{zone_count}+{extend_report:,}+{extend_interim:,}={extend_cost_no_vat:,}원"
-                else:
-                    extend_formula = f"{extend_total_rounds:,}×{zone_count}+{extend_report:,}={extend_cost_no_vat:,}원"
+                amounts = plan_engine.estimate_amounts(extend_total_rounds, zone_count, extend_report, extend_interim)
+                extend_formula = amounts['formula']
                 self.extend_cost_formula.setText(extend_formula)
 
-                extend_vat = int(extend_cost_no_vat * 0.1)
-                extend_with_vat = extend_cost_no_vat + extend_vat
+                extend_cost_no_vat = amounts['supply']
+                extend_vat = amounts['tax']
+                extend_with_vat = amounts['total']
                 self.extend_cost_vat.setText(f"{extend_with_vat:,}원")
 
                 # 연장 견적 DB 저장
@@ -3495,37 +3231,10 @@ class ScheduleManagementTab(QWidget):
             traceback.print_exc()
 
     def _collect_experiment_schedule_data(self):
-        """실험 스케줄 테이블의 O/X 상태 수집 (연장 회차 포함)"""
-        if not self.current_schedule:
+        """O/X 계획을 저장 형식으로 변환 {검사항목: ['O', 'X', ...]} (연장 회차 포함)"""
+        if not self.current_schedule or self.experiment_plan is None:
             return None
-
-        data = {}
-        sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-        extend_rounds = self.current_schedule.get('extend_rounds', 0) or 0
-        total_rounds = sampling_count + extend_rounds
-        row_count = self.experiment_table.rowCount()
-
-        # 검사항목 행 (행 3부터 마지막 가격 행 제외 - 중간보고서, 날짜, 제조후일수 행 다음)
-        for row in range(3, row_count - 1):
-            item_cell = self.experiment_table.item(row, 0)
-            if not item_cell:
-                continue
-
-            test_item = item_cell.text()
-            if not test_item:
-                continue
-
-            row_data = []
-            for col in range(1, total_rounds + 1):
-                cell = self.experiment_table.item(row, col)
-                if cell:
-                    row_data.append(cell.text())
-                else:
-                    row_data.append('')
-
-            data[test_item] = row_data
-
-        return data
+        return self.experiment_plan.to_dict()
 
     def _save_experiment_data_to_db(self):
         """O/X 상태 데이터를 DB에 즉시 저장 (자동 저장)"""
@@ -3541,6 +3250,9 @@ class ScheduleManagementTab(QWidget):
 
             experiment_data = self._collect_experiment_schedule_data()
             experiment_data_json = json.dumps(experiment_data, ensure_ascii=False) if experiment_data else None
+            # 검사항목 추가/삭제로 테이블을 다시 그려도 현재 O/X 유지
+            if experiment_data:
+                self.saved_experiment_data = experiment_data
 
             # 모델을 통해 업데이트 (내부망/외부망 자동 처리)
             Schedule.update_experiment_schedule_data(schedule_id, {
@@ -3883,25 +3595,6 @@ class ScheduleManagementTab(QWidget):
         except ValueError:
             self.extend_experiment_period_value.setText("-")
 
-    def add_business_days(self, start_date, num_days):
-        """영업일 기준으로 날짜 계산 (주말 및 공휴일 제외)"""
-        from datetime import timedelta
-
-        holidays = get_korean_holidays(start_date.year)
-        holidays.update(get_korean_holidays(start_date.year + 1))
-
-        current_date = start_date
-        days_added = 0
-
-        while days_added < num_days:
-            current_date += timedelta(days=1)
-            # 주말(토=5, 일=6) 또는 공휴일이면 건너뜀
-            current_date_only = current_date.date() if hasattr(current_date, 'date') else current_date
-            if current_date.weekday() < 5 and current_date_only not in holidays:
-                days_added += 1
-
-        return current_date
-
     def on_interim_report_combo_changed(self, text):
         """중간보고서 시점 선택 변경 시 처리"""
         if not self.current_schedule:
@@ -3929,7 +3622,7 @@ class ScheduleManagementTab(QWidget):
         if col_idx in self.sample_dates and text:
             sample_date = self.sample_dates[col_idx]
             # 영업일 기준 +15일 계산
-            report_date = self.add_business_days(sample_date, 15)
+            report_date = add_business_days(sample_date, 15)
             report_date_str = report_date.strftime('%Y-%m-%d')
 
             # 해당 중간보고서 날짜 업데이트
@@ -3989,7 +3682,7 @@ class ScheduleManagementTab(QWidget):
         sample_date = self.sample_dates[round_num]
 
         # 영업일 기준 +15일 계산
-        report_date = self.add_business_days(sample_date, 15)
+        report_date = add_business_days(sample_date, 15)
         report_date_str = report_date.strftime('%Y-%m-%d')
 
         # 해당 회차에 연결된 중간보고서 날짜 업데이트
@@ -4162,21 +3855,10 @@ class ScheduleManagementTab(QWidget):
         test_method = schedule.get('test_method', '') or ''
 
         # 구간 수 결정
-        if test_method in ['real', 'custom_real']:
-            zone_count = 1
-        else:
-            zone_count = 3
+        zone_count = plan_engine.zone_count(test_method)
 
-        # 중간보고서 여부 확인
-        report_interim = schedule.get('report_interim', False)
-
-        # 기본 보고서 비용 설정:
-        # - 가속 또는 의뢰자요청(가속): 300,000원
-        # - 실측 또는 의뢰자요청(실측): 200,000원
-        if test_method in ['acceleration', 'custom_acceleration']:
-            default_report_cost = 300000
-        else:
-            default_report_cost = 200000
+        # 기본 보고서 비용 (가속: 300,000원, 실측: 200,000원)
+        default_report_cost = plan_engine.default_report_cost(test_method)
 
         # 검사항목 및 수수료
         food_type_id = schedule.get('food_type_id')
@@ -4218,12 +3900,13 @@ class ScheduleManagementTab(QWidget):
         # 연장 중간보고서 비용 (기본값: 0)
         extend_interim = schedule.get('extend_interim_cost', 0) or 0
 
-        extend_cost_no_vat = int(extend_total_rounds * zone_count + extend_report)
-        extend_formula = f"{extend_total_rounds:,}×{zone_count}+{extend_report:,}={extend_cost_no_vat:,}원"
+        amounts = plan_engine.estimate_amounts(extend_total_rounds, zone_count, extend_report)
+        extend_formula = amounts['formula']
         self.extend_cost_formula.setText(extend_formula)
 
-        extend_vat = int(extend_cost_no_vat * 0.1)
-        extend_with_vat = extend_cost_no_vat + extend_vat
+        extend_cost_no_vat = amounts['supply']
+        extend_vat = amounts['tax']
+        extend_with_vat = amounts['total']
         self.extend_cost_vat.setText(f"{extend_with_vat:,}원")
 
         # 연장 견적 DB 저장
@@ -4271,6 +3954,8 @@ class ScheduleManagementTab(QWidget):
 
                 # 테이블 열 수 축소
                 table.setColumnCount(base_col_count)
+                if self.experiment_plan is not None:
+                    self.experiment_plan.set_extend_rounds(0)
 
                 # 헤더 업데이트
                 headers = ['구 분'] + [f'{i+1}회' for i in range(sampling_count)] + ['가격']
@@ -4419,6 +4104,11 @@ class ScheduleManagementTab(QWidget):
         # 이전 연장 회차 수 저장 (다음 호출 시 참조)
         self.current_schedule['_prev_extend_rounds'] = extend_rounds
 
+        # O/X 계획에 연장 회차 추가 (새 회차는 모두 O)
+        plan = self.experiment_plan
+        if plan is not None:
+            plan.set_extend_rounds(extend_rounds)
+
         # 헤더 업데이트
         headers = ['구 분'] + [f'{i+1}회' for i in range(sampling_count + extend_rounds)] + ['가격']
         table.setHorizontalHeaderLabels(headers)
@@ -4429,18 +4119,8 @@ class ScheduleManagementTab(QWidget):
             if old_price_item:
                 table.setItem(row, new_col_count - 1, old_price_item)
 
-        # 1회 기준 가격 계산용 (기존 1회차 열의 1회기준 값 사용)
-        total_price_per_test = 0
-        basis_row = row_count - 1  # 마지막 행 (1회 기준)
-
-        # 기존 1회차의 1회기준 가격 가져오기
-        basis_item = table.item(basis_row, 1)  # 1회 열
-        if basis_item:
-            try:
-                price_text = basis_item.text().replace(',', '')
-                total_price_per_test = int(price_text)
-            except (ValueError, AttributeError):
-                total_price_per_test = 0
+        # 1회 기준 가격 (연장 회차는 모든 항목 O)
+        total_price_per_test = plan.cost_per_test() if plan is not None else 0
 
         # 연장 회차 데이터 채우기
         for i, ext_schedule in enumerate(extension_schedules):
@@ -4481,12 +4161,9 @@ class ScheduleManagementTab(QWidget):
             days_item.setBackground(QColor('#90EE90'))  # 연두색
             table.setItem(2, col_idx, days_item)
 
-            # 행 3 이후: 검사항목에 O 표시
+            # 행 3 이후: 검사항목에 O 표시 (연한 연두색)
             for row in range(3, row_count - 1):  # 마지막 행(1회기준)은 제외
-                o_item = QTableWidgetItem("O")
-                o_item.setTextAlignment(Qt.AlignCenter)
-                o_item.setBackground(QColor('#F0FFF0'))  # 연한 연두색
-                table.setItem(row, col_idx, o_item)
+                table.setItem(row, col_idx, self._make_mark_item(plan_engine.MARK_DONE, '#F0FFF0'))
 
             # 마지막 행: 1회기준 소계
             cost_item = QTableWidgetItem(f"{total_price_per_test:,}")
@@ -4503,48 +4180,17 @@ class ScheduleManagementTab(QWidget):
         # 스케줄 저장 시그널 발생
         self.schedule_saved.emit()
 
-    def _restore_extension_rounds_state(self, schedule, sampling_count, extend_rounds, test_items):
+    def _restore_extension_rounds_state(self, sampling_count, extend_rounds):
         """저장된 연장 회차 O/X 상태 복원"""
-        import json
-        from PyQt5.QtGui import QColor, QBrush
-
-        # 저장된 실험 데이터 가져오기
-        experiment_data_json = schedule.get('experiment_schedule_data', '')
-        if not experiment_data_json:
-            return
-
-        try:
-            saved_data = json.loads(experiment_data_json)
-        except (json.JSONDecodeError, TypeError):
+        plan = self.experiment_plan
+        if plan is None or not self.saved_experiment_data:
             return
 
-        table = self.experiment_table
-        row_count = table.rowCount()
-
-        # 각 검사항목에 대해 연장 회차 상태 복원
-        for row in range(3, row_count - 1):
-            item_cell = table.item(row, 0)
-            if not item_cell:
-                continue
-
-            test_item = item_cell.text()
-            if test_item not in saved_data:
-                continue
-
-            saved_row_data = saved_data[test_item]
-
-            # 연장 회차 열에 대해서만 상태 복원
-            for i in range(extend_rounds):
-                col_idx = sampling_count + 1 + i
-                data_idx = sampling_count + i
-
-                if data_idx < len(saved_row_data):
-                    saved_value = saved_row_data[data_idx]
-                    cell = table.item(row, col_idx)
-                    if cell and saved_value:
-                        cell.setText(saved_value)
-                        if saved_value == 'X':
-                            cell.setForeground(QBrush(QColor('#e74c3c')))  # 빨간색
+        # 연장 회차 열에 대해서만 상태 복원
+        plan.apply_marks(self.saved_experiment_data, first_round=sampling_count)
+        for row_idx in range(len(plan.test_items)):
+            for round_idx in range(sampling_count, plan.total_rounds):
+                self._set_mark_cell(row_idx, round_idx)
 
     def edit_last_experiment_date_with_calendar(self):
         """달력을 통해 마지막 실험일 수정"""
@@ -4808,21 +4454,15 @@ class ScheduleManagementTab(QWidget):
         if not self.can_edit_plan(allow_suspended=True):
             return
 
-        item = table.item(row, col)
-        if item is None:
+        plan = self.experiment_plan
+        if plan is None or row - test_item_start_row >= len(plan.test_items) or col > plan.total_rounds:
             return
 
-        current_value = item.text()
-
         # O → X → O 순환
-        if current_value == 'O':
-            new_value = 'X'
-            item.setForeground(QBrush(QColor('#e74c3c')))  # 빨간색
-        else:
-            new_value = 'O'
-            item.setForeground(QBrush(QColor('#000000')))  # 검정색
-
-        item.setText(new_value)
+        row_idx, round_idx = row - test_item_start_row, col - 1
+        current_value = plan.mark(row_idx, round_idx)
+        new_value = plan.toggle(row_idx, round_idx)
+        self._set_mark_cell(row_idx, round_idx)
 
         # 활동 로그 기록 (검사항목명 가져오기)
         test_item_name = table.item(row, 0).text() if table.item(row, 0) else ''
@@ -4862,6 +4502,12 @@ class ScheduleManagementTab(QWidget):
             QMessageBox.information(self, "선택 영역 없음", "변경할 영역을 먼저 드래그로 선택해주세요.")
             return
 
+        plan = self.experiment_plan
+        if plan is None:
+            return
+        test_item_end_row = min(test_item_end_row, test_item_start_row + len(plan.test_items) - 1)
+        total_rounds = min(total_rounds, plan.total_rounds)
+
         changed_count = 0
 
         for selection in selected_ranges:
@@ -4875,14 +4521,9 @@ class ScheduleManagementTab(QWidget):
                     if col < 1 or col > total_rounds:
                         continue
 
-                    item = table.item(row, col)
-                    if item is None:
-                        continue
-
-                    current_value = item.text()
-                    if current_value != 'X':
-                        item.setText('X')
-                        item.setForeground(QBrush(QColor('#e74c3c')))  # 빨간색
+                    row_idx, round_idx = row - test_item_start_row, col - 1
+                    if plan.set_mark(row_idx, round_idx, plan_engine.MARK_SKIP):
+                        self._set_mark_cell(row_idx, round_idx)
                         changed_count += 1
 
         if changed_count > 0:
@@ -4900,58 +4541,14 @@ class ScheduleManagementTab(QWidget):
             QMessageBox.information(self, "변경 없음", "변경된 셀이 없습니다.\n검사항목 영역을 선택해주세요.")
 
     def count_completed_rounds(self):
-        """온도조건별 실험 테이블에서 완료된 회차 수를 계산
+        """온도조건별 실험 계획에서 완료된 회차 수를 계산
 
         중단 견적서에서 실제 완료된 회차만 정산하기 위해 사용
-        각 회차(열)에서:
-        - X 표시가 하나라도 있으면 미완료 회차로 간주
-        - O 표시만 있으면 완료 회차로 간주
+        앞에서부터 모든 검사항목이 O인 회차만 완료로 간주 (X가 있는 첫 회차에서 중단)
         """
-        if not hasattr(self, 'experiment_table') or not self.current_schedule:
-            return 0
-
-        table = self.experiment_table
-        sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-        extend_rounds = self.current_schedule.get('extend_rounds', 0) or 0
-        total_rounds = sampling_count + extend_rounds
-
-        # 검사항목 행 범위 (행 3부터 마지막-1 행까지)
-        # 행 0: 중간보고서, 행 1: 날짜, 행 2: 제조후 일수, 행 3~: 검사항목
-        test_item_start_row = 3
-        test_item_end_row = table.rowCount() - 2  # 마지막 행(1회 기준) 제외
-
-        if test_item_end_row < test_item_start_row:
+        if self.experiment_plan is None or not self.current_schedule:
             return 0
-
-        completed_rounds = 0
-
-        # 각 회차(열) 확인 (연장 회차 포함)
-        for col in range(1, total_rounds + 1):
-            has_incomplete = False
-            has_any_test = False
-
-            # 해당 회차의 모든 검사항목 확인
-            for row in range(test_item_start_row, test_item_end_row + 1):
-                item = table.item(row, col)
-                if item:
-                    text = item.text()
-                    if text == 'X':
-                        # X 표시가 있으면 미완료 회차
-                        has_incomplete = True
-                        break
-                    elif text == 'O':
-                        has_any_test = True
-
-            if has_incomplete:
-                # X 표시가 있는 첫 회차에서 중단 (연속된 완료 회차만 카운트)
-                break
-            elif has_any_test:
-                completed_rounds += 1
-            else:
-                # O도 X도 없으면 미완료로 간주하고 중단
-                break
-
-        return completed_rounds
+        return self.experiment_plan.completed_rounds()
 
     def edit_date_with_calendar(self, col):
         """달력을 통해 날짜 수정 - 1회차 날짜 변경 시 시작일도 연동"""
@@ -5009,12 +4606,7 @@ class ScheduleManagementTab(QWidget):
                 date_item.setText(dialog.selected_date.strftime('%Y-%m-%d'))
 
                 # 주말/공휴일 체크하여 배경색 결정
-                selected_date = dialog.selected_date
-                selected_date_only = selected_date.date() if hasattr(selected_date, 'date') else selected_date
-                holidays = get_korean_holidays(selected_date.year)
-                is_weekend = selected_date.weekday() >= 5
-                is_holiday = selected_date_only in holidays
-                if is_weekend or is_holiday:
+                if not is_business_day(dialog.selected_date):
                     date_item.setBackground(QColor('#FF8C00'))  # 진한 주황색 (수정됨 + 검토 필요)
                     date_item.setToolTip("수정됨 - 주말 또는 공휴일 검토 필요")
                 else:
@@ -5055,17 +4647,16 @@ class ScheduleManagementTab(QWidget):
             return
 
         sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-        days = self.current_schedule.get('test_period_days', 0) or 0
-        months = self.current_schedule.get('test_period_months', 0) or 0
-        years = self.current_schedule.get('test_period_years', 0) or 0
-        experiment_days = days + (months * 30) + (years * 365)
+        experiment_days = plan_engine.experiment_days(
+            self.current_schedule.get('test_method', '') or '',
+            self.current_schedule.get('test_period_days', 0),
+            self.current_schedule.get('test_period_months', 0),
+            self.current_schedule.get('test_period_years', 0)
+        )
+        offsets = plan_engine.round_offsets(experiment_days, sampling_count)
 
         table = self.experiment_table
 
-        # 공휴일 목록 가져오기
-        holidays = get_korean_holidays(new_start_date.year)
-        holidays.update(get_korean_holidays(new_start_date.year + 1))
-
         # 각 회차별 날짜 재계산
         for i in range(sampling_count):
             col_idx = i + 1
@@ -5073,13 +4664,7 @@ class ScheduleManagementTab(QWidget):
             # 사용자가 직접 수정한 날짜가 아닌 경우에만 재계산
             if col_idx not in self.custom_dates or col_idx == 1:
                 from datetime import timedelta
-                if i == sampling_count - 1:
-                    days_offset = experiment_days
-                elif sampling_count > 1:
-                    interval_days = experiment_days / (sampling_count - 1)
-                    days_offset = round(i * interval_days)
-                else:
-                    days_offset = 0
+                days_offset = offsets[i]
 
                 sample_date = new_start_date + timedelta(days=days_offset)
 
@@ -5089,10 +4674,7 @@ class ScheduleManagementTab(QWidget):
                     date_item.setText(sample_date.strftime('%Y-%m-%d'))
 
                     # 주말/공휴일 체크하여 배경색 결정
-                    sample_date_only = sample_date.date() if hasattr(sample_date, 'date') else sample_date
-                    is_weekend = sample_date.weekday() >= 5
-                    is_holiday = sample_date_only in holidays
-                    if is_weekend or is_holiday:
+                    if not is_business_day(sample_date):
                         if col_idx == 1:
                             date_item.setBackground(QColor('#FF8C00'))  # 진한 주황색 (시작일 + 검토 필요)
                         else:
@@ -5176,105 +4758,46 @@ class ScheduleManagementTab(QWidget):
             print(f"실험기간 업데이트 오류: {e}")
 
     def recalculate_costs(self):
-        """셀 변경 시 비용 재계산"""
+        """셀 변경 시 비용 재계산 (O/X 계획의 배열 연산)"""
         if not self.current_schedule:
             return
 
         # 필수 속성 체크
-        if not hasattr(self, 'experiment_table'):
+        if not hasattr(self, 'experiment_table') or self.experiment_plan is None:
             return
 
         table = self.experiment_table
-        sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-        extend_rounds = self.current_schedule.get('extend_rounds', 0) or 0
-        total_rounds = sampling_count + extend_rounds
+        plan = self.experiment_plan
+        sampling_count = plan.sampling_count
+        extend_rounds = plan.extend_rounds
         test_method = self.current_schedule.get('test_method', '') or ''
 
-        # 수수료 정보 로드
-        fees = {}
-        try:
-            all_fees = Fee.get_all()
-            for fee in all_fees:
-                fees[fee['test_item']] = fee['price']
-        except Exception:
-            pass
-
-        # 식품유형에서 검사항목 가져오기 + 추가된 항목
-        base_items = self.get_test_items_from_food_type(self.current_schedule)
-        additional_items = self.additional_test_items if hasattr(self, 'additional_test_items') else []
-        test_items = base_items + additional_items
+        # 각 회차별 비용 (O로 체크된 항목 단가 합계, 연장 회차 포함)
+        column_costs = plan.column_costs()
 
-        # 검사항목 행 시작 (행 3부터: 0=중간보고서, 1=날짜, 2=제조후일수, 3~=검사항목)
-        test_item_start_row = 3
-
-        # 각 검사항목별 O 체크 수 및 비용 계산
-        item_o_counts = {}  # {항목명: O 체크 수}
-        item_costs = {}     # {항목명: 총 비용}
-
-        # 각 회차별 활성 항목 비용 합계 계산 (연장 회차 포함)
-        column_costs = []  # 각 회차별 비용
-        for col_idx in range(1, total_rounds + 1):
-            col_cost = 0
-            for row_idx, test_item in enumerate(test_items):
-                item = table.item(test_item_start_row + row_idx, col_idx)
-                if item and item.text() == 'O':
-                    col_cost += int(fees.get(test_item, 0))
-                    # 항목별 O 체크 수 카운트
-                    item_o_counts[test_item] = item_o_counts.get(test_item, 0) + 1
-            column_costs.append(col_cost)
-
-        # 항목별 총 비용 계산 (O 체크 수 × 단가)
-        for test_item in test_items:
-            o_count = item_o_counts.get(test_item, 0)
-            unit_price = int(fees.get(test_item, 0))
-            item_costs[test_item] = o_count * unit_price
-
-        # 1차 견적 항목별 비용 내역 텍스트 생성 (기본 회차 기준, O/X 상태 반영)
-        first_detail_parts = []
-        # 기본 회차(1~sampling_count)에서 각 항목별 O 체크 수 계산
-        first_item_o_counts = {}
-        for col_idx in range(1, sampling_count + 1):
-            for row_idx, test_item in enumerate(test_items):
-                item = table.item(test_item_start_row + row_idx, col_idx)
-                if item and item.text() == 'O':
-                    first_item_o_counts[test_item] = first_item_o_counts.get(test_item, 0) + 1
-        for test_item in test_items:
-            o_count = first_item_o_counts.get(test_item, 0)
-            if o_count > 0:
-                unit_price = int(fees.get(test_item, 0))
-                item_cost = unit_price * o_count
-                first_detail_parts.append(f"{test_item}({o_count}회)={item_cost:,}원")
-        self.item_cost_detail.setText(" | ".join(first_detail_parts) if first_detail_parts else "-")
+        # 1차 견적 항목별 비용 내역 (기본 회차 기준, O/X 상태 반영)
+        self.item_cost_detail.setText(plan.item_detail(0, sampling_count))
 
-        # 중단 견적 항목별 비용 내역 텍스트 생성 (O로 체크된 것만)
-        suspend_detail_parts = []
-        for test_item in test_items:
-            o_count = item_o_counts.get(test_item, 0)
-            total_cost = item_costs.get(test_item, 0)
-            if o_count > 0:
-                suspend_detail_parts.append(f"{test_item}({o_count}회)={total_cost:,}원")
+        # 중단 견적 항목별 비용 내역 (전체 회차, O로 체크된 것만)
         if hasattr(self, 'suspend_item_cost_detail'):
-            self.suspend_item_cost_detail.setText(" | ".join(suspend_detail_parts) if suspend_detail_parts else "-")
+            self.suspend_item_cost_detail.setText(plan.item_detail())
 
         # (1회 기준) 행 업데이트
         basis_row = table.rowCount() - 1
-        for i, col_cost in enumerate(column_costs):
+        for i, col_cost in enumerate(column_costs.tolist()):
             cost_item = table.item(basis_row, i + 1)
             if cost_item:
                 cost_item.setText(f"{col_cost:,}")
 
         # 실험 방법에 따른 구간 수 결정 (실측=1구간, 가속=3구간)
-        if test_method in ['real', 'custom_real']:
-            zone_count = 1
-        else:
-            zone_count = 3
+        zone_count = plan_engine.zone_count(test_method)
 
         # 1. 1회 기준 (합계) - 모든 검사항목 합계 (전체 항목, O/X 상태 무관)
-        cost_per_test = int(sum(fees.get(item, 0) for item in test_items))
+        cost_per_test = plan.cost_per_test()
         self.cost_per_test.setText(f"1회:{cost_per_test:,}원")
 
         # 2. 기본 회차별 총계 (O로 체크된 항목만)
-        total_rounds_cost = sum(column_costs[:sampling_count])  # 기본 회차만
+        total_rounds_cost = plan.base_rounds_cost()
         self.total_rounds_cost.setText(f"회차:{total_rounds_cost:,}원")
 
         # ========== 1차 견적 계산 ==========
@@ -5292,16 +4815,14 @@ class ScheduleManagementTab(QWidget):
             except (ValueError, TypeError):
                 first_interim_cost = 200000
 
-        first_cost_no_vat = int(first_total_rounds * zone_count + first_report_cost + first_interim_cost)
-        if first_interim_cost > 0:
-            first_formula = f"{first_total_rounds:,}×{zone_count}+{first_report_cost:,}+{first_interim_cost:,}={first_cost_no_vat:,}원"
-        else:
-            first_formula = f"{first_total_rounds:,}×{zone_count}+{first_report_cost:,}={first_cost_no_vat:,}원"
+        amounts = plan_engine.estimate_amounts(first_total_rounds, zone_count, first_report_cost, first_interim_cost)
+        first_formula = amounts['formula']
         self.first_cost_formula.setText(first_formula)
 
         # 1차 부가세 포함 (통일된 형식)
-        first_vat = int(first_cost_no_vat * 0.1)
-        first_with_vat = first_cost_no_vat + first_vat
+        first_cost_no_vat = amounts['supply']
+        first_vat = amounts['tax']
+        first_with_vat = amounts['total']
         if hasattr(self, 'first_cost_vat'):
             self.first_cost_vat.setText(f"{first_with_vat:,}원")
 
@@ -5338,14 +4859,12 @@ class ScheduleManagementTab(QWidget):
             except (ValueError, TypeError):
                 suspend_interim_cost = first_interim_cost
 
-        suspend_cost_no_vat = int(suspend_rounds_cost_value * zone_count + suspend_report_cost + suspend_interim_cost)
-        if suspend_interim_cost > 0:
-            suspend_formula = f"{suspend_rounds_cost_value:,}×{zone_count}+{suspend_report_cost:,}+{suspend_interim_cost:,}={suspend_cost_no_vat:,}원"
-        else:
-            suspend_formula = f"{suspend_rounds_cost_value:,}×{zone_count}+{suspend_report_cost:,}={suspend_cost_no_vat:,}원"
-
-        suspend_vat = int(suspend_cost_no_vat * 0.1)
-        suspend_with_vat = suspend_cost_no_vat + suspend_vat
+        amounts = plan_engine.estimate_amounts(suspend_rounds_cost_value, zone_count,
+                                               suspend_report_cost, suspend_interim_cost)
+        suspend_formula = amounts['formula']
+        suspend_cost_no_vat = amounts['supply']
+        suspend_vat = amounts['tax']
+        suspend_with_vat = amounts['total']
 
         # 중단 견적 DB에 저장 (상태와 관계없이 항상 저장 - 견적서 금액 일치 위해)
         if schedule_id and hasattr(self, 'suspend_item_cost_detail'):
@@ -5381,30 +4900,16 @@ class ScheduleManagementTab(QWidget):
             self.row_extend_widget.show()
 
             # 연장 회차 비용 (O로 체크된 것만)
-            extend_total_cost = sum(column_costs[sampling_count:])
+            extend_total_cost = plan.extend_rounds_cost()
             self.extend_rounds_cost.setText(f"회차:{extend_total_cost:,}원")
 
             # 연장 1회 비용
             if hasattr(self, 'extend_cost_per_test'):
                 self.extend_cost_per_test.setText(f"1회:{cost_per_test:,}원")
 
-            # 연장 항목별 비용 내역 (O/X 상태 반영)
-            extend_detail_parts = []
-            # 연장 회차(sampling_count+1 ~ sampling_count+extend_rounds)에서 각 항목별 O 체크 수 계산
-            extend_item_o_counts = {}
-            for col_idx in range(sampling_count + 1, sampling_count + extend_rounds + 1):
-                for row_idx, test_item in enumerate(test_items):
-                    item = table.item(test_item_start_row + row_idx, col_idx)
-                    if item and item.text() == 'O':
-                        extend_item_o_counts[test_item] = extend_item_o_counts.get(test_item, 0) + 1
-            for test_item in test_items:
-                o_count = extend_item_o_counts.get(test_item, 0)
-                if o_count > 0:
-                    unit_price = int(fees.get(test_item, 0))
-                    extend_item_cost = unit_price * o_count
-                    extend_detail_parts.append(f"{test_item}({o_count}회)={extend_item_cost:,}원")
+            # 연장 항목별 비용 내역 (연장 회차의 O/X 상태 반영)
             if hasattr(self, 'extend_item_cost_detail'):
-                self.extend_item_cost_detail.setText(" | ".join(extend_detail_parts))
+                self.extend_item_cost_detail.setText(plan.item_detail(sampling_count))
 
             try:
                 extend_report_cost = int(self.extend_report_cost_input.text().replace(',', '').replace('원', ''))
@@ -5418,16 +4923,15 @@ class ScheduleManagementTab(QWidget):
                 except (ValueError, TypeError):
                     extend_interim_cost = 0
 
-            extend_cost_no_vat = int(extend_total_cost * zone_count + extend_report_cost + extend_interim_cost)
-            if extend_interim_cost > 0:
-                extend_formula = f"{extend_total_cost:,}×{zone_count}+{extend_report_cost:,}+{extend_interim_cost:,}={extend_cost_no_vat:,}원"
-            else:
-                extend_formula = f"{extend_total_cost:,}×{zone_count}+{extend_report_cost:,}={extend_cost_no_vat:,}원"
+            amounts = plan_engine.estimate_amounts(extend_total_cost, zone_count,
+                                                   extend_report_cost, extend_interim_cost)
+            extend_formula = amounts['formula']
             self.extend_cost_formula.setText(extend_formula)
 
             # 연장 부가세 포함 (통일된 형식)
-            extend_vat = int(extend_cost_no_vat * 0.1)
-            extend_with_vat = extend_cost_no_vat + extend_vat
+            extend_cost_no_vat = amounts['supply']
+            extend_vat = amounts['tax']
+            extend_with_vat = amounts['total']
             if hasattr(self, 'extend_cost_vat'):
                 self.extend_cost_vat.setText(f"{extend_with_vat:,}원")
 
@@ -5452,41 +4956,9 @@ class ScheduleManagementTab(QWidget):
 
     def _calculate_extend_rounds_cost(self):
         """연장 회차만의 비용 계산 (O/X 상태 반영)"""
-        if not self.current_schedule:
-            return 0
-
-        table = self.experiment_table
-        sampling_count = self.current_schedule.get('sampling_count', 6) or 6
-        extend_rounds = self.current_schedule.get('extend_rounds', 0) or 0
-
-        if extend_rounds == 0:
+        if not self.current_schedule or self.experiment_plan is None:
             return 0
-
-        # 수수료 정보 로드
-        fees = {}
-        try:
-            all_fees = Fee.get_all()
-            for fee in all_fees:
-                fees[fee['test_item']] = fee['price']
-        except Exception:
-            pass
-
-        # 식품유형에서 검사항목 가져오기 + 추가된 항목
-        base_items = self.get_test_items_from_food_type(self.current_schedule)
-        test_items = base_items + self.additional_test_items
-
-        # 검사항목 행 시작 (행 3부터)
-        test_item_start_row = 3
-
-        # 연장 회차 열만 계산 (sampling_count + 1 부터 sampling_count + extend_rounds 까지)
-        extend_cost = 0
-        for col_idx in range(sampling_count + 1, sampling_count + extend_rounds + 1):
-            for row_idx, test_item in enumerate(test_items):
-                item = table.item(test_item_start_row + row_idx, col_idx)
-                if item and item.text() == 'O':
-                    extend_cost += int(fees.get(test_item, 0))
-
-        return extend_cost
+        return self.experiment_plan.extend_rounds_cost()
 
     def on_cost_input_changed(self):
         """보고서 비용 입력 변경 시 총비용 재계산 (1차/중단/연장 개별 처리)"""
@@ -6461,14 +5933,8 @@ class ScheduleMailDialog(QDialog):
             QMessageBox.information(self, "알림", "등록된 업체 이메일이 없습니다.")
 
     def send_mail(self):
-        """메일 전송 (시스템 내 메일 + SMTP 이메일)"""
-        import os
-        import smtplib
-        from email.mime.multipart import MIMEMultipart
-        from email.mime.text import MIMEText
-        from email.mime.base import MIMEBase
-        from email import encoders
-        from email.header import Header
+        """메일 전송 (시스템 내 메일 + SMTP 이메일 발송 대기열)"""
+        from utils.mail_queue import mail_queue
 
         to_ids = [uid for uid, cb in self.to_checkboxes.items() if cb.isChecked()]
         cc_ids = [uid for uid, cb in self.cc_checkboxes.items() if cb.isChecked()]
@@ -6536,76 +6002,27 @@ class ScheduleMailDialog(QDialog):
                 if not smtp_server or not smtp_email or not smtp_password:
                     errors.append("SMTP 설정이 완료되지 않았습니다. 설정 > 이메일 탭에서 SMTP 설정을 완료해주세요.")
                 else:
-                    # 이메일 구성
-                    msg = MIMEMultipart()
-                    msg['From'] = f"{sender_name} <{smtp_email}>"
-
-                    # 수신자 처리
+                    # 수신자/참조 처리
                     to_list = [email.strip() for email in external_to.split(',') if email.strip()]
-                    msg['To'] = ', '.join(to_list)
-
-                    # 참조 처리
                     cc_list = []
                     if external_cc:
                         cc_list = [email.strip() for email in external_cc.split(',') if email.strip()]
-                        msg['Cc'] = ', '.join(cc_list)
-
-                    msg['Subject'] = subject
-
-                    # 본문
-                    msg.attach(MIMEText(content, 'plain', 'utf-8'))
-
-                    # 첨부파일
-                    for file_path in self.attachment_files:
-                        if os.path.exists(file_path):
-                            with open(file_path, 'rb') as attachment:
-                                filename = os.path.basename(file_path)
-                                ext = os.path.splitext(filename)[1].lower()
-
-                                # MIME 타입 결정
-                                if ext in ['.jpg', '.jpeg']:
-                                    mime_type = 'image/jpeg'
-                                elif ext == '.png':
-                                    mime_type = 'image/png'
-                                elif ext == '.pdf':
-                                    mime_type = 'application/pdf'
-                                else:
-                                    mime_type = 'application/octet-stream'
-
-                                maintype, subtype = mime_type.split('/', 1)
-                                part = MIMEBase(maintype, subtype)
-                                part.set_payload(attachment.read())
-                                encoders.encode_base64(part)
-
-                                # 한글 파일명 인코딩
-                                encoded_filename = Header(filename, 'utf-8').encode()
-                                part.add_header(
-                                    'Content-Disposition',
-                                    'attachment',
-                                    filename=('utf-8', '', filename)
-                                )
-                                part.add_header('Content-Type', mime_type, name=encoded_filename)
-                                msg.attach(part)
-
-                    # SMTP 연결 및 발송
-                    all_recipients = to_list + cc_list
-
-                    if smtp_security == "SSL":
-                        server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                    else:
-                        server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                        if smtp_security == "TLS":
-                            server.starttls()
 
-                    server.login(smtp_email, smtp_password)
-                    server.sendmail(smtp_email, all_recipients, msg.as_string())
-                    server.quit()
+                    # 발송 대기열에 추가 (실제 발송은 백그라운드에서 처리)
+                    mail_queue.enqueue(
+                        smtp={'server': smtp_server, 'port': smtp_port,
+                              'security': smtp_security, 'username': smtp_email},
+                        credential={'scope': 'global'},
+                        sender_name=sender_name,
+                        to_list=to_list,
+                        cc_list=cc_list,
+                        subject=subject,
+                        body=content,
+                        attachments=list(self.attachment_files),
+                        owner_id=self.current_user.get('id') if self.current_user else None
+                    )
                     smtp_mail_sent = True
 
-            except smtplib.SMTPAuthenticationError:
-                errors.append("SMTP 인증 실패. 이메일 또는 비밀번호를 확인해주세요.")
-            except smtplib.SMTPException as e:
-                errors.append(f"SMTP 오류: {str(e)}")
             except Exception as e:
                 errors.append(f"외부 이메일: {str(e)}")
 
@@ -6617,7 +6034,7 @@ class ScheduleMailDialog(QDialog):
                 if system_mail_sent:
                     sent_parts.append("시스템 내 메일")
                 if smtp_mail_sent:
-                    sent_parts.append("외부 이메일")
+                    sent_parts.append("외부 이메일(발송 대기)")
                 QMessageBox.warning(self, "부분 성공",
                     f"{', '.join(sent_parts)} 발송 완료.\n\n오류:\n{error_msg}")
                 self.accept()
@@ -6628,6 +6045,6 @@ class ScheduleMailDialog(QDialog):
             if system_mail_sent:
                 sent_parts.append("시스템 내 메일")
             if smtp_mail_sent:
-                sent_parts.append("외부 이메일")
+                sent_parts.append("외부 이메일(발송 대기)")
             QMessageBox.information(self, "완료", f"메일 발송 완료: {', '.join(sent_parts)}")
             self.accept()
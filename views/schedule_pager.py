@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+스케줄 목록 페이지 조회 (스케줄 작성 탭 / 스케줄 선택 팝업 공용)
+- SchedulePager: 서버 필터와 키셋 페이지 커서를 보관하고 다음 페이지를 이어서 조회
+- schedule_search_filters: 검색어 / 검색 필드를 서버 필터로 변환 (초성 검색 포함)
+  결과가 있을 수 없는 검색(일치하는 상태 없음)은 None - 페이저는 DB를 조회하지 않고 빈 목록
+"""
+
+from models.schedules import Schedule
+from utils.chosung import is_chosung_only, match_chosung
+from .settings_dialog import get_status_map
+
+
+def schedule_search_filters(search_text, search_field):
+    """검색어를 Schedule.get_page 서버 필터로 변환
+
+    초성만 입력하면 서버에서 업체명/샘플명 초성 컬럼으로 검색하고,
+    상태명은 설정의 상태 이름과 비교해 상태 코드로 변환
+
+    Returns:
+        서버 필터 dict (검색어가 없으면 {}), 결과가 없는 검색이면 None
+    """
+    if not search_text:
+        return {}
+
+    if is_chosung_only(search_text):
+        matched_statuses = [code for code, name in get_status_map().items()
+                            if match_chosung(name or '', search_text)]
+    else:
+        search_lower = search_text.lower()
+        matched_statuses = [code for code, name in get_status_map().items()
+                            if search_lower in (name or '').lower()]
+
+    if search_field == "업체명":
+        return {'keyword': search_text, 'keyword_field': 'client_name'}
+    if search_field == "샘플명":
+        return {'keyword': search_text, 'keyword_field': 'product_name'}
+    if search_field == "상태":
+        # 일치하는 상태가 없으면 결과 없음
+        return {'status': matched_statuses} if matched_statuses else None
+    return {'keyword': search_text, 'keyword_statuses': matched_statuses}
+
+
+class SchedulePager:
+    """스케줄 목록 키셋 페이지 조회 상태"""
+
+    def __init__(self, page_size=200):
+        self.page_size = page_size
+        self.filters = {}  # 현재 서버 필터
+        self.no_results = False  # 결과가 없는 검색 (DB 조회 안 함)
+        self.next_cursor = None  # 다음 페이지 커서
+        self.has_more = False  # 다음 페이지 존재 여부
+        self.loading = False  # 페이지 로딩 중 여부
+
+    def reset(self):
+        """조회 상태 초기화 (로그아웃 시)"""
+        self.filters = {}
+        self.no_results = False
+        self.next_cursor = None
+        self.has_more = False
+
+    def first_page(self, *filter_parts):
+        """필터를 바꾸고 첫 페이지 조회 (목록 표시용 요약 컬럼)
+
+        Args:
+            filter_parts: 합쳐서 사용할 서버 필터 dict (권한 필터, 검색 필터 ...)
+                None이 있으면 결과가 없는 검색 - DB를 조회하지 않고 빈 목록
+        """
+        self.filters = {}
+        self.no_results = any(part is None for part in filter_parts)
+        if self.no_results:
+            self.next_cursor = None
+            self.has_more = False
+            return []
+        for part in filter_parts:
+            self.filters.update(part)
+        page = Schedule.get_page(limit=self.page_size, filters=self.filters)
+        return self._apply(page)
+
+    def next_page(self):
+        """다음 페이지 조회 (더 없거나 조회 중이면 빈 목록)"""
+        if not self.has_more or self.loading:
+            return []
+        self.loading = True
+        try:
+            page = Schedule.get_page(cursor=self.next_cursor, limit=self.page_size, filters=self.filters)
+            return self._apply(page)
+        finally:
+            self.loading = False
+
+    def iter_all(self):
+        """현재 필터의 전체 스케줄 (엑셀 내보내기용, 필터는 호출 시점 값으로 고정)"""
+        if self.no_results:
+            return iter(())
+        return Schedule.iter_all(filters=dict(self.filters))
+
+    def _apply(self, page):
+        self.next_cursor = page['next_cursor']
+        self.has_more = page['has_more']
+        return [dict(s) for s in page['items']]
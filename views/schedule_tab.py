@@ -5,7 +5,7 @@
 스케줄 작성 탭
 '''
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                           QTableWidget, QTableWidgetItem, QHeaderView,
+                           QHeaderView,
                            QFrame, QMessageBox, QComboBox, QCheckBox, QLabel,
                            QApplication, QDialog, QGroupBox, QScrollArea,
                            QDialogButtonBox, QLineEdit, QFileDialog)
@@ -15,6 +15,9 @@ from PyQt5.QtGui import QColor
 # ScheduleCreateDialog 클래스를 schedule_dialog.py에서 임포트
 from .schedule_dialog import ScheduleCreateDialog
 from .settings_dialog import get_status_settings, get_status_map, get_status_colors, get_status_text_colors, get_status_names, get_status_code_by_name
+from .export_worker import ask_export_path, start_export
+from .table_models import RowTableModel, create_list_view
+from .schedule_pager import SchedulePager, schedule_search_filters
 from utils.logger import log_message, log_error, log_exception
 
 
@@ -175,22 +178,139 @@ class ScheduleDisplaySettingsDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "오류", f"설정 저장 중 오류: {str(e)}")
 
+# 실험방법 / 보관조건 표시명
+TEST_METHOD_TEXT = {
+    'real': '실측', 'acceleration': '가속',
+    'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'
+}
+STORAGE_TEXT = {'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'}
+
+# 의뢰자 요청 온도가 없을 때 보관조건별 실험온도 (가속 / 실측)
+ACCELERATION_TEMPERATURES = {
+    'room_temp': '15℃, 25℃, 35℃',
+    'warm': '25℃, 35℃, 45℃',
+    'cool': '5℃, 10℃, 15℃',
+    'freeze': '-6℃, -12℃, -18℃'
+}
+REAL_TEMPERATURES = {
+    'room_temp': '15℃',
+    'warm': '25℃',
+    'cool': '10℃',
+    'freeze': '-18℃ 이하'
+}
+
+
+def schedule_cell_text(schedule, col_key, data_key=None, status_map=None):
+    """스케줄 목록 셀 표시 문자열 (테이블 표시 / 내보내기 공용, GUI 객체 사용 안 함)"""
+    if col_key == 'test_method':
+        test_method = schedule.get('test_method', '') or ''
+        return TEST_METHOD_TEXT.get(test_method, test_method)
+
+    if col_key == 'storage_condition':
+        storage = schedule.get('storage_condition', '') or ''
+        return STORAGE_TEXT.get(storage, storage)
+
+    if col_key == 'food_type':
+        # 식품유형 (ID → 이름 변환, 카탈로그 캐시)
+        food_type_id = schedule.get('food_type_id', '')
+        if food_type_id:
+            try:
+                from models.product_types import ProductType
+                food_type = ProductType.get_by_id(food_type_id)
+                if food_type:
+                    return food_type.get('type_name', '') or ''
+            except Exception:
+                pass
+        return ''
+
+    days = schedule.get('test_period_days', 0) or 0
+    months = schedule.get('test_period_months', 0) or 0
+    years = schedule.get('test_period_years', 0) or 0
+
+    if col_key == 'expiry_period':
+        # 소비기한 (일/월/년 조합)
+        parts = []
+        if years > 0:
+            parts.append(f"{years}년")
+        if months > 0:
+            parts.append(f"{months}개월")
+        if days > 0:
+            parts.append(f"{days}일")
+        return ' '.join(parts)
+
+    if col_key == 'test_period':
+        # 실험기간 계산
+        total_days = days + (months * 30) + (years * 365)
+        if schedule.get('test_method', 'real') in ['acceleration', 'custom_acceleration']:
+            test_days = total_days // 2
+        else:
+            test_days = int(total_days * 1.5)
+        return f"{test_days}일" if test_days > 0 else ''
+
+    if col_key == 'report_type':
+        # 보고서 종류 - 중간보고서만 표시
+        return '중간' if schedule.get('report_interim') else '-'
+
+    if col_key == 'extension_test':
+        return '진행' if schedule.get('extension_test', False) else '미진행'
+
+    if col_key == 'packaging':
+        weight = schedule.get('packaging_weight', 0) or 0
+        unit = schedule.get('packaging_unit', 'g') or 'g'
+        return f"{weight}{unit}" if weight > 0 else ''
+
+    if col_key in ('supply_amount', 'tax_amount', 'total_amount'):
+        amount = schedule.get(col_key, 0) or 0
+        return f"{int(amount):,}" if amount > 0 else ''
+
+    if col_key == 'status':
+        status = schedule.get('status', 'pending') or 'pending'
+        if status_map is None:
+            status_map = get_status_map()
+        return status_map.get(status, status)
+
+    if col_key == 'custom_temperatures':
+        # 실험온도 - 의뢰자 요청 온도 또는 보관조건에 따른 온도
+        custom_temps = schedule.get('custom_temperatures', '') or ''
+        if custom_temps:
+            return f"{custom_temps.replace(',', ', ')}℃"
+        test_method = schedule.get('test_method', 'real') or 'real'
+        storage = schedule.get('storage_condition', 'room_temp') or 'room_temp'
+        if test_method in ['acceleration', 'custom_acceleration']:
+            return ACCELERATION_TEMPERATURES.get(storage, '')
+        return REAL_TEMPERATURES.get(storage, '')
+
+    if col_key in ['report1_date', 'report2_date', 'report3_date']:
+        # 중간보고 1, 2, 3 날짜 (스케줄 관리에서 저장된 값)
+        date_value = schedule.get(col_key, '') or ''
+        return date_value if date_value and date_value != '-' else '-'
+
+    # 기타 필드 (직접 매핑)
+    value = schedule.get(data_key, '') if data_key else ''
+    return '' if value is None else str(value)
+
+
 class ScheduleTab(QWidget):
     # 더블클릭 시 스케줄 ID를 전달하는 시그널
     schedule_double_clicked = pyqtSignal(int)
     # 스케줄 삭제 시그널 (삭제된 스케줄 ID 전달)
     schedule_deleted = pyqtSignal(int)
 
-    # 한글 초성 매핑
-    CHOSUNG_LIST = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.all_schedules = []  # 전체 스케줄 목록 저장
+        self.all_schedules = []  # 불러온 스케줄 목록 저장 (페이지 단위로 누적)
         self.current_user = None  # 현재 로그인한 사용자
         self._needs_refresh = True  # 데이터 새로고침 필요 여부 (Lazy Loading)
         self._data_loaded = False  # 데이터 로드 완료 여부
 
+        # 페이지 조회 상태 (키셋 페이지네이션)
+        self.pager = SchedulePager(self.PAGE_SIZE)
+
+        # 목록 표시용 상태 이름/색상 (목록을 표시할 때 한 번 읽어 셀마다 재사용)
+        self._status_map = None
+        self._status_colors = {}
+        self._status_text_colors = {}
+
         # 버튼 참조 저장 (권한 체크용)
         self.new_schedule_btn = None
         self.edit_schedule_btn = None
@@ -227,8 +347,10 @@ class ScheduleTab(QWidget):
         self.current_user = None
         self._needs_refresh = True
         self._data_loaded = False
+        self.pager.reset()
         if hasattr(self, 'schedule_table') and self.schedule_table:
-            self.schedule_table.setRowCount(0)
+            self.schedule_model.set_rows([])
+            self.update_load_more_button()
 
     def apply_permissions(self):
         """사용자 권한에 따라 버튼 활성화/비활성화"""
@@ -278,6 +400,9 @@ class ScheduleTab(QWidget):
             if not has_perm:
                 self.export_btn.setToolTip("권한이 없습니다")
     
+    # 한 번에 불러올 스케줄 수 (스크롤 끝 도달 또는 '더 보기' 클릭 시 다음 페이지)
+    PAGE_SIZE = 200
+
     # 컬럼 정의 (key, header_name, data_key, column_index)
     # column_index는 동적으로 계산되므로 None으로 설정
     ALL_COLUMNS = [
@@ -452,11 +577,15 @@ class ScheduleTab(QWidget):
 
         layout.addWidget(search_frame)
 
-        # 스케줄 목록 테이블 - 전체 컬럼 생성
-        self.schedule_table = QTableWidget()
-        self.schedule_table.setColumnCount(len(self.ALL_COLUMNS))
-        headers = [col[1] for col in self.ALL_COLUMNS]
-        self.schedule_table.setHorizontalHeaderLabels(headers)
+        # 스케줄 목록 테이블 - 전체 컬럼 생성 (모델/뷰: 화면에 보이는 행만 그림)
+        self._column_data_keys = {col[0]: col[2] for col in self.ALL_COLUMNS}
+        self.schedule_model = RowTableModel(
+            [(col[0], col[1]) for col in self.ALL_COLUMNS],
+            cell_text=self.list_cell_text,
+            cell_style=self.list_cell_style,
+            check_column=0
+        )
+        self.schedule_table, self.schedule_proxy = create_list_view(self.schedule_model, self)
         self.schedule_table.setColumnHidden(1, True)  # ID 열 항상 숨김
         # 열 너비 조절 설정
         header = self.schedule_table.horizontalHeader()
@@ -502,12 +631,8 @@ class ScheduleTab(QWidget):
             col_key = col_def[0]
             if col_key in column_widths:
                 self.schedule_table.setColumnWidth(col_index, column_widths[col_key])
-        self.schedule_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.schedule_table.setEditTriggers(QTableWidget.NoEditTriggers)
 
-        # 헤더 클릭으로 정렬 기능 활성화
-        self.schedule_table.setSortingEnabled(True)
-        self.schedule_table.horizontalHeader().setSortIndicatorShown(True)
+        # 헤더 클릭으로 정렬 (프록시 모델에서 정렬)
         self.schedule_table.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
 
         # 정렬 상태 저장
@@ -517,8 +642,17 @@ class ScheduleTab(QWidget):
         # 더블클릭 이벤트 연결
         self.schedule_table.doubleClicked.connect(self.on_double_click)
 
+        # 스크롤이 끝에 닿으면 다음 페이지 로드
+        self.schedule_table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
+
         layout.addWidget(self.schedule_table)
 
+        # 다음 페이지 불러오기 버튼
+        self.load_more_btn = QPushButton("더 보기")
+        self.load_more_btn.clicked.connect(self.load_more_schedules)
+        self.load_more_btn.setVisible(False)
+        layout.addWidget(self.load_more_btn)
+
         # 초기 컬럼 표시 설정 적용
         self.apply_column_settings()
 
@@ -527,265 +661,107 @@ class ScheduleTab(QWidget):
 
         # load_schedules()는 set_current_user()에서 호출됨 (로그인 후 데이터 로드)
     
+    def get_permission_filters(self):
+        """사용자 권한에 따른 서버 필터
+
+        열람권한(can_view_all)이 있으면 전체 스케줄 볼 수 있음
+        없으면 본인(sales_rep)의 스케줄만 표시
+        """
+        if not self.current_user:
+            return {}
+        role = self.current_user.get('role', '')
+        can_view_all = self.current_user.get('can_view_all', 0)
+        if role == 'admin' or can_view_all:
+            return {}
+        return {'sales_rep': self.current_user.get('name', '')}
+
+    def get_search_filters(self):
+        """검색어를 서버 필터로 변환 (초성 검색도 서버에서 필터링)"""
+        search_text = self.search_input.text().strip() if hasattr(self, 'search_input') else ''
+        search_field = self.search_field_combo.currentText() if hasattr(self, 'search_field_combo') else '전체'
+        return schedule_search_filters(search_text, search_field)
+
     def load_schedules(self):
-        """스케줄 목록 로드"""
+        """스케줄 목록 로드 (첫 페이지, 서버 필터 적용)"""
         try:
-            from models.schedules import Schedule
             log_message('ScheduleTab', '스케줄 목록 로드 시작')
 
-            raw_schedules = Schedule.get_all() or []
-            # sqlite3.Row를 딕셔너리로 변환하여 .get() 메서드 사용 가능하게 함
-            all_schedules = [dict(s) for s in raw_schedules]
-
-            # 사용자 권한에 따라 스케줄 필터링
-            # 열람권한(can_view_all)이 있으면 전체 스케줄 볼 수 있음
-            # 없으면 본인(sales_rep)의 스케줄만 표시
-            if self.current_user:
-                user_name = self.current_user.get('name', '')
-                role = self.current_user.get('role', '')
-                can_view_all = self.current_user.get('can_view_all', 0)
-
-                # 관리자 또는 열람권한이 있는 사용자는 전체 조회 가능
-                if role == 'admin' or can_view_all:
-                    self.all_schedules = all_schedules
-                else:
-                    # 본인 담당 업체의 스케줄만 필터링 (sales_rep과 사용자 이름 일치)
-                    self.all_schedules = [
-                        s for s in all_schedules
-                        if (s.get('sales_rep', '') or '') == user_name
-                    ]
-            else:
-                self.all_schedules = all_schedules
+            # 목록 표시용 요약 컬럼만 조회 (상세는 스케줄을 열 때 get_by_id로 조회)
+            self.all_schedules = self.pager.first_page(
+                self.get_permission_filters(), self.get_search_filters())
 
             self.display_schedules(self.all_schedules)
+            self.update_load_more_button()
             log_message('ScheduleTab', f'스케줄 {len(self.all_schedules)}개 로드 완료')
         except Exception as e:
             log_exception('ScheduleTab', f'스케줄 로드 중 오류: {str(e)}')
 
-    def display_schedules(self, schedules):
-        """스케줄 목록을 테이블에 표시"""
-        # UI 업데이트 일시 중지 (성능 최적화)
-        self.schedule_table.setUpdatesEnabled(False)
+    def load_more_schedules(self):
+        """다음 페이지 스케줄 로드 (테이블 끝에 추가)"""
         try:
-            self.schedule_table.setRowCount(0)
-
-            # 컬럼 키와 인덱스 매핑
-            col_map = {col[0]: idx for idx, col in enumerate(self.ALL_COLUMNS)}
-
-            for row, schedule in enumerate(schedules):
-                self.schedule_table.insertRow(row)
-
-                # 각 컬럼에 대해 데이터 채우기
-                for col_index, col_def in enumerate(self.ALL_COLUMNS):
-                    col_key = col_def[0]
-                    data_key = col_def[2] if len(col_def) > 2 else None
-
-                    if col_key == 'select':
-                        # 체크박스
-                        checkbox = QCheckBox()
-                        checkbox_widget = QWidget()
-                        checkbox_layout = QHBoxLayout(checkbox_widget)
-                        checkbox_layout.addWidget(checkbox)
-                        checkbox_layout.setAlignment(Qt.AlignCenter)
-                        checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                        self.schedule_table.setCellWidget(row, col_index, checkbox_widget)
-
-                    elif col_key == 'id':
-                        # ID
-                        schedule_id = schedule.get('id', '')
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(str(schedule_id)))
-
-                    elif col_key == 'test_method':
-                        # 실험방법 (코드 → 텍스트 변환)
-                        test_method = schedule.get('test_method', '') or ''
-                        test_method_text = {
-                            'real': '실측', 'acceleration': '가속',
-                            'custom_real': '의뢰자(실측)', 'custom_acceleration': '의뢰자(가속)'
-                        }.get(test_method, test_method)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(test_method_text))
-
-                    elif col_key == 'storage_condition':
-                        # 보관조건 (코드 → 텍스트 변환)
-                        storage = schedule.get('storage_condition', '') or ''
-                        storage_text = {
-                            'room_temp': '상온', 'warm': '실온', 'cool': '냉장', 'freeze': '냉동'
-                        }.get(storage, storage)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(storage_text))
-
-                    elif col_key == 'food_type':
-                        # 식품유형 (ID → 이름 변환)
-                        food_type_id = schedule.get('food_type_id', '')
-                        food_type_name = ''
-                        if food_type_id:
-                            try:
-                                from models.product_types import ProductType
-                                food_type = ProductType.get_by_id(food_type_id)
-                                if food_type:
-                                    food_type_name = food_type.get('type_name', '') or ''
-                            except Exception:
-                                pass
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(food_type_name))
-
-                    elif col_key == 'expiry_period':
-                        # 소비기한 (일/월/년 조합)
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        parts = []
-                        if years > 0:
-                            parts.append(f"{years}년")
-                        if months > 0:
-                            parts.append(f"{months}개월")
-                        if days > 0:
-                            parts.append(f"{days}일")
-                        expiry_text = ' '.join(parts) if parts else ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(expiry_text))
-
-                    elif col_key == 'test_period':
-                        # 실험기간 계산
-                        test_method = schedule.get('test_method', 'real')
-                        days = schedule.get('test_period_days', 0) or 0
-                        months = schedule.get('test_period_months', 0) or 0
-                        years = schedule.get('test_period_years', 0) or 0
-                        total_days = days + (months * 30) + (years * 365)
-                        if test_method in ['acceleration', 'custom_acceleration']:
-                            test_days = total_days // 2
-                        else:
-                            test_days = int(total_days * 1.5)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(f"{test_days}일" if test_days > 0 else ''))
-
-                    elif col_key == 'report_type':
-                        # 보고서 종류 - 중간보고서만 표시
-                        if schedule.get('report_interim'):
-                            self.schedule_table.setItem(row, col_index, QTableWidgetItem('중간'))
-                        else:
-                            self.schedule_table.setItem(row, col_index, QTableWidgetItem('-'))
-
-                    elif col_key == 'extension_test':
-                        # 연장실험
-                        ext = schedule.get('extension_test', False)
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem('진행' if ext else '미진행'))
-
-                    elif col_key == 'packaging':
-                        # 포장단위
-                        weight = schedule.get('packaging_weight', 0) or 0
-                        unit = schedule.get('packaging_unit', 'g') or 'g'
-                        packaging_text = f"{weight}{unit}" if weight > 0 else ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(packaging_text))
-
-                    elif col_key in ('supply_amount', 'tax_amount', 'total_amount'):
-                        # 금액 필드 (포맷팅)
-                        amount = schedule.get(col_key, 0) or 0
-                        amount_text = f"{int(amount):,}" if amount > 0 else ''
-                        amount_item = QTableWidgetItem(amount_text)
-                        amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                        self.schedule_table.setItem(row, col_index, amount_item)
-
-                    elif col_key == 'status':
-                        # 상태 (커스텀 설정 사용)
-                        status = schedule.get('status', 'pending') or 'pending'
-                        status_map = get_status_map()
-                        status_colors = get_status_colors()
-                        status_text_colors = get_status_text_colors()
-                        status_text = status_map.get(status, status)
-                        status_item = QTableWidgetItem(status_text)
-                        # 커스텀 색상 적용
-                        if status in status_colors:
-                            bg_color = QColor(status_colors[status])
-                            status_item.setBackground(bg_color)
-                            # text_color가 있으면 사용, 없으면 자동 계산
-                            if status in status_text_colors:
-                                status_item.setForeground(QColor(status_text_colors[status]))
-                            elif bg_color.lightness() < 128:
-                                status_item.setForeground(QColor('#FFFFFF'))
-                            else:
-                                status_item.setForeground(QColor('#000000'))
-                        self.schedule_table.setItem(row, col_index, status_item)
-
-                    elif col_key == 'custom_temperatures':
-                        # 실험온도 표시 - 의뢰자 요청 온도 또는 보관조건에 따른 온도
-                        custom_temps = schedule.get('custom_temperatures', '') or ''
-                        if custom_temps:
-                            # 의뢰자 요청 온도가 있으면 표시
-                            temp_text = custom_temps.replace(',', ', ')
-                            self.schedule_table.setItem(row, col_index, QTableWidgetItem(f"{temp_text}℃"))
-                        else:
-                            # 보관조건과 실험방법에 따라 온도 결정
-                            test_method = schedule.get('test_method', 'real') or 'real'
-                            storage = schedule.get('storage_condition', 'room_temp') or 'room_temp'
-
-                            if test_method in ['acceleration', 'custom_acceleration']:
-                                # 가속실험 온도
-                                temp_map = {
-                                    'room_temp': '15℃, 25℃, 35℃',
-                                    'warm': '25℃, 35℃, 45℃',
-                                    'cool': '5℃, 10℃, 15℃',
-                                    'freeze': '-6℃, -12℃, -18℃'
-                                }
-                            else:
-                                # 실측실험 온도
-                                temp_map = {
-                                    'room_temp': '15℃',
-                                    'warm': '25℃',
-                                    'cool': '10℃',
-                                    'freeze': '-18℃ 이하'
-                                }
-                            temp_text = temp_map.get(storage, '')
-                            self.schedule_table.setItem(row, col_index, QTableWidgetItem(temp_text))
-
-                    elif col_key in ['report1_date', 'report2_date', 'report3_date']:
-                        # 중간보고 1, 2, 3 날짜 표시 (스케줄 관리에서 저장된 값)
-                        date_value = schedule.get(col_key, '') or ''
-                        if not date_value or date_value == '-':
-                            date_value = '-'
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(date_value))
-
-                    elif col_key == 'sales_rep':
-                        # 영업담당
-                        sales_rep = schedule.get('sales_rep', '') or ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(sales_rep))
-
-                    else:
-                        # 기타 필드 (직접 매핑)
-                        value = schedule.get(data_key, '') if data_key else ''
-                        if value is None:
-                            value = ''
-                        self.schedule_table.setItem(row, col_index, QTableWidgetItem(str(value)))
+            new_schedules = self.pager.next_page()
+            if not new_schedules:
+                return
+            self.all_schedules.extend(new_schedules)
 
-            log_message('ScheduleTab', f'스케줄 {len(schedules)}개 표시 완료')
+            self.display_schedules(new_schedules, append=True)
+            self.update_load_more_button()
+            log_message('ScheduleTab', f'스케줄 {len(new_schedules)}개 추가 로드 (총 {len(self.all_schedules)}개)')
         except Exception as e:
-            log_exception('ScheduleTab', f'스케줄 표시 중 오류: {str(e)}')
-        finally:
-            # UI 업데이트 재개
-            self.schedule_table.setUpdatesEnabled(True)
-
-    def get_chosung(self, text):
-        """문자열에서 초성 추출"""
-        result = ""
-        for char in text:
-            if '가' <= char <= '힣':
-                char_code = ord(char) - ord('가')
-                chosung_idx = char_code // 588
-                # 인덱스 범위 확인 (0-18)
-                if 0 <= chosung_idx < len(self.CHOSUNG_LIST):
-                    result += self.CHOSUNG_LIST[chosung_idx]
-                else:
-                    result += char  # 범위 밖이면 원래 문자 유지
+            log_exception('ScheduleTab', f'스케줄 추가 로드 중 오류: {str(e)}')
+
+    def on_table_scrolled(self, value):
+        """스크롤이 끝에 가까워지면 다음 페이지 로드"""
+        scroll_bar = self.schedule_table.verticalScrollBar()
+        if self.pager.has_more and value >= scroll_bar.maximum() - 5:
+            self.load_more_schedules()
+
+    def update_load_more_button(self):
+        """'더 보기' 버튼 표시 상태 갱신"""
+        if hasattr(self, 'load_more_btn'):
+            self.load_more_btn.setVisible(self.pager.has_more)
+            self.load_more_btn.setText(f"더 보기 (현재 {len(self.all_schedules)}건)")
+
+    def display_schedules(self, schedules, append=False):
+        """스케줄 목록을 테이블 모델에 설정
+
+        Args:
+            append: True면 기존 행 뒤에 추가 (다음 페이지 로드)
+        """
+        try:
+            if append:
+                self.schedule_model.append_rows(schedules)
             else:
-                result += char
-        return result
+                self._status_map = get_status_map()
+                self._status_colors = get_status_colors()
+                self._status_text_colors = get_status_text_colors()
+                self.schedule_model.set_rows(schedules)
 
-    def is_chosung_only(self, text):
-        """문자열이 초성만으로 이루어져 있는지 확인"""
-        for char in text:
-            if char not in self.CHOSUNG_LIST and char != ' ':
-                return False
-        return True
+            log_message('ScheduleTab', f'스케줄 {len(schedules)}개 표시 완료')
+        except Exception as e:
+            log_exception('ScheduleTab', f'스케줄 표시 중 오류: {str(e)}')
 
-    def match_chosung(self, text, search_text):
-        """초성 검색 매칭"""
-        text_chosung = self.get_chosung(text)
-        return search_text.lower() in text_chosung.lower()
+    def list_cell_text(self, schedule, col_key):
+        """목록 셀 표시 문자열 (테이블 모델에서 보이는 셀만 호출)"""
+        return schedule_cell_text(schedule, col_key, self._column_data_keys.get(col_key), self._status_map)
+
+    def list_cell_style(self, schedule, col_key):
+        """목록 셀 스타일 (금액 오른쪽 정렬, 상태 커스텀 색상)"""
+        if col_key in ('supply_amount', 'tax_amount', 'total_amount'):
+            return {'alignment': Qt.AlignRight | Qt.AlignVCenter}
+        if col_key == 'status':
+            status = schedule.get('status', 'pending') or 'pending'
+            if status in self._status_colors:
+                bg_color = QColor(self._status_colors[status])
+                # text_color가 있으면 사용, 없으면 자동 계산
+                if status in self._status_text_colors:
+                    fg_color = QColor(self._status_text_colors[status])
+                elif bg_color.lightness() < 128:
+                    fg_color = QColor('#FFFFFF')
+                else:
+                    fg_color = QColor('#000000')
+                return {'background': bg_color, 'foreground': fg_color}
+        return None
 
     def on_search_text_changed(self):
         """검색어 변경 시 타이머 시작 (디바운싱)"""
@@ -793,112 +769,45 @@ class ScheduleTab(QWidget):
         self.search_timer.start(300)  # 300ms 후 필터링 실행
 
     def filter_schedules(self):
-        """실시간 검색 필터링 (초성 검색 지원)"""
-        try:
-            search_text = self.search_input.text().strip()
-            search_field = self.search_field_combo.currentText()
-
-            if not search_text:
-                self.display_schedules(self.all_schedules)
-                return
-
-            log_message('ScheduleTab', f'스케줄 검색 시작: "{search_text}" (필드: {search_field})')
-
-            filtered = []
-            is_chosung = self.is_chosung_only(search_text)
-
-            status_map = get_status_map()
-
-            for schedule in self.all_schedules:
-                client_name = schedule.get('client_name', '') or ''
-                product_name = schedule.get('product_name', '') or ''
-                status = schedule.get('status', '') or ''
-                status_text = status_map.get(status, status)
-
-                match = False
-
-                if search_field == "전체":
-                    if is_chosung:
-                        match = (self.match_chosung(client_name, search_text) or
-                                 self.match_chosung(product_name, search_text) or
-                                 self.match_chosung(status_text, search_text))
-                    else:
-                        search_lower = search_text.lower()
-                        match = (search_lower in client_name.lower() or
-                                 search_lower in product_name.lower() or
-                                 search_lower in status_text.lower())
-                elif search_field == "업체명":
-                    if is_chosung:
-                        match = self.match_chosung(client_name, search_text)
-                    else:
-                        match = search_text.lower() in client_name.lower()
-                elif search_field == "샘플명":
-                    if is_chosung:
-                        match = self.match_chosung(product_name, search_text)
-                    else:
-                        match = search_text.lower() in product_name.lower()
-                elif search_field == "상태":
-                    if is_chosung:
-                        match = self.match_chosung(status_text, search_text)
-                    else:
-                        match = search_text.lower() in status_text.lower()
-
-                if match:
-                    filtered.append(schedule)
-
-            log_message('ScheduleTab', f'스케줄 검색 완료: {len(filtered)}개 결과')
-            self.display_schedules(filtered)
-        except Exception as e:
-            log_exception('ScheduleTab', f'스케줄 검색 중 오류: {str(e)}')
+        """실시간 검색 필터링 (초성 검색 포함 서버 필터로 첫 페이지부터 다시 조회)"""
+        self.load_schedules()
 
     def reset_search(self):
         """검색 초기화"""
         self.search_input.clear()
         self.search_field_combo.setCurrentIndex(0)
-        self.display_schedules(self.all_schedules)
+        self.search_timer.stop()
+        self.load_schedules()
 
     def on_double_click(self, index):
         """더블클릭 시 스케줄 관리 탭으로 이동"""
-        row = index.row()
-        schedule_id_item = self.schedule_table.item(row, 1)  # ID는 1번 열
-        if schedule_id_item:
-            try:
-                schedule_id = int(schedule_id_item.text())
-                self.schedule_double_clicked.emit(schedule_id)
-            except (ValueError, TypeError):
-                log_error('ScheduleTab', f'잘못된 스케줄 ID 형식: {schedule_id_item.text()}')
-
-    def get_checked_row(self):
-        """체크박스가 선택된 첫 번째 행 반환 (없으면 None)"""
-        for row in range(self.schedule_table.rowCount()):
-            checkbox_widget = self.schedule_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    return row
-        return None
+        schedule = self.schedule_proxy.row_data(index.row())
+        try:
+            schedule_id = int(schedule.get('id'))
+            self.schedule_double_clicked.emit(schedule_id)
+        except (ValueError, TypeError):
+            log_error('ScheduleTab', f'잘못된 스케줄 ID 형식: {schedule.get("id")}')
+
+    def get_checked_schedule(self):
+        """체크박스가 선택된 첫 번째 스케줄 반환 (없으면 None)"""
+        checked = self.schedule_proxy.checked_rows()
+        return checked[0] if checked else None
 
     def delete_selected_schedule(self):
         """선택된 스케줄 삭제"""
-        row = self.get_checked_row()
-        if row is None:
+        schedule = self.get_checked_schedule()
+        if schedule is None:
             QMessageBox.warning(self, "삭제 실패", "삭제할 스케줄을 체크하세요.")
             return
-        schedule_id_item = self.schedule_table.item(row, 1)  # ID는 1번 열
-        if not schedule_id_item:
-            return
 
         try:
-            schedule_id = int(schedule_id_item.text())
+            schedule_id = int(schedule.get('id'))
         except (ValueError, TypeError):
             QMessageBox.warning(self, "삭제 실패", "유효하지 않은 스케줄 ID입니다.")
             return
 
-        # NoneType 오류 방지: .item()이 None을 반환할 수 있음
-        client_name_item = self.schedule_table.item(row, 2)  # 업체명은 2번 열
-        product_name_item = self.schedule_table.item(row, 3)  # 제품명은 3번 열
-        client_name = client_name_item.text() if client_name_item else ''
-        product_name = product_name_item.text() if product_name_item else ''
+        client_name = schedule.get('client_name', '') or ''
+        product_name = schedule.get('product_name', '') or ''
 
         reply = QMessageBox.question(
             self, '삭제 확인',
@@ -940,17 +849,13 @@ class ScheduleTab(QWidget):
 
     def edit_selected_schedule(self):
         """선택된 스케줄 수정 다이얼로그 표시"""
-        row = self.get_checked_row()
-        if row is None:
+        schedule = self.get_checked_schedule()
+        if schedule is None:
             QMessageBox.warning(self, "수정 실패", "수정할 스케줄을 체크하세요.")
             return
 
-        schedule_id_item = self.schedule_table.item(row, 1)  # ID는 1번 열
-        if not schedule_id_item:
-            return
-
         try:
-            schedule_id = int(schedule_id_item.text())
+            schedule_id = int(schedule.get('id'))
         except (ValueError, TypeError):
             QMessageBox.warning(self, "수정 실패", "유효하지 않은 스케줄 ID입니다.")
             return
@@ -970,17 +875,13 @@ class ScheduleTab(QWidget):
 
     def copy_selected_schedule(self):
         """선택된 스케줄 복사 (상태는 대기로 변경)"""
-        row = self.get_checked_row()
-        if row is None:
+        schedule = self.get_checked_schedule()
+        if schedule is None:
             QMessageBox.warning(self, "복사 실패", "복사할 스케줄을 체크하세요.")
             return
 
-        schedule_id_item = self.schedule_table.item(row, 1)  # ID는 1번 열
-        if not schedule_id_item:
-            return
-
         try:
-            schedule_id = int(schedule_id_item.text())
+            schedule_id = int(schedule.get('id'))
         except (ValueError, TypeError):
             QMessageBox.warning(self, "복사 실패", "유효하지 않은 스케줄 ID입니다.")
             return
@@ -1074,14 +975,8 @@ class ScheduleTab(QWidget):
             selected_status_text = self.status_combo.currentText()
             new_status = get_status_code_by_name(selected_status_text)
 
-            # 체크된 행 찾기
-            checked_rows = []
-            for row in range(self.schedule_table.rowCount()):
-                checkbox_widget = self.schedule_table.cellWidget(row, 0)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox and checkbox.isChecked():
-                        checked_rows.append(row)
+            # 체크된 스케줄 (검색으로 숨겨진 행 제외)
+            checked_rows = self.schedule_proxy.checked_rows()
 
             if not checked_rows:
                 QMessageBox.warning(self, "변경 실패", "변경할 스케줄을 체크하세요.")
@@ -1097,15 +992,13 @@ class ScheduleTab(QWidget):
 
             if reply == QMessageBox.Yes:
                 success_count = 0
-                for row in checked_rows:
-                    schedule_id_item = self.schedule_table.item(row, 1)  # ID는 1번 열
-                    if schedule_id_item:
-                        try:
-                            schedule_id = int(schedule_id_item.text())
-                            if Schedule.update_status(schedule_id, new_status):
-                                success_count += 1
-                        except (ValueError, TypeError):
-                            log_error('ScheduleTab', f'잘못된 스케줄 ID 형식: {schedule_id_item.text()}')
+                for schedule in checked_rows:
+                    try:
+                        schedule_id = int(schedule.get('id'))
+                        if Schedule.update_status(schedule_id, new_status):
+                            success_count += 1
+                    except (ValueError, TypeError):
+                        log_error('ScheduleTab', f'잘못된 스케줄 ID 형식: {schedule.get("id")}')
 
                 QMessageBox.information(
                     self, "변경 완료",
@@ -1119,29 +1012,6 @@ class ScheduleTab(QWidget):
             print(error_msg)
             QMessageBox.critical(self, "오류", error_msg)
 
-    def add_sample_data(self):
-        """샘플 데이터 추가 (테스트용)"""
-        sample_data = [
-            {"client": "계림농장", "sample": "계란 샘플", "start": "2023-07-10", "end": "2023-07-30", "status": "진행중"},
-            {"client": "거성씨푸드", "sample": "생선 샘플", "start": "2023-07-05", "end": "2023-07-25", "status": "완료"}
-        ]
-        
-        self.schedule_table.setRowCount(len(sample_data))
-        
-        for row, data in enumerate(sample_data):
-            self.schedule_table.setItem(row, 0, QTableWidgetItem(data["client"]))
-            self.schedule_table.setItem(row, 1, QTableWidgetItem(data["sample"]))
-            self.schedule_table.setItem(row, 2, QTableWidgetItem(data["start"]))
-            self.schedule_table.setItem(row, 3, QTableWidgetItem(data["end"]))
-            
-            status_item = QTableWidgetItem(data["status"])
-            if data["status"] == "진행중":
-                status_item.setBackground(Qt.yellow)
-            elif data["status"] == "완료":
-                status_item.setBackground(Qt.green)
-
-            self.schedule_table.setItem(row, 4, status_item)
-
     def open_display_settings(self):
         """표시 설정 다이얼로그 열기"""
         dialog = ScheduleDisplaySettingsDialog(self)
@@ -1288,67 +1158,43 @@ class ScheduleTab(QWidget):
             self.current_sort_order = Qt.AscendingOrder
 
         # 정렬 실행
-        self.schedule_table.sortItems(logical_index, self.current_sort_order)
+        self.schedule_table.sortByColumn(logical_index, self.current_sort_order)
 
     def export_to_excel(self):
-        """스케줄 목록을 엑셀 파일로 내보내기"""
-        try:
-            import pandas as pd
-            from datetime import datetime
+        """스케줄 목록을 엑셀/CSV 파일로 내보내기
 
-            # 저장 경로 선택
-            default_filename = f"스케줄목록_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "엑셀 파일 저장",
-                default_filename,
-                "Excel Files (*.xlsx);;All Files (*)"
-            )
+        현재 검색 조건의 스케줄 전체를 페이지 단위로 조회하여 작업 스레드에서 한 행씩 기록
+        (불러오지 않은 다음 페이지도 포함)
+        """
+        from datetime import datetime
 
-            if not file_path:
-                return
+        default_filename = f"스케줄목록_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        file_path = ask_export_path(self, default_filename)
+        if not file_path:
+            return
 
-            # 테이블 데이터 수집
-            headers = []
-            visible_columns = []
-
-            # 보이는 컬럼만 수집
-            for col_index in range(self.schedule_table.columnCount()):
-                if not self.schedule_table.isColumnHidden(col_index):
-                    header = self.schedule_table.horizontalHeaderItem(col_index)
-                    if header and header.text() not in ['선택', 'ID']:
-                        headers.append(header.text())
-                        visible_columns.append(col_index)
-
-            # 데이터 수집
-            data = []
-            for row in range(self.schedule_table.rowCount()):
-                row_data = []
-                for col_index in visible_columns:
-                    item = self.schedule_table.item(row, col_index)
-                    row_data.append(item.text() if item else '')
-                data.append(row_data)
-
-            # DataFrame 생성 및 엑셀 저장
-            df = pd.DataFrame(data, columns=headers)
-            df.to_excel(file_path, index=False, engine='openpyxl')
+        # 보이는 컬럼만 ('선택', 'ID' 제외)
+        columns = []
+        for col_index, col_def in enumerate(self.ALL_COLUMNS):
+            if col_index >= self.schedule_model.columnCount() or self.schedule_table.isColumnHidden(col_index):
+                continue
+            if col_def[1] in ('선택', 'ID'):
+                continue
+            columns.append(col_def)
+        headers = [col_def[1] for col_def in columns]
 
-            QMessageBox.information(
-                self, "내보내기 완료",
-                f"엑셀 파일이 저장되었습니다.\n{file_path}"
-            )
-            log_message('ScheduleTab', f'엑셀 내보내기 완료: {file_path}')
+        # 검색 조건(초성 검색 포함)은 GUI 스레드에서 미리 고정
+        schedules = self.pager.iter_all()
 
-        except ImportError:
-            QMessageBox.critical(
-                self, "라이브러리 오류",
-                "엑셀 내보내기를 위해 pandas와 openpyxl 라이브러리가 필요합니다.\n"
-                "pip install pandas openpyxl 명령으로 설치하세요."
-            )
-        except Exception as e:
-            import traceback
-            error_msg = f"엑셀 내보내기 중 오류 발생:\n{str(e)}"
-            log_exception('ScheduleTab', error_msg)
-            QMessageBox.critical(self, "오류", error_msg)
+        def make_rows():
+            status_map = get_status_map()
+            for schedule in schedules:
+                yield [schedule_cell_text(schedule, col_def[0], col_def[2], status_map) for col_def in columns]
+
+        def on_done(path, count):
+            log_message('ScheduleTab', f'엑셀 내보내기 완료: {path} ({count}건)')
+
+        start_export(self, file_path, headers, make_rows, "스케줄", on_done=on_done)
 
     def import_from_excel(self):
         """엑셀 파일에서 스케줄 목록 불러오기"""
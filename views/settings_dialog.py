@@ -3,52 +3,56 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
                             QWidget, QFormLayout, QLineEdit, QPushButton,
                             QLabel, QMessageBox, QSpinBox, QGroupBox, QCheckBox,
                             QComboBox, QListWidget, QListWidgetItem, QColorDialog,
-                            QFrame, QGridLayout)
-from PyQt5.QtCore import Qt
+                            QFrame, QGridLayout, QDateEdit)
+from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QColor
 
 
-# 상태 설정을 가져오는 유틸리티 함수
-def get_status_settings():
-    """데이터베이스에서 상태 설정을 가져옴
+# 상태 설정 기본값
+DEFAULT_STATUSES = [
+    {'code': 'pending', 'name': '대기', 'color': '#FFFFFF', 'text_color': '#2196F3'},      # 파란색 글씨
+    {'code': 'received', 'name': '입고', 'color': '#FFFFFF', 'text_color': '#4CAF50'},     # 초록색 글씨
+    {'code': 'suspended', 'name': '중단', 'color': '#FFFFFF', 'text_color': '#FF9800'},    # 주황색 글씨
+    {'code': 'completed', 'name': '완료', 'color': '#FFFFFF', 'text_color': '#9C27B0'},    # 보라색 글씨
+]
+
+# custom_statuses 원본 문자열 -> 파싱 결과 (행마다 JSON 파싱하지 않도록)
+_parsed_statuses = {'raw': None, 'statuses': DEFAULT_STATUSES}
 
-    Returns:
-        list: [{'code': 'pending', 'name': '대기', 'color': '#FFFFFF', 'text_color': '#333333'}, ...]
-    """
-    default_statuses = [
-        {'code': 'pending', 'name': '대기', 'color': '#FFFFFF', 'text_color': '#2196F3'},      # 파란색 글씨
-        {'code': 'received', 'name': '입고', 'color': '#FFFFFF', 'text_color': '#4CAF50'},     # 초록색 글씨
-        {'code': 'suspended', 'name': '중단', 'color': '#FFFFFF', 'text_color': '#FF9800'},    # 주황색 글씨
-        {'code': 'completed', 'name': '완료', 'color': '#FFFFFF', 'text_color': '#9C27B0'},    # 보라색 글씨
-    ]
 
+def _load_statuses():
+    """설정 스냅샷에서 상태 목록 조회 (DB/API 조회 없이 메모리에서 처리)"""
     try:
         from connection_manager import is_internal_mode
-        if is_internal_mode():
-            # 내부망: DB 직접 조회
-            from database import get_connection
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE `key` = 'custom_statuses'")
-            result = cursor.fetchone()
-            conn.close()
-
-            if result and result['value']:
-                import json
-                return json.loads(result['value'])
-        else:
-            # 외부망: API를 통해 조회
+        if not is_internal_mode():
+            # 외부망: 로그인 전에는 API 조회 불가
             from api_client import get_api_client
-            api = get_api_client()
-            if api.is_logged_in():
-                result = api.get_setting('custom_statuses')
-                if result:
-                    import json
-                    return json.loads(result)
+            if not get_api_client().is_logged_in():
+                return DEFAULT_STATUSES
+
+        from models.settings import Settings
+        raw = Settings.get('custom_statuses')
+        if not raw:
+            return DEFAULT_STATUSES
+
+        if raw != _parsed_statuses['raw']:
+            import json
+            _parsed_statuses['statuses'] = json.loads(raw)
+            _parsed_statuses['raw'] = raw
+        return _parsed_statuses['statuses']
     except Exception as e:
         print(f"상태 설정 로드 오류: {e}")
+        return DEFAULT_STATUSES
+
+
+# 상태 설정을 가져오는 유틸리티 함수
+def get_status_settings():
+    """설정에서 상태 목록을 가져옴 (메모리 스냅샷, 수정해도 원본에 영향 없도록 복사본 반환)
 
-    return default_statuses
+    Returns:
+        list: [{'code': 'pending', 'name': '대기', 'color': '#FFFFFF', 'text_color': '#333333'}, ...]
+    """
+    return [dict(s) for s in _load_statuses()]
 
 
 def get_status_map():
@@ -57,7 +61,7 @@ def get_status_map():
     Returns:
         dict: {'pending': '대기', 'scheduled': '입고예정', ...}
     """
-    statuses = get_status_settings()
+    statuses = _load_statuses()
     return {s['code']: s['name'] for s in statuses}
 
 
@@ -67,7 +71,7 @@ def get_status_colors():
     Returns:
         dict: {'pending': '#FFFFFF', 'received': '#FFFFFF', ...}
     """
-    statuses = get_status_settings()
+    statuses = _load_statuses()
     return {s['code']: s['color'] for s in statuses}
 
 
@@ -77,7 +81,7 @@ def get_status_text_colors():
     Returns:
         dict: {'pending': '#2196F3', 'received': '#4CAF50', ...}
     """
-    statuses = get_status_settings()
+    statuses = _load_statuses()
     return {s['code']: s.get('text_color', '#333333') for s in statuses}
 
 
@@ -87,7 +91,7 @@ def get_status_names():
     Returns:
         list: ['대기', '입고예정', '입고', '종료']
     """
-    statuses = get_status_settings()
+    statuses = _load_statuses()
     return [s['name'] for s in statuses]
 
 
@@ -100,7 +104,7 @@ def get_status_code_by_name(name):
     Returns:
         str: 상태 코드 (예: 'pending')
     """
-    statuses = get_status_settings()
+    statuses = _load_statuses()
     for s in statuses:
         if s['name'] == name:
             return s['code']
@@ -718,17 +722,80 @@ class SettingsDialog(QDialog):
         interim_group.setLayout(interim_layout)
         layout.addWidget(interim_group)
 
+        # 공휴일 추가/근무일 지정 그룹 (custom_holidays)
+        holiday_group = QGroupBox("공휴일 추가 / 근무일 지정")
+        holiday_layout = QVBoxLayout()
+
+        self.custom_holidays = []
+        self.holiday_list_widget = QListWidget()
+        self.holiday_list_widget.setMaximumHeight(120)
+        holiday_layout.addWidget(self.holiday_list_widget)
+
+        holiday_edit_layout = QHBoxLayout()
+        self.holiday_date_edit = QDateEdit(QDate.currentDate())
+        self.holiday_date_edit.setCalendarPopup(True)
+        self.holiday_date_edit.setDisplayFormat('yyyy-MM-dd')
+        self.holiday_name_input = QLineEdit()
+        self.holiday_name_input.setPlaceholderText("이름 (예: 임시공휴일)")
+        self.holiday_type_combo = QComboBox()
+        self.holiday_type_combo.addItem("휴무일", 'holiday')
+        self.holiday_type_combo.addItem("근무일", 'workday')
+        add_holiday_btn = QPushButton("추가")
+        add_holiday_btn.clicked.connect(self.add_custom_holiday)
+        remove_holiday_btn = QPushButton("삭제")
+        remove_holiday_btn.clicked.connect(self.remove_custom_holiday)
+        holiday_edit_layout.addWidget(self.holiday_date_edit)
+        holiday_edit_layout.addWidget(self.holiday_name_input)
+        holiday_edit_layout.addWidget(self.holiday_type_combo)
+        holiday_edit_layout.addWidget(add_holiday_btn)
+        holiday_edit_layout.addWidget(remove_holiday_btn)
+        holiday_layout.addLayout(holiday_edit_layout)
+
+        holiday_group.setLayout(holiday_layout)
+        layout.addWidget(holiday_group)
+
         # 안내 문구
         info_label = QLabel(
             "※ 이 설정은 스케줄 관리 탭의 중간보고일 자동 계산에 적용됩니다.\n"
             "※ 중간보고일은 스케줄 관리 탭에서 달력을 통해 직접 수정할 수도 있습니다.\n"
-            "※ 공휴일: 설날, 추석, 어린이날, 광복절, 한글날, 크리스마스 등 + 대체공휴일"
+            "※ 공휴일: 설날, 추석, 어린이날, 광복절, 한글날, 크리스마스 등 + 대체공휴일\n"
+            "※ 임시공휴일·선거일은 휴무일로, 공휴일 중 근무하는 날은 근무일로 추가하세요."
         )
         info_label.setStyleSheet("color: #666; font-size: 11px;")
         layout.addWidget(info_label)
 
         layout.addStretch()
 
+    def refresh_holiday_list(self):
+        """공휴일 추가/근무일 지정 목록 표시 (날짜순)"""
+        self.custom_holidays.sort(key=lambda h: h['date'])
+        self.holiday_list_widget.clear()
+        for holiday in self.custom_holidays:
+            type_text = "근무일" if holiday.get('type') == 'workday' else "휴무일"
+            name = holiday.get('name') or ''
+            self.holiday_list_widget.addItem(f"{holiday['date']}  [{type_text}]  {name}")
+
+    def add_custom_holiday(self):
+        """공휴일 추가/근무일 지정 항목 추가 (같은 날짜는 교체)"""
+        date_text = self.holiday_date_edit.date().toString('yyyy-MM-dd')
+        self.custom_holidays = [h for h in self.custom_holidays if h['date'] != date_text]
+        self.custom_holidays.append({
+            'date': date_text,
+            'name': self.holiday_name_input.text().strip(),
+            'type': self.holiday_type_combo.currentData(),
+        })
+        self.holiday_name_input.clear()
+        self.refresh_holiday_list()
+
+    def remove_custom_holiday(self):
+        """선택된 공휴일 추가/근무일 지정 항목 삭제"""
+        current_row = self.holiday_list_widget.currentRow()
+        if current_row < 0:
+            QMessageBox.warning(self, "선택 오류", "삭제할 항목을 선택하세요.")
+            return
+        del self.custom_holidays[current_row]
+        self.refresh_holiday_list()
+
     def setup_status_tab(self, tab):
         """상태 설정 탭 - 상태 커스터마이징"""
         layout = QVBoxLayout(tab)
@@ -1076,6 +1143,15 @@ class SettingsDialog(QDialog):
                 except (ValueError, TypeError):
                     self.interim_report_offset_spin.setValue(0)
 
+            # 공휴일 추가/근무일 지정
+            if settings_dict.get('custom_holidays'):
+                import json
+                try:
+                    self.custom_holidays = json.loads(settings_dict['custom_holidays'])
+                except (ValueError, TypeError):
+                    self.custom_holidays = []
+                self.refresh_holiday_list()
+
             # 상태 목록 로드
             self.load_status_list()
 
@@ -1112,6 +1188,7 @@ class SettingsDialog(QDialog):
                 'stamp_path': self.stamp_path_input.text(),
                 # 스케줄 설정
                 'interim_report_offset': str(self.interim_report_offset_spin.value()),
+                'custom_holidays': json.dumps(self.custom_holidays, ensure_ascii=False),
             }
 
             # 상태 설정 추가 (JSON으로 저장)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+목록 테이블 모델 (스케줄 / 업체 / 수수료 / 식품유형 / 대시보드 공용)
+- RowTableModel: 불러온 행 dict 목록을 그대로 보관하고, 화면에 보이는 셀을 그릴 때만 표시 값 계산
+  (행마다 QTableWidgetItem / 체크박스 위젯을 만들지 않음)
+- RowFilterProxyModel: 검색 필터와 헤더 정렬을 원본 목록을 다시 만들지 않고 처리
+"""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtWidgets import QTableView
+
+
+class RowTableModel(QAbstractTableModel):
+    """행 dict 목록 테이블 모델 (읽기 전용, 체크 열 지원)"""
+
+    def __init__(self, columns=None, cell_text=None, cell_style=None, check_column=None, parent=None):
+        """
+        Args:
+            columns: [(컬럼 키, 헤더 이름), ...]
+            cell_text: (행 dict, 컬럼 키) -> 표시 문자열 (없으면 행 값 그대로 표시)
+            cell_style: (행 dict, 컬럼 키) -> {'background', 'foreground', 'alignment'} 또는 None
+            check_column: 체크박스를 표시할 열 번호 (없으면 None)
+        """
+        super().__init__(parent)
+        self.columns = list(columns or [])
+        self.rows = []
+        self.check_column = check_column
+        self._cell_text = cell_text or self.default_cell_text
+        self._cell_style = cell_style
+        self._checked = set()  # 체크된 행 번호
+        # 셀 표시 값 캐시 (정렬할 때 같은 셀을 반복해서 계산하지 않도록)
+        self._text_cache = {}
+        self._style_cache = {}
+
+    @staticmethod
+    def default_cell_text(row, key):
+        value = row.get(key, '')
+        return '' if value is None else str(value)
+
+    # ==================== 데이터 변경 ====================
+
+    def set_rows(self, rows):
+        """전체 행 교체 (체크 상태 초기화)"""
+        self.beginResetModel()
+        self.rows = list(rows or [])
+        self._checked.clear()
+        self._text_cache.clear()
+        self._style_cache.clear()
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """기존 행 뒤에 추가 (다음 페이지 로드)"""
+        rows = list(rows or [])
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def set_columns(self, columns):
+        """컬럼 구성 변경 (표시 설정 변경 시)"""
+        self.beginResetModel()
+        self.columns = list(columns)
+        self._text_cache.clear()
+        self._style_cache.clear()
+        self.endResetModel()
+
+    def column_index(self, key):
+        """컬럼 키의 열 번호 (없으면 -1)"""
+        for col, (col_key, _) in enumerate(self.columns):
+            if col_key == key:
+                return col
+        return -1
+
+    # ==================== 체크 상태 ====================
+
+    def is_checked(self, row):
+        return row in self._checked
+
+    def set_rows_checked(self, rows, checked):
+        """여러 행 체크 상태 변경"""
+        if checked:
+            self._checked.update(rows)
+        else:
+            self._checked.difference_update(rows)
+        if self.check_column is not None and self.rows:
+            self.dataChanged.emit(self.index(0, self.check_column),
+                                  self.index(len(self.rows) - 1, self.check_column),
+                                  [Qt.CheckStateRole])
+
+    # ==================== QAbstractTableModel ====================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.columns):
+            return self.columns[section][1]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.check_column:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if col == self.check_column:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked else Qt.Unchecked
+            return None
+
+        if role == Qt.DisplayRole:
+            text = self._text_cache.get((row, col))
+            if text is None:
+                try:
+                    text = self._cell_text(self.rows[row], self.columns[col][0])
+                except Exception as e:
+                    print(f"목록 셀 표시 오류: {e}")
+                    text = ''
+                self._text_cache[(row, col)] = text
+            return text
+
+        if self._cell_style and role in (Qt.BackgroundRole, Qt.ForegroundRole, Qt.TextAlignmentRole):
+            if (row, col) not in self._style_cache:
+                try:
+                    self._style_cache[(row, col)] = self._cell_style(self.rows[row], self.columns[col][0]) or {}
+                except Exception as e:
+                    print(f"목록 셀 스타일 오류: {e}")
+                    self._style_cache[(row, col)] = {}
+            style = self._style_cache[(row, col)]
+            if role == Qt.BackgroundRole:
+                return style.get('background')
+            if role == Qt.ForegroundRole:
+                return style.get('foreground')
+            alignment = style.get('alignment')
+            return int(alignment) if alignment is not None else None
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if index.isValid() and index.column() == self.check_column and role == Qt.CheckStateRole:
+            row = index.row()
+            if value == Qt.Checked:
+                self._checked.add(row)
+            else:
+                self._checked.discard(row)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+
+
+class RowFilterProxyModel(QSortFilterProxyModel):
+    """검색 필터 / 헤더 정렬 프록시 (행 dict 단위 필터 함수)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_filter = None
+
+    def set_row_filter(self, row_filter):
+        """행 필터 함수 설정 (행 dict -> bool, None이면 전체 표시)"""
+        self._row_filter = row_filter
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._row_filter is None:
+            return True
+        try:
+            return bool(self._row_filter(self.sourceModel().rows[source_row]))
+        except Exception as e:
+            print(f"목록 필터 오류: {e}")
+            return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        # 행 번호는 정렬/필터 후 표시 순서대로
+        if orientation == Qt.Vertical and role == Qt.DisplayRole:
+            return section + 1
+        return super().headerData(section, orientation, role)
+
+    def source_row(self, row):
+        """표시 순서 row번째 행의 원본 행 번호"""
+        return self.mapToSource(self.index(row, 0)).row()
+
+    def row_data(self, row):
+        """표시 순서 row번째 행 dict"""
+        return self.sourceModel().rows[self.source_row(row)]
+
+    def checked_rows(self):
+        """체크된 행 dict 목록 (표시 순서, 필터로 숨겨진 행 제외)"""
+        model = self.sourceModel()
+        rows = []
+        for row in range(self.rowCount()):
+            source_row = self.source_row(row)
+            if model.is_checked(source_row):
+                rows.append(model.rows[source_row])
+        return rows
+
+    def set_all_checked(self, checked):
+        """표시 중인 모든 행 체크/해제"""
+        self.sourceModel().set_rows_checked([self.source_row(row) for row in range(self.rowCount())], checked)
+
+
+def create_list_view(model, parent=None):
+    """목록 테이블 뷰 생성 (행 단위 선택, 편집 불가, 헤더 클릭 정렬)
+
+    Returns:
+        (QTableView, RowFilterProxyModel)
+    """
+    proxy = RowFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    view = QTableView(parent)
+    view.setModel(proxy)
+    view.setSelectionBehavior(QTableView.SelectRows)
+    view.setEditTriggers(QTableView.NoEditTriggers)
+    view.setSortingEnabled(True)
+    view.horizontalHeader().setSortIndicatorShown(True)
+    return view, proxy
+
+
+def selected_row_data(view):
+    """뷰에서 선택된 첫 번째 행 dict (없으면 None)"""
+    indexes = view.selectedIndexes()
+    if not indexes:
+        return None
+    return view.model().row_data(indexes[0].row())